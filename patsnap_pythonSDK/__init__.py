@@ -1,6 +1,22 @@
-from .client import PatsnapClient
-from .auth import AuthClient
-from .errors import AuthError, ApiError
+from .client import PatsnapClient, AsyncPatsnapClient
+from .auth import AuthClient, AsyncAuthClient
+from .errors import AuthError, ApiError, CircuitOpenError
+from .transport import TransportConfig
+from .export import ParquetWriter, write_parquet
+from .claims import ClaimScoreCache
+from .counts import CountMatrix
+from .facets import FacetTable
+from .partitions import QueryPartitions
+from .uploads import ImagePreprocessor, UploadCache
+from .utils.adaptive import AdaptiveConcurrencyLimiter
+from .utils.backoff import RetryPolicy
+from .utils.ratelimit import RateLimiter, InProcessRateLimiter, FileLockRateLimiter
+from .utils.cache import ResponseCache, MemoryCacheBackend, SQLiteCacheBackend
+from .utils.jsoncodec import JsonCodec, StdlibJsonCodec, OrjsonCodec, MsgspecCodec
+from .utils.records import CompactRecord, record_type
+from .utils.responsemode import LazyModelList, response_mode
+from .utils.tokenstore import TokenStore, MemoryTokenStore, FileTokenStore
+from .utils.tracing import RequestTrace, Tracer, CallbackTracer, OpenTelemetryTracer
 from .models import (
     PatentSearchPnRequest, 
     PatentBaseV2Response, 
@@ -68,9 +84,44 @@ def __getattr__(name):
 
 __all__ = [
     "PatsnapClient", 
+    "AsyncPatsnapClient",
     "AuthClient", 
+    "AsyncAuthClient",
     "AuthError", 
     "ApiError",
+    "CircuitOpenError",
+    "RetryPolicy",
+    "TransportConfig",
+    "ParquetWriter",
+    "write_parquet",
+    "ClaimScoreCache",
+    "FacetTable",
+    "CountMatrix",
+    "QueryPartitions",
+    "UploadCache",
+    "ImagePreprocessor",
+    "RateLimiter",
+    "InProcessRateLimiter",
+    "FileLockRateLimiter",
+    "AdaptiveConcurrencyLimiter",
+    "RequestTrace",
+    "Tracer",
+    "CallbackTracer",
+    "OpenTelemetryTracer",
+    "ResponseCache",
+    "MemoryCacheBackend",
+    "SQLiteCacheBackend",
+    "TokenStore",
+    "MemoryTokenStore",
+    "FileTokenStore",
+    "JsonCodec",
+    "StdlibJsonCodec",
+    "OrjsonCodec",
+    "MsgspecCodec",
+    "response_mode",
+    "LazyModelList",
+    "CompactRecord",
+    "record_type",
     "PatentSearchPnRequest",
     "PatentBaseV2Response", 
     "SearchPatentV2Response",
@@ -1,30 +1,61 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from threading import Lock
-from typing import Any, Dict, Optional
+from functools import cached_property, partial
+from threading import Lock, Thread
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional
 
 import requests
 
 from .errors import AuthError
+from .utils.singleflight import AsyncSingleFlight, SingleFlight
+from .utils.tokenstore import StoredToken, TokenStore, store_key
+
+try:  # Optional dependency, only needed by the async client
+    import httpx
+except ImportError:  # pragma: no cover - exercised when the extra is not installed
+    httpx = None
+
+if TYPE_CHECKING:  # pragma: no cover
+    import httpx as _httpx
 
 
 DEFAULT_TOKEN_URL = "https://connect.patsnap.com/oauth/token"
 
+# Stop using a token this long before the server says it expires
+_EXPIRY_MARGIN_SECONDS = 5
+
+# Single-flight keys; a forced refresh never settles for a merely unexpired token
+_REFRESH_KEY = "token"
+_FORCED_REFRESH_KEY = "token:force"
+
 
-@dataclass
+@dataclass(frozen=True)
 class _TokenState:
     token: Optional[str] = None
+    # Last moment the token may be sent
     expires_at_utc: Optional[datetime] = None
+    # From here on a background refresh is started while the token stays in use
+    refresh_at_utc: Optional[datetime] = None
+
+    @cached_property
+    def authorization_header(self) -> Mapping[str, str]:
+        # Built once per token and shared read-only by every request
+        return MappingProxyType({"Authorization": f"Bearer {self.token}"})
 
 
 class AuthClient:
     """Client-credentials OAuth helper for Patsnap API.
 
     - Obtains a bearer token using HTTP Basic auth with Client ID and Secret
-    - Caches the token until it is close to expiry, then refreshes automatically
-    - Thread-safe
+    - Caches the token; within ``refresh_leeway_seconds`` of expiry it keeps
+      serving the current token while one background thread fetches the next
+    - Thread-safe: no lock is held during network I/O, and concurrent callers
+      that must wait for a token share a single token request
+    - With a ``token_store``, tokens are shared with other processes on the host
 
     Usage:
         auth = AuthClient(client_id, client_secret)
@@ -41,15 +72,24 @@ class AuthClient:
         session: Optional[requests.Session] = None,
         timeout_seconds: float = 15.0,
         refresh_leeway_seconds: int = 60,
+        background_refresh: bool = True,
+        token_store: Optional[TokenStore] = None,
     ) -> None:
         self._client_id = client_id
         self._client_secret = client_secret
         self._token_url = token_url
         self._timeout_seconds = timeout_seconds
         self._refresh_leeway = max(0, int(refresh_leeway_seconds))
+        self._background_refresh = background_refresh
+        self._token_store = token_store
+        self._store_key = store_key(token_url, client_id)
 
         self._session = session or requests.Session()
+        # Guards only the background-refresh flag; never held across I/O
         self._lock = Lock()
+        self._refreshing = False
+        self._refresh_flight = SingleFlight()
+        # Replaced atomically; readers need no lock
         self._state = _TokenState()
 
     @property
@@ -66,33 +106,76 @@ class AuthClient:
 
     # ------------------------ Public API ------------------------
     def get_token(self, *, force_refresh: bool = False) -> str:
-        """Return a valid bearer token, refreshing if needed."""
-        with self._lock:
-            if force_refresh or not self._is_token_valid_locked():
-                self._fetch_new_token_locked()
-            assert self._state.token is not None  # for type-checkers
-            return self._state.token
+        """Return a valid bearer token, refreshing if needed.
+
+        Only a missing or expired token (or ``force_refresh``) makes the
+        caller wait; a token inside the leeway window is returned at once and
+        refreshed in the background.
+        """
+        token = self._current_state(force_refresh).token
+        assert token is not None  # for type-checkers
+        return token
 
     def get_authorization_value(self, *, force_refresh: bool = False) -> str:
         """Return the value for the Authorization header: "Bearer <token>"."""
-        token = self.get_token(force_refresh=force_refresh)
-        return f"Bearer {token}"
+        return self._current_state(force_refresh).authorization_header["Authorization"]
+
+    def get_authorization_header(self, *, force_refresh: bool = False) -> Mapping[str, str]:
+        """Return a read-only mapping with the Authorization header set.
 
-    def get_authorization_header(self, *, force_refresh: bool = False) -> Dict[str, str]:
-        """Return a dict with the Authorization header set."""
-        return {"Authorization": self.get_authorization_value(force_refresh=force_refresh)}
+        The mapping is built once per token and reused, so the per-request
+        cost is a lookup.
+        """
+        return self._current_state(force_refresh).authorization_header
 
     # --------------------- Internal helpers ---------------------
-    def _is_token_valid_locked(self) -> bool:
-        token = self._state.token
-        expires_at = self._state.expires_at_utc
-        if not token or not expires_at:
-            return False
-        # Refresh slightly before actual expiry
-        now_utc = datetime.now(timezone.utc)
-        return now_utc < expires_at
-
-    def _fetch_new_token_locked(self) -> None:
+    def _current_state(self, force_refresh: bool) -> _TokenState:
+        state = self._state
+        if not force_refresh and _is_state_valid(state):
+            if self._background_refresh and _needs_refresh(state):
+                self._start_background_refresh()
+            return state
+
+        key = _FORCED_REFRESH_KEY if force_refresh else _REFRESH_KEY
+        return self._refresh_flight.do(key, lambda: self._refresh(force=force_refresh))
+
+    def _refresh(self, *, force: bool) -> _TokenState:
+        """Fetch and install a new token; runs on one thread at a time."""
+        state = self._state
+        # A refresh that finished just before this one started is good enough
+        if not force and _is_state_valid(state) and not _needs_refresh(state):
+            return state
+        if self._token_store is None:
+            state = self._fetch_new_token()
+        else:
+            # Other processes wait here and then reuse the token this one fetches
+            with self._token_store.refresh_lock(self._store_key):
+                state = _load_stored_state(self._token_store, self._store_key, rejected=state if force else None)
+                if state is None:
+                    state = self._fetch_new_token()
+                    _save_stored_state(self._token_store, self._store_key, state)
+        self._state = state
+        return state
+
+    def _start_background_refresh(self) -> None:
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        Thread(target=self._background_refresh_worker, name="patsnap-token-refresh", daemon=True).start()
+
+    def _background_refresh_worker(self) -> None:
+        try:
+            self._refresh_flight.do(_REFRESH_KEY, lambda: self._refresh(force=False))
+        except Exception:
+            # The current token stays in use; once it expires the next caller
+            # refreshes in the foreground and sees the error
+            pass
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def _fetch_new_token(self) -> _TokenState:
         data = {"grant_type": "client_credentials"}
         headers = {"Content-Type": "application/x-www-form-urlencoded"}
 
@@ -130,52 +213,262 @@ class AuthClient:
             except requests.RequestException:
                 raise AuthError(f"Failed to reach token endpoint: {exc}")
 
-        if response.status_code >= 400:
-            raise AuthError(
-                f"Token endpoint returned HTTP {response.status_code}: {response.text}",
-                status_code=response.status_code,
-            )
+        return _token_state_from_response(response, self._refresh_leeway)
+
+
+class AsyncAuthClient:
+    """Asyncio counterpart of :class:`AuthClient`.
+
+    - Fetches tokens over a shared ``httpx.AsyncClient``
+    - Many concurrent coroutines hitting an expired token share a single
+      token request; inside the leeway window the current token keeps being
+      served while a background task fetches the next one
+    - Requires the optional ``httpx`` dependency (``pip install patsnap-pythonSDK[async]``)
+
+    Usage:
+        auth = AsyncAuthClient(client_id, client_secret)
+        headers = await auth.get_authorization_header()
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        *,
+        token_url: str = DEFAULT_TOKEN_URL,
+        client: Optional["_httpx.AsyncClient"] = None,
+        timeout_seconds: float = 15.0,
+        refresh_leeway_seconds: int = 60,
+        background_refresh: bool = True,
+        token_store: Optional[TokenStore] = None,
+    ) -> None:
+        _require_httpx()
+        self._client_id = client_id
+        self._client_secret = client_secret
+        self._token_url = token_url
+        self._timeout_seconds = timeout_seconds
+        self._refresh_leeway = max(0, int(refresh_leeway_seconds))
+        self._background_refresh = background_refresh
+        self._token_store = token_store
+        self._store_key = store_key(token_url, client_id)
 
+        self._client = client or httpx.AsyncClient()
+        self._refresh_flight = AsyncSingleFlight()
+        self._refresh_task: Optional["asyncio.Task"] = None
+        self._state = _TokenState()
+
+    @property
+    def client_id(self) -> str:
+        return self._client_id
+
+    async def aclose(self) -> None:
+        """Close the underlying async HTTP client."""
         try:
-            payload: Dict[str, Any] = response.json()
-        except ValueError:
-            raise AuthError("Token endpoint did not return JSON.")
-
-        # Handle multiple Patsnap response formats:
-        # Format 1: { token, token_type, expires_in, status, issued_at }
-        # Format 2: { data: { token }, ... }
-        # Format 3: Standard OAuth { access_token, ... }
-        token = None
-        if "data" in payload and isinstance(payload["data"], dict):
-            token = payload["data"].get("token")
-        if not token:
-            token = payload.get("token") or payload.get("access_token")
-        
-        if not token or not isinstance(token, str):
-            raise AuthError("Token missing in response.")
-
-        expires_in = _coerce_int(payload.get("expires_in"))
-        issued_at_ms = _coerce_int(payload.get("issued_at"))
-
-        now_utc = datetime.now(timezone.utc)
-        if expires_in is not None and issued_at_ms is not None:
-            issued_at = datetime.fromtimestamp(issued_at_ms / 1000.0, tz=timezone.utc)
-            raw_expires_at = issued_at + timedelta(seconds=expires_in)
-        elif expires_in is not None:
-            raw_expires_at = now_utc + timedelta(seconds=expires_in)
+            await self._client.aclose()
+        except Exception:
+            pass
+
+    # ------------------------ Public API ------------------------
+    async def get_token(self, *, force_refresh: bool = False) -> str:
+        """Return a valid bearer token, refreshing if needed."""
+        token = (await self._current_state(force_refresh)).token
+        assert token is not None  # for type-checkers
+        return token
+
+    async def get_authorization_value(self, *, force_refresh: bool = False) -> str:
+        """Return the value for the Authorization header: "Bearer <token>"."""
+        return (await self._current_state(force_refresh)).authorization_header["Authorization"]
+
+    async def get_authorization_header(self, *, force_refresh: bool = False) -> Mapping[str, str]:
+        """Return the shared read-only Authorization header mapping."""
+        return (await self._current_state(force_refresh)).authorization_header
+
+    # --------------------- Internal helpers ---------------------
+    async def _current_state(self, force_refresh: bool) -> _TokenState:
+        state = self._state
+        if not force_refresh and _is_state_valid(state):
+            if self._background_refresh and _needs_refresh(state):
+                self._start_background_refresh()
+            return state
+
+        key = _FORCED_REFRESH_KEY if force_refresh else _REFRESH_KEY
+        return await self._refresh_flight.do(key, lambda: self._refresh(force=force_refresh))
+
+    async def _refresh(self, *, force: bool) -> _TokenState:
+        state = self._state
+        if not force and _is_state_valid(state) and not _needs_refresh(state):
+            return state
+        if self._token_store is None:
+            state = await self._fetch_new_token()
         else:
-            # Fallback to 30 minutes as per docs
-            raw_expires_at = now_utc + timedelta(minutes=30)
+            # The store's lock is taken and released on one thread and can block
+            # for as long as another process's refresh takes, so the refresh
+            # runs on the default executor; the token request itself still
+            # goes out on this loop
+            loop = asyncio.get_running_loop()
+            state = await loop.run_in_executor(
+                None, partial(self._refresh_with_store, loop, rejected=state if force else None)
+            )
+        self._state = state
+        return state
+
+    def _refresh_with_store(
+        self, loop: asyncio.AbstractEventLoop, *, rejected: Optional[_TokenState]
+    ) -> _TokenState:
+        """Run on an executor thread: reuse or fetch a token under the store's refresh lock."""
+        assert self._token_store is not None
+        # Other processes wait here and then reuse the token this one fetches
+        with self._token_store.refresh_lock(self._store_key):
+            state = _load_stored_state(self._token_store, self._store_key, rejected=rejected)
+            if state is None:
+                state = asyncio.run_coroutine_threadsafe(self._fetch_new_token(), loop).result()
+                _save_stored_state(self._token_store, self._store_key, state)
+        return state
+
+    def _start_background_refresh(self) -> None:
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        self._refresh_task = asyncio.ensure_future(self._background_refresh_worker())
+
+    async def _background_refresh_worker(self) -> None:
+        try:
+            await self._refresh_flight.do(_REFRESH_KEY, lambda: self._refresh(force=False))
+        except Exception:
+            # Same policy as the sync client: surface errors in the foreground
+            pass
 
-        # Apply leeway for proactive refreshes
-        expires_at_with_leeway = raw_expires_at - timedelta(seconds=self._refresh_leeway)
-        # Never set expiry earlier than now + 1 second
-        min_valid_until = now_utc + timedelta(seconds=1)
-        if expires_at_with_leeway <= min_valid_until:
-            expires_at_with_leeway = min_valid_until
+    async def _fetch_new_token(self) -> _TokenState:
+        data = {"grant_type": "client_credentials"}
+        headers = {"Content-Type": "application/x-www-form-urlencoded"}
+        auth_url = f"https://{self._client_id}:{self._client_secret}@{self._token_url.replace('https://', '')}"
 
-        self._state.token = token
-        self._state.expires_at_utc = expires_at_with_leeway
+        # Same strategy as the sync client: standard OAuth first, then URL-based auth
+        try:
+            response = await self._client.post(
+                self._token_url,
+                data=data,
+                headers=headers,
+                auth=(self._client_id, self._client_secret),
+                timeout=self._timeout_seconds,
+            )
+            if response.status_code == 401 or (response.status_code == 200 and
+                response.json().get("error_code") == 67200003):
+                response = await self._client.post(
+                    auth_url,
+                    data=data,
+                    headers=headers,
+                    timeout=self._timeout_seconds,
+                )
+        except httpx.RequestError as exc:
+            try:
+                response = await self._client.post(
+                    auth_url,
+                    data=data,
+                    headers=headers,
+                    timeout=self._timeout_seconds,
+                )
+            except httpx.RequestError:
+                raise AuthError(f"Failed to reach token endpoint: {exc}")
+
+        return _token_state_from_response(response, self._refresh_leeway)
+
+
+def _require_httpx() -> None:
+    if httpx is None:
+        raise ImportError(
+            "The async client requires httpx. Install it with: pip install 'patsnap-pythonSDK[async]'"
+        )
+
+
+def _is_state_valid(state: _TokenState) -> bool:
+    if not state.token or not state.expires_at_utc:
+        return False
+    return datetime.now(timezone.utc) < state.expires_at_utc
+
+
+def _load_stored_state(store: TokenStore, key: str, *, rejected: Optional[_TokenState]) -> Optional[_TokenState]:
+    """Return the stored token if it is fresh and not the one being force-refreshed."""
+    stored = store.load(key)
+    if stored is None or (rejected is not None and stored.token == rejected.token):
+        return None
+    state = _TokenState(
+        token=stored.token,
+        expires_at_utc=datetime.fromtimestamp(stored.expires_at, tz=timezone.utc),
+        refresh_at_utc=datetime.fromtimestamp(stored.refresh_at, tz=timezone.utc),
+    )
+    if not _is_state_valid(state) or _needs_refresh(state):
+        return None
+    return state
+
+
+def _save_stored_state(store: TokenStore, key: str, state: _TokenState) -> None:
+    assert state.token and state.expires_at_utc and state.refresh_at_utc
+    store.save(
+        key,
+        StoredToken(
+            token=state.token,
+            expires_at=state.expires_at_utc.timestamp(),
+            refresh_at=state.refresh_at_utc.timestamp(),
+        ),
+    )
+
+
+def _needs_refresh(state: _TokenState) -> bool:
+    return state.refresh_at_utc is None or datetime.now(timezone.utc) >= state.refresh_at_utc
+
+
+def _token_state_from_response(response: Any, refresh_leeway: int) -> _TokenState:
+    """Parse a token endpoint response into a new ``_TokenState``.
+
+    Works with both ``requests`` and ``httpx`` responses.
+    """
+    if response.status_code >= 400:
+        raise AuthError(
+            f"Token endpoint returned HTTP {response.status_code}: {response.text}",
+            status_code=response.status_code,
+        )
+
+    try:
+        payload: Dict[str, Any] = response.json()
+    except ValueError:
+        raise AuthError("Token endpoint did not return JSON.")
+
+    # Handle multiple Patsnap response formats:
+    # Format 1: { token, token_type, expires_in, status, issued_at }
+    # Format 2: { data: { token }, ... }
+    # Format 3: Standard OAuth { access_token, ... }
+    token = None
+    if "data" in payload and isinstance(payload["data"], dict):
+        token = payload["data"].get("token")
+    if not token:
+        token = payload.get("token") or payload.get("access_token")
+    
+    if not token or not isinstance(token, str):
+        raise AuthError("Token missing in response.")
+
+    expires_in = _coerce_int(payload.get("expires_in"))
+    issued_at_ms = _coerce_int(payload.get("issued_at"))
+
+    now_utc = datetime.now(timezone.utc)
+    if expires_in is not None and issued_at_ms is not None:
+        issued_at = datetime.fromtimestamp(issued_at_ms / 1000.0, tz=timezone.utc)
+        raw_expires_at = issued_at + timedelta(seconds=expires_in)
+    elif expires_in is not None:
+        raw_expires_at = now_utc + timedelta(seconds=expires_in)
+    else:
+        # Fallback to 30 minutes as per docs
+        raw_expires_at = now_utc + timedelta(minutes=30)
+
+    # Stop sending the token just before it expires, and start refreshing it
+    # in the background once inside the leeway window
+    expires_at = raw_expires_at - timedelta(seconds=min(refresh_leeway, _EXPIRY_MARGIN_SECONDS))
+    refresh_at = raw_expires_at - timedelta(seconds=refresh_leeway)
+    # Never set expiry earlier than now + 1 second
+    min_valid_until = now_utc + timedelta(seconds=1)
+    expires_at = max(expires_at, min_valid_until)
+    refresh_at = min(max(refresh_at, min_valid_until), expires_at)
+
+    return _TokenState(token=token, expires_at_utc=expires_at, refresh_at_utc=refresh_at)
 
 
 def _coerce_int(value: Any) -> Optional[int]:
@@ -189,6 +482,6 @@ def _coerce_int(value: Any) -> Optional[int]:
         return None
 
 
-__all__ = ["AuthClient"]
+__all__ = ["AuthClient", "AsyncAuthClient"]
 
 
@@ -0,0 +1,250 @@
+"""Bulk lookups: run one call per input on a bounded worker pool.
+
+Used by ``PatentsSearchResource.search_pn_bulk`` to resolve large lists of
+patent or application numbers. Inputs are read lazily from the iterable and
+normalised. Results stream back as ``(input, result)`` pairs in completion
+order, one per input. An input repeating a number that is in flight, or
+whose result is among the most recent ones kept, shares that result; an
+older repeat is looked up again, so memory stays bounded by ``chunk``
+rather than growing with the input. A failed lookup yields its exception
+instead of aborting the run. The :class:`BulkStats` of a run are available
+once it has been consumed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import re
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+
+T = TypeVar("T")
+
+# Separators people paste into patent numbers, e.g. "US 11,205,304 B2"
+_NUMBER_NOISE = re.compile(r"[\s,]+")
+
+
+def normalize_patent_number(number: str) -> str:
+    """Canonical form of a patent or application number: upper case, no spaces or commas.
+
+    Slashes and dots are kept; they are part of application numbers such as
+    ``US17/521392`` and ``CN201710123456.7``.
+    """
+    return _NUMBER_NOISE.sub("", str(number)).upper()
+
+
+@dataclass
+class BulkStats:
+    """Counters for one bulk run; final once the run is exhausted."""
+
+    submitted: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+    finished_at: Optional[float] = None
+
+    @property
+    def elapsed(self) -> float:
+        end = self.finished_at if self.finished_at is not None else time.monotonic()
+        return end - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """Completed lookups per second."""
+        elapsed = self.elapsed
+        return (self.succeeded + self.failed) / elapsed if elapsed > 0 else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.succeeded} ok, {self.failed} failed, {self.duplicates} duplicates, "
+            f"{self.invalid} invalid in {self.elapsed:.1f}s ({self.throughput:.1f}/s)"
+        )
+
+
+BulkItem = Tuple[str, Union[T, Exception]]
+
+
+class _BulkRunBase(Generic[T]):
+    def __init__(self, inputs: Iterable[str], *, concurrency: int, chunk: int) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        if chunk < 1:
+            raise ValueError("chunk must be >= 1")
+        self._inputs = inputs
+        self._concurrency = concurrency
+        # Inputs read ahead of completed results; bounds memory for huge inputs
+        self._chunk = max(chunk, concurrency)
+        self.stats = BulkStats()
+        # Normalised number -> inputs waiting on its lookup
+        self._waiting: Dict[str, List[str]] = {}
+        # Inputs held in _waiting; counted against chunk with the lookups
+        self._held = 0
+        # Every number seen, to count repeats
+        self._seen: Set[str] = set()
+        # Outcomes of the last ``chunk`` lookups, for repeats close behind them
+        self._recent: "OrderedDict[str, Union[T, Exception]]" = OrderedDict()
+
+    def _has_room(self) -> bool:
+        return self._held < self._chunk
+
+    def _admit(self, raw: str) -> Tuple[Optional[str], List[BulkItem[T]]]:
+        """Take one input: the number to look up, if new, and the pairs ready at once."""
+        number = normalize_patent_number(raw)
+        if not number:
+            self.stats.invalid += 1
+            return None, [(raw, ValueError(f"Invalid patent number: {raw!r}"))]
+        if number in self._seen:
+            self.stats.duplicates += 1
+            if number in self._recent:
+                self._recent.move_to_end(number)
+                return None, [(raw, self._recent[number])]
+            if number in self._waiting:
+                self._waiting[number].append(raw)
+                self._held += 1
+                return None, []
+        # New numbers and repeats whose result was dropped are looked up
+        self._seen.add(number)
+        self._waiting[number] = [raw]
+        self._held += 1
+        self.stats.submitted += 1
+        return number, []
+
+    def _finish(self, number: str, outcome: Union[T, Exception]) -> List[BulkItem[T]]:
+        """Record a finished lookup and pair it with every input that spelled its number."""
+        if isinstance(outcome, Exception):
+            self.stats.failed += 1
+        else:
+            self.stats.succeeded += 1
+        self._recent[number] = outcome
+        if len(self._recent) > self._chunk:
+            self._recent.popitem(last=False)
+        raws = self._waiting.pop(number)
+        self._held -= len(raws)
+        return [(raw, outcome) for raw in raws]
+
+
+class BulkRun(_BulkRunBase[T]):
+    """Iterable of ``(input, result | exception)`` pairs from a threaded bulk run."""
+
+    def __init__(
+        self,
+        lookup: Callable[[str], T],
+        inputs: Iterable[str],
+        *,
+        concurrency: int = 8,
+        chunk: int = 1000,
+    ) -> None:
+        super().__init__(inputs, concurrency=concurrency, chunk=chunk)
+        self._lookup = lookup
+
+    def __iter__(self) -> Iterator[BulkItem[T]]:
+        self.stats.started_at = time.monotonic()
+        executor = ThreadPoolExecutor(max_workers=self._concurrency)
+        pending: Dict[Future, str] = {}
+        inputs = iter(self._inputs)
+        try:
+            exhausted = False
+            while True:
+                while not exhausted and self._has_room():
+                    raw = next(inputs, None)
+                    if raw is None:
+                        exhausted = True
+                        break
+                    number, ready = self._admit(raw)
+                    yield from ready
+                    if number is not None:
+                        future = executor.submit(contextvars.copy_context().run, self._lookup, number)
+                        pending[future] = number
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    number = pending.pop(future)
+                    try:
+                        outcome: Union[T, Exception] = future.result()
+                    except Exception as exc:
+                        outcome = exc
+                    yield from self._finish(number, outcome)
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+            self.stats.finished_at = time.monotonic()
+
+
+class AsyncBulkRun(_BulkRunBase[T]):
+    """Async iterable of ``(input, result | exception)`` pairs for the async client."""
+
+    def __init__(
+        self,
+        lookup: Callable[[str], Awaitable[T]],
+        inputs: Iterable[str],
+        *,
+        concurrency: int = 8,
+        chunk: int = 1000,
+    ) -> None:
+        super().__init__(inputs, concurrency=concurrency, chunk=chunk)
+        self._lookup = lookup
+
+    async def __aiter__(self) -> AsyncIterator[BulkItem[T]]:
+        self.stats.started_at = time.monotonic()
+        semaphore = asyncio.Semaphore(self._concurrency)
+        pending: Dict[asyncio.Task, str] = {}
+        inputs = iter(self._inputs)
+
+        async def run(number: str) -> T:
+            async with semaphore:
+                return await self._lookup(number)
+
+        try:
+            exhausted = False
+            while True:
+                while not exhausted and self._has_room():
+                    raw = next(inputs, None)
+                    if raw is None:
+                        exhausted = True
+                        break
+                    number, ready = self._admit(raw)
+                    for item in ready:
+                        yield item
+                    if number is not None:
+                        pending[asyncio.ensure_future(run(number))] = number
+                if not pending:
+                    break
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    number = pending.pop(task)
+                    try:
+                        outcome: Union[T, Exception] = task.result()
+                    except Exception as exc:
+                        outcome = exc
+                    for item in self._finish(number, outcome):
+                        yield item
+        finally:
+            for task in pending:
+                task.cancel()
+            self.stats.finished_at = time.monotonic()
+
+
+__all__ = ["BulkStats", "BulkRun", "AsyncBulkRun", "normalize_patent_number"]
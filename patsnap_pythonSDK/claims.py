@@ -0,0 +1,175 @@
+"""Batch claim-similarity scoring.
+
+Used by ``PatentsSearchResource.claim_similarity_batch`` and
+``claim_similarity_matrix``. Each claim text is hashed once. Repeated pairs,
+and with ``symmetric=True`` the reversed pairs, are scored by a single call.
+Scores are remembered by content hash in a :class:`ClaimScoreCache`, so
+re-running an overlapping comparison only pays for the new pairs. The
+remaining calls run on a bounded worker pool.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .utils.concurrency import map_ordered
+
+
+# The claim-sim endpoint expects line breaks and tabs escaped
+_CLAIM_ESCAPES = str.maketrans({"\n": "\\n", "\r": "\\r", "\t": "\\t"})
+
+PairKey = Tuple[bytes, bytes]
+
+
+def escape_claim(text: str) -> str:
+    """Escape ``\\n``, ``\\r`` and ``\\t`` the way the claim-sim endpoint expects."""
+    return text.translate(_CLAIM_ESCAPES)
+
+
+def claim_digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+class ClaimScoreCache:
+    """Thread-safe LRU of similarity scores keyed by the content hashes of a pair."""
+
+    def __init__(self, max_entries: int = 100_000) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self._max_entries = max_entries
+        self._scores: "OrderedDict[PairKey, float]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: PairKey) -> Optional[float]:
+        with self._lock:
+            score = self._scores.get(key)
+            if score is None:
+                self.misses += 1
+                return None
+            self._scores.move_to_end(key)
+            self.hits += 1
+            return score
+
+    def put(self, key: PairKey, score: float) -> None:
+        with self._lock:
+            self._scores[key] = score
+            self._scores.move_to_end(key)
+            while len(self._scores) > self._max_entries:
+                self._scores.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._scores.clear()
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+
+class _Plan:
+    """Unique upstream calls for a list of pairs, and where each score goes."""
+
+    def __init__(self, pairs: Iterable[Tuple[str, str]], *, symmetric: bool, cache: ClaimScoreCache) -> None:
+        digests: Dict[str, bytes] = {}
+
+        def digest(text: str) -> bytes:
+            value = digests.get(text)
+            if value is None:
+                value = digests[text] = claim_digest(text)
+            return value
+
+        self.keys: List[PairKey] = []
+        self.scores: Dict[PairKey, float] = {}
+        # key -> (src, tgt) for the pairs that still need a call
+        self.calls: Dict[PairKey, Tuple[str, str]] = {}
+        for src, tgt in pairs:
+            key = (digest(src), digest(tgt))
+            if symmetric and key[1] < key[0]:
+                # Canonical order, so (a, b) and (b, a) share one call and one cache entry
+                key = (key[1], key[0])
+                src, tgt = tgt, src
+            self.keys.append(key)
+            if key in self.scores or key in self.calls:
+                continue
+            cached = cache.get(key)
+            if cached is not None:
+                self.scores[key] = cached
+            else:
+                self.calls[key] = (src, tgt)
+
+    def record(self, cache: ClaimScoreCache, keys: Sequence[PairKey], scores: Sequence[float]) -> List[float]:
+        for key, score in zip(keys, scores):
+            self.scores[key] = score
+            cache.put(key, score)
+        return [self.scores[key] for key in self.keys]
+
+
+def score_pairs(
+    score: Callable[[str, str], float],
+    pairs: Iterable[Tuple[str, str]],
+    *,
+    cache: ClaimScoreCache,
+    concurrency: int = 8,
+    symmetric: bool = True,
+) -> List[float]:
+    """Score every ``(src, tgt)`` pair; returns the scores in input order."""
+    plan = _Plan(pairs, symmetric=symmetric, cache=cache)
+    keys = list(plan.calls)
+    scores = map_ordered(lambda key: score(*plan.calls[key]), keys, concurrency=concurrency)
+    return plan.record(cache, keys, scores)
+
+
+async def ascore_pairs(
+    score: Callable[[str, str], Awaitable[float]],
+    pairs: Iterable[Tuple[str, str]],
+    *,
+    cache: ClaimScoreCache,
+    concurrency: int = 8,
+    symmetric: bool = True,
+) -> List[float]:
+    """Async equivalent of :func:`score_pairs`."""
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    plan = _Plan(pairs, symmetric=symmetric, cache=cache)
+    keys = list(plan.calls)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(key: PairKey) -> float:
+        async with semaphore:
+            return await score(*plan.calls[key])
+
+    scores = await asyncio.gather(*(run(key) for key in keys))
+    return plan.record(cache, keys, scores)
+
+
+def score_of(result: Any) -> float:
+    """The score of a claim-sim result in any response mode."""
+    if isinstance(result, dict):
+        return float(result["data"]["score"])
+    return float(result.data.score)
+
+
+def require_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError(
+            "A NumPy score matrix requires numpy. Install it with: pip install 'patsnap-pythonSDK[arrow]', "
+            "or pass as_array=False for nested lists"
+        ) from exc
+    return numpy
+
+
+def to_matrix(scores: List[float], rows: int, columns: int, *, as_array: bool) -> Any:
+    """Reshape row-major ``scores`` into a NumPy array, or nested lists."""
+    if as_array:
+        return require_numpy().asarray(scores, dtype="float64").reshape(rows, columns)
+    return [scores[row * columns:(row + 1) * columns] for row in range(rows)]
+
+
+__all__ = ["ClaimScoreCache", "escape_claim", "claim_digest", "score_pairs", "ascore_pairs", "score_of", "require_numpy", "to_matrix"]
@@ -51,14 +51,26 @@ def get_namespace_info() -> Dict[str, Dict[str, Any]]:
                     "description": "Patent search operations",
                                             "methods": {
                             "by_number": "Search patents by patent number or application number",
+                            "by_numbers": "Look up many patent or application numbers concurrently",
                             "by_original_assignee": "Search patents by original applicant/assignee names",
+                            "iter_by_original_assignee": "Stream every original assignee result page by page",
                             "by_current_assignee": "Search patents by current assignee names",
+                            "iter_by_current_assignee": "Stream every current assignee result page by page",
                             "by_defense_applicant": "Search defense/military patents by applicant names",
+                            "iter_by_defense_applicant": "Stream every defense patent result page by page",
                             "by_similarity": "Find patents similar to a given patent by ID or number",
+                            "iter_by_similarity": "Stream every similar patent result page by page",
                             "by_semantic_text": "Search patents using semantic analysis of technical text",
+                            "iter_by_semantic_text": "Stream every semantic search result page by page",
+                            "fetch_all": "Fetch every page of a paginated search concurrently",
+                            "iter_partitioned": "Stream an entire assignee portfolio past the 20,000 result window",
                             "upload_image": "Upload patent images and get public URLs for image search",
+                            "upload_images": "Upload several images concurrently, reusing URLs of identical images",
                             "by_image": "Search patents using image similarity analysis",
-                            "by_multiple_images": "Search patents using multiple image similarity analysis (up to 4 images)"
+                            "by_multiple_images": "Search patents using multiple image similarity analysis (up to 4 images)",
+                            "iter_by_image": "Stream all 1,100 reachable image search results page by page",
+                            "iter_by_multiple_images": "Stream all 1,100 reachable multiple-image search results",
+                            "by_images_fused": "Run several image searches in parallel and fuse results by patent"
                         }
                 },
                 "data": "Patent data retrieval (biblio, legal status, citations, etc.)",
@@ -76,7 +88,13 @@ def get_namespace_info() -> Dict[str, Dict[str, Any]]:
                     "methods": {
                         "query_count": "Get total patent count for analytics queries",
                         "query_search": "Search patents using analytics queries with full data",
-                        "query_filter": "Get aggregated field statistics from analytics queries"
+                        "count_matrix": "Count patents over a grid of terms, years and authorities",
+                        "iter_query_search": "Stream every analytics query result page by page",
+                        "fetch_all": "Fetch every page of an analytics query concurrently",
+                        "partition_query": "Split a query into date slices within the 20,000 result window",
+                        "iter_partitioned_search": "Stream every result of a query past the 20,000 result window",
+                        "query_filter": "Get aggregated field statistics from analytics queries",
+                        "facet_sweep": "Get complete field distributions beyond the Top-200 cap"
                     }
                 },
                 "trends": "Patent application and publication trends",
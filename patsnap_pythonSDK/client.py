@@ -1,12 +1,23 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import requests
 
-from .auth import AuthClient
-from .http import HttpClient
+from .auth import AsyncAuthClient, AuthClient
+from .http import AsyncHttpClient, HttpClient
 from .namespaces import AnalyticsNamespace, PatentsNamespace
+from .transport import TransportConfig
+from .utils.adaptive import AdaptiveConcurrencyLimiter
+from .utils.backoff import RetryPolicy
+from .utils.ratelimit import RateLimiter
+from .utils.cache import ResponseCache
+from .utils.jsoncodec import JsonCodec
+from .utils.tokenstore import TokenStore
+from .utils.tracing import Tracer
+
+if TYPE_CHECKING:  # pragma: no cover
+    import httpx
 
 
 class PatsnapClient:
@@ -17,9 +28,41 @@ class PatsnapClient:
         client_secret: str,
         base_url: str = "https://connect.patsnap.com",
         session: Optional[requests.Session] = None,
+        transport: Optional[TransportConfig] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        tracer: Optional[Tracer] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce: bool = True,
+        json_codec: Optional[JsonCodec] = None,
+        response_mode: str = "model",
+        token_store: Optional[TokenStore] = None,
     ) -> None:
-        self._auth = AuthClient(client_id, client_secret, token_url=f"{base_url.rstrip('/')}/oauth/token", session=session)
-        self._http = HttpClient(self._auth, base_url=base_url, session=session)
+        # A caller-supplied session is used as-is; otherwise build a tuned one
+        transport = transport or TransportConfig()
+        session = session or transport.build_session()
+        self._auth = AuthClient(
+            client_id,
+            client_secret,
+            token_url=f"{base_url.rstrip('/')}/oauth/token",
+            session=session,
+            token_store=token_store,
+        )
+        self._http = HttpClient(
+            self._auth,
+            base_url=base_url,
+            session=session,
+            timeout_seconds=transport.timeout,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            concurrency_limiter=concurrency_limiter,
+            tracer=tracer,
+            cache=cache,
+            coalesce=coalesce,
+            json_codec=json_codec,
+            response_mode=response_mode,
+        )
 
         # Namespaces
         self.analytics = AnalyticsNamespace(self._http)
@@ -30,7 +73,85 @@ class PatsnapClient:
         self._auth.close()
 
 
-__all__ = ["PatsnapClient"]
+class AsyncPatsnapClient:
+    """Asyncio client exposing the same ``analytics``/``patents`` namespaces.
+
+    Every endpoint method returns an awaitable, so a single event loop can keep
+    many requests in flight. Token refresh and business calls share one
+    ``httpx.AsyncClient`` whose connection pool is bounded by ``max_connections``.
+    Requires the optional ``httpx`` dependency.
+
+    Example:
+        >>> async with AsyncPatsnapClient(client_id="...", client_secret="...") as client:
+        ...     results = await asyncio.gather(
+        ...         *(client.patents.search.by_number(pn=pn) for pn in numbers)
+        ...     )
+    """
+
+    def __init__(
+        self,
+        *,
+        client_id: str,
+        client_secret: str,
+        base_url: str = "https://connect.patsnap.com",
+        client: Optional["httpx.AsyncClient"] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        timeout_seconds: float = 30.0,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        tracer: Optional[Tracer] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce: bool = True,
+        json_codec: Optional[JsonCodec] = None,
+        response_mode: str = "model",
+        token_store: Optional[TokenStore] = None,
+    ) -> None:
+        if client is None:
+            import httpx
+
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                ),
+            )
+        self._auth = AsyncAuthClient(
+            client_id,
+            client_secret,
+            token_url=f"{base_url.rstrip('/')}/oauth/token",
+            client=client,
+            token_store=token_store,
+        )
+        self._http = AsyncHttpClient(
+            self._auth,
+            base_url=base_url,
+            client=client,
+            timeout_seconds=timeout_seconds,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            concurrency_limiter=concurrency_limiter,
+            tracer=tracer,
+            cache=cache,
+            coalesce=coalesce,
+            json_codec=json_codec,
+            response_mode=response_mode,
+        )
+
+        # Namespaces
+        self.analytics = AnalyticsNamespace(self._http)
+        self.patents = PatentsNamespace(self._http)
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+        await self._auth.aclose()
+
+    async def __aenter__(self) -> "AsyncPatsnapClient":
+        return self
 
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
 
 
+__all__ = ["PatsnapClient", "AsyncPatsnapClient"]
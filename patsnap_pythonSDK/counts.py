@@ -0,0 +1,156 @@
+"""Count matrices: ``query_count`` over a grid of terms and dimensions.
+
+Used by ``AnalyticsSearchResource.count_matrix``. Each cell of
+``terms x dim1 x dim2 ...`` becomes one query,
+``(term) AND <clause of dim1 value> AND ...``. Dimension values use the
+same clauses as the facet sweep (``PUBLICATION_YEAR`` becomes a ``PBD``
+range, ``AUTHORITY`` an ``AUTHORITY:(..)`` filter), or an explicit mapping
+of label to clause. Identical cell queries are counted once. With a
+response cache on the client (for instance ``SQLiteCacheBackend`` with a
+long TTL for ``/search/patent/query-search-count/v2``), a refreshed
+landscape only pays for cells whose queries changed.
+"""
+
+from __future__ import annotations
+
+import importlib
+import itertools
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple, Union
+
+from .facets import PARTITION_CLAUSES
+
+
+# Axis values given as plain values use PARTITION_CLAUSES; a mapping gives label -> clause
+DimValues = Union[Iterable[Any], Mapping[Any, str]]
+
+TERM_AXIS = "term"
+
+# query_text limit of query_count
+MAX_QUERY_LENGTH = 1500
+
+
+class CountMatrix:
+    """Patent counts over ``term x dims``, stored row-major.
+
+    Attributes:
+        axes: ``(name, labels)`` per axis, terms first
+        counts: Flat list of counts in row-major order
+        queries: Number of distinct queries the grid needed
+    """
+
+    def __init__(self, axes: List[Tuple[str, List[Any]]], counts: List[int], queries: int) -> None:
+        self.axes = axes
+        self.counts = counts
+        self.queries = queries
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return tuple(len(labels) for _, labels in self.axes)
+
+    @property
+    def names(self) -> List[str]:
+        return [name for name, _ in self.axes]
+
+    def get(self, *labels: Any) -> int:
+        """Count of one cell, addressed by one label per axis."""
+        if len(labels) != len(self.axes):
+            raise ValueError(f"Expected {len(self.axes)} labels ({', '.join(self.names)}); got {len(labels)}")
+        index = 0
+        for (name, axis_labels), label in zip(self.axes, labels):
+            try:
+                position = axis_labels.index(label)
+            except ValueError:
+                raise KeyError(f"{label!r} is not a {name} label") from None
+            index = index * len(axis_labels) + position
+        return self.counts[index]
+
+    def to_numpy(self) -> Any:
+        """The counts as an ``int64`` array of :attr:`shape` (requires numpy)."""
+        np = _require("numpy", "arrow")
+        return np.asarray(self.counts, dtype=np.int64).reshape(self.shape)
+
+    def to_pandas(self) -> Any:
+        """The counts as a ``pandas.Series`` with one MultiIndex level per axis (requires pandas).
+
+        ``.unstack()`` turns the last level into columns.
+        """
+        pd = _require("pandas", "pandas")
+        index = pd.MultiIndex.from_product([labels for _, labels in self.axes], names=self.names)
+        return pd.Series(self.counts, index=index, name="count", dtype="int64")
+
+    def to_lists(self) -> Any:
+        """The counts as nested lists, one level per axis."""
+        nested: Any = self.counts
+        for size in reversed(self.shape[1:]):
+            nested = [nested[start:start + size] for start in range(0, len(nested), size)]
+        return nested
+
+    def __repr__(self) -> str:
+        axes = " x ".join(f"{name}[{len(labels)}]" for name, labels in self.axes)
+        return f"CountMatrix({axes}, queries={self.queries})"
+
+
+def grid_axes(
+    terms: Union[Sequence[str], Mapping[Any, str]],
+    dims: Mapping[str, DimValues],
+) -> Tuple[List[Tuple[str, List[Any]]], List[List[str]]]:
+    """Axis labels and, per axis, the query fragment of each label."""
+    if not terms:
+        raise ValueError("terms must not be empty")
+    term_labels = list(terms)
+    term_queries = [terms[label] for label in term_labels] if isinstance(terms, Mapping) else term_labels
+    axes = [(TERM_AXIS, term_labels)]
+    fragments = [[f"({query})" for query in term_queries]]
+    for name, values in dims.items():
+        if isinstance(values, Mapping):
+            labels, clauses = list(values), list(values.values())
+        else:
+            clause = PARTITION_CLAUSES.get(name)
+            if clause is None:
+                raise ValueError(
+                    f"No query clause for dimension {name!r}; pass its values as a mapping of label -> query clause"
+                )
+            labels = list(values)
+            clauses = [clause(str(value)) for value in labels]
+        if not labels:
+            raise ValueError(f"Dimension {name!r} has no values")
+        axes.append((name, labels))
+        fragments.append(clauses)
+    return axes, fragments
+
+
+def cell_queries(fragments: List[List[str]]) -> List[str]:
+    """Row-major ``query_text`` of every cell.
+
+    Raises:
+        ValueError: If a cell query is longer than query_count accepts
+    """
+    queries = [" AND ".join(parts) for parts in itertools.product(*fragments)]
+    longest = max(queries, key=len)
+    if len(longest) > MAX_QUERY_LENGTH:
+        raise ValueError(f"Cell query is {len(longest)} characters; query_count accepts {MAX_QUERY_LENGTH}: {longest[:80]}...")
+    return queries
+
+
+def count_of(result: Any) -> int:
+    """total_search_result_count of a query_count result in any response mode."""
+    if isinstance(result, dict):
+        return int(result.get("data", result)["total_search_result_count"])
+    return int(result.total_search_result_count)
+
+
+def assemble(axes: List[Tuple[str, List[Any]]], queries: List[str], counts: Dict[str, int]) -> CountMatrix:
+    """The matrix for row-major cell ``queries``, given the count of each distinct query."""
+    return CountMatrix(axes, [counts[query] for query in queries], len(counts))
+
+
+def _require(module: str, extra: str) -> Any:
+    try:
+        return importlib.import_module(module)
+    except ImportError as exc:
+        raise ImportError(
+            f"This conversion requires {module}. Install it with: pip install 'patsnap-pythonSDK[{extra}]'"
+        ) from exc
+
+
+__all__ = ["CountMatrix", "TERM_AXIS", "grid_axes", "cell_queries", "count_of", "assemble"]
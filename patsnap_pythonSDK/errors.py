@@ -22,11 +22,14 @@ class ApiError(Exception):
         status_code: Optional[int] = None,
         error_code: Optional[int] = None,
         response_text: Optional[str] = None,
+        retry_after: Optional[float] = None,
     ):
         super().__init__(message)
         self.status_code = status_code
         self.error_code = error_code
         self.response_text = response_text
+        # Seconds the server asked us to wait (Retry-After), if any
+        self.retry_after = retry_after
 
     def __str__(self) -> str:  # pragma: no cover - formatting helper
         parts = [super().__str__()]
@@ -37,3 +40,9 @@ class ApiError(Exception):
         return " | ".join(parts)
 
 
+class CircuitOpenError(ApiError):
+    """Raised without contacting the API while the circuit breaker is open.
+
+    The breaker opens after repeated connection failures or 5xx responses and
+    lets a trial request through once its reset timeout has elapsed.
+    """
@@ -0,0 +1,208 @@
+"""Columnar export of search results to Arrow, Parquet and NumPy.
+
+Columns are typed from the row model (``PatentBaseV2Response``,
+``SemanticResult`` or ``PatentMessage``) and filled straight from the row
+data: dict rows (the ``dict`` response mode) and the unread rows of a lazy
+page are converted without building a model per row. ``apdt``/``pbdt`` are
+``int32`` ``YYYYMMDD`` values and ``relevancy`` (``"87%"``) becomes a float
+percentage.
+
+pyarrow and numpy are optional; install them with
+``pip install 'patsnap-pythonSDK[arrow]'``.
+"""
+
+from __future__ import annotations
+
+import importlib
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel
+
+from .utils.records import unwrap_optional
+from .utils.responsemode import LazyModelList
+
+
+STRING = "string"
+INT32 = "int32"
+INT64 = "int64"
+FLOAT64 = "float64"
+BOOL = "bool"
+
+# Columns whose type is not what the model annotation says
+_COLUMN_OVERRIDES = {"apdt": INT32, "pbdt": INT32, "relevancy": FLOAT64}
+
+_SCALAR_KINDS = {str: STRING, int: INT64, float: FLOAT64, bool: BOOL}
+
+
+def column_types(model: Type[BaseModel]) -> Dict[str, Tuple[str, bool]]:
+    """Map each scalar field of ``model`` to ``(kind, nullable)``; other fields are skipped."""
+    columns: Dict[str, Tuple[str, bool]] = {}
+    for name, field in model.model_fields.items():
+        annotation, nullable = unwrap_optional(field.annotation)
+        kind = _COLUMN_OVERRIDES.get(name) or _SCALAR_KINDS.get(annotation)
+        if kind is not None:
+            columns[name] = (kind, nullable)
+    return columns
+
+
+def parse_relevancy(value: Any) -> Optional[float]:
+    """``"87%"`` -> ``87.0``; numbers pass through and blanks become None."""
+    if value is None or isinstance(value, (int, float)):
+        return None if value is None else float(value)
+    text = str(value).strip().rstrip("%").strip()
+    return float(text) if text else None
+
+
+def to_columns(model: Type[BaseModel], rows: Iterable[Any]) -> Dict[str, List[Any]]:
+    """Build one typed Python list per column of ``model`` from model or dict rows."""
+    kinds = column_types(model)
+    columns: Dict[str, List[Any]] = {name: [] for name in kinds}
+    converters = [(columns[name], name, _converter(name, kind)) for name, (kind, _) in kinds.items()]
+    for row in _raw_rows(rows):
+        if isinstance(row, dict):
+            for values, name, convert in converters:
+                values.append(convert(row.get(name)))
+        else:
+            for values, name, convert in converters:
+                values.append(convert(getattr(row, name, None)))
+    return columns
+
+
+def arrow_schema(model: Type[BaseModel]) -> Any:
+    """The ``pyarrow.Schema`` of ``model``'s columns."""
+    pa = _require("pyarrow")
+    arrow_types = {STRING: pa.string(), INT32: pa.int32(), INT64: pa.int64(), FLOAT64: pa.float64(), BOOL: pa.bool_()}
+    return pa.schema(
+        [pa.field(name, arrow_types[kind], nullable=nullable) for name, (kind, nullable) in column_types(model).items()]
+    )
+
+
+def to_arrow(model: Type[BaseModel], rows: Iterable[Any]) -> Any:
+    """Convert rows to a ``pyarrow.Table`` with :func:`arrow_schema` columns."""
+    pa = _require("pyarrow")
+    return pa.Table.from_pydict(to_columns(model, rows), schema=arrow_schema(model))
+
+
+def to_records(model: Type[BaseModel], rows: Iterable[Any]) -> Any:
+    """Convert rows to a ``numpy.recarray``.
+
+    Strings are object columns. Integer columns containing nulls fall back to
+    ``float64`` with NaN, as pandas does.
+    """
+    np = _require("numpy")
+    kinds = column_types(model)
+    arrays = []
+    for name, values in to_columns(model, rows).items():
+        kind = kinds[name][0]
+        if kind == STRING:
+            arrays.append(np.array(values, dtype=object))
+        elif None in values:
+            arrays.append(np.array([np.nan if v is None else v for v in values], dtype=np.float64))
+        else:
+            arrays.append(np.array(values, dtype=kind))
+    return np.rec.fromarrays(arrays, names=list(kinds))
+
+
+class ParquetWriter:
+    """Stream result rows into a Parquet file, one row group per ``batch_size`` rows.
+
+    Only one batch is held in memory, so it can consume the ``iter_by_*``
+    iterators for result sets of any size.
+
+    Example:
+        >>> with ParquetWriter("portfolio.parquet", PatentBaseV2Response) as writer:
+        ...     writer.write(client.patents.search.iter_by_current_assignee(assignee="Apple, Inc."))
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        model: Type[BaseModel],
+        *,
+        batch_size: int = 10_000,
+        compression: str = "zstd",
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        pq = _require("pyarrow.parquet")
+        self._model = model
+        self._schema = arrow_schema(model)
+        self._batch_size = batch_size
+        self._writer = pq.ParquetWriter(str(path), self._schema, compression=compression)
+        self.rows_written = 0
+
+    def write(self, rows: Iterable[Any]) -> int:
+        """Write ``rows``; returns how many were written."""
+        written = 0
+        batch: List[Any] = []
+        for row in _raw_rows(rows):
+            batch.append(row)
+            if len(batch) >= self._batch_size:
+                written += self._flush(batch)
+                batch = []
+        if batch:
+            written += self._flush(batch)
+        return written
+
+    def _flush(self, batch: List[Any]) -> int:
+        pa = _require("pyarrow")
+        self._writer.write_table(pa.Table.from_pydict(to_columns(self._model, batch), schema=self._schema))
+        self.rows_written += len(batch)
+        return len(batch)
+
+    def close(self) -> None:
+        self._writer.close()
+
+    def __enter__(self) -> "ParquetWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def write_parquet(
+    rows: Iterable[Any],
+    path: Union[str, Path],
+    model: Type[BaseModel],
+    *,
+    batch_size: int = 10_000,
+    compression: str = "zstd",
+) -> int:
+    """Write ``rows`` to a new Parquet file; returns the number of rows written."""
+    with ParquetWriter(path, model, batch_size=batch_size, compression=compression) as writer:
+        return writer.write(rows)
+
+
+def _raw_rows(rows: Iterable[Any]) -> Iterator[Any]:
+    # Unread rows of a lazy page are converted from their dicts, unvalidated
+    return rows.iter_raw() if isinstance(rows, LazyModelList) else iter(rows)
+
+
+def _converter(name: str, kind: str) -> Callable[[Any], Any]:
+    if name == "relevancy":
+        return parse_relevancy
+    cast: Callable[[Any], Any] = {STRING: str, INT32: int, INT64: int, FLOAT64: float, BOOL: bool}[kind]
+    return lambda value: None if value is None else cast(value)
+
+
+def _require(module: str) -> Any:
+    try:
+        return importlib.import_module(module)
+    except ImportError as exc:
+        raise ImportError(
+            f"Columnar export requires {module.split('.')[0]}. "
+            "Install it with: pip install 'patsnap-pythonSDK[arrow]'"
+        ) from exc
+
+
+__all__ = [
+    "column_types",
+    "parse_relevancy",
+    "to_columns",
+    "arrow_schema",
+    "to_arrow",
+    "to_records",
+    "ParquetWriter",
+    "write_parquet",
+]
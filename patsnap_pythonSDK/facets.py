@@ -0,0 +1,210 @@
+"""Complete facet distributions from ``query_filter``, past its Top-200 cap.
+
+``query_filter`` returns at most 100 buckets per call and the top 200 per
+field. The sweep reads both pages of every requested field. Up to five
+fields share each call, since the endpoint accepts them comma-separated.
+When a field fills all 200 buckets its long tail is cut off, so the query
+is split by a partitioning dimension and each slice is swept again:
+``(query) AND PBD:[20200101 TO 20201231]`` for each publication year, then
+by authority, and so on. Every patent falls in exactly one slice, so the
+slices' bucket counts add up to the full distribution.
+
+The sweep runs level by level. All calls of a level are issued at once on
+a bounded pool. Pages already fetched in the sweep are reused. A field is
+marked incomplete when a slice still fills 200 buckets after every
+dimension has been used, or when the split query would exceed the
+800-character limit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Generator, Iterable, List, Mapping, Sequence, Tuple
+
+from .utils.concurrency import map_ordered
+
+
+# query_filter caps
+FACET_PAGE_SIZE = 100
+FACET_WINDOW_LIMIT = 200
+MAX_FIELDS_PER_CALL = 5
+MAX_FILTER_QUERY_LENGTH = 800
+
+# Query clause selecting one bucket of a partitioning dimension
+PARTITION_CLAUSES: Dict[str, Callable[[str], str]] = {
+    "PUBLICATION_YEAR": lambda year: f"PBD:[{year}0101 TO {year}1231]",
+    "APPLICATION_YEAR": lambda year: f"APD:[{year}0101 TO {year}1231]",
+    "AUTHORITY": lambda authority: f"AUTHORITY:({authority})",
+}
+
+DEFAULT_PARTITIONS = ("PUBLICATION_YEAR", "AUTHORITY")
+
+# (query, comma-separated fields, offset, limit)
+FacetRequest = Tuple[str, str, int, int]
+Bucket = Tuple[str, int]
+
+
+@dataclass
+class FacetTable:
+    """Bucket counts of one field, largest first."""
+
+    field: str
+    counts: Dict[str, int] = field(default_factory=dict)
+    # False if part of the long tail could not be reached
+    complete: bool = True
+    # Number of query slices the counts were summed from
+    slices: int = 0
+
+    def rows(self) -> List[Bucket]:
+        return sorted(self.counts.items(), key=lambda item: (-item[1], item[0]))
+
+    def top(self, n: int) -> List[Bucket]:
+        return self.rows()[:n]
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+
+def bucket_key(field_code: str) -> str:
+    """Key of ``field_code``'s buckets in a query_filter response, e.g. ``ASSIGNEE`` -> ``assignee``."""
+    return field_code.lower()
+
+
+def buckets_of(rows: Sequence[Mapping[str, Any]], field_code: str, *, only_field: bool = False) -> List[Bucket]:
+    """``(name, count)`` buckets of ``field_code`` in query_filter's ``data`` rows."""
+    key = bucket_key(field_code)
+    for row in rows:
+        items = row.get(key)
+        if items is None and only_field:
+            # A single-field response under an unexpected key
+            lists = [value for value in row.values() if isinstance(value, list)]
+            items = lists[0] if len(lists) == 1 else None
+        if items is not None:
+            return [(str(item["name"]), int(item["count"])) for item in items]
+    return []
+
+
+def plan_sweep(
+    query: str,
+    fields: Sequence[str],
+    *,
+    partitions: Sequence[str] = DEFAULT_PARTITIONS,
+    partition_clauses: Mapping[str, Callable[[str], str]] = PARTITION_CLAUSES,
+) -> Generator[List[FacetRequest], List[Sequence[Mapping[str, Any]]], Dict[str, FacetTable]]:
+    """The sweep as a generator: yields batches of calls, is sent their ``data`` rows, returns the tables.
+
+    Drive it with :func:`run_sweep` or :func:`arun_sweep`.
+    """
+    for dimension in partitions:
+        if dimension not in partition_clauses:
+            raise ValueError(f"No query clause for partition dimension {dimension!r}; add it to partition_clauses")
+    tables = {code: FacetTable(code) for code in fields}
+    pages: Dict[Tuple[str, str, int], List[Bucket]] = {}
+
+    def fetch(wanted: Iterable[Tuple[str, str]]) -> Generator[List[FacetRequest], Any, None]:
+        """Fetch both pages of each (query, field) not already fetched, five fields per call."""
+        by_query: Dict[str, List[str]] = {}
+        for query_text, code in wanted:
+            if (query_text, code, 0) not in pages and code not in by_query.setdefault(query_text, []):
+                by_query[query_text].append(code)
+        requests = [
+            (query_text, ",".join(codes[start:start + MAX_FIELDS_PER_CALL]), offset, FACET_PAGE_SIZE)
+            for query_text, codes in by_query.items()
+            for start in range(0, len(codes), MAX_FIELDS_PER_CALL)
+            for offset in range(0, FACET_WINDOW_LIMIT, FACET_PAGE_SIZE)
+        ]
+        if not requests:
+            return
+        responses = yield requests
+        for (query_text, codes, offset, _), rows in zip(requests, responses):
+            split = codes.split(",")
+            for code in split:
+                pages[(query_text, code, offset)] = buckets_of(rows, code, only_field=len(split) == 1)
+
+    def buckets(query_text: str, code: str) -> List[Bucket]:
+        return [bucket for offset in range(0, FACET_WINDOW_LIMIT, FACET_PAGE_SIZE) for bucket in pages[(query_text, code, offset)]]
+
+    def add(code: str, found: List[Bucket]) -> None:
+        table = tables[code]
+        table.slices += 1
+        table.complete = table.complete and len(found) < FACET_WINDOW_LIMIT
+        for name, count in found:
+            table.counts[name] = table.counts.get(name, 0) + count
+
+    # (field, query slice, partition dimensions left)
+    jobs = [(code, query, tuple(dim for dim in partitions if dim != code)) for code in fields]
+    while jobs:
+        yield from fetch((query_text, code) for code, query_text, _ in jobs)
+        capped = []
+        for code, query_text, dims in jobs:
+            found = buckets(query_text, code)
+            if len(found) >= FACET_WINDOW_LIMIT and dims:
+                capped.append((code, query_text, dims))
+            else:
+                add(code, found)
+
+        # Split each capped slice by its next dimension
+        yield from fetch((query_text, dims[0]) for _, query_text, dims in capped)
+        jobs = []
+        for code, query_text, dims in capped:
+            values = buckets(query_text, dims[0])
+            slices = [f"({query_text}) AND {partition_clauses[dims[0]](name)}" for name, _ in values]
+            if len(values) < FACET_WINDOW_LIMIT and all(len(text) <= MAX_FILTER_QUERY_LENGTH for text in slices):
+                jobs.extend((code, text, dims[1:]) for text in slices)
+            elif dims[1:]:
+                # This dimension cannot be enumerated in full; try the next one
+                jobs.append((code, query_text, dims[1:]))
+            else:
+                add(code, buckets(query_text, code))
+    return tables
+
+
+def run_sweep(
+    sweep: Generator[List[FacetRequest], List[Any], Dict[str, FacetTable]],
+    fetch: Callable[[FacetRequest], Sequence[Mapping[str, Any]]],
+    *,
+    concurrency: int,
+) -> Dict[str, FacetTable]:
+    """Drive :func:`plan_sweep`, issuing each batch of calls on a thread pool."""
+    try:
+        requests = next(sweep)
+        while True:
+            requests = sweep.send(map_ordered(fetch, requests, concurrency=concurrency))
+    except StopIteration as done:
+        return done.value
+
+
+async def arun_sweep(
+    sweep: Generator[List[FacetRequest], List[Any], Dict[str, FacetTable]],
+    fetch: Callable[[FacetRequest], Awaitable[Sequence[Mapping[str, Any]]]],
+    *,
+    concurrency: int,
+) -> Dict[str, FacetTable]:
+    """Async equivalent of :func:`run_sweep`."""
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited(request: FacetRequest) -> Sequence[Mapping[str, Any]]:
+        async with semaphore:
+            return await fetch(request)
+
+    try:
+        requests = next(sweep)
+        while True:
+            requests = sweep.send(list(await asyncio.gather(*(limited(request) for request in requests))))
+    except StopIteration as done:
+        return done.value
+
+
+__all__ = [
+    "FacetTable",
+    "PARTITION_CLAUSES",
+    "DEFAULT_PARTITIONS",
+    "bucket_key",
+    "buckets_of",
+    "plan_sweep",
+    "run_sweep",
+    "arun_sweep",
+]
@@ -0,0 +1,96 @@
+"""Fusing the results of several image searches into one ranking.
+
+Used by ``PatentsSearchResource.image_search_fused``. Each query's
+``PatentMessage`` list is walked once, rows are grouped by ``patent_id``,
+and each patent gets a single fused score from its per-query scores:
+
+- ``max``: best score in any query
+- ``mean``: average over all queries, with queries that missed the patent counting as 0
+- ``sum``: total score, which rewards patents that several queries found
+- ``rrf``: reciprocal-rank fusion, ``sum(1 / (rrf_k + rank))``; it uses
+  ranks only, so it also works when results are not sorted by ``SCORE``
+
+A callable taking the per-query scores (None where a query missed the
+patent) can be passed instead of a name.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+
+ScoreAggregate = Callable[[List[Optional[float]]], float]
+
+AGGREGATES = ("max", "mean", "sum", "rrf")
+
+
+def _max(scores: List[Optional[float]]) -> float:
+    return max(score or 0.0 for score in scores)
+
+
+def _mean(scores: List[Optional[float]]) -> float:
+    return sum(score or 0.0 for score in scores) / len(scores)
+
+
+def _sum(scores: List[Optional[float]]) -> float:
+    return sum(score or 0.0 for score in scores)
+
+
+_SCORE_AGGREGATES: Dict[str, ScoreAggregate] = {"max": _max, "mean": _mean, "sum": _sum}
+
+
+def check_aggregate(aggregate: Union[str, ScoreAggregate]) -> None:
+    if not callable(aggregate) and aggregate not in AGGREGATES:
+        raise ValueError(f"aggregate must be one of {', '.join(AGGREGATES)} or a callable; got {aggregate!r}")
+
+
+def fuse_results(
+    result_lists: Sequence[Sequence[Any]],
+    *,
+    aggregate: Union[str, ScoreAggregate] = "max",
+    rrf_k: int = 60,
+) -> List[Any]:
+    """Merge per-query ``PatentMessage`` lists into one list ranked by fused score.
+
+    Each patent appears once, as the row from the query that scored it best,
+    with ``score`` replaced by the fused score. Ties keep the order of the
+    patent's best rank in any query.
+
+    Args:
+        result_lists: One ranked list of rows per query
+        aggregate: ``"max"``, ``"mean"``, ``"sum"``, ``"rrf"`` or a callable
+        rrf_k: Rank offset for ``"rrf"``; larger values flatten the rank curve
+    """
+    check_aggregate(aggregate)
+    queries = len(result_lists)
+    # patent_id -> [per-query scores, best row, best rank]
+    fused: Dict[str, List[Any]] = {}
+    for query, rows in enumerate(result_lists):
+        for rank, row in enumerate(rows):
+            entry = fused.get(row.patent_id)
+            if entry is None:
+                entry = fused[row.patent_id] = [[None] * queries, row, rank]
+            scores = entry[0]
+            # A query lists a patent once; if it repeats, its first (best) position counts
+            if scores[query] is None:
+                scores[query] = 1.0 / (rrf_k + rank + 1) if aggregate == "rrf" else row.score
+            if (row.score or 0.0) > (entry[1].score or 0.0):
+                entry[1] = row
+            entry[2] = min(entry[2], rank)
+
+    combine = _combiner(aggregate)
+    ranked = sorted(
+        ((combine(scores), best_rank, order, best) for order, (scores, best, best_rank) in enumerate(fused.values())),
+        key=lambda item: (-item[0], item[1], item[2]),
+    )
+    return [best.model_copy(update={"score": score}) for score, _, _, best in ranked]
+
+
+def _combiner(aggregate: Union[str, ScoreAggregate]) -> ScoreAggregate:
+    if callable(aggregate):
+        return aggregate
+    # Reciprocal ranks are summed
+    return _sum if aggregate == "rrf" else _SCORE_AGGREGATES[aggregate]
+
+
+__all__ = ["AGGREGATES", "ScoreAggregate", "check_aggregate", "fuse_results"]
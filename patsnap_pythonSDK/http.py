@@ -1,18 +1,76 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Mapping, Optional
+import asyncio
+import io
+import time
+import uuid
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import requests
+import urllib3
+from pydantic import BaseModel, ValidationError
 
-from .auth import AuthClient
+from .auth import AsyncAuthClient, AuthClient, _require_httpx
 from .errors import ApiError
+from .utils.adaptive import AdaptiveConcurrencyLimiter
+from .utils.backoff import RetryController, RetryPolicy, parse_retry_after
+from .utils.ratelimit import RateLimiter
+from .utils.cache import Payload, ResponseCache, check_cache_mode, request_key
+from .utils.jsoncodec import JsonCodec, default_codec
+from .utils.responsemode import DICT, MODEL, check_response_mode, current_response_mode, response_mode
+from .utils.singleflight import AsyncSingleFlight, SingleFlight
+from .utils.tracing import NOOP_TRACER, Tracer
+
+try:  # Optional dependency, only needed by the async client
+    import httpx
+except ImportError:  # pragma: no cover - exercised when the extra is not installed
+    httpx = None
+
+if TYPE_CHECKING:  # pragma: no cover
+    import httpx as _httpx
 
 
 BASE_URL = "https://connect.patsnap.com"
 
+T = TypeVar("T")
+
 
 class HttpClient:
-    """Lightweight HTTP client that injects auth and apikey automatically."""
+    """Lightweight HTTP client that injects auth and apikey automatically.
+
+    Every call runs through a :class:`~patsnap_pythonSDK.utils.backoff.RetryController`:
+    transient failures (429/5xx, connection errors) are retried with jittered
+    exponential backoff, and a circuit breaker fails fast while the upstream is down.
+    An optional :class:`~patsnap_pythonSDK.utils.ratelimit.RateLimiter` paces
+    every attempt per endpoint path, an optional
+    :class:`~patsnap_pythonSDK.utils.adaptive.AdaptiveConcurrencyLimiter`
+    bounds the attempts in flight per endpoint path, an optional
+    :class:`~patsnap_pythonSDK.utils.tracing.Tracer` records per-phase timings,
+    and an optional :class:`~patsnap_pythonSDK.utils.cache.ResponseCache`
+    answers repeated identical calls. Identical JSON calls already in flight
+    are coalesced into one upstream request unless ``coalesce=False``.
+    Responses are decoded with ``json_codec`` (orjson when installed), and
+    parsers that declare a ``response_model`` validate straight from the raw
+    body with ``model_validate_json``. ``response_mode`` selects whether calls
+    return models, plain payload dicts, lazily validated models, or models
+    holding compact row records; see
+    :mod:`patsnap_pythonSDK.utils.responsemode`.
+    """
 
     def __init__(
         self,
@@ -20,12 +78,30 @@ class HttpClient:
         *,
         base_url: str = BASE_URL,
         session: Optional[requests.Session] = None,
-        timeout_seconds: float = 30.0,
+        timeout_seconds: Union[float, Tuple[float, float]] = 30.0,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        tracer: Optional[Tracer] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce: bool = True,
+        json_codec: Optional[JsonCodec] = None,
+        response_mode: str = MODEL,
     ) -> None:
         self._auth = auth
         self._base_url = base_url.rstrip("/")
         self._session = session or requests.Session()
         self._timeout = timeout_seconds
+        self._retry = RetryController(policy=retry_policy or RetryPolicy())
+        self._rate_limiter = rate_limiter
+        self._concurrency = concurrency_limiter
+        self._tracer = tracer or NOOP_TRACER
+        self._cache = cache
+        self._inflight: Optional[SingleFlight] = SingleFlight() if coalesce else None
+        self._codec = json_codec or default_codec()
+        self._response_mode = check_response_mode(response_mode)
+        # Shared by every request; never mutated
+        self._params: Mapping[str, Any] = MappingProxyType({"apikey": auth.client_id})
 
     def close(self) -> None:
         try:
@@ -33,6 +109,15 @@ class HttpClient:
         except Exception:
             pass
 
+    def fan_out(self, concurrency: int) -> int:
+        """Worker count for a bulk helper asked to run ``concurrency`` calls at once.
+
+        With a concurrency limiter the helper runs as many workers as the
+        limiter may ever allow, and the limiter decides how many requests are
+        actually in flight.
+        """
+        return self._concurrency.max_limit if self._concurrency is not None else concurrency
+
     def post_json(
         self,
         path: str,
@@ -40,52 +125,38 @@ class HttpClient:
         json_body: Optional[Dict[str, Any]] = None,
         headers: Optional[Mapping[str, str]] = None,
         params: Optional[Mapping[str, Any]] = None,
-    ) -> Dict[str, Any]:
+        raw: bool = False,
+    ) -> Payload:
+        """Post a JSON body and return the decoded payload.
+
+        With ``raw=True`` the payload is returned as the undecoded response
+        body (``bytes``) once it has been checked for API errors.
+        """
         url = f"{self._base_url}/{path.lstrip('/')}"
-        merged_headers: Dict[str, str] = {"Content-Type": "application/json"}
-        merged_headers.update(self._auth.get_authorization_header())
-        if headers:
-            merged_headers.update(headers)
-
-        merged_params: Dict[str, Any] = {"apikey": self._auth.client_id}
-        if params:
-            merged_params.update(params)
-
-        response = self._session.post(
-            url,
-            headers=merged_headers,
-            params=merged_params,
-            json=json_body or {},
-            timeout=self._timeout,
-        )
+        merged_params = _merge(self._params, params)
 
-        if response.status_code >= 400:
-            raise ApiError(
-                f"HTTP {response.status_code} calling {url}",
-                status_code=response.status_code,
-                response_text=response.text,
-            )
+        with self._tracer.trace(path) as trace:
 
-        try:
-            payload: Dict[str, Any] = response.json()
-        except ValueError:
-            raise ApiError("Response was not valid JSON", response_text=response.text)
-
-        # Patsnap responses include status, error_code; surface errors consistently
-        if not isinstance(payload, dict):
-            raise ApiError("Response JSON was not an object", response_text=str(payload))
-
-        status = payload.get("status")
-        error_code = payload.get("error_code")
-        if status is False or (isinstance(error_code, int) and error_code != 0):
-            raise ApiError(
-                payload.get("error_msg") or "API returned an error",
-                status_code=response.status_code,
-                error_code=error_code if isinstance(error_code, int) else None,
-                response_text=response.text,
-            )
+            def send() -> Payload:
+                # Looked up per attempt so a retry picks up a refreshed token;
+                # Content-Type comes from json= and the rest from the session
+                with trace.phase("auth"):
+                    merged_headers = _merge(self._auth.get_authorization_header(), headers)
 
-        return payload
+                trace.encode_body(json_body or {})
+                with trace.phase("network"):
+                    response = self._session.post(
+                        url,
+                        headers=merged_headers,
+                        params=merged_params,
+                        json=json_body or {},
+                        timeout=self._timeout,
+                    )
+                trace.record_response(response)
+                with trace.phase("decode"):
+                    return _parse_json_response(url, response, self._codec, raw=raw)
+
+            return self._with_retries(path, send, trace)
 
     def post(
         self,
@@ -113,47 +184,609 @@ class HttpClient:
         if files:
             # Handle multipart file upload
             url = f"{self._base_url}/{path.lstrip('/')}"
-            merged_headers: Dict[str, str] = {}
-            merged_headers.update(self._auth.get_authorization_header())
-            if headers:
-                merged_headers.update(headers)
-
-            merged_params: Dict[str, Any] = {"apikey": self._auth.client_id}
-            if params:
-                merged_params.update(params)
-
-            response = self._session.post(
-                url,
-                files=files,
-                headers=merged_headers,
-                params=merged_params,
-                timeout=self._timeout,
-            )
-
-            # Parse and validate response
-            try:
-                payload = response.json()
-            except ValueError as e:
-                raise ApiError(f"Invalid JSON response: {e}", status_code=response.status_code, response_text=response.text)
-
-            # Check for API errors
-            status = payload.get("status")
-            error_code = payload.get("error_code")
-            if status is False or (isinstance(error_code, int) and error_code != 0):
-                raise ApiError(
-                    payload.get("error_msg") or "API returned an error",
-                    status_code=response.status_code,
-                    error_code=error_code if isinstance(error_code, int) else None,
-                    response_text=response.text,
-                )
+            merged_params = _merge(self._params, params)
+
+            with self._tracer.trace(path) as trace:
+
+                def send() -> Dict[str, Any]:
+                    _rewind(files)
+                    with trace.phase("auth"):
+                        merged_headers = _merge(self._auth.get_authorization_header(), headers)
 
-            return payload
+                    # requests would build the whole multipart body in memory
+                    # from files=; stream it from the files instead
+                    body = _MultipartStream.of(files)
+                    with trace.phase("network"):
+                        if body is None:
+                            response = self._session.post(
+                                url,
+                                files=files,
+                                headers=merged_headers,
+                                params=merged_params,
+                                timeout=self._timeout,
+                            )
+                        else:
+                            response = self._session.post(
+                                url,
+                                data=body,
+                                headers=_merge(merged_headers, {"Content-Type": body.content_type}),
+                                params=merged_params,
+                                timeout=self._timeout,
+                            )
+                    trace.record_response(response)
+                    with trace.phase("decode"):
+                        return _parse_multipart_response(response, self._codec)
+
+                return self._with_retries(path, send, trace)
         else:
             # Delegate to post_json for regular JSON requests
             return self.post_json(path, json_body=json, headers=headers, params=params)
 
+    def call(
+        self,
+        path: str,
+        *,
+        parse: Callable[[Dict[str, Any]], T],
+        json: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None,
+        cache: Optional[str] = None,
+    ) -> T:
+        """Post to ``path`` and hand the payload to ``parse``.
+
+        Resources go through this method rather than :meth:`post` so that the
+        same resource code can run on top of :class:`AsyncHttpClient`, whose
+        ``call`` returns an awaitable instead. JSON calls are answered from the
+        response cache when one is configured, and identical calls already in
+        flight share one upstream request; each caller still parses its own
+        response model. When ``parse`` has a ``response_model`` the raw body
+        is validated directly, skipping the intermediate dict.
+
+        ``cache`` is ``"bypass"`` or ``"refresh"`` to skip or re-fetch the
+        cached response for this call alone, as :meth:`ResponseCache.bypass`
+        and :meth:`ResponseCache.refresh` do for a block of calls.
+
+        In ``dict`` response mode the decoded payload is returned without
+        calling ``parse``; it may be shared with the cache and with coalesced
+        callers, so treat it as read-only.
+        """
+        if cache is not None:
+            check_cache_mode(cache)
+        with self._tracer.trace(path) as trace:
+            key = payload = None
+            mode = current_response_mode(self._response_mode)
+            # Only model mode can validate a raw body in one step
+            raw = mode == MODEL and _response_model(parse) is not None
+            if self._cache is not None and not files:
+                key, payload = self._cache.lookup(path, json, cache)
+            if payload is not None:
+                trace.cache_hit = True
+            else:
+
+                def fetch() -> Payload:
+                    if files:
+                        fetched = self.post(path, json=json, files=files)
+                    else:
+                        fetched = self.post_json(path, json_body=json, raw=raw)
+                    if key is not None:
+                        self._cache.store(path, key, fetched)
+                    return fetched
+
+                if self._inflight is not None and not files:
+                    payload = self._inflight.do(request_key(path, json), fetch)
+                else:
+                    payload = fetch()
+            with trace.phase("parse"):
+                result = _parse_payload(payload, parse, self._codec, mode)
+            trace.record_result(result)
+            return result
+
+    def _with_retries(self, path: str, send: Callable[[], Payload], trace: Any) -> Payload:
+        retry = self._retry
+        retry.begin(path)
+        attempt = 0
+        while True:
+            retry.before_attempt()
+            if self._rate_limiter is not None:
+                wait = self._rate_limiter.reserve(path)
+                if wait > 0:
+                    time.sleep(wait)
+            trace.retries = attempt
+            try:
+                payload = self._send_limited(path, send)
+            except ApiError as exc:
+                delay = retry.retry_delay(
+                    path,
+                    attempt,
+                    status_code=exc.status_code,
+                    error_code=exc.error_code,
+                    retry_after=exc.retry_after,
+                )
+                if delay is None:
+                    raise
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                delay = retry.retry_delay(
+                    path,
+                    attempt,
+                    transport_error=True,
+                    request_sent=not _never_sent(exc),
+                )
+                if delay is None:
+                    raise
+            except BaseException:
+                retry.abandon()
+                raise
+            else:
+                retry.record_success()
+                return payload
+            time.sleep(delay)
+            attempt += 1
+
+    def _send_limited(self, path: str, send: Callable[[], Payload]) -> Payload:
+        """Run one attempt in a slot of the concurrency limiter, reporting how it went."""
+        limiter = self._concurrency
+        if limiter is None:
+            return send()
+        limiter.acquire(path)
+        started = time.perf_counter()
+        try:
+            payload = send()
+        except ApiError as exc:
+            limiter.release(path, overloaded=limiter.is_overload(exc.status_code, exc.error_code))
+            raise
+        except requests.Timeout:
+            limiter.release(path, overloaded=True)
+            raise
+        except BaseException:
+            limiter.release(path)
+            raise
+        limiter.release(path, time.perf_counter() - started)
+        return payload
+
+
+class AsyncHttpClient:
+    """Asyncio HTTP client backed by a pooled ``httpx.AsyncClient``.
+
+    Mirrors :class:`HttpClient` so the existing resources can run unchanged;
+    every method is a coroutine. Requires the optional ``httpx`` dependency.
+    """
+
+    def __init__(
+        self,
+        auth: AsyncAuthClient,
+        *,
+        base_url: str = BASE_URL,
+        client: Optional["_httpx.AsyncClient"] = None,
+        timeout_seconds: float = 30.0,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        tracer: Optional[Tracer] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce: bool = True,
+        json_codec: Optional[JsonCodec] = None,
+        response_mode: str = MODEL,
+    ) -> None:
+        _require_httpx()
+        self._auth = auth
+        self._base_url = base_url.rstrip("/")
+        self._client = client or httpx.AsyncClient()
+        self._timeout = timeout_seconds
+        self._retry = RetryController(policy=retry_policy or RetryPolicy())
+        self._rate_limiter = rate_limiter
+        self._concurrency = concurrency_limiter
+        self._tracer = tracer or NOOP_TRACER
+        self._cache = cache
+        self._inflight: Optional[AsyncSingleFlight] = AsyncSingleFlight() if coalesce else None
+        self._codec = json_codec or default_codec()
+        self._response_mode = check_response_mode(response_mode)
+        self._params: Mapping[str, Any] = MappingProxyType({"apikey": auth.client_id})
+
+    async def aclose(self) -> None:
+        try:
+            await self._client.aclose()
+        except Exception:
+            pass
+
+    def fan_out(self, concurrency: int) -> int:
+        """See :meth:`HttpClient.fan_out`."""
+        return self._concurrency.max_limit if self._concurrency is not None else concurrency
+
+    async def post_json(
+        self,
+        path: str,
+        *,
+        json_body: Optional[Dict[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        params: Optional[Mapping[str, Any]] = None,
+        raw: bool = False,
+    ) -> Payload:
+        url = f"{self._base_url}/{path.lstrip('/')}"
+        merged_params = _merge(self._params, params)
+
+        with self._tracer.trace(path) as trace:
+
+            async def send() -> Payload:
+                with trace.phase("auth"):
+                    merged_headers = _merge(await self._auth.get_authorization_header(), headers)
+
+                trace.encode_body(json_body or {})
+                with trace.phase("network"):
+                    response = await self._client.post(
+                        url,
+                        headers=merged_headers,
+                        params=merged_params,
+                        json=json_body or {},
+                        timeout=self._timeout,
+                    )
+                trace.record_response(response)
+                with trace.phase("decode"):
+                    return _parse_json_response(url, response, self._codec, raw=raw)
+
+            return await self._with_retries(path, send, trace)
+
+    async def post(
+        self,
+        path: str,
+        *,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Mapping[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """Async equivalent of :meth:`HttpClient.post`."""
+        if not files:
+            return await self.post_json(path, json_body=json, headers=headers, params=params)
+
+        url = f"{self._base_url}/{path.lstrip('/')}"
+        merged_params = _merge(self._params, params)
+
+        with self._tracer.trace(path) as trace:
+
+            async def send() -> Dict[str, Any]:
+                _rewind(files)
+                with trace.phase("auth"):
+                    merged_headers = _merge(await self._auth.get_authorization_header(), headers)
+
+                with trace.phase("network"):
+                    response = await self._client.post(
+                        url,
+                        files=files,
+                        headers=merged_headers,
+                        params=merged_params,
+                        timeout=self._timeout,
+                    )
+                trace.record_response(response)
+                with trace.phase("decode"):
+                    return _parse_multipart_response(response, self._codec)
+
+            return await self._with_retries(path, send, trace)
+
+    async def call(
+        self,
+        path: str,
+        *,
+        parse: Callable[[Dict[str, Any]], T],
+        json: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None,
+        cache: Optional[str] = None,
+    ) -> T:
+        """Async equivalent of :meth:`HttpClient.call`."""
+        if cache is not None:
+            check_cache_mode(cache)
+        with self._tracer.trace(path) as trace:
+            key = payload = None
+            mode = current_response_mode(self._response_mode)
+            # Only model mode can validate a raw body in one step
+            raw = mode == MODEL and _response_model(parse) is not None
+            if self._cache is not None and not files:
+                key, payload = self._cache.lookup(path, json, cache)
+            if payload is not None:
+                trace.cache_hit = True
+            else:
+
+                async def fetch() -> Payload:
+                    if files:
+                        fetched = await self.post(path, json=json, files=files)
+                    else:
+                        fetched = await self.post_json(path, json_body=json, raw=raw)
+                    if key is not None:
+                        self._cache.store(path, key, fetched)
+                    return fetched
+
+                if self._inflight is not None and not files:
+                    payload = await self._inflight.do(request_key(path, json), fetch)
+                else:
+                    payload = await fetch()
+            with trace.phase("parse"):
+                result = _parse_payload(payload, parse, self._codec, mode)
+            trace.record_result(result)
+            return result
+
+    async def _with_retries(
+        self, path: str, send: Callable[[], Awaitable[Payload]], trace: Any
+    ) -> Payload:
+        retry = self._retry
+        retry.begin(path)
+        attempt = 0
+        while True:
+            retry.before_attempt()
+            if self._rate_limiter is not None:
+                wait = self._rate_limiter.reserve(path)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            trace.retries = attempt
+            try:
+                payload = await self._send_limited(path, send)
+            except ApiError as exc:
+                delay = retry.retry_delay(
+                    path,
+                    attempt,
+                    status_code=exc.status_code,
+                    error_code=exc.error_code,
+                    retry_after=exc.retry_after,
+                )
+                if delay is None:
+                    raise
+            except httpx.TransportError as exc:
+                delay = retry.retry_delay(
+                    path,
+                    attempt,
+                    transport_error=True,
+                    request_sent=not isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout)),
+                )
+                if delay is None:
+                    raise
+            except BaseException:
+                retry.abandon()
+                raise
+            else:
+                retry.record_success()
+                return payload
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send_limited(self, path: str, send: Callable[[], Awaitable[Payload]]) -> Payload:
+        """Async equivalent of :meth:`HttpClient._send_limited`."""
+        limiter = self._concurrency
+        if limiter is None:
+            return await send()
+        await limiter.aacquire(path)
+        started = time.perf_counter()
+        try:
+            payload = await send()
+        except ApiError as exc:
+            limiter.release(path, overloaded=limiter.is_overload(exc.status_code, exc.error_code))
+            raise
+        except httpx.TimeoutException:
+            limiter.release(path, overloaded=True)
+            raise
+        except BaseException:
+            limiter.release(path)
+            raise
+        limiter.release(path, time.perf_counter() - started)
+        return payload
+
+
+def _never_sent(exc: requests.RequestException) -> bool:
+    """Whether a requests failure happened before a connection existed to send on.
+
+    Refused connections and DNS failures arrive as a ``ConnectionError``
+    wrapping urllib3's ``NewConnectionError`` (the async client's
+    ``httpx.ConnectError``); a reset or other error after connecting may
+    follow a request the server received.
+    """
+    if isinstance(exc, requests.ConnectTimeout):
+        return True
+    reason = exc.args[0] if exc.args else None
+    if isinstance(reason, urllib3.exceptions.MaxRetryError):
+        reason = reason.reason
+    return isinstance(reason, urllib3.exceptions.NewConnectionError)
+
+
+def _merge(base: Mapping[str, Any], extra: Optional[Mapping[str, Any]]) -> Mapping[str, Any]:
+    """Return ``base`` itself unless ``extra`` adds keys, avoiding a copy per request."""
+    if not extra:
+        return base
+    merged = dict(base)
+    merged.update(extra)
+    return merged
+
+
+def _parse_json_response(url: str, response: Any, codec: JsonCodec, *, raw: bool = False) -> Payload:
+    """Validate a JSON API response and return its payload (or raw body)."""
+    if response.status_code >= 400:
+        raise ApiError(
+            f"HTTP {response.status_code} calling {url}",
+            status_code=response.status_code,
+            response_text=response.text,
+            retry_after=_retry_after(response),
+        )
+
+    body = response.content
+    if raw:
+        _raise_for_envelope(body, response)
+        return bytes(body)
+
+    try:
+        payload: Dict[str, Any] = codec.loads(body)
+    except ValueError:
+        raise ApiError("Response was not valid JSON", response_text=response.text)
+
+    # Patsnap responses include status, error_code; surface errors consistently
+    if not isinstance(payload, dict):
+        raise ApiError("Response JSON was not an object", response_text=str(payload))
+
+    _raise_for_payload(payload, response)
+    return payload
+
+
+def _parse_multipart_response(response: Any, codec: JsonCodec) -> Dict[str, Any]:
+    """Validate the response of a multipart upload and return its payload."""
+    try:
+        payload = codec.loads(response.content)
+    except ValueError as e:
+        raise ApiError(
+            f"Invalid JSON response: {e}",
+            status_code=response.status_code,
+            response_text=response.text,
+            retry_after=_retry_after(response),
+        )
+
+    # Check for API errors
+    _raise_for_payload(payload, response)
+    return payload
+
+
+class _Envelope(BaseModel):
+    """Top-level status fields of a Patsnap response; everything else is ignored."""
+
+    status: Any = None
+    error_code: Any = None
+    error_msg: Any = None
+
+
+def _rewind(files: Mapping[str, Any]) -> None:
+    """Seek streamed upload files back to their start, so a retry resends the whole file."""
+    for value in files.values():
+        stream = value[1] if isinstance(value, tuple) else value
+        if hasattr(stream, "seek"):
+            stream.seek(0)
+
+
+class _MultipartStream:
+    """A ``multipart/form-data`` body read from the upload files while it is sent.
+
+    requests streams iterable, file-like request bodies and takes the
+    Content-Length from ``len()``, so only one block of a file is in memory
+    at a time.
+    """
+
+    _BLOCK = 64 * 1024
+
+    def __init__(self, parts: List[Union[bytes, BinaryIO]], length: int, boundary: str) -> None:
+        self._parts = parts
+        self._length = length
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+
+    @classmethod
+    def of(cls, files: Mapping[str, Any]) -> Optional["_MultipartStream"]:
+        """Body for ``files`` (as taken by ``requests``), or None if a file's size cannot be known."""
+        boundary = uuid.uuid4().hex
+        parts: List[Union[bytes, BinaryIO]] = []
+        length = 0
+        for name, value in files.items():
+            filename, stream, content_type = value if isinstance(value, tuple) else (name, value, None)
+            if isinstance(stream, (bytes, bytearray)):
+                stream = io.BytesIO(stream)
+            size = _remaining(stream)
+            if size is None:
+                return None
+            head = (
+                f"--{boundary}\r\n"
+                f'Content-Disposition: form-data; name="{_quote(name)}"; filename="{_quote(filename)}"\r\n'
+                f"Content-Type: {content_type or 'application/octet-stream'}\r\n\r\n"
+            ).encode("utf-8")
+            parts += [head, stream, b"\r\n"]
+            length += len(head) + size + 2
+        tail = f"--{boundary}--\r\n".encode("ascii")
+        parts.append(tail)
+        return cls(parts, length + len(tail), boundary)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(lambda: self.read(self._BLOCK), b"")
+
+    def read(self, size: int = -1) -> bytes:
+        out = bytearray()
+        while self._parts and (size < 0 or len(out) < size):
+            part = self._parts[0]
+            want = -1 if size < 0 else size - len(out)
+            if isinstance(part, bytes):
+                chunk = part if want < 0 else part[:want]
+                if len(chunk) < len(part):
+                    self._parts[0] = part[len(chunk):]
+                else:
+                    self._parts.pop(0)
+            else:
+                chunk = part.read(want)
+                if not chunk or want < 0:
+                    self._parts.pop(0)
+            out += chunk
+        return bytes(out)
+
+
+def _remaining(stream: Any) -> Optional[int]:
+    """Bytes left in a seekable ``stream``, or None when it cannot seek."""
+    try:
+        start = stream.tell()
+        end = stream.seek(0, io.SEEK_END)
+        stream.seek(start)
+    except (AttributeError, OSError, ValueError):
+        return None
+    return end - start
+
+
+def _quote(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+
+def _raise_for_envelope(body: bytes, response: Any) -> None:
+    """Check a raw body for business errors without decoding its ``data``."""
+    try:
+        envelope = _Envelope.model_validate_json(body)
+    except ValidationError:
+        # Not JSON, or not an object
+        raise ApiError("Response was not valid JSON", response_text=response.text)
+    _raise_for_payload(envelope.__dict__, response)
+
+
+def _response_model(parse: Callable[..., Any]) -> Optional[type]:
+    return getattr(parse, "response_model", None)
+
+
+def _parse_payload(payload: Payload, parse: Callable[[Dict[str, Any]], T], codec: JsonCodec, mode: str) -> Any:
+    """Turn a payload into the call's result according to the response mode."""
+    if isinstance(payload, bytes):
+        model = _response_model(parse)
+        if model is not None and mode == MODEL:
+            try:
+                return model.model_validate_json(payload)
+            except ValidationError:
+                # e.g. a body without the "data" wrapper; let the parser normalise it
+                pass
+        payload = codec.loads(payload)
+    if mode == DICT:
+        return payload
+    if mode != MODEL:
+        # Parsers read the mode to build lazy or compact results
+        with response_mode(mode):
+            return parse(payload)
+    return parse(payload)
+
+
+def _retry_after(response: Any) -> Optional[float]:
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    return parse_retry_after(headers.get("Retry-After"))
+
+
+def _raise_for_payload(payload: Dict[str, Any], response: Any) -> None:
+    """Raise ``ApiError`` when a Patsnap payload reports a business error."""
+    status = payload.get("status")
+    error_code = payload.get("error_code")
+    if status is False or (isinstance(error_code, int) and error_code != 0):
+        raise ApiError(
+            payload.get("error_msg") or "API returned an error",
+            status_code=response.status_code,
+            error_code=error_code if isinstance(error_code, int) else None,
+            response_text=response.text,
+        )
+
 
-__all__ = ["HttpClient", "BASE_URL"]
+__all__ = ["HttpClient", "AsyncHttpClient", "BASE_URL"]
 
 
 
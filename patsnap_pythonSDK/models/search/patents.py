@@ -3,6 +3,8 @@ from __future__ import annotations
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
 
+from ...export import to_arrow, to_records
+
 
 class PatentSearchPnRequest(BaseModel):
     pn: Optional[str] = Field(default=None, description="Patent number")
@@ -34,6 +36,14 @@ class SearchPatentV2Response(BaseModel):
     """Complete response wrapper for patent search V2"""
     data: SearchPatentV2ResponseData = Field(description="Response data containing results")
 
+    def to_arrow(self) -> Any:
+        """Result rows as a ``pyarrow.Table`` (requires pyarrow)."""
+        return to_arrow(PatentBaseV2Response, self.data.results)
+
+    def to_records(self) -> Any:
+        """Result rows as a ``numpy.recarray`` (requires numpy)."""
+        return to_records(PatentBaseV2Response, self.data.results)
+
 
 class CompanySearchRequest(BaseModel):
     """Request model for original applicant/assignee search.
@@ -269,6 +279,14 @@ class SearchComputeV2Response(BaseModel):
     """Complete response wrapper for similar patent search."""
     data: SearchComputeV2ResponseData = Field(description="Response data containing results")
 
+    def to_arrow(self) -> Any:
+        """Result rows as a ``pyarrow.Table`` (requires pyarrow)."""
+        return to_arrow(SemanticResult, self.data.results)
+
+    def to_records(self) -> Any:
+        """Result rows as a ``numpy.recarray`` (requires numpy)."""
+        return to_records(SemanticResult, self.data.results)
+
 
 class SemanticSearchRequest(BaseModel):
     """Request model for semantic search using technical text.
@@ -405,6 +423,14 @@ class ImageSearchResponse(BaseModel):
     patent_messages: List[PatentMessage] = Field(description="List of similar patent results")
     total_search_result_count: int = Field(description="Total number of search results")
 
+    def to_arrow(self) -> Any:
+        """Result rows as a ``pyarrow.Table`` (requires pyarrow)."""
+        return to_arrow(PatentMessage, self.patent_messages)
+
+    def to_records(self) -> Any:
+        """Result rows as a ``numpy.recarray`` (requires numpy)."""
+        return to_records(PatentMessage, self.patent_messages)
+
 
 class ImageSearchMultipleRequest(BaseModel):
     """Request model for multiple image patent search.
@@ -56,6 +56,33 @@ class AnalyticsSearchNamespace:
         """
         return self._analytics_search.query_count(**kwargs)
     
+    def count_matrix(self, terms, dims=None, **kwargs):
+        """Count patents for every cell of a terms x dimensions grid.
+        
+        Expands the grid into query_count calls, ``(term) AND <dimension clauses>``,
+        counts each distinct query once and runs the calls concurrently.
+        
+        Args:
+            terms: Query texts, or a mapping of label to query text
+            dims: Ordered mapping of dimension name to values. PUBLICATION_YEAR,
+                  APPLICATION_YEAR and AUTHORITY take plain values; other dimensions
+                  take a mapping of label to query clause
+            concurrency: Maximum requests in flight (default: 8)
+            **kwargs: Any other query_count parameter
+            
+        Returns:
+            CountMatrix: Counts indexed by term and each dimension
+            
+        Example:
+            >>> matrix = patsnap.analytics.search.count_matrix(
+            ...     {"VR": "TACD: virtual reality", "AR": "TACD: augmented reality"},
+            ...     {"PUBLICATION_YEAR": range(2015, 2025), "AUTHORITY": ["US", "CN", "EP"]},
+            ...     concurrency=16,
+            ... )
+            >>> table = matrix.to_pandas().unstack()
+        """
+        return self._analytics_search.count_matrix(terms, dims, **kwargs)
+    
     def query_search(self, **kwargs):
         """Search PatSnap's global patent database using analytics queries.
         
@@ -93,6 +120,100 @@ class AnalyticsSearchNamespace:
         """
         return self._analytics_search.query_search(**kwargs)
     
+    def iter_query_search(self, **kwargs):
+        """Iterate over every result, fetching pages lazily with prefetch.
+        
+        Streaming variant of query_search. Stops at total_search_result_count
+        or the 20,000 result window.
+        On the async client this returns an async iterator (``async for``).
+        
+        Args:
+            offset: Offset of the first result (default: 0)
+            page_size: Results per request (1-1000, default: 1000)
+            max_results: Stop after this many results (default: no limit)
+            prefetch: Fetch the next page in the background (default: True)
+            **kwargs: Any other query_search parameter
+            
+        Yields:
+            PatentBaseV2Response: Individual patent results
+            
+        Example:
+            >>> for patent in patsnap.analytics.search.iter_query_search(query_text="TACD: virtual reality"):
+            ...     print(patent.pn)
+        """
+        return self._analytics_search.iter_query_search(**kwargs)
+    
+    def fetch_all(self, endpoint: str = "query_search", **kwargs):
+        """Fetch every page of query_search concurrently, merged in order.
+        
+        Args:
+            endpoint: Paginated method name (only query_search)
+            concurrency: Maximum requests in flight (default: 4)
+            offset: Offset of the first result (default: 0)
+            page_size: Results per request (1-1000, default: 1000)
+            max_results: Stop after this many results (default: no limit)
+            **kwargs: Any other query_search parameter
+            
+        Returns:
+            SearchPatentV2Response: All results in one response
+            
+        Example:
+            >>> everything = patsnap.analytics.search.fetch_all(
+            ...     query_text="TACD: virtual reality",
+            ...     concurrency=8
+            ... )
+            >>> print(len(everything.data.results))
+        """
+        return self._analytics_search.fetch_all(endpoint, **kwargs)
+    
+    def partition_query(self, **kwargs):
+        """Split a query into date slices that each fit the 20,000 result window.
+        
+        Probes query_count and halves the query's date range until every
+        slice counts at most 20,000 results.
+        
+        Args:
+            query_text: Analytics query, maximum length 1,500 characters
+            date_field: Date to split by: APD (application date, default) or PBD (publication date)
+            start: First date of the range to split (default: 1700-01-01)
+            end: Last date of the range to split (default: today)
+            concurrency: Maximum requests in flight (default: 4)
+            **kwargs: Any other query_count parameter
+            
+        Returns:
+            QueryPartitions: The slices with their queries and counts
+            
+        Example:
+            >>> plan = patsnap.analytics.search.partition_query(query_text="TACD: battery")
+            >>> print(plan.total, len(plan), plan.complete)
+        """
+        return self._analytics_search.partition_query(**kwargs)
+    
+    def iter_partitioned_search(self, **kwargs):
+        """Iterate over every result of a query, past the 20,000 result window.
+        
+        Splits the query into date slices, pages through them concurrently
+        and de-duplicates rows by patent_id.
+        On the async client this returns an async iterator (``async for``).
+        
+        Args:
+            query_text: Analytics query, maximum length 1,500 characters
+            date_field: Date to split by: APD (application date, default) or PBD (publication date)
+            start: First date of the range to split (default: 1700-01-01)
+            end: Last date of the range to split (default: today)
+            page_size: Results per request (1-1000, default: 1000)
+            concurrency: Maximum requests in flight (default: 4)
+            **kwargs: Any other query_search parameter (sort, collapse_type, ...)
+            
+        Yields:
+            PatentBaseV2Response: Individual patent results
+            
+        Example:
+            >>> for patent in patsnap.analytics.search.iter_partitioned_search(query_text="TACD: battery"):
+            ...     print(patent.pn)
+        """
+        return self._analytics_search.iter_partitioned_search(**kwargs)
+    
     def query_filter(self, **kwargs):
         """Get aggregated statistical results of specified field dimensions.
         
@@ -132,3 +253,30 @@ class AnalyticsSearchNamespace:
             ...         print(f"{assignee.name}: {assignee.count:,}")
         """
         return self._analytics_search.query_filter(**kwargs)
+    
+    def facet_sweep(self, **kwargs):
+        """Get the complete bucket distribution of fields, past query_filter's Top-200 cap.
+        
+        Reads every page of each field (five fields per call). When a field
+        fills all 200 buckets, the query is split by publication year, then by
+        authority, and each slice is swept concurrently; the counts are summed
+        into one table per field.
+        
+        Args:
+            query: Analytics query, maximum length 800 characters
+            fields: Field codes, as a list or comma-separated (ASSIGNEE, IPC, ...)
+            partitions: Dimensions to split capped queries by (default: PUBLICATION_YEAR, AUTHORITY)
+            partition_clauses: Query clause for each dimension value, to add or override dimensions
+            concurrency: Maximum requests in flight (default: 4)
+            **kwargs: Any other query_filter parameter (lang, collapse_type, ...)
+            
+        Returns:
+            Dict[str, FacetTable]: One table per field code
+            
+        Example:
+            >>> tables = patsnap.analytics.search.facet_sweep(query="TTL:汽车", fields=["ASSIGNEE", "IPC"])
+            >>> print(len(tables["ASSIGNEE"]), tables["ASSIGNEE"].complete)
+            >>> for name, count in tables["ASSIGNEE"].top(10):
+            ...     print(f"{name}: {count:,}")
+        """
+        return self._analytics_search.facet_sweep(**kwargs)
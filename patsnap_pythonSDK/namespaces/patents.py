@@ -18,6 +18,16 @@ class PatentsNamespace:
         return self._search
 
 
+# Namespace method names mapped to the resource methods they wrap
+_PAGINATED_METHODS = {
+    "by_original_assignee": "company_search",
+    "by_current_assignee": "current_assignee_search",
+    "by_defense_applicant": "defense_patent_search",
+    "by_similarity": "similar_patent_search",
+    "by_semantic_text": "semantic_search",
+}
+
+
 class PatentsSearchNamespace:
     """Patent search operations."""
     
@@ -52,6 +62,35 @@ class PatentsSearchNamespace:
         """
         return self._patents.search_pn(**kwargs)
     
+    def by_numbers(self, numbers, **kwargs):
+        """Look up many patent or application numbers concurrently.
+        
+        Numbers are normalized and each distinct one is looked up once on a
+        bounded worker pool. Every input is streamed back as an
+        (input, result | exception) pair as its lookup finishes; inputs that
+        spell the same number (e.g. "US7654321B2" and "US 7,654,321 B2") each
+        get a pair with the shared result.
+        
+        Args:
+            numbers: Iterable of patent numbers (or application numbers)
+            number_type: "pn" (default) or "apno"
+            authority: List of patent authorities (e.g., ['US', 'CN'])
+            limit: Maximum results per number (default: 10)
+            concurrency: Lookups in flight at once (default: 8)
+            chunk: Inputs read ahead of completed results (default: 1000)
+            
+        Returns:
+            BulkRun: Iterable of (input, result | exception); ``.stats`` reports
+            throughput and error counts once consumed
+            
+        Example:
+            >>> run = patsnap.patents.search.by_numbers(["US11205304B2", "us 10,000,000 b2"])
+            >>> for number, result in run:
+            ...     print(number, result)
+            >>> print(run.stats)
+        """
+        return self._patents.search_pn_bulk(numbers, **kwargs)
+    
     def by_original_assignee(self, **kwargs):
         """Search patents by original applicant/assignee names.
         
@@ -89,6 +128,28 @@ class PatentsSearchNamespace:
         """
         return self._patents.company_search(**kwargs)
     
+    def iter_by_original_assignee(self, **kwargs):
+        """Iterate over every result, fetching pages lazily with prefetch.
+        
+        Streaming variant of by_original_assignee. Stops at total_search_result_count or the 20,000 result window.
+        On the async client this returns an async iterator (``async for``).
+        
+        Args:
+            offset: Offset of the first result (default: 0)
+            page_size: Results per request (1-1000, default: 1000)
+            max_results: Stop after this many results (default: no limit)
+            prefetch: Fetch the next page in the background (default: True)
+            **kwargs: Any other search parameter
+            
+        Yields:
+            PatentBaseV2Response: Individual patent results
+            
+        Example:
+            >>> for patent in patsnap.patents.search.iter_by_original_assignee(application="Apple, Inc."):
+            ...     print(patent.pn)
+        """
+        return self._patents.iter_company_search(**kwargs)
+    
     def by_current_assignee(self, **kwargs):
         """Search patents by current assignee names.
         
@@ -126,6 +187,28 @@ class PatentsSearchNamespace:
         """
         return self._patents.current_assignee_search(**kwargs)
     
+    def iter_by_current_assignee(self, **kwargs):
+        """Iterate over every result, fetching pages lazily with prefetch.
+        
+        Streaming variant of by_current_assignee. Stops at total_search_result_count or the 20,000 result window.
+        On the async client this returns an async iterator (``async for``).
+        
+        Args:
+            offset: Offset of the first result (default: 0)
+            page_size: Results per request (1-1000, default: 1000)
+            max_results: Stop after this many results (default: no limit)
+            prefetch: Fetch the next page in the background (default: True)
+            **kwargs: Any other search parameter
+            
+        Yields:
+            PatentBaseV2Response: Individual patent results
+            
+        Example:
+            >>> for patent in patsnap.patents.search.iter_by_current_assignee(assignee="Apple, Inc."):
+            ...     print(patent.pn)
+        """
+        return self._patents.iter_current_assignee_search(**kwargs)
+    
     def by_defense_applicant(self, **kwargs):
         """Search defense/military patents by applicant names.
         
@@ -164,6 +247,28 @@ class PatentsSearchNamespace:
         """
         return self._patents.defense_patent_search(**kwargs)
     
+    def iter_by_defense_applicant(self, **kwargs):
+        """Iterate over every result, fetching pages lazily with prefetch.
+        
+        Streaming variant of by_defense_applicant. Stops at total_search_result_count or the 20,000 result window.
+        On the async client this returns an async iterator (``async for``).
+        
+        Args:
+            offset: Offset of the first result (default: 0)
+            page_size: Results per request (1-1000, default: 1000)
+            max_results: Stop after this many results (default: no limit)
+            prefetch: Fetch the next page in the background (default: True)
+            **kwargs: Any other search parameter
+            
+        Yields:
+            PatentBaseV2Response: Individual patent results
+            
+        Example:
+            >>> for patent in patsnap.patents.search.iter_by_defense_applicant(application="Boeing Company"):
+            ...     print(patent.pn)
+        """
+        return self._patents.iter_defense_patent_search(**kwargs)
+    
     def by_similarity(self, **kwargs):
         """Search for patents similar to a given patent by ID or number.
         
@@ -207,6 +312,28 @@ class PatentsSearchNamespace:
         """
         return self._patents.similar_patent_search(**kwargs)
     
+    def iter_by_similarity(self, **kwargs):
+        """Iterate over every result, fetching pages lazily with prefetch.
+        
+        Streaming variant of by_similarity. Stops at total_search_result_count or the 1,000 result window.
+        On the async client this returns an async iterator (``async for``).
+        
+        Args:
+            offset: Offset of the first result (default: 0)
+            page_size: Results per request (1-1000, default: 1000)
+            max_results: Stop after this many results (default: no limit)
+            prefetch: Fetch the next page in the background (default: True)
+            **kwargs: Any other search parameter
+            
+        Yields:
+            SemanticResult: Individual patent results
+            
+        Example:
+            >>> for patent in patsnap.patents.search.iter_by_similarity(patent_number="US11205304B2"):
+            ...     print(patent.pn)
+        """
+        return self._patents.iter_similar_patent_search(**kwargs)
+    
     def by_semantic_text(self, **kwargs):
         """Search for patents using semantic analysis of technical text.
         
@@ -252,6 +379,84 @@ class PatentsSearchNamespace:
         """
         return self._patents.semantic_search(**kwargs)
     
+    def iter_by_semantic_text(self, **kwargs):
+        """Iterate over every result, fetching pages lazily with prefetch.
+        
+        Streaming variant of by_semantic_text. Stops at total_search_result_count or the 1,000 result window.
+        On the async client this returns an async iterator (``async for``).
+        
+        Args:
+            offset: Offset of the first result (default: 0)
+            page_size: Results per request (1-1000, default: 1000)
+            max_results: Stop after this many results (default: no limit)
+            prefetch: Fetch the next page in the background (default: True)
+            **kwargs: Any other search parameter
+            
+        Yields:
+            SemanticResult: Individual patent results
+            
+        Example:
+            >>> for patent in patsnap.patents.search.iter_by_semantic_text(text=description):
+            ...     print(patent.pn)
+        """
+        return self._patents.iter_semantic_search(**kwargs)
+    
+    def fetch_all(self, endpoint: str, **kwargs):
+        """Fetch every page of a paginated search concurrently, merged in order.
+        
+        Args:
+            endpoint: by_original_assignee, by_current_assignee, by_defense_applicant,
+                     by_similarity or by_semantic_text
+            concurrency: Maximum requests in flight (default: 4)
+            offset: Offset of the first result (default: 0)
+            page_size: Results per request (1-1000, default: 1000)
+            max_results: Stop after this many results (default: no limit)
+            **kwargs: Any other parameter of the chosen search
+            
+        Returns:
+            SearchPatentV2Response or SearchComputeV2Response: All results in one response
+            
+        Example:
+            >>> portfolio = patsnap.patents.search.fetch_all(
+            ...     "by_current_assignee",
+            ...     assignee="Apple, Inc.",
+            ...     concurrency=8
+            ... )
+            >>> print(len(portfolio.data.results))
+        """
+        return self._patents.fetch_all(_PAGINATED_METHODS.get(endpoint, endpoint), **kwargs)
+    
+    def iter_partitioned(self, endpoint: str, **kwargs):
+        """Iterate over an entire assignee portfolio, past the 20,000 result window.
+        
+        The names become an analytics query on the standardized assignee
+        field, which is split into date slices that each fit the window. The
+        slices are paged concurrently and rows are de-duplicated by patent_id.
+        On the async client this returns an async iterator (``async for``).
+        
+        Args:
+            endpoint: by_original_assignee or by_current_assignee
+            application / assignee: The search's company names, separated by ' OR '
+            date_field: Date to split by: APD (default) or PBD
+            start: First date of the range to split (default: 1700-01-01)
+            end: Last date of the range to split (default: today)
+            page_size: Results per request (1-1000, default: 1000)
+            concurrency: Maximum requests in flight (default: 4)
+            **kwargs: Any other query_search parameter (sort, collapse_type, ...)
+            
+        Yields:
+            PatentBaseV2Response: Individual patent results
+            
+        Example:
+            >>> for patent in patsnap.patents.search.iter_partitioned(
+            ...     "by_current_assignee",
+            ...     assignee="Samsung Electronics",
+            ...     concurrency=8
+            ... ):
+            ...     print(patent.pn)
+        """
+        return self._patents.iter_partitioned(_PAGINATED_METHODS.get(endpoint, endpoint), **kwargs)
+    
     def upload_image(self, **kwargs):
         """Upload an image and get a public URL for image search operations.
         
@@ -267,6 +472,9 @@ class PatentsSearchNamespace:
             image: Image file to upload. Can be:
                   - File path (str or Path object)
                   - File-like object (BinaryIO)
+            reuse: Reuse the unexpired URL of an identical earlier upload (default: True)
+            preprocess: ImagePreprocessor to resize/re-encode the image and strip EXIF
+                  first (requires Pillow); images over 4MB are then shrunk, not rejected
             **kwargs: Additional parameters
                   
         Returns:
@@ -291,6 +499,28 @@ class PatentsSearchNamespace:
         """
         return self._patents.upload_image(**kwargs)
     
+    def upload_images(self, images, **kwargs):
+        """Upload several images concurrently.
+        
+        Each image is streamed from disk and keyed by its content hash, so
+        duplicates are uploaded once and images uploaded earlier by this client
+        reuse their unexpired URLs.
+        
+        Args:
+            images: File paths or file-like objects
+            concurrency: Uploads in flight at once (default: 4)
+            reuse: Reuse the unexpired URL of an identical earlier upload (default: True)
+            preprocess: ImagePreprocessor applied to each image before upload
+            
+        Returns:
+            List[FileUrlResponse]: One result per image, in input order
+            
+        Example:
+            >>> results = patsnap.patents.search.upload_images(["front.png", "side.png"], concurrency=4)
+            >>> urls = [result.url for result in results]
+        """
+        return self._patents.upload_images(images, **kwargs)
+    
     def by_image(self, **kwargs):
         """Search for patents using image similarity analysis.
         
@@ -412,6 +642,70 @@ class PatentsSearchNamespace:
         """
         return self._patents.multi_image_search(**kwargs)
     
+    def iter_by_image(self, **kwargs):
+        """Iterate over every image search result, fetching pages lazily with prefetch.
+        
+        Streaming variant of by_image. Walks all 1,100 reachable results
+        (limit 100 up to offset 1000), or stops at total_search_result_count.
+        On the async client this returns an async iterator (``async for``).
+        
+        Args:
+            offset: Offset of the first result (default: 0)
+            page_size: Results per request (1-100, default: 100)
+            max_results: Stop after this many results (default: no limit)
+            prefetch: Fetch the next page in the background (default: True)
+            **kwargs: Any other by_image parameter
+            
+        Yields:
+            PatentMessage: Individual patent results
+            
+        Example:
+            >>> for patent in patsnap.patents.search.iter_by_image(url=image.url, patent_type="D", model=1):
+            ...     print(patent.patent_pn, patent.score)
+        """
+        return self._patents.iter_image_search(**kwargs)
+    
+    def iter_by_multiple_images(self, **kwargs):
+        """Iterate over every multiple-image search result, fetching pages lazily with prefetch.
+        
+        Streaming variant of by_multiple_images, over the same 1,100 result window.
+        On the async client this returns an async iterator (``async for``).
+        
+        Args:
+            offset: Offset of the first result (default: 0)
+            page_size: Results per request (1-100, default: 100)
+            max_results: Stop after this many results (default: no limit)
+            prefetch: Fetch the next page in the background (default: True)
+            **kwargs: Any other by_multiple_images parameter
+            
+        Yields:
+            PatentMessage: Individual patent results
+        """
+        return self._patents.iter_multi_image_search(**kwargs)
+    
+    def by_images_fused(self, queries, **kwargs):
+        """Run several single-image searches in parallel and fuse their results by patent.
+        
+        Args:
+            queries: ImageSearchSingleRequest objects or by_image keyword dicts
+            depth: Results fetched per query (1-1100, default: 100)
+            aggregate: Score aggregation - "max", "mean", "sum", "rrf" or a callable (default: "max")
+            rrf_k: Rank offset for "rrf" (default: 60)
+            concurrency: Requests in flight at once (default: 4)
+            
+        Returns:
+            ImageSearchResponse: One row per patent ranked by fused score
+            
+        Example:
+            >>> fused = patsnap.patents.search.by_images_fused(
+            ...     [{"url": front.url, "patent_type": "D", "model": 1},
+            ...      {"url": side.url, "patent_type": "D", "model": 1}],
+            ...     depth=300,
+            ...     aggregate="rrf",
+            ... )
+        """
+        return self._patents.image_search_fused(queries, **kwargs)
+    
     def claim_similarity(self, **kwargs):
         """Analyze the similarity between two patent claim texts.
         
@@ -484,4 +778,47 @@ class PatentsSearchNamespace:
             >>> else:
             ...     print("Low similarity detected")
         """
-        return self._patents.claim_similarity(**kwargs)
\ No newline at end of file
+        return self._patents.claim_similarity(**kwargs)
+    
+    def claim_similarity_batch(self, pairs, **kwargs):
+        """Score many (src, tgt) claim pairs concurrently.
+        
+        Repeated and reversed pairs are scored once, and scores are cached by
+        content hash so pairs this client has already scored cost no call.
+        
+        Args:
+            pairs: Iterable of (src, tgt) claim texts
+            concurrency: Calls in flight at once (default: 8)
+            symmetric: Treat (a, b) and (b, a) as the same pair (default: True)
+            cache: ClaimScoreCache to use instead of the client's
+            
+        Returns:
+            List[float]: Scores in the order of ``pairs``
+            
+        Example:
+            >>> scores = patsnap.patents.search.claim_similarity_batch([
+            ...     (our_claim, their_claim_1),
+            ...     (our_claim, their_claim_2),
+            ... ], concurrency=16)
+        """
+        return self._patents.claim_similarity_batch(pairs, **kwargs)
+    
+    def claim_similarity_matrix(self, srcs, tgts=None, **kwargs):
+        """Score every source claim against every target claim.
+        
+        Args:
+            srcs: Source claim texts (matrix rows)
+            tgts: Target claim texts (matrix columns); defaults to ``srcs``
+            concurrency: Calls in flight at once (default: 8)
+            symmetric: Treat (a, b) and (b, a) as the same pair (default: True)
+            cache: ClaimScoreCache to use instead of the client's
+            as_array: Return a NumPy array (default: True); False returns nested lists
+            
+        Returns:
+            numpy.ndarray: Scores of shape (len(srcs), len(tgts))
+            
+        Example:
+            >>> matrix = patsnap.patents.search.claim_similarity_matrix(our_claims, their_claims)
+            >>> print(matrix.max(axis=1))  # Closest prior-art claim for each of ours
+        """
+        return self._patents.claim_similarity_matrix(srcs, tgts, **kwargs)
\ No newline at end of file
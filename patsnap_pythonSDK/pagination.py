@@ -0,0 +1,357 @@
+"""Offset/limit pagination helpers shared by the search resources.
+
+The Patsnap search endpoints return one page per call and cap how deep a
+caller may page (``limit + offset``). These helpers walk that window lazily,
+fetching the next page on a background thread while the current one is
+being consumed, so at most two pages are held in memory at a time. When the
+whole result set is wanted at once, :func:`fetch_all_pages` issues the
+remaining windows concurrently instead.
+
+Pages are either ``Search*V2Response`` objects (rows in ``data.results``) or
+``ImageSearchResponse`` objects (rows in ``patent_messages``), or the
+``dict`` payloads of either.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, List, Optional, Tuple, TypeVar
+
+from .utils.concurrency import map_ordered
+from .utils.responsemode import LazyModelList
+
+
+# limit + offset caps documented by the API
+RESULT_WINDOW_LIMIT = 20000
+SEMANTIC_RESULT_WINDOW_LIMIT = 1000
+
+# Image search caps limit at 100 and offset at 1000, so 1,100 results are reachable
+IMAGE_PAGE_SIZE = 100
+IMAGE_MAX_OFFSET = 1000
+IMAGE_RESULT_WINDOW_LIMIT = IMAGE_MAX_OFFSET + IMAGE_PAGE_SIZE
+
+# Largest page the offset/limit endpoints accept
+MAX_PAGE_SIZE = 1000
+
+PageT = TypeVar("PageT")
+
+# fetch_page(offset, limit) -> page response
+PageFetcher = Callable[[int, int], PageT]
+
+
+def page_results(page: Any) -> list:
+    """Return the result rows of a search page or its ``dict`` payload."""
+    data = _page_data(page)
+    if isinstance(page, dict):
+        return data[_rows_field(data)]
+    return getattr(data, _rows_field(data))
+
+
+def page_total(page: Any) -> int:
+    """Return ``total_search_result_count`` of a search page or its ``dict`` payload."""
+    data = _page_data(page)
+    return data["total_search_result_count"] if isinstance(page, dict) else data.total_search_result_count
+
+
+def _page_data(page: Any) -> Any:
+    # Pages fetched in the "dict" response mode are the raw payloads;
+    # ImageSearchResponse keeps its rows at the top level
+    if isinstance(page, dict):
+        return page.get("data", page)
+    return getattr(page, "data", page)
+
+
+def _rows_field(data: Any) -> str:
+    has_messages = "patent_messages" in data if isinstance(data, dict) else hasattr(data, "patent_messages")
+    return "patent_messages" if has_messages else "results"
+
+
+def iter_pages(
+    fetch_page: PageFetcher[PageT],
+    *,
+    offset: int = 0,
+    page_size: int = MAX_PAGE_SIZE,
+    max_results: Optional[int] = None,
+    window_limit: int = RESULT_WINDOW_LIMIT,
+    max_offset: Optional[int] = None,
+    prefetch: bool = True,
+) -> Iterator[PageT]:
+    """Yield successive pages until the result set or the API window is exhausted.
+
+    Args:
+        fetch_page: Callable issuing one request for ``(offset, limit)``
+        offset: Offset of the first result to fetch
+        page_size: Results requested per call (1-1000)
+        max_results: Stop after this many results (default: no limit)
+        window_limit: API cap on ``limit + offset`` for the endpoint
+        max_offset: API cap on ``offset`` alone, if the endpoint has one
+        prefetch: Fetch the next page in the background while the current one is consumed
+
+    Yields:
+        The page responses, in order
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be >= 1")
+    if offset < 0:
+        raise ValueError("offset must be >= 0")
+
+    end = window_limit
+    if max_results is not None:
+        end = min(end, offset + max_results)
+    if offset >= end:
+        return
+
+    executor: Optional[ThreadPoolExecutor] = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    pending: Optional[Future] = None
+    try:
+        page = fetch_page(offset, min(page_size, end - offset))
+        while True:
+            results = page_results(page)
+            # Total is only known once the first page has arrived
+            end = min(end, page_total(page))
+            next_offset = offset + len(results)
+            has_next = bool(results) and next_offset < end and (max_offset is None or next_offset <= max_offset)
+
+            if has_next and executor is not None:
+                pending = executor.submit(
+                    contextvars.copy_context().run, fetch_page, next_offset, min(page_size, end - next_offset)
+                )
+
+            yield page
+
+            if not has_next:
+                return
+            offset = next_offset
+            if pending is not None:
+                page, pending = pending.result(), None
+            else:
+                page = fetch_page(offset, min(page_size, end - offset))
+    finally:
+        if pending is not None:
+            pending.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+def iter_results(fetch_page: PageFetcher[Any], **kwargs: Any) -> Iterator[Any]:
+    """Flatten :func:`iter_pages` into individual result rows.
+
+    Accepts the same keyword arguments as :func:`iter_pages`.
+    """
+    for page in iter_pages(fetch_page, **kwargs):
+        yield from page_results(page)
+
+
+async def aiter_pages(
+    fetch_page: Callable[[int, int], Awaitable[PageT]],
+    *,
+    offset: int = 0,
+    page_size: int = MAX_PAGE_SIZE,
+    max_results: Optional[int] = None,
+    window_limit: int = RESULT_WINDOW_LIMIT,
+    max_offset: Optional[int] = None,
+    prefetch: bool = True,
+) -> AsyncIterator[PageT]:
+    """Async equivalent of :func:`iter_pages` for the async client.
+
+    With ``prefetch`` the next page is requested as a task while the
+    current one is consumed.
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be >= 1")
+    if offset < 0:
+        raise ValueError("offset must be >= 0")
+
+    end = window_limit
+    if max_results is not None:
+        end = min(end, offset + max_results)
+    if offset >= end:
+        return
+
+    pending: Optional[asyncio.Future] = None
+    try:
+        page = await fetch_page(offset, min(page_size, end - offset))
+        while True:
+            results = page_results(page)
+            end = min(end, page_total(page))
+            next_offset = offset + len(results)
+            has_next = bool(results) and next_offset < end and (max_offset is None or next_offset <= max_offset)
+
+            if has_next and prefetch:
+                pending = asyncio.ensure_future(fetch_page(next_offset, min(page_size, end - next_offset)))
+
+            yield page
+
+            if not has_next:
+                return
+            offset = next_offset
+            if pending is not None:
+                page, pending = await pending, None
+            else:
+                page = await fetch_page(offset, min(page_size, end - offset))
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+async def aiter_results(fetch_page: Callable[[int, int], Awaitable[Any]], **kwargs: Any) -> AsyncIterator[Any]:
+    """Flatten :func:`aiter_pages` into individual result rows.
+
+    Accepts the same keyword arguments as :func:`aiter_pages`.
+    """
+    async for page in aiter_pages(fetch_page, **kwargs):
+        for row in page_results(page):
+            yield row
+
+
+def page_windows(
+    first_offset: int,
+    first_count: int,
+    total: int,
+    *,
+    page_size: int = MAX_PAGE_SIZE,
+    max_results: Optional[int] = None,
+    window_limit: int = RESULT_WINDOW_LIMIT,
+    max_offset: Optional[int] = None,
+) -> List[Tuple[int, int]]:
+    """Return the ``(offset, limit)`` windows left after a first page.
+
+    Args:
+        first_offset: Offset the first page was requested at
+        first_count: Number of rows the first page returned
+        total: total_search_result_count reported by the first page
+        page_size: Results requested per call (1-1000)
+        max_results: Cap on results counted from ``first_offset``
+        window_limit: API cap on ``limit + offset`` for the endpoint
+        max_offset: API cap on ``offset`` alone, if the endpoint has one
+    """
+    end = min(total, window_limit)
+    if max_results is not None:
+        end = min(end, first_offset + max_results)
+    windows = []
+    offset = first_offset + first_count
+    while first_count and offset < end and (max_offset is None or offset <= max_offset):
+        limit = min(page_size, end - offset)
+        windows.append((offset, limit))
+        offset += limit
+    return windows
+
+
+def merge_pages(pages: List[PageT]) -> PageT:
+    """Concatenate pages into one response of the same type as the first page.
+
+    The result rows are reused as-is rather than re-validated; rows of lazy
+    pages stay unvalidated.
+    """
+    first = pages[0]
+    parts = [page_results(page) for page in pages]
+    if all(isinstance(part, LazyModelList) for part in parts):
+        results: list = LazyModelList.concat(parts)
+    else:
+        results = [row for part in parts for row in part]
+    data = _page_data(first)
+    field = _rows_field(data)
+    update = {field: results} if field == "patent_messages" else {field: results, "result_count": len(results)}
+    if isinstance(first, dict):
+        data = {**data, **update}
+        return {**first, "data": data} if "data" in first else data
+    if data is first:
+        return first.model_copy(update=update)
+    return first.model_copy(update={"data": data.model_copy(update=update)})
+
+
+def fetch_all_pages(
+    fetch_page: PageFetcher[PageT],
+    *,
+    offset: int = 0,
+    page_size: int = MAX_PAGE_SIZE,
+    max_results: Optional[int] = None,
+    window_limit: int = RESULT_WINDOW_LIMIT,
+    max_offset: Optional[int] = None,
+    concurrency: int = 4,
+) -> PageT:
+    """Fetch every page concurrently and return them merged in order.
+
+    The first page is fetched alone to learn total_search_result_count; the
+    remaining offset windows are then issued on a thread pool with at most
+    ``concurrency`` requests in flight.
+    """
+    first_limit = min(page_size, window_limit - offset)
+    if max_results is not None:
+        first_limit = min(first_limit, max_results)
+    if first_limit < 1:
+        raise ValueError("offset is beyond the result window")
+
+    first = fetch_page(offset, first_limit)
+    windows = page_windows(
+        offset,
+        len(page_results(first)),
+        page_total(first),
+        page_size=page_size,
+        max_results=max_results,
+        window_limit=window_limit,
+        max_offset=max_offset,
+    )
+    rest = map_ordered(lambda window: fetch_page(*window), windows, concurrency=concurrency)
+    return merge_pages([first, *rest])
+
+
+async def afetch_all_pages(
+    fetch_page: Callable[[int, int], Awaitable[PageT]],
+    *,
+    offset: int = 0,
+    page_size: int = MAX_PAGE_SIZE,
+    max_results: Optional[int] = None,
+    window_limit: int = RESULT_WINDOW_LIMIT,
+    max_offset: Optional[int] = None,
+    concurrency: int = 4,
+) -> PageT:
+    """Async equivalent of :func:`fetch_all_pages` for the async client."""
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    first_limit = min(page_size, window_limit - offset)
+    if max_results is not None:
+        first_limit = min(first_limit, max_results)
+    if first_limit < 1:
+        raise ValueError("offset is beyond the result window")
+
+    first = await fetch_page(offset, first_limit)
+    windows = page_windows(
+        offset,
+        len(page_results(first)),
+        page_total(first),
+        page_size=page_size,
+        max_results=max_results,
+        window_limit=window_limit,
+        max_offset=max_offset,
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_window(window: Tuple[int, int]) -> PageT:
+        async with semaphore:
+            return await fetch_page(*window)
+
+    rest = await asyncio.gather(*(fetch_window(window) for window in windows))
+    return merge_pages([first, *rest])
+
+
+__all__ = [
+    "RESULT_WINDOW_LIMIT",
+    "SEMANTIC_RESULT_WINDOW_LIMIT",
+    "IMAGE_PAGE_SIZE",
+    "IMAGE_MAX_OFFSET",
+    "IMAGE_RESULT_WINDOW_LIMIT",
+    "MAX_PAGE_SIZE",
+    "iter_pages",
+    "iter_results",
+    "aiter_pages",
+    "aiter_results",
+    "page_windows",
+    "merge_pages",
+    "fetch_all_pages",
+    "afetch_all_pages",
+    "page_results",
+    "page_total",
+]
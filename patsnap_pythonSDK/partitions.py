@@ -0,0 +1,208 @@
+"""Date-range partitioning past the 20,000 result window.
+
+``query_search`` and the assignee searches cap ``limit + offset`` at
+20,000, so a larger result set can only be read in slices. The planner
+probes ``query_count`` for the query, then halves its date range
+(``APD`` or ``PBD``) until every slice counts at most 20,000:
+``(query) AND APD:[20200101 TO 20200630]``. Each level of probes is issued
+at once on a bounded pool. Small neighbouring slices are then merged back,
+up to the window, so pages stay full.
+
+Every patent falls in exactly one slice, so the slices' counts should add
+up to the query's count. They do not when a single day holds more than
+20,000 patents, when patents have no date in the range, or when the index
+changes during the run; the plan is then marked incomplete.
+"""
+
+from __future__ import annotations
+
+import datetime
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Generator, Iterator, List, Optional, Set, Tuple
+
+from .pagination import MAX_PAGE_SIZE, RESULT_WINDOW_LIMIT
+
+
+DATE_FIELDS = ("APD", "PBD")
+
+# Default date range swept when the query's range is not given
+EARLIEST_DATE = datetime.date(1700, 1, 1)
+
+# query_text limit of query_count and query_search
+MAX_QUERY_LENGTH = 1500
+
+# Assignee search -> (name parameter, query field of the standardized names)
+ASSIGNEE_QUERY_FIELDS = {
+    "company_search": ("application", "ANS"),
+    "current_assignee_search": ("assignee", "ANCS"),
+}
+
+
+@dataclass
+class Partition:
+    """One date slice of a query."""
+
+    query_text: str
+    start: datetime.date
+    end: datetime.date
+    count: int
+
+
+@dataclass
+class QueryPartitions:
+    """Date slices covering a query, each within the result window."""
+
+    query_text: str
+    total: int
+    partitions: List[Partition] = field(default_factory=list)
+    # False if the slices do not add up to the query's count
+    complete: bool = True
+    # Number of query_count calls the plan took
+    probes: int = 0
+
+    def windows(self, page_size: int = MAX_PAGE_SIZE, window_limit: int = RESULT_WINDOW_LIMIT) -> List[Tuple[str, int, int]]:
+        """``(query_text, offset, limit)`` of every page needed to read all slices."""
+        return [
+            (partition.query_text, offset, min(page_size, reachable - offset))
+            for partition in self.partitions
+            for reachable in (min(partition.count, window_limit),)
+            for offset in range(0, reachable, page_size)
+        ]
+
+    def __len__(self) -> int:
+        return len(self.partitions)
+
+
+def date_clause(date_field: str, start: datetime.date, end: datetime.date) -> str:
+    """Inclusive range clause, e.g. ``APD:[20200101 TO 20200630]``."""
+    return f"{date_field}:[{start:%Y%m%d} TO {end:%Y%m%d}]"
+
+
+def assignee_query(names: str, query_field: str) -> str:
+    """Analytics query for an assignee search's ``' OR '``-separated names, e.g. ``ANCS:("Apple, Inc." OR "Huawei")``."""
+    quoted = " OR ".join('"{}"'.format(name.strip().replace('"', '\\"')) for name in names.split(" OR "))
+    return f"{query_field}:({quoted})"
+
+
+def plan_partitions(
+    query_text: str,
+    *,
+    date_field: str = "APD",
+    start: Optional[datetime.date] = None,
+    end: Optional[datetime.date] = None,
+    window_limit: int = RESULT_WINDOW_LIMIT,
+) -> Generator[List[str], List[int], QueryPartitions]:
+    """The plan as a generator: yields batches of queries to count, is sent their counts, returns the slices.
+
+    Drive it with :func:`facets.run_sweep` or :func:`facets.arun_sweep`.
+    """
+    if date_field not in DATE_FIELDS:
+        raise ValueError(f"date_field must be one of {', '.join(DATE_FIELDS)}; got {date_field!r}")
+    start = start or EARLIEST_DATE
+    end = end or datetime.date.today()
+    if start > end:
+        raise ValueError("start must not be after end")
+
+    def sliced(low: datetime.date, high: datetime.date) -> str:
+        text = f"({query_text}) AND {date_clause(date_field, low, high)}"
+        if len(text) > MAX_QUERY_LENGTH:
+            raise ValueError(f"Partition query is {len(text)} characters; the API accepts {MAX_QUERY_LENGTH}")
+        return text
+
+    (total,) = yield [query_text]
+    plan = QueryPartitions(query_text, total, probes=1)
+    if total <= window_limit:
+        if total:
+            plan.partitions.append(Partition(query_text, start, end, total))
+        return plan
+
+    leaves: List[Partition] = []
+    # Ranges known to count more than the window
+    oversized = [(start, end, total)]
+    while oversized:
+        halves = []
+        for low, high, count in oversized:
+            if low == high:
+                # A single day over the window: only its first window_limit results are reachable
+                leaves.append(Partition(sliced(low, high), low, high, count))
+                plan.complete = False
+                continue
+            middle = datetime.date.fromordinal((low.toordinal() + high.toordinal()) // 2)
+            halves.extend([(low, middle), (middle + datetime.timedelta(days=1), high)])
+        if not halves:
+            break
+        counts = yield [sliced(low, high) for low, high in halves]
+        plan.probes += len(halves)
+        oversized = []
+        for (low, high), count in zip(halves, counts):
+            if count > window_limit:
+                oversized.append((low, high, count))
+            elif count:
+                leaves.append(Partition(sliced(low, high), low, high, count))
+
+    plan.partitions = merge_adjacent(sorted(leaves, key=lambda leaf: leaf.start), query_text, date_field, window_limit)
+    plan.complete = plan.complete and sum(partition.count for partition in plan.partitions) == total
+    return plan
+
+
+def merge_adjacent(
+    partitions: List[Partition],
+    query_text: str,
+    date_field: str,
+    window_limit: int = RESULT_WINDOW_LIMIT,
+) -> List[Partition]:
+    """Merge runs of date-ordered slices whose counts fit the window together.
+
+    Empty ranges between slices hold no results, so a merged slice spans
+    from the first slice's start to the last one's end.
+    """
+    merged: List[Partition] = []
+    for partition in partitions:
+        last = merged[-1] if merged else None
+        if last is not None and last.count + partition.count <= window_limit:
+            text = f"({query_text}) AND {date_clause(date_field, last.start, partition.end)}"
+            merged[-1] = Partition(text, last.start, partition.end, last.count + partition.count)
+        else:
+            merged.append(partition)
+    return merged
+
+
+def unique_rows(rows: Iterator[Any]) -> Iterator[Any]:
+    """Drop rows whose ``patent_id`` was already seen; rows may be models, records or dicts."""
+    seen: Set[Any] = set()
+    for row in rows:
+        if _is_new_row(row, seen):
+            yield row
+
+
+async def aunique_rows(rows: AsyncIterator[Any]) -> AsyncIterator[Any]:
+    """Async equivalent of :func:`unique_rows`."""
+    seen: Set[Any] = set()
+    async for row in rows:
+        if _is_new_row(row, seen):
+            yield row
+
+
+def _is_new_row(row: Any, seen: Set[Any]) -> bool:
+    """Whether ``row``'s ``patent_id`` is not in ``seen``; records it there. Rows without an id are always new."""
+    patent_id = row.get("patent_id") if isinstance(row, dict) else getattr(row, "patent_id", None)
+    if patent_id is None:
+        return True
+    if patent_id in seen:
+        return False
+    seen.add(patent_id)
+    return True
+
+
+__all__ = [
+    "DATE_FIELDS",
+    "ASSIGNEE_QUERY_FIELDS",
+    "Partition",
+    "QueryPartitions",
+    "date_clause",
+    "assignee_query",
+    "plan_partitions",
+    "merge_adjacent",
+    "unique_rows",
+    "aunique_rows",
+]
@@ -0,0 +1,74 @@
+"""Shared response parsers used by the resource handlers.
+
+Resources pass these to ``HttpClient.call`` so the same parsing runs for both
+the sync and the async HTTP clients. Parsers tagged with :func:`validates_json`
+carry the response model the raw body validates into, which lets the HTTP
+client call ``model_validate_json`` instead of building a dict first.
+Parsers build their results with :func:`build` and :func:`build_list`, which
+honour the ``lazy`` and ``compact`` response modes.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterable, List, Type, TypeVar
+
+from pydantic import BaseModel
+
+from ..models.search.patents import SearchComputeV2Response, SearchPatentV2Response
+from ..utils.records import to_compact
+from ..utils.responsemode import COMPACT, LAZY, LazyModelList, compact_model, current_response_mode, lazy_model
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+M = TypeVar("M", bound=BaseModel)
+
+
+def validates_json(model: Type[BaseModel]) -> Callable[[F], F]:
+    """Mark a parser whose input, the full response body, validates as ``model``."""
+
+    def decorate(parse: F) -> F:
+        parse.response_model = model  # type: ignore[attr-defined]
+        return parse
+
+    return decorate
+
+
+def build(model: Type[M], **fields: Any) -> M:
+    """Create ``model`` from ``fields``, unvalidated in the ``lazy`` and ``compact`` response modes."""
+    mode = current_response_mode()
+    if mode == LAZY:
+        return lazy_model(model, fields)
+    if mode == COMPACT:
+        return compact_model(model, fields)
+    return model(**fields)
+
+
+def build_list(model: Type[M], rows: Iterable[Dict[str, Any]]) -> List[M]:
+    """Create a list of ``model``; lazily validated or compact records in those response modes."""
+    mode = current_response_mode()
+    if mode == LAZY:
+        return LazyModelList(model, rows)
+    # query_filter rows keep everything in extras, which records have no slots for
+    if mode == COMPACT and model.model_fields:
+        return to_compact(model, rows)
+    return [model(**row) for row in rows]
+
+
+def unwrap_data(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the ``data`` section, handling both wrapped and direct response formats."""
+    if "data" in response:
+        return response["data"]
+    return response
+
+
+@validates_json(SearchPatentV2Response)
+def parse_search_patent_v2(response: Dict[str, Any]) -> SearchPatentV2Response:
+    return build(SearchPatentV2Response, data=unwrap_data(response))
+
+
+@validates_json(SearchComputeV2Response)
+def parse_search_compute_v2(response: Dict[str, Any]) -> SearchComputeV2Response:
+    return build(SearchComputeV2Response, data=unwrap_data(response))
+
+
+__all__ = ["validates_json", "build", "build_list", "unwrap_data", "parse_search_patent_v2", "parse_search_compute_v2"]
@@ -1,8 +1,24 @@
 from __future__ import annotations
 
-from typing import Optional, List
+import asyncio
+import datetime
+import warnings
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, Mapping, Optional, List, Sequence, Union
 
-from ...http import HttpClient
+from ...counts import CountMatrix, DimValues, assemble, cell_queries, count_of, grid_axes
+from ...facets import DEFAULT_PARTITIONS, PARTITION_CLAUSES, FacetRequest, FacetTable, arun_sweep, plan_sweep, run_sweep
+from ...http import AsyncHttpClient, HttpClient
+from ...pagination import (
+    MAX_PAGE_SIZE,
+    RESULT_WINDOW_LIMIT,
+    afetch_all_pages,
+    aiter_results,
+    fetch_all_pages,
+    iter_results,
+    page_results,
+)
+from ...partitions import QueryPartitions, aunique_rows, plan_partitions, unique_rows
+from .._parsing import build, build_list, parse_search_patent_v2, unwrap_data
 from ...models.analytics.search import (
     AnalyticsQuerySearchCountRequest,
     SearchPatentCountResponse,
@@ -11,7 +27,9 @@ from ...models.analytics.search import (
     AnalyticsQueryFilterRequest,
     PatentDataFieldResponse,
 )
-from ...models.search.patents import SearchPatentV2Response
+from ...models.search.patents import PatentBaseV2Response, SearchPatentV2Response
+from ...utils.concurrency import aimap_ordered, imap_ordered, map_ordered
+from ...utils.responsemode import DICT, response_mode
 
 
 class AnalyticsSearchResource:
@@ -75,11 +93,88 @@ class AnalyticsSearchResource:
         # Convert request to dict and filter out None values
         json_data = {k: v for k, v in request.model_dump().items() if v is not None}
         
-        # Make HTTP request
-        response = self._http.post("/search/patent/query-search-count/v2", json=json_data)
+        # Make HTTP request and parse the response
+        return self._http.call(
+            "/search/patent/query-search-count/v2",
+            json=json_data,
+            parse=lambda response: build(SearchPatentCountResponse, **response["data"]),
+        )
+    
+    def count_matrix(
+        self,
+        terms: Union[Sequence[str], Mapping[Any, str]],
+        dims: Optional[Mapping[str, DimValues]] = None,
+        *,
+        concurrency: int = 8,
+        **params,
+    ) -> CountMatrix:
+        """
+        Count patents for every cell of a terms x dimensions grid.
+        
+        Each cell becomes one query_count call with
+        ``(term) AND <clause per dimension value>``. Identical cell queries are
+        counted once, and the calls run with at most ``concurrency`` in flight.
+        Values of PUBLICATION_YEAR, APPLICATION_YEAR and AUTHORITY turn into
+        PBD/APD year ranges and authority filters; for any other dimension pass
+        a mapping of label to query clause. Configure a response cache on the
+        client to reuse counts across runs.
         
-        # Parse and return response
-        return SearchPatentCountResponse(**response["data"])
+        Args:
+            terms: Query texts, or a mapping of label to query text
+            dims: Ordered mapping of dimension name to its values
+                  (e.g. {"PUBLICATION_YEAR": range(2015, 2025), "AUTHORITY": ["US", "CN", "EP"]})
+            concurrency: Maximum requests in flight (default: 8)
+            **params: Any other query_count parameter (collapse_type, stemming, ...)
+            
+        Returns:
+            CountMatrix: Counts indexed by term then each dimension, with
+            ``to_numpy()``, ``to_pandas()`` and ``get(term, *values)``
+            (awaitable on the async client)
+            
+        Raises:
+            ApiError: If any call fails
+            ValueError: If a dimension has no query clause or a cell query is too long
+            
+        Example:
+            >>> matrix = resource.count_matrix(
+            ...     {"VR": "TACD: virtual reality", "AR": "TACD: augmented reality"},
+            ...     {"PUBLICATION_YEAR": range(2015, 2025), "AUTHORITY": ["US", "CN"]},
+            ... )
+            >>> matrix.to_numpy().shape
+            (2, 10, 2)
+            >>> matrix.get("VR", 2020, "US")
+        """
+        concurrency = self._http.fan_out(concurrency)
+        axes, fragments = grid_axes(terms, dims or {})
+        queries = cell_queries(fragments)
+        distinct = list(dict.fromkeys(queries))
+        if isinstance(self._http, AsyncHttpClient):
+            return self._acount_matrix(axes, queries, distinct, concurrency, params)
+
+        def count(query_text: str) -> int:
+            return count_of(self.query_count(query_text=query_text, **params))
+
+        counts = map_ordered(count, distinct, concurrency=concurrency)
+        return assemble(axes, queries, dict(zip(distinct, counts)))
+
+    async def _acount_matrix(
+        self,
+        axes: List[Any],
+        queries: List[str],
+        distinct: List[str],
+        concurrency: int,
+        params: Dict[str, Any],
+    ) -> CountMatrix:
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def count(query_text: str) -> int:
+            async with semaphore:
+                return count_of(await self.query_count(query_text=query_text, **params))
+
+        counts = await asyncio.gather(*(count(query_text) for query_text in distinct))
+        return assemble(axes, queries, dict(zip(distinct, counts)))
     
     def query_search(
         self,
@@ -147,23 +242,234 @@ class AnalyticsSearchResource:
             collapse_type=collapse_type,
         )
         
-        # Convert request to dict and filter out None values
+        # Convert request to dict and filter out None values; model_dump() turns
+        # the SortField objects back into {"field", "order"} dicts
         json_data = {k: v for k, v in request.model_dump().items() if v is not None}
         
-        # Convert SortField objects back to dicts for JSON serialization
-        if json_data.get("sort"):
-            json_data["sort"] = [{"field": s.field, "order": s.order} for s in json_data["sort"]]
+        # Make HTTP request and parse the response (wrapped or direct format)
+        return self._http.call("/search/patent/query-search-patent/v2", json=json_data, parse=parse_search_patent_v2)
+    
+    def iter_query_search(
+        self,
+        *,
+        offset: int = 0,
+        page_size: int = MAX_PAGE_SIZE,
+        max_results: Optional[int] = None,
+        prefetch: bool = True,
+        **params,
+    ) -> Iterator[PatentBaseV2Response]:
+        """
+        Iterate over every result of an analytics query, page by page.
+        
+        Pages are requested lazily and the next page is prefetched while the
+        current one is consumed. Iteration stops at total_search_result_count
+        or at the 20,000 result window, whichever comes first.
+        On the async client this returns an async iterator (``async for``).
+        
+        Args:
+            offset: Offset of the first result (default: 0)
+            page_size: Results per request (1-1000, default: 1000)
+            max_results: Stop after this many results (default: no limit)
+            prefetch: Fetch the next page in the background (default: True)
+            **params: Any other query_search parameter (query_text, sort, ...)
+            
+        Yields:
+            PatentBaseV2Response: Individual patent results
+            
+        Example:
+            >>> for patent in resource.iter_query_search(query_text="TACD: virtual reality"):
+            ...     print(patent.pn)
+        """
+        iterate = aiter_results if isinstance(self._http, AsyncHttpClient) else iter_results
+        return iterate(
+            lambda page_offset, page_limit: self.query_search(offset=page_offset, limit=page_limit, **params),
+            offset=offset,
+            page_size=page_size,
+            max_results=max_results,
+            window_limit=RESULT_WINDOW_LIMIT,
+            prefetch=prefetch,
+        )
+    
+    def fetch_all(
+        self,
+        endpoint: str = "query_search",
+        *,
+        concurrency: int = 4,
+        offset: int = 0,
+        page_size: int = MAX_PAGE_SIZE,
+        max_results: Optional[int] = None,
+        **params,
+    ) -> SearchPatentV2Response:
+        """
+        Fetch every page of an analytics query concurrently and merge them in order.
         
-        # Make HTTP request
-        response = self._http.post("/search/patent/query-search-patent/v2", json=json_data)
+        The first page is requested alone to learn total_search_result_count, then
+        the remaining offset windows are issued in parallel with at most
+        ``concurrency`` requests in flight. On the async client this returns an
+        awaitable.
         
-        # Parse and return response - handle both wrapped and direct response formats
-        if "data" in response:
-            # Response has data wrapper
-            return SearchPatentV2Response(data=response["data"])
-        else:
-            # Response is direct data (no wrapper)
-            return SearchPatentV2Response(data=response)
+        Args:
+            endpoint: Paginated method name (only query_search)
+            concurrency: Maximum requests in flight (default: 4)
+            offset: Offset of the first result (default: 0)
+            page_size: Results per request (1-1000, default: 1000)
+            max_results: Stop after this many results (default: no limit)
+            **params: Any other query_search parameter (query_text, sort, ...)
+            
+        Returns:
+            SearchPatentV2Response: All results in one response
+            
+        Raises:
+            ApiError: If any page request fails
+            ValueError: If the endpoint is not paginated
+            
+        Example:
+            >>> everything = resource.fetch_all(query_text="TACD: virtual reality", concurrency=8)
+            >>> print(len(everything.data.results))
+        """
+        concurrency = self._http.fan_out(concurrency)
+        if endpoint != "query_search":
+            raise ValueError(f"Unsupported endpoint for fetch_all: {endpoint}. Use: query_search")
+        fetch = afetch_all_pages if isinstance(self._http, AsyncHttpClient) else fetch_all_pages
+        return fetch(
+            lambda page_offset, page_limit: self.query_search(offset=page_offset, limit=page_limit, **params),
+            offset=offset,
+            page_size=page_size,
+            max_results=max_results,
+            window_limit=RESULT_WINDOW_LIMIT,
+            concurrency=concurrency,
+        )
+    
+    def partition_query(
+        self,
+        *,
+        query_text: str,
+        date_field: str = "APD",
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+        concurrency: int = 4,
+        **params,
+    ) -> QueryPartitions:
+        """
+        Split an analytics query into date slices that each fit the 20,000 result window.
+        
+        Probes query_count for the query, then halves its date range until
+        every slice counts at most 20,000 results; each level of probes runs
+        concurrently. Neighbouring slices are merged back while their counts
+        fit the window together.
+        
+        Args:
+            query_text: Analytics query, maximum length 1,500 characters
+            date_field: Date to split by: APD (application date, default) or PBD (publication date)
+            start: First date of the range to split (default: 1700-01-01)
+            end: Last date of the range to split (default: today)
+            concurrency: Maximum requests in flight (default: 4)
+            **params: Any other query_count parameter (collapse_type, stemming, ...)
+            
+        Returns:
+            QueryPartitions: The slices, with their queries and counts
+            (awaitable on the async client). ``complete`` is False when the
+            slices do not add up to the query's count, e.g. because one day
+            holds more than 20,000 results.
+            
+        Raises:
+            ApiError: If any call fails
+            ValueError: If date_field is unknown or a slice query is too long
+            
+        Example:
+            >>> plan = resource.partition_query(query_text="TACD: battery")
+            >>> print(plan.total, len(plan), plan.complete)
+        """
+        concurrency = self._http.fan_out(concurrency)
+        plan = plan_partitions(query_text, date_field=date_field, start=start, end=end, window_limit=RESULT_WINDOW_LIMIT)
+        if isinstance(self._http, AsyncHttpClient):
+
+            async def acount(text: str) -> int:
+                return count_of(await self.query_count(query_text=text, **params))
+
+            return arun_sweep(plan, acount, concurrency=concurrency)
+
+        def count(text: str) -> int:
+            return count_of(self.query_count(query_text=text, **params))
+
+        return run_sweep(plan, count, concurrency=concurrency)
+    
+    def iter_partitioned_search(
+        self,
+        *,
+        query_text: str,
+        date_field: str = "APD",
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        concurrency: int = 4,
+        **params,
+    ) -> Iterator[PatentBaseV2Response]:
+        """
+        Iterate over every result of an analytics query, past the 20,000 result window.
+        
+        Splits the query into date slices with :meth:`partition_query`, then
+        pages through every slice with ``concurrency`` pages in flight ahead of
+        the consumer. Rows come slice by slice in date order and are
+        de-duplicated by patent_id. The slices are planned when this is
+        called (on the async client, when iteration starts); a
+        ``RuntimeWarning`` is issued if they do not cover the whole result
+        set. On the async client this returns an async iterator
+        (``async for``).
+        
+        Args:
+            query_text: Analytics query, maximum length 1,500 characters
+            date_field: Date to split by: APD (application date, default) or PBD (publication date)
+            start: First date of the range to split (default: 1700-01-01)
+            end: Last date of the range to split (default: today)
+            page_size: Results per request (1-1000, default: 1000)
+            concurrency: Maximum requests in flight (default: 4)
+            **params: Any other query_search parameter (sort, collapse_type, ...)
+            
+        Yields:
+            PatentBaseV2Response: Individual patent results
+            
+        Example:
+            >>> for patent in resource.iter_partitioned_search(query_text="TACD: battery", concurrency=8):
+            ...     print(patent.pn)
+        """
+        concurrency = self._http.fan_out(concurrency)
+        count_params = {key: value for key, value in params.items() if key != "sort"}
+        plan = self.partition_query(
+            query_text=query_text, date_field=date_field, start=start, end=end, concurrency=concurrency, **count_params
+        )
+        if isinstance(self._http, AsyncHttpClient):
+            return self._aiter_partitioned_search(plan, page_size, concurrency, params)
+        _warn_incomplete(plan)
+
+        def fetch(window: Any) -> list:
+            text, offset, limit = window
+            return page_results(self.query_search(query_text=text, offset=offset, limit=limit, **params))
+
+        pages = imap_ordered(fetch, plan.windows(page_size, RESULT_WINDOW_LIMIT), concurrency=concurrency)
+        return unique_rows(row for rows in pages for row in rows)
+    
+    async def _aiter_partitioned_search(
+        self,
+        planning: Awaitable[QueryPartitions],
+        page_size: int,
+        concurrency: int,
+        params: Dict[str, Any],
+    ) -> AsyncIterator[PatentBaseV2Response]:
+        plan = await planning
+        _warn_incomplete(plan)
+
+        async def fetch(window: Any) -> list:
+            text, offset, limit = window
+            return page_results(await self.query_search(query_text=text, offset=offset, limit=limit, **params))
+
+        async def rows() -> AsyncIterator[PatentBaseV2Response]:
+            async for page in aimap_ordered(fetch, plan.windows(page_size, RESULT_WINDOW_LIMIT), concurrency=concurrency):
+                for row in page:
+                    yield row
+
+        async for row in aunique_rows(rows()):
+            yield row
     
     def query_filter(
         self,
@@ -236,15 +542,95 @@ class AnalyticsSearchResource:
         # Convert request to dict and filter out None values
         json_data = {k: v for k, v in request.model_dump().items() if v is not None}
         
-        # Make HTTP request
-        response = self._http.post("/search/patent/query/v2", json=json_data)
+        # Make HTTP request and parse the response
+        return self._http.call("/search/patent/query/v2", json=json_data, parse=_parse_query_filter)
+    
+    def facet_sweep(
+        self,
+        *,
+        query: str,
+        fields: Union[str, Sequence[str]],
+        partitions: Sequence[str] = DEFAULT_PARTITIONS,
+        partition_clauses: Optional[Mapping[str, Callable[[str], str]]] = None,
+        concurrency: int = 4,
+        **params,
+    ) -> Dict[str, FacetTable]:
+        """
+        Get the complete bucket distribution of one or more fields.
         
-        # Parse and return response - the API returns a list of objects
-        results = []
-        for item in response["data"]:
-            results.append(PatentDataFieldResponse(**item))
+        query_filter returns the top 200 buckets of a field at most. This reads
+        both 100-bucket pages of every field, five fields per call, and when a
+        field fills all 200 buckets it splits the query by each value of a
+        partitioning dimension (by default publication year, then authority)
+        and sweeps every slice. The slices' counts are summed into one table
+        per field. Each level of calls runs concurrently, and pages already
+        fetched during the sweep are reused.
         
-        return results
+        Args:
+            query: Analytics query, maximum length 800 characters
+            fields: Field codes, as a list or comma-separated (ASSIGNEE, IPC, ...)
+            partitions: Dimensions to split capped queries by, in order
+                       (default: PUBLICATION_YEAR, AUTHORITY)
+            partition_clauses: Query clause for each dimension value, to add or
+                              override dimensions (see ``facets.PARTITION_CLAUSES``)
+            concurrency: Maximum requests in flight (default: 4)
+            **params: Any other query_filter parameter (lang, collapse_type, ...)
+            
+        Returns:
+            Dict[str, FacetTable]: One table per field, keyed by field code
+            (awaitable on the async client). ``FacetTable.complete`` is False
+            when part of the long tail could not be reached.
+            
+        Raises:
+            ApiError: If any call fails
+            ValueError: If a partition dimension has no query clause
+            
+        Example:
+            >>> tables = resource.facet_sweep(query="TACD: virtual reality", fields=["ASSIGNEE", "IPC"])
+            >>> for name, count in tables["ASSIGNEE"].top(10):
+            ...     print(f"{name}: {count}")
+        """
+        concurrency = self._http.fan_out(concurrency)
+        codes = [code.strip() for code in fields.split(",")] if isinstance(fields, str) else list(fields)
+        sweep = plan_sweep(
+            query,
+            codes,
+            partitions=partitions,
+            partition_clauses={**PARTITION_CLAUSES, **(partition_clauses or {})},
+        )
+        if isinstance(self._http, AsyncHttpClient):
+
+            async def afetch(request: FacetRequest) -> List[Dict[str, Any]]:
+                query_text, field, offset, limit = request
+                # Raw rows: the sweep reads every bucket list whatever the response mode
+                with response_mode(DICT):
+                    payload = await self.query_filter(query=query_text, field=field, offset=offset, limit=limit, **params)
+                return unwrap_data(payload)
+
+            return arun_sweep(sweep, afetch, concurrency=concurrency)
+
+        def fetch(request: FacetRequest) -> List[Dict[str, Any]]:
+            query_text, field, offset, limit = request
+            with response_mode(DICT):
+                payload = self.query_filter(query=query_text, field=field, offset=offset, limit=limit, **params)
+            return unwrap_data(payload)
+
+        return run_sweep(sweep, fetch, concurrency=concurrency)
+
+
+def _warn_incomplete(plan: QueryPartitions) -> None:
+    if not plan.complete:
+        warnings.warn(
+            f"Date slices of {plan.query_text!r} cover {sum(p.count for p in plan.partitions)} of {plan.total} results; "
+            "see partition_query() for the slices",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+
+
+def _parse_query_filter(response: Dict[str, Any]) -> List[PatentDataFieldResponse]:
+    # The API returns a list of objects
+    return build_list(PatentDataFieldResponse, response["data"])
 
 
 __all__ = ["AnalyticsSearchResource"]
@@ -1,31 +1,73 @@
 from __future__ import annotations
 
-from typing import Optional, List, Dict, Union, BinaryIO
+from typing import Any, Iterable, Iterator, Optional, List, Dict, Sequence, Tuple, Union, BinaryIO
+import asyncio
 import os
 from pathlib import Path
 
-from ...http import HttpClient
+from ...bulk import AsyncBulkRun, BulkRun
+from ...claims import ClaimScoreCache, ascore_pairs, escape_claim, require_numpy, score_of, score_pairs, to_matrix
+from ...fusion import ScoreAggregate, check_aggregate, fuse_results
+from ...http import AsyncHttpClient, HttpClient
+from ...partitions import ASSIGNEE_QUERY_FIELDS, assignee_query
+from ...uploads import ImagePreprocessor, PreparedImage, UploadCache, file_url_of, prepare_image
+from ...utils.concurrency import map_ordered
+from ...utils.responsemode import MODEL, response_mode
+from ...utils.singleflight import AsyncSingleFlight, SingleFlight
+from ...pagination import (
+    IMAGE_MAX_OFFSET,
+    IMAGE_PAGE_SIZE,
+    IMAGE_RESULT_WINDOW_LIMIT,
+    MAX_PAGE_SIZE,
+    RESULT_WINDOW_LIMIT,
+    SEMANTIC_RESULT_WINDOW_LIMIT,
+    afetch_all_pages,
+    aiter_results,
+    fetch_all_pages,
+    iter_results,
+    page_windows,
+)
+from .._parsing import build, parse_search_compute_v2, parse_search_patent_v2
+from ..analytics import AnalyticsSearchResource
 from ...models.search.patents import (
     PatentSearchPnRequest, 
+    PatentBaseV2Response,
     SearchPatentV2Response,
     CompanySearchRequest,
     CurrentAssigneeSearchRequest,
     DefensePatentSearchRequest,
     SimilarPatentSearchRequest,
+    SemanticResult,
     SearchComputeV2Response,
     SemanticSearchRequest,
     FileUrlResponse,
     ImageSearchSingleRequest,
     ImageSearchResponse,
     ImageSearchMultipleRequest,
+    PatentMessage,
     PatentClaimSimRequest,
     ClaimSimResponse,
 )
 
 
+# Offset/limit endpoints and the limit + offset window each one allows
+PAGINATED_ENDPOINTS = {
+    "company_search": RESULT_WINDOW_LIMIT,
+    "current_assignee_search": RESULT_WINDOW_LIMIT,
+    "defense_patent_search": RESULT_WINDOW_LIMIT,
+    "similar_patent_search": SEMANTIC_RESULT_WINDOW_LIMIT,
+    "semantic_search": SEMANTIC_RESULT_WINDOW_LIMIT,
+}
+
+
 class PatentsSearchResource:
     def __init__(self, http_client: HttpClient) -> None:
         self._http = http_client
+        # Claim-similarity scores by content hash, shared by batch and matrix calls
+        self._claim_scores = ClaimScoreCache()
+        # Upload URLs by image content hash, reused until shortly before they expire
+        self._uploads = UploadCache()
+        self._upload_flight = AsyncSingleFlight() if isinstance(http_client, AsyncHttpClient) else SingleFlight()
 
     def search_pn(
         self,
@@ -72,12 +114,64 @@ class PatentsSearchResource:
         # Convert the request to dict and filter out None values
         params = {k: v for k, v in request.model_dump().items() if v is not None}
         
-        response = self._http.post("/search/patent/pn-search-patent/v2", json=params)
         # Handle both wrapped and direct response formats
-        if "data" in response:
-            return SearchPatentV2Response(data=response["data"])
-        else:
-            return SearchPatentV2Response(data=response)
+        return self._http.call("/search/patent/pn-search-patent/v2", json=params, parse=parse_search_patent_v2)
+    
+    def search_pn_bulk(
+        self,
+        numbers: Iterable[str],
+        *,
+        number_type: str = "pn",
+        authority: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        concurrency: int = 8,
+        chunk: int = 1000,
+    ) -> Union[BulkRun[SearchPatentV2Response], AsyncBulkRun[SearchPatentV2Response]]:
+        """
+        Look up many patent or application numbers, one search_pn call each.
+        
+        Numbers are normalized (upper case, spaces and commas removed)
+        and each distinct number is looked up once, on a pool of ``concurrency``
+        workers. The input iterable is read lazily, at most ``chunk`` numbers
+        ahead of the results, so generators of millions of numbers are fine.
+        Results stream back in completion order as one ``(input, result)`` pair
+        per input, where ``result`` is the SearchPatentV2Response or the
+        exception the lookup raised. Inputs spelling the same number each get
+        a pair: repeats of a number in flight or among the last ``chunk``
+        results share its result, older repeats are looked up again. Once the
+        run is exhausted, ``run.stats`` holds throughput and error counts. On
+        the async client the run is consumed with ``async for``.
+        
+        Args:
+            numbers: Patent numbers (or application numbers, see number_type)
+            number_type: "pn" for patent numbers, "apno" for application numbers
+            authority: List of patent authorities to search in (e.g., ['US', 'CN'])
+            limit: Maximum results per number (default: API default of 10)
+            concurrency: Lookups in flight at once (default: 8)
+            chunk: Inputs read ahead of completed results (default: 1000)
+            
+        Returns:
+            BulkRun (AsyncBulkRun on the async client) yielding (input, result | exception)
+            
+        Raises:
+            ValueError: If number_type, concurrency or chunk is invalid
+            
+        Example:
+            >>> run = resource.search_pn_bulk(open("portfolio.txt"), concurrency=16)
+            >>> for number, result in run:
+            ...     if isinstance(result, Exception):
+            ...         print(number, "failed:", result)
+            >>> print(run.stats)
+        """
+        concurrency = self._http.fan_out(concurrency)
+        if number_type not in ("pn", "apno"):
+            raise ValueError("number_type must be 'pn' or 'apno'")
+
+        def lookup(number: str):
+            return self.search_pn(**{number_type: number}, authority=authority, limit=limit)
+
+        run_class = AsyncBulkRun if isinstance(self._http, AsyncHttpClient) else BulkRun
+        return run_class(lookup, numbers, concurrency=concurrency, chunk=chunk)
     
     def company_search(
         self,
@@ -141,14 +235,49 @@ class PatentsSearchResource:
         # Convert request to dict and filter out None values
         json_data = {k: v for k, v in request.model_dump().items() if v is not None}
         
-        # Make HTTP request
-        response = self._http.post("/search/patent/company-search-patent/v2", json=json_data)
+        # Make HTTP request and parse the response (wrapped or direct format)
+        return self._http.call("/search/patent/company-search-patent/v2", json=json_data, parse=parse_search_patent_v2)
+    
+    def iter_company_search(
+        self,
+        *,
+        offset: int = 0,
+        page_size: int = MAX_PAGE_SIZE,
+        max_results: Optional[int] = None,
+        prefetch: bool = True,
+        **params,
+    ) -> Iterator[PatentBaseV2Response]:
+        """
+        Iterate over every result of company_search, page by page.
+        
+        Walks an original assignee portfolio. Pages are requested lazily and the next page is prefetched while
+        the current one is consumed. Iteration stops at total_search_result_count
+        or at the 20,000 result window, whichever comes first.
+        On the async client this returns an async iterator (``async for``).
         
-        # Parse and return response - handle both wrapped and direct response formats
-        if "data" in response:
-            return SearchPatentV2Response(data=response["data"])
-        else:
-            return SearchPatentV2Response(data=response)
+        Args:
+            offset: Offset of the first result (default: 0)
+            page_size: Results per request (1-1000, default: 1000)
+            max_results: Stop after this many results (default: no limit)
+            prefetch: Fetch the next page in the background (default: True)
+            **params: Any other company_search parameter
+            
+        Yields:
+            PatentBaseV2Response: Individual patent results
+            
+        Example:
+            >>> for patent in resource.iter_company_search(application="Apple, Inc."):
+            ...     print(patent.pn)
+        """
+        iterate = aiter_results if isinstance(self._http, AsyncHttpClient) else iter_results
+        return iterate(
+            lambda page_offset, page_limit: self.company_search(offset=page_offset, limit=page_limit, **params),
+            offset=offset,
+            page_size=page_size,
+            max_results=max_results,
+            window_limit=RESULT_WINDOW_LIMIT,
+            prefetch=prefetch,
+        )
     
     def current_assignee_search(
         self,
@@ -212,14 +341,49 @@ class PatentsSearchResource:
         # Convert request to dict and filter out None values
         json_data = {k: v for k, v in request.model_dump().items() if v is not None}
         
-        # Make HTTP request
-        response = self._http.post("/search/patent/current-search-patent/v2", json=json_data)
+        # Make HTTP request and parse the response (wrapped or direct format)
+        return self._http.call("/search/patent/current-search-patent/v2", json=json_data, parse=parse_search_patent_v2)
+    
+    def iter_current_assignee_search(
+        self,
+        *,
+        offset: int = 0,
+        page_size: int = MAX_PAGE_SIZE,
+        max_results: Optional[int] = None,
+        prefetch: bool = True,
+        **params,
+    ) -> Iterator[PatentBaseV2Response]:
+        """
+        Iterate over every result of current_assignee_search, page by page.
         
-        # Parse and return response - handle both wrapped and direct response formats
-        if "data" in response:
-            return SearchPatentV2Response(data=response["data"])
-        else:
-            return SearchPatentV2Response(data=response)
+        Walks a current assignee portfolio. Pages are requested lazily and the next page is prefetched while
+        the current one is consumed. Iteration stops at total_search_result_count
+        or at the 20,000 result window, whichever comes first.
+        On the async client this returns an async iterator (``async for``).
+        
+        Args:
+            offset: Offset of the first result (default: 0)
+            page_size: Results per request (1-1000, default: 1000)
+            max_results: Stop after this many results (default: no limit)
+            prefetch: Fetch the next page in the background (default: True)
+            **params: Any other current_assignee_search parameter
+            
+        Yields:
+            PatentBaseV2Response: Individual patent results
+            
+        Example:
+            >>> for patent in resource.iter_current_assignee_search(assignee="Apple, Inc."):
+            ...     print(patent.pn)
+        """
+        iterate = aiter_results if isinstance(self._http, AsyncHttpClient) else iter_results
+        return iterate(
+            lambda page_offset, page_limit: self.current_assignee_search(offset=page_offset, limit=page_limit, **params),
+            offset=offset,
+            page_size=page_size,
+            max_results=max_results,
+            window_limit=RESULT_WINDOW_LIMIT,
+            prefetch=prefetch,
+        )
     
     def defense_patent_search(
         self,
@@ -284,24 +448,53 @@ class PatentsSearchResource:
         # Convert request to dict and filter out None values
         json_data = {k: v for k, v in request.model_dump().items() if v is not None}
         
-        # Make HTTP request
-        response = self._http.post("/search/patent/company-search-defense-patent/v2", json=json_data)
-        
-        # Handle empty response (no results found)
-        if not response or response == {}:
-            # Return empty response structure
-            empty_data = {
-                "results": [],
-                "result_count": 0,
-                "total_search_result_count": 0
-            }
-            return SearchPatentV2Response(data=empty_data)
-        
-        # Parse and return response - handle both wrapped and direct response formats
-        if "data" in response:
-            return SearchPatentV2Response(data=response["data"])
-        else:
-            return SearchPatentV2Response(data=response)
+        # Make HTTP request and parse the response
+        return self._http.call(
+            "/search/patent/company-search-defense-patent/v2",
+            json=json_data,
+            parse=_parse_defense_patent_search,
+        )
+    
+    def iter_defense_patent_search(
+        self,
+        *,
+        offset: int = 0,
+        page_size: int = MAX_PAGE_SIZE,
+        max_results: Optional[int] = None,
+        prefetch: bool = True,
+        **params,
+    ) -> Iterator[PatentBaseV2Response]:
+        """
+        Iterate over every result of defense_patent_search, page by page.
+        
+        Walks a defense applicant portfolio. Pages are requested lazily and the next page is prefetched while
+        the current one is consumed. Iteration stops at total_search_result_count
+        or at the 20,000 result window, whichever comes first.
+        On the async client this returns an async iterator (``async for``).
+        
+        Args:
+            offset: Offset of the first result (default: 0)
+            page_size: Results per request (1-1000, default: 1000)
+            max_results: Stop after this many results (default: no limit)
+            prefetch: Fetch the next page in the background (default: True)
+            **params: Any other defense_patent_search parameter
+            
+        Yields:
+            PatentBaseV2Response: Individual patent results
+            
+        Example:
+            >>> for patent in resource.iter_defense_patent_search(application="Lockheed Martin Corporation"):
+            ...     print(patent.pn)
+        """
+        iterate = aiter_results if isinstance(self._http, AsyncHttpClient) else iter_results
+        return iterate(
+            lambda page_offset, page_limit: self.defense_patent_search(offset=page_offset, limit=page_limit, **params),
+            offset=offset,
+            page_size=page_size,
+            max_results=max_results,
+            window_limit=RESULT_WINDOW_LIMIT,
+            prefetch=prefetch,
+        )
     
     def similar_patent_search(
         self,
@@ -378,15 +571,49 @@ class PatentsSearchResource:
         # Convert request to dict and filter out None values
         json_data = {k: v for k, v in request.model_dump().items() if v is not None}
         
-        # Make HTTP request
-        response = self._http.post("/search/patent/similar-search-patent/v2", json=json_data)
+        # Make HTTP request and parse the response (wrapped or direct format)
+        return self._http.call("/search/patent/similar-search-patent/v2", json=json_data, parse=parse_search_compute_v2)
+    
+    def iter_similar_patent_search(
+        self,
+        *,
+        offset: int = 0,
+        page_size: int = MAX_PAGE_SIZE,
+        max_results: Optional[int] = None,
+        prefetch: bool = True,
+        **params,
+    ) -> Iterator[SemanticResult]:
+        """
+        Iterate over every result of similar_patent_search, page by page.
         
-        # Parse and return response
-        # Handle both wrapped and direct response formats
-        if "data" in response:
-            return SearchComputeV2Response(data=response["data"])
-        else:
-            return SearchComputeV2Response(data=response)
+        Walks the similar patent list. Pages are requested lazily and the next page is prefetched while
+        the current one is consumed. Iteration stops at total_search_result_count
+        or at the 1,000 result window, whichever comes first.
+        On the async client this returns an async iterator (``async for``).
+        
+        Args:
+            offset: Offset of the first result (default: 0)
+            page_size: Results per request (1-1000, default: 1000)
+            max_results: Stop after this many results (default: no limit)
+            prefetch: Fetch the next page in the background (default: True)
+            **params: Any other similar_patent_search parameter
+            
+        Yields:
+            SemanticResult: Individual patent results
+            
+        Example:
+            >>> for patent in resource.iter_similar_patent_search(patent_number="US11205304B2"):
+            ...     print(patent.pn)
+        """
+        iterate = aiter_results if isinstance(self._http, AsyncHttpClient) else iter_results
+        return iterate(
+            lambda page_offset, page_limit: self.similar_patent_search(offset=page_offset, limit=page_limit, **params),
+            offset=offset,
+            page_size=page_size,
+            max_results=max_results,
+            window_limit=SEMANTIC_RESULT_WINDOW_LIMIT,
+            prefetch=prefetch,
+        )
     
     def semantic_search(
         self,
@@ -457,19 +684,148 @@ class PatentsSearchResource:
         # Convert request to dict and filter out None values
         json_data = {k: v for k, v in request.model_dump().items() if v is not None}
         
-        # Make HTTP request
-        response = self._http.post("/search/patent/semantic-search-patent/v2", json=json_data)
+        # Make HTTP request and parse the response (wrapped or direct format)
+        return self._http.call("/search/patent/semantic-search-patent/v2", json=json_data, parse=parse_search_compute_v2)
+    
+    def iter_semantic_search(
+        self,
+        *,
+        offset: int = 0,
+        page_size: int = MAX_PAGE_SIZE,
+        max_results: Optional[int] = None,
+        prefetch: bool = True,
+        **params,
+    ) -> Iterator[SemanticResult]:
+        """
+        Iterate over every result of semantic_search, page by page.
+        
+        Walks the semantic search result list. Pages are requested lazily and the next page is prefetched while
+        the current one is consumed. Iteration stops at total_search_result_count
+        or at the 1,000 result window, whichever comes first.
+        On the async client this returns an async iterator (``async for``).
         
-        # Parse and return response
-        # Handle both wrapped and direct response formats
-        if "data" in response:
-            return SearchComputeV2Response(data=response["data"])
-        else:
-            return SearchComputeV2Response(data=response)
+        Args:
+            offset: Offset of the first result (default: 0)
+            page_size: Results per request (1-1000, default: 1000)
+            max_results: Stop after this many results (default: no limit)
+            prefetch: Fetch the next page in the background (default: True)
+            **params: Any other semantic_search parameter
+            
+        Yields:
+            SemanticResult: Individual patent results
+            
+        Example:
+            >>> for patent in resource.iter_semantic_search(text=description):
+            ...     print(patent.pn)
+        """
+        iterate = aiter_results if isinstance(self._http, AsyncHttpClient) else iter_results
+        return iterate(
+            lambda page_offset, page_limit: self.semantic_search(offset=page_offset, limit=page_limit, **params),
+            offset=offset,
+            page_size=page_size,
+            max_results=max_results,
+            window_limit=SEMANTIC_RESULT_WINDOW_LIMIT,
+            prefetch=prefetch,
+        )
+    
+    def fetch_all(
+        self,
+        endpoint: str,
+        *,
+        concurrency: int = 4,
+        offset: int = 0,
+        page_size: int = MAX_PAGE_SIZE,
+        max_results: Optional[int] = None,
+        **params,
+    ) -> Union[SearchPatentV2Response, SearchComputeV2Response]:
+        """
+        Fetch every page of a paginated search concurrently and merge them in order.
+        
+        The first page is requested alone to learn total_search_result_count, then
+        the remaining offset windows are issued in parallel with at most
+        ``concurrency`` requests in flight. On the async client this returns an
+        awaitable.
+        
+        Args:
+            endpoint: Paginated method name: company_search, current_assignee_search,
+                     defense_patent_search, similar_patent_search or semantic_search
+            concurrency: Maximum requests in flight (default: 4)
+            offset: Offset of the first result (default: 0)
+            page_size: Results per request (1-1000, default: 1000)
+            max_results: Stop after this many results (default: no limit)
+            **params: Any other parameter of the chosen endpoint
+            
+        Returns:
+            SearchPatentV2Response or SearchComputeV2Response: All results in one response
+            
+        Raises:
+            ApiError: If any page request fails
+            ValueError: If the endpoint is not paginated
+            
+        Example:
+            >>> everything = resource.fetch_all(
+            ...     "current_assignee_search",
+            ...     assignee="Apple, Inc.",
+            ...     concurrency=8
+            ... )
+            >>> print(len(everything.data.results))
+        """
+        concurrency = self._http.fan_out(concurrency)
+        if endpoint not in PAGINATED_ENDPOINTS:
+            raise ValueError(f"Unsupported endpoint for fetch_all: {endpoint}. Use one of: {', '.join(PAGINATED_ENDPOINTS)}")
+        search = getattr(self, endpoint)
+        fetch = afetch_all_pages if isinstance(self._http, AsyncHttpClient) else fetch_all_pages
+        return fetch(
+            lambda page_offset, page_limit: search(offset=page_offset, limit=page_limit, **params),
+            offset=offset,
+            page_size=page_size,
+            max_results=max_results,
+            window_limit=PAGINATED_ENDPOINTS[endpoint],
+            concurrency=concurrency,
+        )
+    
+    def iter_partitioned(self, endpoint: str, **params) -> Iterator[PatentBaseV2Response]:
+        """
+        Iterate over an entire assignee portfolio, past the 20,000 result window.
+        
+        The assignee endpoints take no date filter, so the names are turned
+        into the equivalent analytics query on the standardized assignee field
+        (``ANS`` for company_search, ``ANCS`` for current_assignee_search) and
+        read with ``AnalyticsSearchResource.iter_partitioned_search``: the query
+        is split into date slices that each fit the window, the slices are paged
+        concurrently, and rows are de-duplicated by patent_id.
+        On the async client this returns an async iterator (``async for``).
+        
+        Args:
+            endpoint: company_search or current_assignee_search
+            **params: The endpoint's name parameter (application or assignee), plus
+                     any iter_partitioned_search parameter (date_field, start, end,
+                     page_size, concurrency, sort, collapse_type, ...)
+            
+        Yields:
+            PatentBaseV2Response: Individual patent results
+            
+        Raises:
+            ValueError: If the endpoint is not an assignee search
+            
+        Example:
+            >>> for patent in resource.iter_partitioned("current_assignee_search", assignee="Samsung Electronics"):
+            ...     print(patent.pn)
+        """
+        if endpoint not in ASSIGNEE_QUERY_FIELDS:
+            raise ValueError(f"Unsupported endpoint for iter_partitioned: {endpoint}. Use one of: {', '.join(ASSIGNEE_QUERY_FIELDS)}")
+        name_param, query_field = ASSIGNEE_QUERY_FIELDS[endpoint]
+        if name_param not in params:
+            raise TypeError(f"iter_partitioned('{endpoint}') requires {name_param}=")
+        query_text = assignee_query(params.pop(name_param), query_field)
+        return AnalyticsSearchResource(self._http).iter_partitioned_search(query_text=query_text, **params)
     
     def upload_image(
         self,
         image: Union[str, Path, BinaryIO],
+        *,
+        reuse: bool = True,
+        preprocess: Optional[ImagePreprocessor] = None,
     ) -> FileUrlResponse:
         """
         Upload an image and get a public URL for image search operations.
@@ -478,6 +834,17 @@ class PatentsSearchResource:
         for subsequent image search operations. The URL is valid for 9 hours and will
         be automatically deleted after expiration.
         
+        The file is streamed to the API rather than read into memory. Uploads are
+        keyed by the SHA-256 of the image content: an image this client uploaded
+        before whose URL is still valid for at least 10 minutes returns that URL
+        (with ``expire`` set to the seconds left) without another upload, and
+        concurrent uploads of the same image share one request.
+        
+        Pass an :class:`ImagePreprocessor` (requires Pillow) to downscale and
+        re-encode the image and strip its EXIF metadata first. The 4MB limit
+        then applies to the preprocessed image, so large photos are shrunk
+        rather than rejected.
+        
         Supported formats: JPG, PNG
         File size limit: 4MB (4096KB)
         URL validity: 9 hours (32400 seconds)
@@ -486,9 +853,12 @@ class PatentsSearchResource:
             image: Image file to upload. Can be:
                   - File path (str or Path object)
                   - File-like object (BinaryIO)
+            reuse: Reuse the unexpired URL of an identical earlier upload (default: True)
+            preprocess: Resize/re-encode the image before upload (default: send as is)
                   
         Returns:
-            FileUrlResponse: Contains the public URL and expiration time
+            FileUrlResponse: Contains the public URL and expiration time. Uploads
+            always return the model, whatever the response mode.
             
         Raises:
             ApiError: If the API request fails or returns an error
@@ -507,52 +877,131 @@ class PatentsSearchResource:
             >>> with open("image.png", "rb") as f:
             ...     result = resource.upload_image(f)
         """
-        # Validate and prepare file for upload
-        if isinstance(image, (str, Path)):
-            image_path = Path(image)
-            if not image_path.exists():
-                raise FileNotFoundError(f"Image file not found: {image_path}")
-            
-            # Check file extension
-            if image_path.suffix.lower() not in ['.jpg', '.jpeg', '.png']:
-                raise ValueError(f"Unsupported image format: {image_path.suffix}. Only JPG and PNG are supported.")
-            
-            # Check file size (4MB limit)
-            file_size = image_path.stat().st_size
-            if file_size > 4 * 1024 * 1024:  # 4MB in bytes
-                raise ValueError(f"Image file too large: {file_size / (1024*1024):.1f}MB. Maximum size is 4MB.")
-            
-            # Open file for upload
-            with open(image_path, 'rb') as f:
-                file_data = f.read()
-                filename = image_path.name
-        else:
-            # Handle file-like object
-            if hasattr(image, 'read'):
-                file_data = image.read()
-                filename = getattr(image, 'name', 'image.jpg')
-            else:
-                raise ValueError("Image must be a file path (str/Path) or file-like object")
-            
-            # Reset file pointer if possible
-            if hasattr(image, 'seek'):
-                try:
-                    image.seek(0)
-                except (OSError, IOError):
-                    pass  # Some file objects don't support seeking
-        
-        # Prepare multipart form data
-        files = {
-            'image': (filename, file_data, 'image/jpeg' if filename.lower().endswith(('.jpg', '.jpeg')) else 'image/png')
-        }
+        # Validate and open the file; its content is read while the request is sent
+        prepared = prepare_image(image, preprocess)
+        if isinstance(self._http, AsyncHttpClient):
+            return self._aupload(prepared, reuse)
+        try:
+            if not reuse:
+                return self._send_upload(prepared)
+            digest = prepared.digest()
+            return self._upload_flight.do(digest, lambda: self._upload_once(digest, prepared))
+        finally:
+            prepared.close()
+
+    def upload_images(
+        self,
+        images: Iterable[Union[str, Path, BinaryIO]],
+        *,
+        concurrency: int = 4,
+        reuse: bool = True,
+        preprocess: Optional[ImagePreprocessor] = None,
+    ) -> List[FileUrlResponse]:
+        """
+        Upload several images concurrently.
         
-        # Make HTTP request with file upload
-        # Note: This assumes the HttpClient has a method to handle multipart uploads
-        # If not available, this will need to be implemented in the HttpClient
-        response = self._http.post("/image-search/image-upload", files=files)
+        Each image goes through :meth:`upload_image`, so duplicates (by content)
+        are uploaded once and images uploaded earlier reuse their URLs.
         
-        # Parse and return response
-        return FileUrlResponse(**response["data"])
+        Args:
+            images: File paths or file-like objects
+            concurrency: Uploads in flight at once (default: 4)
+            reuse: Reuse the unexpired URL of an identical earlier upload (default: True)
+            preprocess: Resize/re-encode each image before upload (default: send as is)
+            
+        Returns:
+            List[FileUrlResponse]: One result per image, in input order
+            (awaitable on the async client)
+            
+        Raises:
+            ApiError: If any upload fails
+            FileNotFoundError: If an image file path doesn't exist
+            ValueError: If an image format or size is not supported
+            
+        Example:
+            >>> results = resource.upload_images(["front.png", "side.png", "top.png"])
+            >>> urls = [result.url for result in results]
+        """
+        concurrency = self._http.fan_out(concurrency)
+        images = list(images)
+        if isinstance(self._http, AsyncHttpClient):
+            return self._aupload_many(images, concurrency, reuse, preprocess)
+
+        def upload(image: Any) -> FileUrlResponse:
+            return self.upload_image(image, reuse=reuse, preprocess=preprocess)
+
+        return map_ordered(upload, images, concurrency=concurrency)
+
+    def _upload_once(self, digest: str, prepared: PreparedImage) -> FileUrlResponse:
+        cached = self._uploads.get(digest)
+        if cached is not None:
+            return FileUrlResponse(url=cached[0], expire=cached[1])
+        result = self._send_upload(prepared)
+        self._uploads.put(digest, *file_url_of(result))
+        return result
+
+    def _send_upload(self, prepared: PreparedImage) -> FileUrlResponse:
+        # The upload cache needs the url/expire fields, so parse into the model in every mode
+        with response_mode(MODEL):
+            return self._http.call(
+                "/image-search/image-upload",
+                files=prepared.files(),
+                parse=_parse_file_url,
+            )
+
+    async def _asend_upload(self, prepared: PreparedImage) -> FileUrlResponse:
+        with response_mode(MODEL):
+            return await self._http.call(
+                "/image-search/image-upload",
+                files=prepared.files(),
+                parse=_parse_file_url,
+            )
+
+    async def _aupload(self, prepared: PreparedImage, reuse: bool) -> FileUrlResponse:
+        handed_over = False
+        try:
+            if not reuse:
+                return await self._asend_upload(prepared)
+            digest = prepared.digest()
+
+            async def upload() -> FileUrlResponse:
+                cached = self._uploads.get(digest)
+                if cached is not None:
+                    return FileUrlResponse(url=cached[0], expire=cached[1])
+                result = await self._asend_upload(prepared)
+                self._uploads.put(digest, *file_url_of(result))
+                return result
+
+            def start() -> "asyncio.Future[FileUrlResponse]":
+                # The shared task reads the stream and outlives a cancelled
+                # caller, so it closes the stream when it finishes
+                nonlocal handed_over
+                task = asyncio.ensure_future(upload())
+                task.add_done_callback(lambda _: prepared.close())
+                handed_over = True
+                return task
+
+            return await self._upload_flight.do(digest, start)
+        finally:
+            if not handed_over:
+                prepared.close()
+
+    async def _aupload_many(
+        self,
+        images: List[Any],
+        concurrency: int,
+        reuse: bool,
+        preprocess: Optional[ImagePreprocessor],
+    ) -> List[FileUrlResponse]:
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def upload(image: Any) -> FileUrlResponse:
+            async with semaphore:
+                return await self.upload_image(image, reuse=reuse, preprocess=preprocess)
+
+        return list(await asyncio.gather(*(upload(image) for image in images)))
     
     def image_search(
         self,
@@ -662,11 +1111,8 @@ class PatentsSearchResource:
         # Convert request to dict and filter out None values
         json_data = {k: v for k, v in request.model_dump().items() if v is not None}
         
-        # Make HTTP request
-        response = self._http.post("/search/patent/image-single", json=json_data)
-        
-        # Parse and return response
-        return ImageSearchResponse(**response["data"])
+        # Make HTTP request and parse the response
+        return self._http.call("/search/patent/image-single", json=json_data, parse=_parse_image_search)
     
     def multi_image_search(
         self,
@@ -778,11 +1224,181 @@ class PatentsSearchResource:
         # Convert request to dict and filter out None values
         json_data = {k: v for k, v in request.model_dump().items() if v is not None}
         
-        # Make HTTP request
-        response = self._http.post("/search/patent/image-multiple", json=json_data)
+        # Make HTTP request and parse the response
+        return self._http.call("/search/patent/image-multiple", json=json_data, parse=_parse_image_search)
+    
+    def iter_image_search(
+        self,
+        *,
+        offset: int = 0,
+        page_size: int = IMAGE_PAGE_SIZE,
+        max_results: Optional[int] = None,
+        prefetch: bool = True,
+        **params,
+    ) -> Iterator[PatentMessage]:
+        """
+        Iterate over every result of image_search, page by page.
+        
+        Walks the whole reachable result list: image search caps ``limit`` at 100
+        and ``offset`` at 1000, so up to 1,100 results. The next page is
+        prefetched while the current one is consumed.
+        On the async client this returns an async iterator (``async for``).
         
-        # Parse and return response
-        return ImageSearchResponse(**response["data"])
+        Args:
+            offset: Offset of the first result (default: 0)
+            page_size: Results per request (1-100, default: 100)
+            max_results: Stop after this many results (default: no limit)
+            prefetch: Fetch the next page in the background (default: True)
+            **params: Any other image_search parameter (url, patent_type, model, ...)
+            
+        Yields:
+            PatentMessage: Individual patent results
+            
+        Example:
+            >>> for patent in resource.iter_image_search(url=image_url, patent_type="D", model=1):
+            ...     print(patent.patent_pn, patent.score)
+        """
+        iterate = aiter_results if isinstance(self._http, AsyncHttpClient) else iter_results
+        return iterate(
+            lambda page_offset, page_limit: self.image_search(offset=page_offset, limit=page_limit, **params),
+            offset=offset,
+            page_size=page_size,
+            max_results=max_results,
+            window_limit=IMAGE_RESULT_WINDOW_LIMIT,
+            max_offset=IMAGE_MAX_OFFSET,
+            prefetch=prefetch,
+        )
+    
+    def iter_multi_image_search(
+        self,
+        *,
+        offset: int = 0,
+        page_size: int = IMAGE_PAGE_SIZE,
+        max_results: Optional[int] = None,
+        prefetch: bool = True,
+        **params,
+    ) -> Iterator[PatentMessage]:
+        """
+        Iterate over every result of multi_image_search, page by page.
+        
+        Same as :meth:`iter_image_search`, for up to 4 image URLs.
+        On the async client this returns an async iterator (``async for``).
+        
+        Args:
+            offset: Offset of the first result (default: 0)
+            page_size: Results per request (1-100, default: 100)
+            max_results: Stop after this many results (default: no limit)
+            prefetch: Fetch the next page in the background (default: True)
+            **params: Any other multi_image_search parameter (urls, patent_type, model, ...)
+            
+        Yields:
+            PatentMessage: Individual patent results
+        """
+        iterate = aiter_results if isinstance(self._http, AsyncHttpClient) else iter_results
+        return iterate(
+            lambda page_offset, page_limit: self.multi_image_search(offset=page_offset, limit=page_limit, **params),
+            offset=offset,
+            page_size=page_size,
+            max_results=max_results,
+            window_limit=IMAGE_RESULT_WINDOW_LIMIT,
+            max_offset=IMAGE_MAX_OFFSET,
+            prefetch=prefetch,
+        )
+    
+    def image_search_fused(
+        self,
+        queries: Sequence[Union[ImageSearchSingleRequest, Dict[str, Any]]],
+        *,
+        depth: int = IMAGE_PAGE_SIZE,
+        aggregate: Union[str, ScoreAggregate] = "max",
+        rrf_k: int = 60,
+        concurrency: int = 4,
+    ) -> ImageSearchResponse:
+        """
+        Run several single-image searches in parallel and fuse their results.
+        
+        Each query fetches its top ``depth`` results: the first page of every
+        query goes out at once, then all remaining pages at once, with at most
+        ``concurrency`` requests in flight. Results are merged by ``patent_id``
+        and ranked by a fused score:
+        
+        - ``"max"``: best score in any query
+        - ``"mean"``: average over all queries, 0 where a query missed the patent
+        - ``"sum"``: total score, rewarding patents several queries found
+        - ``"rrf"``: reciprocal-rank fusion, for results not sorted by SCORE
+        - or a callable taking the per-query scores (None where missed)
+        
+        Args:
+            queries: ImageSearchSingleRequest objects or image_search keyword dicts;
+                     their ``offset`` and ``limit`` are ignored
+            depth: Results fetched per query (1-1100, default: 100)
+            aggregate: Score aggregation (default: "max")
+            rrf_k: Rank offset for "rrf" (default: 60)
+            concurrency: Requests in flight at once (default: 4)
+            
+        Returns:
+            ImageSearchResponse: One row per patent, best-scoring row first, with
+            ``score`` set to the fused score and ``total_search_result_count`` the
+            number of distinct patents (awaitable on the async client). Always a
+            model, whatever the response mode.
+            
+        Raises:
+            ApiError: If any search fails
+            ValueError: If ``depth`` or ``aggregate`` is invalid
+            
+        Example:
+            >>> fused = resource.image_search_fused(
+            ...     [{"url": front_url, "patent_type": "D", "model": 1},
+            ...      {"url": side_url, "patent_type": "D", "model": 1}],
+            ...     depth=300,
+            ...     aggregate="rrf",
+            ... )
+            >>> for patent in fused.patent_messages[:10]:
+            ...     print(patent.patent_pn, patent.score)
+        """
+        concurrency = self._http.fan_out(concurrency)
+        check_aggregate(aggregate)
+        if not 1 <= depth <= IMAGE_RESULT_WINDOW_LIMIT:
+            raise ValueError(f"depth must be between 1 and {IMAGE_RESULT_WINDOW_LIMIT}")
+        params = [_image_query(query) for query in queries]
+        first_limit = min(depth, IMAGE_PAGE_SIZE)
+        if isinstance(self._http, AsyncHttpClient):
+            return self._aimage_search_fused(params, first_limit, depth, aggregate, rrf_k, concurrency)
+
+        def search(item: Tuple[int, Tuple[int, int]]) -> ImageSearchResponse:
+            index, (page_offset, page_limit) = item
+            return self.image_search(offset=page_offset, limit=page_limit, **params[index])
+
+        # Fusion reads scores and copies rows, so fetch models in every mode
+        with response_mode(MODEL):
+            firsts = map_ordered(search, [(index, (0, first_limit)) for index in range(len(params))], concurrency=concurrency)
+            windows = _image_windows(firsts, depth)
+            rest = map_ordered(search, windows, concurrency=concurrency)
+        return _fuse_image_pages(firsts, windows, rest, aggregate, rrf_k)
+
+    async def _aimage_search_fused(
+        self,
+        params: List[Dict[str, Any]],
+        first_limit: int,
+        depth: int,
+        aggregate: Union[str, ScoreAggregate],
+        rrf_k: int,
+        concurrency: int,
+    ) -> ImageSearchResponse:
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def search(item: Tuple[int, Tuple[int, int]]) -> ImageSearchResponse:
+            index, (page_offset, page_limit) = item
+            async with semaphore:
+                return await self.image_search(offset=page_offset, limit=page_limit, **params[index])
+
+        with response_mode(MODEL):
+            firsts = await asyncio.gather(*(search((index, (0, first_limit))) for index in range(len(params))))
+            windows = _image_windows(firsts, depth)
+            rest = await asyncio.gather(*(search(window) for window in windows))
+        return _fuse_image_pages(firsts, windows, rest, aggregate, rrf_k)
     
     def claim_similarity(
         self,
@@ -848,13 +1464,163 @@ class PatentsSearchResource:
         
         # Escape special characters in claim texts to match API expectations
         # The API expects escaped \r\n and \t characters
-        if 'src' in json_data:
-            json_data['src'] = json_data['src'].replace('\n', '\\n').replace('\r', '\\r').replace('\t', '\\t')
-        if 'tgt' in json_data:
-            json_data['tgt'] = json_data['tgt'].replace('\n', '\\n').replace('\r', '\\r').replace('\t', '\\t')
+        json_data['src'] = escape_claim(json_data['src'])
+        json_data['tgt'] = escape_claim(json_data['tgt'])
+        
+        # Make HTTP request and parse the response
+        return self._http.call(
+            "/search/patent/claim-sim",
+            json=json_data,
+            parse=lambda response: build(ClaimSimResponse, **response),
+        )
+
+    def claim_similarity_batch(
+        self,
+        pairs: Iterable[Tuple[str, str]],
+        *,
+        concurrency: int = 8,
+        symmetric: bool = True,
+        cache: Optional[ClaimScoreCache] = None,
+    ) -> List[float]:
+        """
+        Score many (src, tgt) claim pairs concurrently.
         
-        # Make HTTP request
-        response = self._http.post("/search/patent/claim-sim", json=json_data)
+        Repeated pairs are scored once, and so are reversed pairs unless
+        ``symmetric=False``. Scores are cached by the content hash of both
+        texts, so pairs already scored by this client cost no call. The
+        remaining pairs run on a pool of ``concurrency`` workers.
         
-        # Parse and return response
-        return ClaimSimResponse(**response)
+        Args:
+            pairs: Iterable of (src, tgt) claim texts
+            concurrency: Calls in flight at once (default: 8)
+            symmetric: Treat (a, b) and (b, a) as the same pair (default: True)
+            cache: Score cache to use instead of this client's
+            
+        Returns:
+            List[float]: Scores in the order of ``pairs`` (awaitable on the async client)
+            
+        Raises:
+            ApiError: If any call fails
+            
+        Example:
+            >>> scores = resource.claim_similarity_batch([(claim_a, claim_b), (claim_a, claim_c)])
+        """
+        concurrency = self._http.fan_out(concurrency)
+        cache = cache or self._claim_scores
+        if isinstance(self._http, AsyncHttpClient):
+
+            async def ascore(src: str, tgt: str) -> float:
+                return score_of(await self.claim_similarity(src=src, tgt=tgt))
+
+            return ascore_pairs(ascore, pairs, cache=cache, concurrency=concurrency, symmetric=symmetric)
+
+        def score(src: str, tgt: str) -> float:
+            return score_of(self.claim_similarity(src=src, tgt=tgt))
+
+        return score_pairs(score, pairs, cache=cache, concurrency=concurrency, symmetric=symmetric)
+
+    def claim_similarity_matrix(
+        self,
+        srcs: Sequence[str],
+        tgts: Optional[Sequence[str]] = None,
+        *,
+        concurrency: int = 8,
+        symmetric: bool = True,
+        cache: Optional[ClaimScoreCache] = None,
+        as_array: bool = True,
+    ) -> Any:
+        """
+        Score every claim in ``srcs`` against every claim in ``tgts``.
+        
+        Runs as one :meth:`claim_similarity_batch`, so duplicate and mirrored
+        pairs (all of the lower triangle when ``tgts`` is omitted) cost no
+        extra calls.
+        
+        Args:
+            srcs: Source claim texts (matrix rows)
+            tgts: Target claim texts (matrix columns); defaults to ``srcs``
+            concurrency: Calls in flight at once (default: 8)
+            symmetric: Treat (a, b) and (b, a) as the same pair (default: True)
+            cache: Score cache to use instead of this client's
+            as_array: Return a NumPy array (requires numpy); False returns nested lists
+            
+        Returns:
+            numpy.ndarray of shape (len(srcs), len(tgts)), or a list of rows
+            (awaitable on the async client)
+            
+        Example:
+            >>> matrix = resource.claim_similarity_matrix(our_claims, their_claims, concurrency=16)
+            >>> print(matrix.max(axis=1))
+        """
+        if as_array:
+            require_numpy()
+        srcs = list(srcs)
+        tgts = srcs if tgts is None else list(tgts)
+        pairs = [(src, tgt) for src in srcs for tgt in tgts]
+        scores = self.claim_similarity_batch(pairs, concurrency=concurrency, symmetric=symmetric, cache=cache)
+        if isinstance(self._http, AsyncHttpClient):
+
+            async def reshape() -> Any:
+                return to_matrix(await scores, len(srcs), len(tgts), as_array=as_array)
+
+            return reshape()
+        return to_matrix(scores, len(srcs), len(tgts), as_array=as_array)
+
+
+def _parse_file_url(response: Dict[str, Any]) -> FileUrlResponse:
+    return FileUrlResponse(**response["data"])
+
+
+def _parse_defense_patent_search(response: Dict[str, Any]) -> SearchPatentV2Response:
+    # Handle empty response (no results found)
+    if not response:
+        empty_data = {
+            "results": [],
+            "result_count": 0,
+            "total_search_result_count": 0
+        }
+        return build(SearchPatentV2Response, data=empty_data)
+    return parse_search_patent_v2(response)
+
+
+def _image_query(query: Union[ImageSearchSingleRequest, Dict[str, Any]]) -> Dict[str, Any]:
+    """image_search keyword arguments of a fused-search query, minus its paging."""
+    if isinstance(query, ImageSearchSingleRequest):
+        query = query.model_dump(exclude_none=True)
+    return {name: value for name, value in query.items() if name not in ("offset", "limit")}
+
+
+def _image_windows(firsts: Sequence[ImageSearchResponse], depth: int) -> List[Tuple[int, Tuple[int, int]]]:
+    """``(query index, (offset, limit))`` of the pages still needed after each query's first page."""
+    return [
+        (index, window)
+        for index, first in enumerate(firsts)
+        for window in page_windows(
+            0,
+            len(first.patent_messages),
+            first.total_search_result_count,
+            page_size=IMAGE_PAGE_SIZE,
+            max_results=depth,
+            window_limit=IMAGE_RESULT_WINDOW_LIMIT,
+            max_offset=IMAGE_MAX_OFFSET,
+        )
+    ]
+
+
+def _fuse_image_pages(
+    firsts: Sequence[ImageSearchResponse],
+    windows: Sequence[Tuple[int, Tuple[int, int]]],
+    rest: Sequence[ImageSearchResponse],
+    aggregate: Union[str, ScoreAggregate],
+    rrf_k: int,
+) -> ImageSearchResponse:
+    rows = [list(first.patent_messages) for first in firsts]
+    # Pages come back in window order, which is offset order within each query
+    for (index, _), page in zip(windows, rest):
+        rows[index].extend(page.patent_messages)
+    fused = fuse_results(rows, aggregate=aggregate, rrf_k=rrf_k)
+    return ImageSearchResponse(patent_messages=fused, total_search_result_count=len(fused))
+
+
+def _parse_image_search(response: Dict[str, Any]) -> ImageSearchResponse:
+    return build(ImageSearchResponse, **response["data"])
@@ -0,0 +1,103 @@
+"""Connection pool, timeout and compression settings for the sync client.
+
+``PatsnapClient`` builds its ``requests.Session`` from a
+:class:`TransportConfig`. The defaults are sized for multi-threaded workloads
+(fan-out helpers, bulk lookups), which would otherwise queue on requests'
+default pool of 10 connections per host and churn sockets.
+"""
+
+from __future__ import annotations
+
+import socket
+from dataclasses import dataclass
+from typing import Any, List, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.request import ACCEPT_ENCODING
+
+
+@dataclass(frozen=True)
+class TransportConfig:
+    """HTTP transport settings for :class:`~patsnap_pythonSDK.PatsnapClient`.
+
+    Attributes:
+        pool_connections: Number of per-host connection pools to cache
+        pool_maxsize: Connections kept open per host; match your thread count
+        pool_block: Wait for a free connection instead of opening an extra,
+                    non-pooled one when the pool is exhausted
+        connect_timeout: Seconds to establish a connection
+        read_timeout: Seconds to wait for the server between bytes
+        compression: Advertise every encoding urllib3 can decode
+                     (gzip and deflate, plus br/zstd when brotli/zstandard are installed)
+        tcp_keepalive: Enable TCP keep-alive probes on pooled sockets
+        keepalive_idle: Idle seconds before the first probe
+        keepalive_interval: Seconds between probes
+        keepalive_count: Unanswered probes before the connection is dropped
+    """
+
+    pool_connections: int = 10
+    pool_maxsize: int = 100
+    pool_block: bool = False
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+    compression: bool = True
+    tcp_keepalive: bool = True
+    keepalive_idle: int = 60
+    keepalive_interval: int = 15
+    keepalive_count: int = 4
+
+    @property
+    def timeout(self) -> Tuple[float, float]:
+        """``(connect, read)`` timeout tuple as accepted by requests."""
+        return (self.connect_timeout, self.read_timeout)
+
+    def socket_options(self) -> List[Tuple[int, int, int]]:
+        options = list(HTTPConnection.default_socket_options)
+        if not self.tcp_keepalive:
+            return options
+        options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        # Probe tuning is platform specific; skip whatever is unavailable
+        idle_option = getattr(socket, "TCP_KEEPIDLE", None) or getattr(socket, "TCP_KEEPALIVE", None)
+        if idle_option is not None:
+            options.append((socket.IPPROTO_TCP, idle_option, self.keepalive_idle))
+        if hasattr(socket, "TCP_KEEPINTVL"):
+            options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, self.keepalive_interval))
+        if hasattr(socket, "TCP_KEEPCNT"):
+            options.append((socket.IPPROTO_TCP, socket.TCP_KEEPCNT, self.keepalive_count))
+        return options
+
+    def build_session(self) -> requests.Session:
+        """Create a ``requests.Session`` configured with these settings."""
+        session = requests.Session()
+        adapter = _SocketOptionsAdapter(
+            socket_options=self.socket_options(),
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["Accept-Encoding"] = ACCEPT_ENCODING if self.compression else "identity"
+        return session
+
+
+class _SocketOptionsAdapter(HTTPAdapter):
+    """``HTTPAdapter`` that applies socket options to every pooled connection."""
+
+    def __init__(self, *, socket_options: List[Tuple[int, int, int]], **kwargs: Any) -> None:
+        # Set before super().__init__, which builds the pool manager
+        self._socket_options = socket_options
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs["socket_options"] = self._socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, proxy: str, **proxy_kwargs: Any) -> Any:
+        proxy_kwargs["socket_options"] = self._socket_options
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+
+__all__ = ["TransportConfig"]
@@ -0,0 +1,315 @@
+"""Image uploads: streamed from disk and de-duplicated by content hash.
+
+``PatentsSearchResource.upload_image`` hands the open file to the HTTP
+client, which streams it in blocks as the multipart body is sent rather
+than reading it into memory first. Each image is hashed (SHA-256, in
+chunks), and an :class:`UploadCache` remembers the URL the API returned
+for that hash until shortly before it expires (URLs live 9 hours), so
+re-uploading the same product photo returns the cached URL instead of
+another upload.
+
+An optional :class:`ImagePreprocessor` downscales and re-encodes images
+before upload and strips their EXIF metadata. Images over the 4MB limit are
+then shrunk rather than rejected. It needs Pillow:
+``pip install 'patsnap-pythonSDK[images]'``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Lock
+from typing import Any, BinaryIO, Dict, Optional, Tuple, Union
+
+
+# Documented limits of /image-search/image-upload
+MAX_IMAGE_BYTES = 4 * 1024 * 1024
+IMAGE_SUFFIXES = (".jpg", ".jpeg", ".png")
+
+_HASH_CHUNK = 1024 * 1024
+
+ImageInput = Union[str, Path, BinaryIO]
+
+
+@dataclass
+class PreprocessStats:
+    """Running totals of the images an :class:`ImagePreprocessor` has processed."""
+
+    images: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.bytes_in - self.bytes_out
+
+    @property
+    def ratio(self) -> float:
+        """Output size as a fraction of input size (1.0 before any image is processed)."""
+        return self.bytes_out / self.bytes_in if self.bytes_in else 1.0
+
+
+class ImagePreprocessor:
+    """Downscale, re-encode and strip metadata from images before upload.
+
+    Image search matches on shape and colour, which survive a resize to a
+    couple of thousand pixels and a JPEG re-encode; a 4MB catalog PNG
+    typically shrinks to a few hundred KB. When re-encoding does not make an
+    image smaller and nothing else has to change, the original bytes are
+    sent.
+
+    Args:
+        max_dimension: Longest side in pixels; larger images are scaled down
+        quality: JPEG quality (1-95)
+        format: Output format, ``"JPEG"`` or ``"PNG"``. Transparency is
+                flattened onto white for JPEG
+        strip_exif: Drop EXIF and other metadata (the orientation is applied first)
+
+    Example:
+        >>> preprocessor = ImagePreprocessor(max_dimension=1600, quality=80)
+        >>> result = client.patents.search.upload_image(image="catalog.png", preprocess=preprocessor)
+        >>> print(preprocessor.stats.bytes_saved)
+    """
+
+    def __init__(
+        self,
+        *,
+        max_dimension: int = 2048,
+        quality: int = 85,
+        format: str = "JPEG",
+        strip_exif: bool = True,
+    ) -> None:
+        if max_dimension < 1:
+            raise ValueError("max_dimension must be >= 1")
+        if not 1 <= quality <= 95:
+            raise ValueError("quality must be between 1 and 95")
+        format = format.upper()
+        if format not in ("JPEG", "PNG"):
+            raise ValueError(f"format must be JPEG or PNG; got {format!r}")
+        self.max_dimension = max_dimension
+        self.quality = quality
+        self.format = format
+        self.strip_exif = strip_exif
+        self.stats = PreprocessStats()
+        self._lock = Lock()
+
+    @property
+    def cache_key(self) -> str:
+        """Settings that affect the output, mixed into the upload cache key."""
+        return f"{self.format}:{self.max_dimension}:{self.quality}:{int(self.strip_exif)}"
+
+    def process(self, data: bytes, filename: str) -> Tuple[bytes, str]:
+        """Return the bytes to upload for ``data`` and the matching filename."""
+        Image, ImageOps = _require_pillow()
+        with Image.open(io.BytesIO(data)) as source:
+            has_metadata = bool(source.info.get("exif")) or "icc_profile" in source.info
+            oversized = max(source.size) > self.max_dimension
+            image = ImageOps.exif_transpose(source) if self.strip_exif else source
+            image.thumbnail((self.max_dimension, self.max_dimension), Image.LANCZOS)
+            if self.format == "JPEG" and image.mode not in ("RGB", "L"):
+                image = _flatten(Image, image)
+            options: Dict[str, Any] = {"optimize": True}
+            if self.format == "JPEG":
+                options["quality"] = self.quality
+            if not self.strip_exif and source.info.get("exif"):
+                options["exif"] = source.info["exif"]
+            out = io.BytesIO()
+            image.save(out, format=self.format, **options)
+        processed = out.getvalue()
+
+        must_change = oversized or len(data) > MAX_IMAGE_BYTES or (self.strip_exif and has_metadata)
+        if len(processed) >= len(data) and not must_change:
+            processed = data
+        else:
+            suffix = ".jpg" if self.format == "JPEG" else ".png"
+            filename = f"{Path(filename).stem}{suffix}"
+        with self._lock:
+            self.stats.images += 1
+            self.stats.bytes_in += len(data)
+            self.stats.bytes_out += len(processed)
+        return processed, filename
+
+
+@dataclass
+class PreparedImage:
+    """An image ready for multipart upload; ``stream`` is read when the request is sent."""
+
+    filename: str
+    content_type: str
+    stream: BinaryIO
+    # Whether the stream was opened here and must be closed after the upload
+    owned: bool = False
+    preprocessor: Optional[ImagePreprocessor] = None
+    _processed: Optional[Tuple[str, bytes]] = field(default=None, init=False, repr=False)
+
+    def digest(self) -> str:
+        """SHA-256 of the source image (and preprocessing settings); the stream is left at its start."""
+        sha = hashlib.sha256()
+        self.stream.seek(0)
+        for chunk in iter(lambda: self.stream.read(_HASH_CHUNK), b""):
+            sha.update(chunk)
+        self.stream.seek(0)
+        if self.preprocessor is not None:
+            sha.update(self.preprocessor.cache_key.encode())
+        return sha.hexdigest()
+
+    def files(self) -> Dict[str, Tuple[str, BinaryIO, str]]:
+        if self.preprocessor is None:
+            return {"image": (self.filename, self.stream, self.content_type)}
+        if self._processed is None:
+            # Preprocess once, on first send rather than on an upload cache hit
+            self.stream.seek(0)
+            data, filename = self.preprocessor.process(self.stream.read(), self.filename)
+            if len(data) > MAX_IMAGE_BYTES:
+                raise ValueError(
+                    f"Image file too large after preprocessing: {len(data) / (1024*1024):.1f}MB. "
+                    "Maximum size is 4MB; lower max_dimension or quality."
+                )
+            self._processed = (filename, data)
+        filename, data = self._processed
+        return {"image": (filename, io.BytesIO(data), content_type_for(filename))}
+
+    def close(self) -> None:
+        if self.owned:
+            self.stream.close()
+
+
+def content_type_for(filename: str) -> str:
+    return "image/jpeg" if filename.lower().endswith((".jpg", ".jpeg")) else "image/png"
+
+
+def prepare_image(image: ImageInput, preprocessor: Optional[ImagePreprocessor] = None) -> PreparedImage:
+    """Validate an image path or file object and open it for streaming.
+
+    With a ``preprocessor``, files over 4MB are accepted; the limit applies
+    to the preprocessed image instead.
+
+    Raises:
+        FileNotFoundError: If the image file path doesn't exist
+        ValueError: If the image format or size is not supported
+    """
+    if isinstance(image, (str, Path)):
+        image_path = Path(image)
+        if not image_path.exists():
+            raise FileNotFoundError(f"Image file not found: {image_path}")
+
+        # Check file extension
+        if image_path.suffix.lower() not in IMAGE_SUFFIXES:
+            raise ValueError(f"Unsupported image format: {image_path.suffix}. Only JPG and PNG are supported.")
+
+        # Check file size (4MB limit)
+        file_size = image_path.stat().st_size
+        if file_size > MAX_IMAGE_BYTES and preprocessor is None:
+            raise ValueError(f"Image file too large: {file_size / (1024*1024):.1f}MB. Maximum size is 4MB.")
+
+        return PreparedImage(
+            image_path.name,
+            content_type_for(image_path.name),
+            open(image_path, "rb"),
+            owned=True,
+            preprocessor=preprocessor,
+        )
+
+    if not hasattr(image, "read"):
+        raise ValueError("Image must be a file path (str/Path) or file-like object")
+
+    filename = Path(getattr(image, "name", None) or "image.jpg").name
+    stream: BinaryIO = image
+    owned = False
+    if not _seekable(image):
+        # Hashing and retries both need to rewind; buffer one-shot streams
+        stream, owned = io.BytesIO(image.read()), True
+    return PreparedImage(filename, content_type_for(filename), stream, owned=owned, preprocessor=preprocessor)
+
+
+class UploadCache:
+    """Thread-safe map from image content hash to its unexpired upload URL.
+
+    Args:
+        min_remaining: Only reuse URLs valid for at least this many more seconds,
+                       so searches issued with them do not race the expiry
+        max_entries: Entries kept before the oldest are dropped
+    """
+
+    def __init__(self, *, min_remaining: float = 600.0, max_entries: int = 10_000) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self._min_remaining = min_remaining
+        self._max_entries = max_entries
+        self._urls: Dict[str, Tuple[str, float]] = {}
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, digest: str) -> Optional[Tuple[str, int]]:
+        """Return ``(url, seconds_left)`` for ``digest``, or None when absent or about to expire."""
+        now = time.time()
+        with self._lock:
+            entry = self._urls.get(digest)
+            if entry is not None and entry[1] - now >= self._min_remaining:
+                self.hits += 1
+                return entry[0], int(entry[1] - now)
+            if entry is not None:
+                del self._urls[digest]
+            self.misses += 1
+            return None
+
+    def put(self, digest: str, url: str, expire_seconds: float) -> None:
+        with self._lock:
+            self._urls.pop(digest, None)
+            self._urls[digest] = (url, time.time() + expire_seconds)
+            while len(self._urls) > self._max_entries:
+                # Dicts keep insertion order; the first entry is the oldest upload
+                del self._urls[next(iter(self._urls))]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._urls.clear()
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+
+def file_url_of(result: Any) -> Tuple[str, int]:
+    """``(url, expire)`` of an upload result."""
+    return result.url, int(result.expire)
+
+
+def _flatten(Image: Any, image: Any) -> Any:
+    """Composite a transparent or palette image onto white, as RGB."""
+    image = image.convert("RGBA")
+    background = Image.new("RGB", image.size, (255, 255, 255))
+    background.paste(image, mask=image.getchannel("A"))
+    return background
+
+
+def _require_pillow() -> Tuple[Any, Any]:
+    try:
+        from PIL import Image, ImageOps
+    except ImportError as exc:
+        raise ImportError(
+            "Image preprocessing requires Pillow. Install it with: pip install 'patsnap-pythonSDK[images]'"
+        ) from exc
+    return Image, ImageOps
+
+
+def _seekable(stream: Any) -> bool:
+    try:
+        return bool(stream.seekable())
+    except (AttributeError, OSError, ValueError):
+        return False
+
+
+__all__ = [
+    "MAX_IMAGE_BYTES",
+    "ImagePreprocessor",
+    "PreprocessStats",
+    "PreparedImage",
+    "UploadCache",
+    "prepare_image",
+    "content_type_for",
+    "file_url_of",
+]
@@ -0,0 +1 @@
+"""Internal helpers shared across the SDK."""
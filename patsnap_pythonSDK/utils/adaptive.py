@@ -0,0 +1,203 @@
+"""Adaptive concurrency: find the in-flight limit the upstream sustains.
+
+A limiter is handed to ``HttpClient``/``AsyncHttpClient`` and wraps every
+attempt: a slot is acquired before the request is sent and released with
+its latency and outcome. Each endpoint path gets its own limit, adjusted
+AIMD-style:
+
+- While the rolling p50 latency stays within ``tolerance`` of the best p50
+  seen, the limit grows by about one per round trip (``+1/limit`` per
+  success), but only while at least half of it is in use
+- When p50 rises past that, the limit shrinks by the latency gradient
+  (``baseline * tolerance / p50``, at least ``backoff``)
+- A 429, a 5xx, a Patsnap ``error_code`` or a timeout halves it
+  (``backoff``)
+
+At most one decrease happens per round trip, so a burst of throttled
+requests that were already in flight counts once. The baseline slowly
+follows p50 upwards (``drift``), so a permanently slower upstream is
+re-learned rather than read as congestion forever.
+
+With a limiter on the client, the bulk and fan-out helpers
+(``fetch_all``, ``search_pn_bulk``, ``count_matrix``, ...) run
+``max_limit`` workers and the limiter decides how many requests are
+really in flight; their ``concurrency`` argument no longer applies.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+from collections import deque
+from dataclasses import dataclass, field
+from threading import Condition
+from typing import Deque, Dict, FrozenSet, List, Optional
+
+
+@dataclass
+class _PathState:
+    limit: float
+    in_flight: int = 0
+    completed: int = 0
+    # Completion count by which every request sent before the last decrease has finished
+    settled_at: int = 0
+    baseline: Optional[float] = None
+    samples: Deque[float] = field(default_factory=deque)
+
+
+class AdaptiveConcurrencyLimiter:
+    """Per-endpoint in-flight limits driven by observed latency and throttling.
+
+    Args:
+        initial: Starting limit per endpoint
+        min_limit: Lowest limit an endpoint can be pushed to
+        max_limit: Highest limit; also the worker count of the fan-out helpers
+        window: Latencies in the rolling p50
+        tolerance: p50 may rise this factor above its baseline before the limit shrinks
+        backoff: Factor applied to the limit on throttling, timeouts and errors
+        drift: Share of the gap to the current p50 the baseline follows per window
+        overload_status: HTTP status codes read as overload
+        overload_error_codes: Patsnap ``error_code`` values read as overload
+                              (None: every error code)
+
+    Example:
+        >>> limiter = AdaptiveConcurrencyLimiter(initial=4, max_limit=32)
+        >>> client = PatsnapClient(client_id="...", client_secret="...", concurrency_limiter=limiter)
+        >>> run = client.patents.search.by_numbers(numbers)  # settles at the sustainable rate
+    """
+
+    def __init__(
+        self,
+        *,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        window: int = 20,
+        tolerance: float = 1.5,
+        backoff: float = 0.5,
+        drift: float = 0.05,
+        overload_status: FrozenSet[int] = frozenset({429, 500, 502, 503, 504}),
+        overload_error_codes: Optional[FrozenSet[int]] = None,
+    ) -> None:
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError("limits must satisfy 1 <= min_limit <= initial <= max_limit")
+        if window < 1 or tolerance < 1 or not 0 < backoff < 1 or not 0 <= drift <= 1:
+            raise ValueError("window must be >= 1, tolerance >= 1, backoff in (0, 1) and drift in [0, 1]")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self._initial = initial
+        self._window = window
+        self._tolerance = tolerance
+        self._backoff = backoff
+        self._drift = drift
+        self._overload_status = overload_status
+        self._overload_error_codes = overload_error_codes
+        self._paths: Dict[str, _PathState] = {}
+        self._cond = Condition()
+        self._waiters: List[asyncio.Future] = []
+
+    def limit(self, path: str) -> int:
+        """Current in-flight limit of ``path``."""
+        with self._cond:
+            return int(self._state(path).limit)
+
+    def in_flight(self, path: str) -> int:
+        with self._cond:
+            return self._state(path).in_flight
+
+    def limits(self) -> Dict[str, int]:
+        """Current limit of every endpoint seen so far."""
+        with self._cond:
+            return {path: int(state.limit) for path, state in self._paths.items()}
+
+    def is_overload(self, status_code: Optional[int], error_code: Optional[int]) -> bool:
+        """Whether a failed response means the upstream wants less traffic."""
+        if status_code in self._overload_status:
+            return True
+        if error_code is None:
+            return False
+        return self._overload_error_codes is None or error_code in self._overload_error_codes
+
+    def acquire(self, path: str) -> None:
+        """Block until ``path`` is below its limit, then take a slot."""
+        with self._cond:
+            state = self._state(path)
+            while state.in_flight >= int(state.limit):
+                self._cond.wait()
+            state.in_flight += 1
+
+    async def aacquire(self, path: str) -> None:
+        """Async equivalent of :meth:`acquire`."""
+        while True:
+            with self._cond:
+                state = self._state(path)
+                if state.in_flight < int(state.limit):
+                    state.in_flight += 1
+                    return
+                waiter = asyncio.get_running_loop().create_future()
+                self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                with self._cond:
+                    if waiter in self._waiters:
+                        self._waiters.remove(waiter)
+
+    def release(self, path: str, latency: Optional[float] = None, *, overloaded: bool = False) -> None:
+        """Free a slot of ``path`` and adjust its limit.
+
+        Args:
+            path: Endpoint the slot was acquired for
+            latency: Seconds the request took, if it succeeded
+            overloaded: The request was throttled, timed out or failed with an error code
+        """
+        with self._cond:
+            state = self._state(path)
+            # Growth only means something while the limit is at least half used
+            saturated = state.in_flight * 2 >= state.limit
+            state.in_flight -= 1
+            state.completed += 1
+            if overloaded:
+                self._decrease(state, self._backoff)
+            elif latency is not None:
+                self._observe(state, latency, saturated)
+            self._cond.notify_all()
+            waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            waiter.get_loop().call_soon_threadsafe(_wake, waiter)
+
+    def _state(self, path: str) -> _PathState:
+        state = self._paths.get(path)
+        if state is None:
+            state = self._paths[path] = _PathState(limit=float(self._initial), samples=deque(maxlen=self._window))
+        return state
+
+    def _observe(self, state: _PathState, latency: float, saturated: bool) -> None:
+        state.samples.append(latency)
+        if len(state.samples) < self._window:
+            return
+        p50 = statistics.median(state.samples)
+        if state.baseline is None or p50 < state.baseline:
+            state.baseline = p50
+        else:
+            state.baseline += (p50 - state.baseline) * self._drift / self._window
+        if p50 > state.baseline * self._tolerance:
+            self._decrease(state, max(self._backoff, state.baseline * self._tolerance / p50))
+        elif saturated:
+            state.limit = min(float(self.max_limit), state.limit + 1.0 / state.limit)
+
+    def _decrease(self, state: _PathState, factor: float) -> None:
+        # Requests sent before the last decrease report the old level; count them once
+        if state.completed <= state.settled_at:
+            return
+        state.limit = max(float(self.min_limit), state.limit * factor)
+        state.settled_at = state.completed + state.in_flight
+        state.samples.clear()
+
+
+def _wake(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+__all__ = ["AdaptiveConcurrencyLimiter"]
@@ -0,0 +1,272 @@
+"""Retry, backoff and circuit breaking for the HTTP clients.
+
+``HttpClient`` and ``AsyncHttpClient`` run every request through a
+:class:`RetryController`, which decides whether a failed attempt is retried
+and how long to wait:
+
+- Exponential backoff with full jitter, capped at ``max_delay``
+- ``Retry-After`` honoured when the server sends one
+- A per-endpoint retry budget so retries stay a fraction of real traffic
+- Idempotency classification: non-idempotent calls (image upload) are only
+  retried when the server cannot have processed them
+- A circuit breaker that fails fast while the upstream is down
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from typing import Callable, Dict, FrozenSet, Optional
+
+from ..errors import CircuitOpenError
+
+
+RETRYABLE_STATUS_CODES: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+
+# POST endpoints with side effects; every search endpoint is a read
+NON_IDEMPOTENT_PATHS: FrozenSet[str] = frozenset({"/image-search/image-upload"})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Tunable retry behaviour. ``RetryPolicy(max_attempts=1)`` disables retries.
+
+    Attributes:
+        max_attempts: Total attempts per call, including the first one
+        base_delay: Backoff for the first retry in seconds; doubles per attempt
+        max_delay: Upper bound on any single wait, including Retry-After
+        retry_on_status: HTTP status codes treated as transient
+        retry_on_error_codes: Patsnap ``error_code`` values treated as transient
+        respect_retry_after: Wait for the server's Retry-After when present
+        budget_ratio: Retry tokens earned per request on an endpoint
+        budget_capacity: Maximum retry tokens an endpoint can bank
+        non_idempotent_paths: Paths only retried when the request was never sent
+    """
+
+    max_attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 20.0
+    retry_on_status: FrozenSet[int] = RETRYABLE_STATUS_CODES
+    retry_on_error_codes: FrozenSet[int] = frozenset()
+    respect_retry_after: bool = True
+    budget_ratio: float = 0.2
+    budget_capacity: float = 10.0
+    non_idempotent_paths: FrozenSet[str] = NON_IDEMPOTENT_PATHS
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay before retry number ``attempt`` (0-based)."""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    def is_idempotent(self, path: str) -> bool:
+        return "/" + path.lstrip("/") not in self.non_idempotent_paths
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryBudget:
+    """Per-endpoint token bucket limiting retries to a share of traffic.
+
+    Each request deposits ``ratio`` tokens (up to ``capacity``) and each retry
+    spends one, so a failing endpoint cannot multiply its own load.
+    """
+
+    def __init__(self, *, ratio: float = 0.2, capacity: float = 10.0) -> None:
+        self._ratio = ratio
+        self._capacity = capacity
+        self._tokens: Dict[str, float] = {}
+        self._lock = Lock()
+
+    def record_request(self, key: str) -> None:
+        with self._lock:
+            tokens = self._tokens.get(key, self._capacity)
+            self._tokens[key] = min(self._capacity, tokens + self._ratio)
+
+    def try_spend(self, key: str) -> bool:
+        with self._lock:
+            tokens = self._tokens.get(key, self._capacity)
+            if tokens < 1.0:
+                return False
+            self._tokens[key] = tokens - 1.0
+            return True
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    calls fail immediately with :class:`CircuitOpenError`. Once
+    ``reset_timeout`` seconds have passed a single trial call is let through;
+    its success closes the circuit, its failure re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._failure_threshold = max(1, failure_threshold)
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state_locked()
+
+    def before_call(self) -> None:
+        """Raise :class:`CircuitOpenError` unless a call may proceed."""
+        with self._lock:
+            state = self._state_locked()
+            if state == self.CLOSED:
+                return
+            if state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+            raise CircuitOpenError("Circuit breaker is open; upstream considered unavailable")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self._failure_threshold:
+                self._opened_at = self._clock()
+            self._trial_in_flight = False
+
+    def release(self) -> None:
+        """Give back a half-open trial slot without recording an outcome."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def _state_locked(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if self._clock() - self._opened_at >= self._reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+
+@dataclass
+class RetryController:
+    """Combines a :class:`RetryPolicy` with its budget and circuit breaker.
+
+    The HTTP clients call :meth:`before_attempt` ahead of each attempt, then
+    either :meth:`record_success` or :meth:`retry_delay` with what went wrong.
+    """
+
+    policy: RetryPolicy = field(default_factory=RetryPolicy)
+    breaker: CircuitBreaker = field(default_factory=CircuitBreaker)
+    budget: Optional[RetryBudget] = None
+
+    def __post_init__(self) -> None:
+        if self.budget is None:
+            self.budget = RetryBudget(ratio=self.policy.budget_ratio, capacity=self.policy.budget_capacity)
+
+    def begin(self, path: str) -> None:
+        """Register a new logical call on ``path`` (earns retry budget)."""
+        self.budget.record_request(path)
+
+    def before_attempt(self) -> None:
+        self.breaker.before_call()
+
+    def record_success(self) -> None:
+        self.breaker.record_success()
+
+    def abandon(self) -> None:
+        """Forget an attempt that failed before reaching the network."""
+        self.breaker.release()
+
+    def retry_delay(
+        self,
+        path: str,
+        attempt: int,
+        *,
+        status_code: Optional[int] = None,
+        error_code: Optional[int] = None,
+        retry_after: Optional[float] = None,
+        transport_error: bool = False,
+        request_sent: bool = True,
+    ) -> Optional[float]:
+        """Return seconds to wait before retrying, or ``None`` to give up.
+
+        Args:
+            path: Endpoint path of the failed attempt
+            attempt: 0-based number of the attempt that failed
+            status_code: HTTP status of the failure, if a response arrived
+            error_code: Patsnap error_code of the failure, if any
+            retry_after: Server-provided Retry-After in seconds
+            transport_error: True for connection errors and timeouts
+            request_sent: False when the request provably never reached the server
+        """
+        policy = self.policy
+        if transport_error or (status_code is not None and status_code >= 500):
+            self.breaker.record_failure()
+        else:
+            # The upstream answered; it is alive even if it refused the call
+            self.breaker.record_success()
+
+        transient = (
+            transport_error
+            or (status_code is not None and status_code in policy.retry_on_status)
+            or (error_code is not None and error_code in policy.retry_on_error_codes)
+        )
+        if not transient or attempt + 1 >= policy.max_attempts:
+            return None
+        if not policy.is_idempotent(path):
+            # Only safe when the server cannot have acted on the request
+            never_processed = (transport_error and not request_sent) or status_code == 429
+            if not never_processed:
+                return None
+        if not self.budget.try_spend(path):
+            return None
+
+        delay = policy.backoff(attempt)
+        if policy.respect_retry_after and retry_after is not None:
+            delay = max(delay, retry_after)
+        return min(delay, policy.max_delay)
+
+
+__all__ = [
+    "RETRYABLE_STATUS_CODES",
+    "NON_IDEMPOTENT_PATHS",
+    "RetryPolicy",
+    "RetryBudget",
+    "CircuitBreaker",
+    "RetryController",
+    "parse_retry_after",
+]
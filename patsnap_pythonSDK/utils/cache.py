@@ -0,0 +1,303 @@
+"""Response caching for repeated identical calls.
+
+``HttpClient.call`` consults a :class:`ResponseCache` before going to the
+network. Entries are keyed by endpoint path plus the canonical JSON of the
+request body (the resource's ``model_dump()``), expire after a per-endpoint
+TTL, and are evicted least-recently-used once the backend is full. The raw
+payload is cached, so a hit still builds a fresh response model.
+
+Two backends are provided:
+
+- :class:`MemoryCacheBackend`: per-process, fastest
+- :class:`SQLiteCacheBackend`: on disk, shared by processes and across runs
+
+Caching can be bypassed or forced to refresh for the calls made inside
+:meth:`ResponseCache.bypass` / :meth:`ResponseCache.refresh`, or for a
+single call with ``HttpClient.call(..., cache="bypass")`` (or ``"refresh"``).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple, Union
+
+
+USE = "use"
+BYPASS = "bypass"
+REFRESH = "refresh"
+CACHE_MODES = (USE, BYPASS, REFRESH)
+
+# A decoded JSON object, or a raw response body awaiting model_validate_json
+Payload = Union[Dict[str, Any], bytes]
+
+_cache_mode: ContextVar[str] = ContextVar("patsnap_cache_mode", default=USE)
+
+
+@dataclass
+class CacheStats:
+    """Counters for one :class:`ResponseCache`."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    bypassed: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CacheBackend:
+    """Storage for cached payloads. Implementations must be thread-safe."""
+
+    def get(self, key: str, now: float) -> Optional[Payload]:
+        """Return the payload stored under ``key`` unless it expired before ``now``."""
+        raise NotImplementedError
+
+    def set(self, key: str, payload: Payload, expires_at: float) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process LRU holding at most ``max_entries`` payloads.
+
+    Payloads are stored as returned by the API and shared between hits; the
+    response parsers never mutate them.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Payload]]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: str, now: float) -> Optional[Payload]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if expires_at <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def set(self, key: str, payload: Payload, expires_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (expires_at, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """On-disk LRU in a SQLite database, safe to share between processes.
+
+    Args:
+        path: Database file; created if missing
+        max_entries: Entries kept before the least recently used are evicted
+    """
+
+    def __init__(self, path: Union[str, Path], max_entries: int = 100_000) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self._max_entries = max_entries
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), timeout=30.0, check_same_thread=False, isolation_level=None)
+        self._lock = Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " payload TEXT NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " used_at REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS responses_used_at ON responses (used_at)")
+
+    def get(self, key: str, now: float) -> Optional[Payload]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._conn.execute("UPDATE responses SET used_at = ? WHERE key = ?", (now, key))
+        # Raw response bodies are stored as BLOBs, decoded payloads as JSON text
+        return row[0] if isinstance(row[0], bytes) else json.loads(row[0])
+
+    def set(self, key: str, payload: Payload, expires_at: float) -> None:
+        encoded = payload if isinstance(payload, bytes) else json.dumps(payload, separators=(",", ":"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, payload, expires_at, used_at) VALUES (?, ?, ?, ?)",
+                (key, encoded, expires_at, time.time()),
+            )
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                " SELECT key FROM responses ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                (self._max_entries,),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+class ResponseCache:
+    """TTL cache of API payloads, consulted by ``HttpClient.call``.
+
+    Args:
+        backend: Storage backend (default: :class:`MemoryCacheBackend`)
+        ttls: Seconds to keep responses, keyed by endpoint path
+        default_ttl: Seconds for endpoints not in ``ttls``; ``None`` leaves them uncached
+
+    Example:
+        >>> cache = ResponseCache(
+        ...     SQLiteCacheBackend("patsnap-cache.sqlite"),
+        ...     ttls={"/search/patent/query-search-count/v2": 3600},
+        ...     default_ttl=600,
+        ... )
+        >>> client = PatsnapClient(client_id="...", client_secret="...", cache=cache)
+        >>> with cache.refresh():
+        ...     client.analytics.search.query_count(query_text="AI")
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        *,
+        ttls: Optional[Mapping[str, float]] = None,
+        default_ttl: Optional[float] = 300.0,
+    ) -> None:
+        self.backend = backend or MemoryCacheBackend()
+        self._ttls = {"/" + path.lstrip("/"): ttl for path, ttl in (ttls or {}).items()}
+        self._default_ttl = default_ttl
+        self.stats = CacheStats()
+        self._stats_lock = Lock()
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        ttl = self._ttls.get(path, self._default_ttl)
+        return ttl if ttl is not None and ttl > 0 else None
+
+    @staticmethod
+    def key(path: str, body: Optional[Mapping[str, Any]]) -> str:
+        """Cache key for ``path`` and the canonical JSON of ``body``."""
+        return request_key(path, body)
+
+    def lookup(
+        self, path: str, body: Optional[Mapping[str, Any]], mode: Optional[str] = None
+    ) -> Tuple[Optional[str], Optional[Payload]]:
+        """Return ``(key, payload)``; ``key`` is None when the call must not be cached.
+
+        ``mode`` overrides the mode set by :meth:`bypass` / :meth:`refresh` for this lookup.
+        """
+        path = "/" + path.lstrip("/")
+        mode = check_cache_mode(mode) if mode is not None else _cache_mode.get()
+        if mode == BYPASS or self.ttl_for(path) is None:
+            with self._stats_lock:
+                self.stats.bypassed += 1
+            return None, None
+
+        key = self.key(path, body)
+        payload = None if mode == REFRESH else self.backend.get(key, time.time())
+        with self._stats_lock:
+            if payload is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+        return key, payload
+
+    def store(self, path: str, key: str, payload: Payload) -> None:
+        ttl = self.ttl_for("/" + path.lstrip("/"))
+        if ttl is None:
+            return
+        self.backend.set(key, payload, time.time() + ttl)
+        with self._stats_lock:
+            self.stats.stores += 1
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def close(self) -> None:
+        self.backend.close()
+
+    @contextmanager
+    def bypass(self) -> Iterator[None]:
+        """Skip the cache entirely for calls made inside the block."""
+        with _mode(BYPASS):
+            yield
+
+    @contextmanager
+    def refresh(self) -> Iterator[None]:
+        """Ignore cached entries but store fresh responses for calls inside the block."""
+        with _mode(REFRESH):
+            yield
+
+
+def check_cache_mode(mode: str) -> str:
+    if mode not in CACHE_MODES:
+        raise ValueError(f"cache must be one of {', '.join(CACHE_MODES)}; got {mode!r}")
+    return mode
+
+
+def request_key(path: str, body: Optional[Mapping[str, Any]]) -> str:
+    """Stable digest of an endpoint path and the canonical JSON of its request body."""
+    canonical = json.dumps(body or {}, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(f"/{path.lstrip('/')}\n{canonical}".encode("utf-8")).hexdigest()
+
+
+@contextmanager
+def _mode(mode: str) -> Iterator[None]:
+    token = _cache_mode.set(mode)
+    try:
+        yield
+    finally:
+        _cache_mode.reset(token)
+
+
+__all__ = [
+    "CacheStats",
+    "CacheBackend",
+    "MemoryCacheBackend",
+    "SQLiteCacheBackend",
+    "ResponseCache",
+    "request_key",
+]
@@ -0,0 +1,96 @@
+"""Bounded fan-out helpers used by the bulk and multi-page operations."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import AsyncIterator, Awaitable, Callable, Deque, Iterable, Iterator, List, Sequence, TypeVar
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def map_ordered(fn: Callable[[T], R], items: Sequence[T], *, concurrency: int) -> List[R]:
+    """Apply ``fn`` to every item on a bounded thread pool.
+
+    At most ``concurrency`` calls are in flight at once and results come back
+    in input order. The first exception is re-raised after cancelling the
+    calls that have not started yet. Each call runs in a copy of the caller's
+    context, so context-scoped settings (such as cache bypass) carry over.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    if concurrency == 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+
+    executor = ThreadPoolExecutor(max_workers=min(concurrency, len(items)))
+    futures: List[Future] = []
+    try:
+        futures = [executor.submit(contextvars.copy_context().run, fn, item) for item in items]
+        return [future.result() for future in futures]
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def imap_ordered(fn: Callable[[T], R], items: Iterable[T], *, concurrency: int) -> Iterator[R]:
+    """Lazy :func:`map_ordered`: yield results in input order as they complete.
+
+    Keeps ``concurrency`` calls in flight ahead of the consumer, so results
+    are buffered for at most that many items. Closing the iterator cancels
+    the calls that have not started yet.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    if concurrency == 1:
+        for item in items:
+            yield fn(item)
+        return
+
+    pending = iter(items)
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    futures: Deque[Future] = deque()
+    try:
+        for item in pending:
+            futures.append(executor.submit(contextvars.copy_context().run, fn, item))
+            if len(futures) == concurrency:
+                break
+        while futures:
+            result = futures.popleft().result()
+            for item in pending:
+                futures.append(executor.submit(contextvars.copy_context().run, fn, item))
+                break
+            yield result
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+async def aimap_ordered(fn: Callable[[T], Awaitable[R]], items: Iterable[T], *, concurrency: int) -> AsyncIterator[R]:
+    """Async equivalent of :func:`imap_ordered`, running the calls as tasks."""
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    pending = iter(items)
+    tasks: Deque[asyncio.Future] = deque()
+    try:
+        for item in pending:
+            tasks.append(asyncio.ensure_future(fn(item)))
+            if len(tasks) == concurrency:
+                break
+        while tasks:
+            result = await tasks.popleft()
+            for item in pending:
+                tasks.append(asyncio.ensure_future(fn(item)))
+                break
+            yield result
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+__all__ = ["map_ordered", "imap_ordered", "aimap_ordered"]
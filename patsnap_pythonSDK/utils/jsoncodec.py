@@ -0,0 +1,89 @@
+"""Pluggable JSON codecs for decoding API responses.
+
+``HttpClient`` decodes response bodies with a :class:`JsonCodec`. The default,
+:func:`default_codec`, picks the fastest installed backend: orjson, then
+msgspec, then the standard library. Endpoints whose response model can be
+validated straight from the raw body skip the codec entirely and use
+pydantic's ``model_validate_json``.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+
+Raw = Union[bytes, bytearray, memoryview, str]
+
+
+class JsonCodec:
+    """Decode/encode JSON; ``loads`` must raise ``ValueError`` on bad input."""
+
+    name = "base"
+
+    def loads(self, data: Raw) -> Any:
+        raise NotImplementedError
+
+    def dumps(self, obj: Any) -> bytes:
+        raise NotImplementedError
+
+
+class StdlibJsonCodec(JsonCodec):
+    name = "json"
+
+    def loads(self, data: Raw) -> Any:
+        if isinstance(data, memoryview):
+            data = bytes(data)
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def loads(self, data: Raw) -> Any:
+        # orjson.JSONDecodeError subclasses ValueError
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+
+class MsgspecCodec(JsonCodec):
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._decode = msgspec.json.decode
+        self._encode = msgspec.json.encode
+        self._error = msgspec.DecodeError
+
+    def loads(self, data: Raw) -> Any:
+        try:
+            return self._decode(data)
+        except self._error as exc:
+            raise ValueError(str(exc)) from exc
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encode(obj)
+
+
+def default_codec() -> JsonCodec:
+    """Return the fastest available codec: orjson, msgspec, then stdlib json."""
+    for codec_class in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec_class()
+        except ImportError:
+            continue
+    return StdlibJsonCodec()
+
+
+__all__ = ["JsonCodec", "StdlibJsonCodec", "OrjsonCodec", "MsgspecCodec", "default_codec"]
@@ -0,0 +1,173 @@
+"""Client-side rate limiting with per-endpoint token buckets.
+
+A limiter is handed to ``HttpClient``/``AsyncHttpClient`` and consulted before
+every attempt. Buckets are keyed by endpoint path (for example
+``/search/patent/query-search-patent/v2``) and an optional global bucket caps
+the combined rate across all endpoints.
+
+Limiters *reserve* capacity rather than block: :meth:`RateLimiter.reserve`
+returns how long the caller must wait before sending, which lets the sync
+client ``time.sleep`` and the async client ``await asyncio.sleep`` on the same
+limiter.
+
+- :class:`InProcessRateLimiter` shares buckets between threads of one process
+- :class:`FileLockRateLimiter` keeps bucket state in a locked file so that
+  several worker processes on one host share a single quota
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+
+from .filelock import locked_file
+
+
+GLOBAL_KEY = "*"
+
+
+@dataclass
+class _Bucket:
+    tokens: float
+    updated_at: float
+
+
+def _reserve(bucket: _Bucket, rate: float, burst: float, now: float) -> float:
+    """Take one token from ``bucket`` and return the wait it implies.
+
+    The balance may go negative: later callers then queue behind earlier
+    reservations instead of racing for the next refill.
+    """
+    elapsed = max(0.0, now - bucket.updated_at)
+    bucket.tokens = min(burst, bucket.tokens + elapsed * rate)
+    bucket.updated_at = now
+    bucket.tokens -= 1.0
+    if bucket.tokens >= 0:
+        return 0.0
+    return -bucket.tokens / rate
+
+
+class RateLimiter:
+    """Base class for rate limiters used by the HTTP clients.
+
+    Args:
+        rates: Requests per second keyed by endpoint path
+        default_rate: Requests per second for any other endpoint (None: unlimited)
+        global_rate: Requests per second across all endpoints combined (None: unlimited)
+        burst: Bucket capacity; defaults to one second worth of requests (min 1)
+    """
+
+    def __init__(
+        self,
+        rates: Optional[Mapping[str, float]] = None,
+        *,
+        default_rate: Optional[float] = None,
+        global_rate: Optional[float] = None,
+        burst: Optional[float] = None,
+    ) -> None:
+        self._rates = {_normalize(path): float(rate) for path, rate in (rates or {}).items()}
+        self._default_rate = default_rate
+        self._global_rate = global_rate
+        self._burst = burst
+        for rate in [*self._rates.values(), default_rate, global_rate]:
+            if rate is not None and rate <= 0:
+                raise ValueError("rates must be > 0")
+
+    def reserve(self, path: str) -> float:
+        """Reserve capacity for one request to ``path``; return seconds to wait first."""
+        limits = self._limits_for(_normalize(path))
+        if not limits:
+            return 0.0
+        return self._reserve_many(limits, time.time())
+
+    def _limits_for(self, path: str) -> List[Tuple[str, float, float]]:
+        limits = []
+        rate = self._rates.get(path, self._default_rate)
+        if rate is not None:
+            limits.append((path, rate, self._burst_for(rate)))
+        if self._global_rate is not None:
+            limits.append((GLOBAL_KEY, self._global_rate, self._burst_for(self._global_rate)))
+        return limits
+
+    def _burst_for(self, rate: float) -> float:
+        return self._burst if self._burst is not None else max(1.0, rate)
+
+    def _reserve_many(self, limits: List[Tuple[str, float, float]], now: float) -> float:
+        raise NotImplementedError
+
+
+class InProcessRateLimiter(RateLimiter):
+    """Token buckets shared by all threads of the current process.
+
+    Example:
+        >>> limiter = InProcessRateLimiter(
+        ...     {"/search/patent/query-search-patent/v2": 5},
+        ...     default_rate=10,
+        ... )
+        >>> client = PatsnapClient(client_id="...", client_secret="...", rate_limiter=limiter)
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._buckets: Dict[str, _Bucket] = {}
+        self._lock = Lock()
+
+    def _reserve_many(self, limits: List[Tuple[str, float, float]], now: float) -> float:
+        wait = 0.0
+        with self._lock:
+            for key, rate, burst in limits:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    bucket = self._buckets[key] = _Bucket(tokens=burst, updated_at=now)
+                wait = max(wait, _reserve(bucket, rate, burst, now))
+        return wait
+
+
+class FileLockRateLimiter(RateLimiter):
+    """Token buckets persisted in a file guarded by an OS file lock.
+
+    Every process pointing at the same ``path`` draws from the same buckets,
+    so N workers on one host stay under one combined rate. Bucket state uses
+    wall-clock time, which all processes on the host share.
+
+    Example:
+        >>> limiter = FileLockRateLimiter("/tmp/patsnap-quota.json", global_rate=20)
+    """
+
+    def __init__(self, path: Union[str, Path], *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        # Serialise threads of this process before taking the cross-process lock
+        self._thread_lock = Lock()
+
+    def _reserve_many(self, limits: List[Tuple[str, float, float]], now: float) -> float:
+        wait = 0.0
+        with self._thread_lock, locked_file(self._path) as handle:
+            handle.seek(0)
+            raw = handle.read()
+            try:
+                state = json.loads(raw) if raw else {}
+            except ValueError:
+                state = {}
+            for key, rate, burst in limits:
+                tokens, updated_at = state.get(key, (burst, now))
+                bucket = _Bucket(tokens=tokens, updated_at=updated_at)
+                wait = max(wait, _reserve(bucket, rate, burst, now))
+                state[key] = (bucket.tokens, bucket.updated_at)
+            handle.seek(0)
+            handle.truncate()
+            handle.write(json.dumps(state))
+            handle.flush()
+        return wait
+
+
+def _normalize(path: str) -> str:
+    return "/" + path.lstrip("/")
+
+
+__all__ = ["RateLimiter", "InProcessRateLimiter", "FileLockRateLimiter"]
@@ -0,0 +1,141 @@
+"""Compact ``__slots__`` records for result rows.
+
+A validated ``PatentBaseV2Response`` carries a ``__dict__``, a fields-set
+and pydantic bookkeeping, several hundred bytes per row before its values.
+:func:`record_type` derives a slotted class with the same attribute names
+from a row model; an instance holds just one pointer per field. Assignee
+names, which repeat across a portfolio, are interned so equal names share
+one string.
+
+Records are what the ``compact`` response mode puts in ``results``. They
+are converted field by field rather than validated by pydantic; call
+:meth:`CompactRecord.to_model` for the full model.
+"""
+
+from __future__ import annotations
+
+import sys
+import types
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Type, TypeVar, Union, get_args, get_origin
+
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+
+
+M = TypeVar("M", bound=BaseModel)
+
+# Low-cardinality text that repeats across rows of a large result set
+_INTERNED_FIELDS = frozenset({"current_assignee", "original_assignee"})
+
+_MISSING = object()
+
+# ``X | Y`` annotations have their own origin on Python 3.10+
+_UNION_ORIGINS = (Union, getattr(types, "UnionType", Union))
+
+
+class CompactRecord:
+    """Base class of the generated record types."""
+
+    __slots__ = ()
+
+    _model: Type[BaseModel]
+    _fields: Tuple[str, ...] = ()
+    _converters: Tuple[Callable[[Any], Any], ...] = ()
+    _defaults: Tuple[Any, ...] = ()
+
+    def __init__(self, *values: Any) -> None:
+        for name, value in zip(self._fields, values):
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def from_dict(cls, row: Dict[str, Any]) -> "CompactRecord":
+        """Build a record from an API row dict, converting each field to its annotated type."""
+        record = object.__new__(cls)
+        for name, convert, default in zip(cls._fields, cls._converters, cls._defaults):
+            value = row.get(name, default)
+            if value is _MISSING:
+                raise ValueError(f"{cls._model.__name__} row is missing {name!r}")
+            object.__setattr__(record, name, None if value is None else convert(value))
+        return record
+
+    def to_model(self) -> BaseModel:
+        """Validate this record into its pydantic row model."""
+        return self._model.model_validate(self._asdict())
+
+    def _asdict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self._fields}
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self._fields)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({values})"
+
+    def __reduce__(self) -> Any:
+        return (_restore, (self._model, tuple(getattr(self, name) for name in self._fields)))
+
+
+@lru_cache(maxsize=None)
+def record_type(model: Type[M]) -> Type[CompactRecord]:
+    """The compact record class for row model ``model``, e.g. ``PatentBaseV2ResponseRecord``."""
+    fields = tuple(model.model_fields)
+    converters = []
+    defaults = []
+    for name, field in model.model_fields.items():
+        converters.append(_converter(name, field.annotation))
+        defaults.append(_MISSING if field.default is PydanticUndefined else field.default)
+    return type(
+        f"{model.__name__}Record",
+        (CompactRecord,),
+        {
+            "__slots__": fields,
+            "__module__": __name__,
+            "_model": model,
+            "_fields": fields,
+            "_converters": tuple(converters),
+            "_defaults": tuple(defaults),
+        },
+    )
+
+
+def to_compact(model: Type[M], rows: Iterable[Any]) -> List[CompactRecord]:
+    """Convert dict rows (or models) into records of ``model``."""
+    cls = record_type(model)
+    return [cls.from_dict(row if isinstance(row, dict) else dict(row)) for row in rows]
+
+
+def _restore(model: Type[BaseModel], values: Tuple[Any, ...]) -> CompactRecord:
+    return record_type(model)(*values)
+
+
+def unwrap_optional(annotation: Any) -> Tuple[Any, bool]:
+    """``Optional[X]`` -> ``(X, True)``; any other annotation -> ``(annotation, False)``."""
+    if get_origin(annotation) in _UNION_ORIGINS:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0], True
+    return annotation, False
+
+
+def _converter(name: str, annotation: Any) -> Callable[[Any], Any]:
+    annotation, _ = unwrap_optional(annotation)
+    if annotation is str:
+        if name in _INTERNED_FIELDS:
+            return lambda value: sys.intern(str(value))
+        return str
+    if annotation in (int, float, bool):
+        return annotation
+    return _identity
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+__all__ = ["CompactRecord", "record_type", "to_compact", "unwrap_optional"]
@@ -0,0 +1,219 @@
+"""Response modes: how much of a payload is turned into pydantic models.
+
+``model`` (the default) validates the whole response. ``dict`` skips models
+entirely and returns the decoded JSON payload, which suits jobs that write
+rows straight to another format. ``lazy`` returns the usual response types,
+but builds them with ``model_construct`` and validates each result row the
+first time it is read, so a 1000-row page costs nothing until it is used.
+``compact`` also returns the usual response types, with each result row
+stored as a slotted :class:`~patsnap_pythonSDK.utils.records.CompactRecord`
+to keep large portfolios small in memory.
+
+The mode is set per client (``response_mode=`` on the client) and can be
+overridden for a block of calls::
+
+    >>> with response_mode("dict"):
+    ...     payload = client.patents.search.by_number(pn="US11205304B2")
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Type, TypeVar, get_args, get_origin
+
+from pydantic import BaseModel
+
+from .records import CompactRecord, to_compact, unwrap_optional
+
+
+MODEL = "model"
+DICT = "dict"
+LAZY = "lazy"
+COMPACT = "compact"
+
+RESPONSE_MODES = (MODEL, DICT, LAZY, COMPACT)
+
+M = TypeVar("M", bound=BaseModel)
+
+_response_mode: ContextVar[Optional[str]] = ContextVar("patsnap_response_mode", default=None)
+
+
+def check_response_mode(mode: str) -> str:
+    if mode not in RESPONSE_MODES:
+        raise ValueError(f"response_mode must be one of {', '.join(RESPONSE_MODES)}; got {mode!r}")
+    return mode
+
+
+@contextmanager
+def response_mode(mode: str) -> Iterator[None]:
+    """Use ``mode`` for every call made inside the block, whatever the client default."""
+    token = _response_mode.set(check_response_mode(mode))
+    try:
+        yield
+    finally:
+        _response_mode.reset(token)
+
+
+def current_response_mode(default: str = MODEL) -> str:
+    """Mode set by an enclosing :func:`response_mode` block, else ``default``."""
+    return _response_mode.get() or default
+
+
+class LazyModelList(list):
+    """List of ``model`` rows, each validated the first time it is read.
+
+    Unread slots hold the raw dicts. Indexing and iteration return models;
+    :meth:`materialize` validates whatever is left.
+    """
+
+    __slots__ = ("model",)
+
+    def __init__(self, model: Type[M], rows: Iterable[Any] = ()) -> None:
+        super().__init__(rows)
+        self.model = model
+
+    def _validated(self, index: int) -> Any:
+        item = list.__getitem__(self, index)
+        if isinstance(item, dict):
+            # A concurrent reader may validate the same row; both get equal models
+            item = self.model.model_validate(item)
+            list.__setitem__(self, index, item)
+        return item
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self._validated(i) for i in range(*index.indices(len(self)))]
+        return self._validated(index)
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self)):
+            yield self._validated(index)
+
+    def __reversed__(self) -> Iterator[Any]:
+        for index in range(len(self) - 1, -1, -1):
+            yield self._validated(index)
+
+    def iter_raw(self) -> Iterator[Any]:
+        """Iterate without validating: raw dicts for unread rows, models for the rest."""
+        return list.__iter__(self)
+
+    def materialize(self) -> "LazyModelList":
+        for index in range(len(self)):
+            self._validated(index)
+        return self
+
+    @classmethod
+    def concat(cls, parts: List["LazyModelList"]) -> "LazyModelList":
+        """Join lists of the same model without validating their rows."""
+        merged = cls(parts[0].model)
+        for part in parts:
+            merged.extend(part.iter_raw())
+        return merged
+
+    def __reduce__(self) -> Any:
+        return (LazyModelList, (self.model, list(self.iter_raw())))
+
+
+def lazy_model(model: Type[M], fields: Mapping[str, Any]) -> M:
+    """Build ``model`` from ``fields`` without validation; nested lists of models become :class:`LazyModelList`."""
+    return _construct(model, fields, LazyModelList)
+
+
+def compact_model(model: Type[M], fields: Mapping[str, Any]) -> M:
+    """Build ``model`` from ``fields`` without validation; nested lists of models become compact records."""
+    return _construct(model, fields, to_compact)
+
+
+def materialize(value: Any) -> Any:
+    """Validate every pending row reachable from ``value``; returns ``value``."""
+    if isinstance(value, LazyModelList):
+        value.materialize()
+    elif isinstance(value, BaseModel):
+        for name in type(value).model_fields:
+            materialize(getattr(value, name, None))
+    return value
+
+
+def _construct(model: Type[M], fields: Mapping[str, Any], make_list: Callable[[Type[BaseModel], list], list]) -> M:
+    values: Dict[str, Any] = {}
+    for name, value in fields.items():
+        field = model.model_fields.get(name)
+        values[name] = value if field is None else _construct_value(field.annotation, value, make_list)
+    return _lazy_class(model).model_construct(**values)
+
+
+def _construct_value(annotation: Any, value: Any, make_list: Callable[[Type[BaseModel], list], list]) -> Any:
+    if value is None:
+        return None
+    model = _model_type(annotation)
+    if model is not None and isinstance(value, dict):
+        return _construct(model, value, make_list)
+    if get_origin(annotation) in (list, List) and isinstance(value, list):
+        (item_type,) = get_args(annotation) or (Any,)
+        item_model = _model_type(item_type)
+        if item_model is not None:
+            return make_list(item_model, value)
+    return value
+
+
+def _dumpable(value: Any) -> Any:
+    """``value`` ready for pydantic serialisation: lazy rows validated, records swapped for models."""
+    if isinstance(value, LazyModelList):
+        return value.materialize()
+    if isinstance(value, list) and value and isinstance(value[0], CompactRecord):
+        return [record.to_model() for record in value]
+    if isinstance(value, BaseModel):
+        update = {}
+        for name in type(value).model_fields:
+            item = getattr(value, name, None)
+            dumped = _dumpable(item)
+            if dumped is not item:
+                update[name] = dumped
+        # Copy rather than replace, so a compact response stays compact
+        return value.model_copy(update=update) if update else value
+    return value
+
+
+def _model_type(annotation: Any) -> Optional[Type[BaseModel]]:
+    """``annotation`` as a model class, unwrapping ``Optional``; None for anything else."""
+    annotation, _ = unwrap_optional(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    return None
+
+
+@lru_cache(maxsize=None)
+def _lazy_class(model: Type[M]) -> Type[M]:
+    """Subclass of ``model`` whose dumps validate pending rows and expand records first."""
+
+    class Lazy(model):  # type: ignore[valid-type, misc]
+        def model_dump(self, **kwargs: Any) -> Dict[str, Any]:
+            target = _dumpable(self)
+            return target.model_dump(**kwargs) if target is not self else super().model_dump(**kwargs)
+
+        def model_dump_json(self, **kwargs: Any) -> str:
+            target = _dumpable(self)
+            return target.model_dump_json(**kwargs) if target is not self else super().model_dump_json(**kwargs)
+
+    Lazy.__name__ = model.__name__
+    Lazy.__qualname__ = model.__qualname__
+    Lazy.__module__ = model.__module__
+    return Lazy
+
+
+__all__ = [
+    "MODEL",
+    "DICT",
+    "LAZY",
+    "COMPACT",
+    "RESPONSE_MODES",
+    "LazyModelList",
+    "response_mode",
+    "current_response_mode",
+    "check_response_mode",
+    "lazy_model",
+    "compact_model",
+    "materialize",
+]
@@ -0,0 +1,149 @@
+"""Pluggable token stores so processes on one host can share an OAuth token.
+
+``AuthClient`` keeps its token in memory. With a :class:`TokenStore` it also
+checks the store before asking the token endpoint and publishes every token
+it fetches, so pre-fork workers and short-lived CLI or cron jobs reuse one
+unexpired token instead of each requesting their own. While refreshing, the
+client holds the store's refresh lock: other processes wait for it and then
+pick up the new token rather than fetching a second one.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from threading import Lock, local
+from typing import Dict, Iterator, Optional, Union
+
+from .filelock import locked_file
+
+
+@dataclass(frozen=True)
+class StoredToken:
+    """A cached token; times are Unix timestamps in seconds."""
+
+    token: str
+    expires_at: float
+    refresh_at: float
+
+
+def store_key(token_url: str, client_id: str) -> str:
+    """Key under which a client's token is stored; never includes the secret."""
+    return hashlib.sha256(f"{token_url}\n{client_id}".encode("utf-8")).hexdigest()
+
+
+class TokenStore:
+    """Base class for token stores. Implementations must be process- and thread-safe."""
+
+    def load(self, key: str) -> Optional[StoredToken]:
+        raise NotImplementedError
+
+    def save(self, key: str, token: StoredToken) -> None:
+        raise NotImplementedError
+
+    @contextmanager
+    def refresh_lock(self, key: str) -> Iterator[None]:
+        """Held while a client fetches a new token for ``key``."""
+        yield
+
+
+class MemoryTokenStore(TokenStore):
+    """Token store shared by the clients of one process."""
+
+    def __init__(self) -> None:
+        self._tokens: Dict[str, StoredToken] = {}
+        self._lock = Lock()
+
+    def load(self, key: str) -> Optional[StoredToken]:
+        return self._tokens.get(key)
+
+    def save(self, key: str, token: StoredToken) -> None:
+        with self._lock:
+            self._tokens[key] = token
+
+
+class FileTokenStore(TokenStore):
+    """Token store in a JSON file, shared by every process on the host.
+
+    The file is replaced atomically and created with mode 0600, since it holds
+    bearer tokens. Refreshes are serialised across processes with an OS lock
+    on ``<path>.lock``.
+
+    Example:
+        >>> store = FileTokenStore("~/.cache/patsnap/token.json")
+        >>> client = PatsnapClient(client_id="...", client_secret="...", token_store=store)
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self._path = Path(path).expanduser()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock_path = self._path.with_name(self._path.name + ".lock")
+        # Serialises this process's threads before they take the file lock
+        self._thread_lock = Lock()
+        self._held = local()
+
+    def load(self, key: str) -> Optional[StoredToken]:
+        entry = self._read().get(key)
+        if not isinstance(entry, dict):
+            return None
+        try:
+            return StoredToken(
+                token=str(entry["token"]),
+                expires_at=float(entry["expires_at"]),
+                refresh_at=float(entry["refresh_at"]),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def save(self, key: str, token: StoredToken) -> None:
+        with self._exclusive():
+            tokens = self._read()
+            tokens[key] = asdict(token)
+            self._write(tokens)
+
+    @contextmanager
+    def refresh_lock(self, key: str) -> Iterator[None]:
+        with self._exclusive():
+            yield
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        # Re-entrant per thread: save() runs inside refresh_lock()
+        if getattr(self._held, "value", False):
+            yield
+            return
+        with self._thread_lock, locked_file(self._lock_path):
+            self._held.value = True
+            try:
+                yield
+            finally:
+                self._held.value = False
+
+    def _read(self) -> Dict[str, dict]:
+        try:
+            with open(self._path, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _write(self, tokens: Dict[str, dict]) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=str(self._path.parent), prefix=self._path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(tokens, handle)
+            os.replace(tmp_path, self._path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+
+__all__ = ["StoredToken", "TokenStore", "MemoryTokenStore", "FileTokenStore", "store_key"]
@@ -0,0 +1,283 @@
+"""Per-request tracing for the HTTP clients.
+
+Every ``HttpClient``/``AsyncHttpClient`` call is wrapped in a
+:class:`RequestTrace` recording how long each phase took:
+
+- ``auth``: building the Authorization header, including any token fetch
+- ``encode``: serialising the JSON body
+- ``network``: sending the request and receiving the response
+- ``decode``: ``response.json()`` and error checking
+- ``parse``: building the pydantic response model
+
+along with the endpoint path, payload sizes, ``result_count``, retries and
+whether the response cache answered the call.
+Finished traces are handed to a :class:`Tracer`. The default tracer is a no-op
+that never allocates a trace, so instrumentation costs nothing unless enabled.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import warnings
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+@dataclass
+class Phase:
+    """One timed phase of a request; times are ``time.perf_counter()`` values."""
+
+    name: str
+    start: float
+    end: float
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+@dataclass
+class RequestTrace:
+    """Timings and metadata for one logical call, retries included."""
+
+    path: str
+    started_at: float = field(default_factory=time.time)
+    perf_start: float = field(default_factory=time.perf_counter)
+    duration: float = 0.0
+    phases: List[Phase] = field(default_factory=list)
+    request_bytes: Optional[int] = None
+    response_bytes: Optional[int] = None
+    status_code: Optional[int] = None
+    result_count: Optional[int] = None
+    retries: int = 0
+    cache_hit: bool = False
+    error: Optional[BaseException] = None
+
+    enabled = True
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append(Phase(name, start, time.perf_counter()))
+
+    def phase_totals(self) -> Dict[str, float]:
+        """Total seconds spent per phase name, summed across retries."""
+        totals: Dict[str, float] = {}
+        for phase in self.phases:
+            totals[phase.name] = totals.get(phase.name, 0.0) + phase.duration
+        return totals
+
+    def encode_body(self, body: Any) -> None:
+        """Time serialising ``body`` and record its size.
+
+        The HTTP session still encodes the body itself; this mirrors that work
+        so the ``encode`` phase and ``request_bytes`` are only paid for when
+        tracing is on.
+        """
+        with self.phase("encode"):
+            self.request_bytes = len(json.dumps(body, separators=(",", ":")).encode("utf-8"))
+
+    def record_response(self, response: Any) -> None:
+        self.status_code = getattr(response, "status_code", None)
+        content = getattr(response, "content", None)
+        if isinstance(content, (bytes, bytearray)):
+            self.response_bytes = len(content)
+
+    def record_result(self, result: Any) -> None:
+        if isinstance(result, dict):
+            data = result.get("data", result)
+            results = data.get("results") if isinstance(data, dict) else None
+        else:
+            data = getattr(result, "data", result)
+            results = getattr(data, "results", None)
+        if isinstance(results, list):
+            self.result_count = len(results)
+
+
+class _NoopTrace:
+    """Stand-in for :class:`RequestTrace` when tracing is disabled."""
+
+    enabled = False
+    retries = 0
+
+    def phase(self, name: str) -> Any:
+        return _NULL_CONTEXT
+
+    def encode_body(self, body: Any) -> None:
+        pass
+
+    def record_response(self, response: Any) -> None:
+        pass
+
+    def record_result(self, result: Any) -> None:
+        pass
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        pass
+
+
+class _NullContext:
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+
+_NULL_CONTEXT = _NullContext()
+NOOP_TRACE = _NoopTrace()
+
+_active_trace: ContextVar[Optional[RequestTrace]] = ContextVar("patsnap_active_trace", default=None)
+
+
+class Tracer:
+    """Base tracer: opens a :class:`RequestTrace` per call and exports it when done.
+
+    Subclasses implement :meth:`export`. Nested ``trace`` calls on the same
+    path of execution (``call`` -> ``post`` -> ``post_json``) share the
+    outermost trace.
+    """
+
+    enabled = True
+
+    @contextmanager
+    def trace(self, path: str) -> Iterator[RequestTrace]:
+        active = _active_trace.get()
+        if active is not None:
+            yield active
+            return
+
+        trace = RequestTrace(path="/" + path.lstrip("/"))
+        token = _active_trace.set(trace)
+        try:
+            yield trace
+        except BaseException as exc:
+            trace.error = exc
+            raise
+        finally:
+            _active_trace.reset(token)
+            trace.duration = time.perf_counter() - trace.perf_start
+            try:
+                self.export(trace)
+            except Exception as exc:  # A broken exporter must not fail the call
+                warnings.warn(f"Tracer export failed: {exc!r}", RuntimeWarning)
+
+    def export(self, trace: RequestTrace) -> None:
+        raise NotImplementedError
+
+
+class NoopTracer(Tracer):
+    """Default tracer; records nothing."""
+
+    enabled = False
+
+    def trace(self, path: str) -> Any:
+        return _NOOP_TRACE_CONTEXT
+
+    def export(self, trace: RequestTrace) -> None:
+        pass
+
+
+class _NoopTraceContext:
+    def __enter__(self) -> _NoopTrace:
+        return NOOP_TRACE
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+
+_NOOP_TRACE_CONTEXT = _NoopTraceContext()
+NOOP_TRACER = NoopTracer()
+
+
+class CallbackTracer(Tracer):
+    """Hand every finished trace to ``callback``.
+
+    Example:
+        >>> traces = []
+        >>> client = PatsnapClient(client_id="...", client_secret="...", tracer=CallbackTracer(traces.append))
+        >>> client.analytics.search.query_count(query_text="AI")
+        >>> traces[0].phase_totals()
+        {'auth': 0.21, 'encode': 1.2e-05, 'network': 0.34, 'decode': 0.0002, 'parse': 0.0001}
+    """
+
+    def __init__(self, callback: Callable[[RequestTrace], None]) -> None:
+        self._callback = callback
+
+    def export(self, trace: RequestTrace) -> None:
+        self._callback(trace)
+
+
+class OpenTelemetryTracer(Tracer):
+    """Export traces as OpenTelemetry spans, one child span per phase.
+
+    Requires ``opentelemetry-api``; spans go wherever the application's
+    configured ``TracerProvider`` sends them.
+
+    Args:
+        tracer: An OpenTelemetry tracer (default: ``trace.get_tracer("patsnap_pythonSDK")``)
+    """
+
+    def __init__(self, tracer: Any = None) -> None:
+        if tracer is None:
+            try:
+                from opentelemetry import trace as otel_trace
+            except ImportError as exc:
+                raise ImportError(
+                    "OpenTelemetryTracer requires opentelemetry-api. "
+                    "Install it with: pip install 'patsnap-pythonSDK[otel]'"
+                ) from exc
+            tracer = otel_trace.get_tracer("patsnap_pythonSDK")
+        self._tracer = tracer
+
+    def export(self, trace: RequestTrace) -> None:
+        start_ns = int(trace.started_at * 1e9)
+
+        def to_ns(perf: float) -> int:
+            return start_ns + int((perf - trace.perf_start) * 1e9)
+
+        attributes = {
+            "http.method": "POST",
+            "patsnap.path": trace.path,
+            "patsnap.retries": trace.retries,
+            "patsnap.cache_hit": trace.cache_hit,
+        }
+        for key, value in (
+            ("http.status_code", trace.status_code),
+            ("patsnap.request_bytes", trace.request_bytes),
+            ("patsnap.response_bytes", trace.response_bytes),
+            ("patsnap.result_count", trace.result_count),
+        ):
+            if value is not None:
+                attributes[key] = value
+        if trace.error is not None:
+            attributes["error.type"] = type(trace.error).__name__
+
+        span = self._tracer.start_span(f"POST {trace.path}", start_time=start_ns, attributes=attributes)
+        try:
+            from opentelemetry import trace as otel_trace
+
+            context = otel_trace.set_span_in_context(span)
+        except ImportError:
+            context = None
+        for phase in trace.phases:
+            child = self._tracer.start_span(phase.name, context=context, start_time=to_ns(phase.start))
+            child.end(end_time=to_ns(phase.end))
+        span.end(end_time=start_ns + int(trace.duration * 1e9))
+
+
+__all__ = [
+    "Phase",
+    "RequestTrace",
+    "Tracer",
+    "NoopTracer",
+    "CallbackTracer",
+    "OpenTelemetryTracer",
+    "NOOP_TRACER",
+]
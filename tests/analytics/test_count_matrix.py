@@ -0,0 +1,135 @@
+"""Tests for the query_count grid."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from patsnap_pythonSDK import AsyncPatsnapClient
+from tests.shared import FakeResponse, FakeSession, make_client_with_session, create_oauth_payload
+
+
+def fake_count(query_text: str) -> int:
+    return len(query_text)
+
+
+class CountSession(FakeSession):
+    """Fake session answering query_count with the length of the query."""
+
+    def __init__(self):
+        super().__init__(FakeResponse(200, create_oauth_payload()), FakeResponse(200, {}))
+        self.queries = []
+        self._lock = threading.Lock()
+
+    def post(self, url, **kwargs):
+        if url.endswith("/oauth/token"):
+            return super().post(url, **kwargs)
+        query_text = kwargs["json"]["query_text"]
+        with self._lock:
+            self.queries.append(query_text)
+        return FakeResponse(200, {"data": {"total_search_result_count": fake_count(query_text)}, "status": True, "error_code": 0})
+
+
+def test_grid_expands_to_one_query_per_cell():
+    session = CountSession()
+    client = make_client_with_session(session)
+
+    matrix = client.analytics.search.count_matrix(
+        {"VR": "TACD: virtual reality", "AR": "TACD: AR"},
+        {"PUBLICATION_YEAR": [2020, 2021, 2022], "AUTHORITY": ["US", "CN"]},
+        concurrency=4,
+    )
+
+    assert matrix.shape == (2, 3, 2)
+    assert matrix.names == ["term", "PUBLICATION_YEAR", "AUTHORITY"]
+    assert len(session.queries) == 12
+    expected = "(TACD: virtual reality) AND PBD:[20210101 TO 20211231] AND AUTHORITY:(CN)"
+    assert expected in session.queries
+    assert matrix.get("VR", 2021, "CN") == fake_count(expected)
+    assert matrix.to_lists()[0][1][1] == fake_count(expected)
+
+
+def test_duplicate_cells_are_counted_once():
+    session = CountSession()
+    client = make_client_with_session(session)
+
+    matrix = client.analytics.search.count_matrix(
+        ["TACD: drone", "TACD: drone"],
+        {"FIELD": {"battery": "TACD: battery", "also battery": "TACD: battery"}},
+    )
+
+    assert matrix.shape == (2, 2)
+    assert len(session.queries) == 1
+    assert matrix.queries == 1
+    assert len(set(matrix.counts)) == 1
+
+
+def test_terms_only():
+    session = CountSession()
+    client = make_client_with_session(session)
+
+    matrix = client.analytics.search.count_matrix(["TACD: a", "TACD: bb"])
+
+    assert matrix.to_lists() == [fake_count("(TACD: a)"), fake_count("(TACD: bb)")]
+
+
+def test_unknown_dimension_needs_clauses():
+    client = make_client_with_session(CountSession())
+
+    with pytest.raises(ValueError, match="mapping of label"):
+        client.analytics.search.count_matrix(["TACD: a"], {"IPC": ["G06F"]})
+
+
+def test_overlong_cell_query_is_rejected_before_any_call():
+    session = CountSession()
+    client = make_client_with_session(session)
+
+    with pytest.raises(ValueError, match="1500"):
+        client.analytics.search.count_matrix(["TACD: " + "x" * 1500], {"AUTHORITY": ["US"]})
+    assert session.queries == []
+
+
+def test_get_rejects_unknown_label():
+    client = make_client_with_session(CountSession())
+    matrix = client.analytics.search.count_matrix(["TACD: a"], {"AUTHORITY": ["US"]})
+
+    with pytest.raises(KeyError, match="AUTHORITY"):
+        matrix.get("TACD: a", "EP")
+
+
+def test_to_numpy_and_pandas():
+    np = pytest.importorskip("numpy")
+    client = make_client_with_session(CountSession())
+    matrix = client.analytics.search.count_matrix(["TACD: a"], {"PUBLICATION_YEAR": [2020, 2021]})
+
+    assert matrix.to_numpy().dtype == np.int64
+    assert matrix.to_numpy().shape == (1, 2)
+    pd = pytest.importorskip("pandas")
+    series = matrix.to_pandas()
+    assert isinstance(series, pd.Series)
+    assert series.loc[("TACD: a", 2021)] == matrix.get("TACD: a", 2021)
+
+
+def test_async_count_matrix():
+    httpx = pytest.importorskip("httpx")
+    queries = []
+
+    def handler(request):
+        if request.url.path.endswith("/oauth/token"):
+            return httpx.Response(200, json=create_oauth_payload())
+        query_text = json.loads(request.content)["query_text"]
+        queries.append(query_text)
+        return httpx.Response(200, json={"data": {"total_search_result_count": fake_count(query_text)}, "status": True, "error_code": 0})
+
+    async def run():
+        transport = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncPatsnapClient(client_id="id", client_secret="secret", client=transport) as client:
+            return await client.analytics.search.count_matrix(["TACD: a", "TACD: a"], {"AUTHORITY": ["US", "CN"]})
+
+    matrix = asyncio.run(run())
+
+    assert matrix.shape == (2, 2)
+    assert len(queries) == 2
@@ -0,0 +1,129 @@
+"""Tests for the query_filter facet sweep."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import threading
+
+import pytest
+
+from patsnap_pythonSDK import AsyncPatsnapClient
+from tests.shared import FakeResponse, FakeSession, make_client_with_session, create_oauth_payload
+
+
+YEARS = ("2020", "2021", "2022")
+AUTHORITIES = ("US", "CN")
+TAIL = 150
+
+
+def slice_counts(year: str, authority: str) -> dict:
+    """Field -> {bucket: count} for the patents of one year and authority."""
+    assignees = {f"A{year}-{authority}-{i}": 1000 - i for i in range(TAIL)}
+    assignees["BIG"] = 5000
+    return {
+        "assignee": assignees,
+        "ipc": {f"G06F{i}": 10 for i in range(10)},
+        "publication_year": {year: sum(assignees.values())},
+        "authority": {authority: sum(assignees.values())},
+    }
+
+
+def filter_payload(body: dict) -> dict:
+    """Answer a query_filter call over the YEARS x AUTHORITIES data set."""
+    year = re.search(r"PBD:\[(\d{4})0101", body["query"])
+    authority = re.search(r"AUTHORITY:\((\w+)\)", body["query"])
+    totals: dict = {}
+    for y in YEARS:
+        for a in AUTHORITIES:
+            if (year and year.group(1) != y) or (authority and authority.group(1) != a):
+                continue
+            for key, buckets in slice_counts(y, a).items():
+                for name, count in buckets.items():
+                    totals.setdefault(key, {})
+                    totals[key][name] = totals[key].get(name, 0) + count
+    row = {}
+    for code in body["field"].split(","):
+        key = code.lower()
+        ranked = sorted(totals.get(key, {}).items(), key=lambda item: (-item[1], item[0]))[:200]
+        page = ranked[body["offset"]:body["offset"] + body["limit"]]
+        row[key] = [{"name": name, "count": count} for name, count in page]
+    return {"data": [row], "status": True, "error_code": 0}
+
+
+class FacetSession(FakeSession):
+    def __init__(self):
+        super().__init__(FakeResponse(200, create_oauth_payload()), FakeResponse(200, {}))
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def post(self, url, **kwargs):
+        if url.endswith("/oauth/token"):
+            return super().post(url, **kwargs)
+        body = kwargs["json"]
+        with self._lock:
+            self.calls.append((body["query"], body["field"], body["offset"]))
+        return FakeResponse(200, filter_payload(body))
+
+
+def test_sweep_recovers_the_long_tail():
+    """Test a capped field is split by year, then authority, and summed exactly."""
+    session = FacetSession()
+    client = make_client_with_session(session)
+
+    tables = client.analytics.search.facet_sweep(query="TTL:car", fields="ASSIGNEE,IPC", concurrency=4)
+
+    assignees = tables["ASSIGNEE"]
+    assert assignees.complete
+    assert len(assignees) == len(YEARS) * len(AUTHORITIES) * TAIL + 1
+    assert assignees.top(1) == [("BIG", 5000 * len(YEARS) * len(AUTHORITIES))]
+    assert assignees.counts["A2021-CN-149"] == 851
+    assert assignees.slices == len(YEARS) * len(AUTHORITIES)
+    assert tables["IPC"].counts == {f"G06F{i}": 60 for i in range(10)}
+    assert tables["IPC"].slices == 1
+
+
+def test_fields_share_calls_and_pages_are_not_refetched():
+    session = FacetSession()
+    client = make_client_with_session(session)
+
+    client.analytics.search.facet_sweep(query="TTL:car", fields=["ASSIGNEE", "IPC"])
+
+    assert sorted(session.calls[:2]) == [("TTL:car", "ASSIGNEE,IPC", 0), ("TTL:car", "ASSIGNEE,IPC", 100)]
+    assert len(session.calls) == len(set(session.calls))
+
+
+def test_sweep_without_partitions_is_marked_incomplete():
+    client = make_client_with_session(FacetSession())
+
+    tables = client.analytics.search.facet_sweep(query="TTL:car", fields=["ASSIGNEE"], partitions=())
+
+    assert not tables["ASSIGNEE"].complete
+    assert len(tables["ASSIGNEE"]) == 200
+
+
+def test_sweep_rejects_unknown_partition():
+    client = make_client_with_session(FacetSession())
+
+    with pytest.raises(ValueError, match="partition_clauses"):
+        client.analytics.search.facet_sweep(query="TTL:car", fields=["ASSIGNEE"], partitions=["INVENTOR"])
+
+
+def test_async_sweep():
+    httpx = pytest.importorskip("httpx")
+
+    def handler(request):
+        if request.url.path.endswith("/oauth/token"):
+            return httpx.Response(200, json=create_oauth_payload())
+        return httpx.Response(200, json=filter_payload(json.loads(request.content)))
+
+    async def run():
+        transport = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncPatsnapClient(client_id="id", client_secret="secret", client=transport) as client:
+            return await client.analytics.search.facet_sweep(query="TTL:car", fields=["ASSIGNEE"])
+
+    tables = asyncio.run(run())
+
+    assert tables["ASSIGNEE"].complete
+    assert len(tables["ASSIGNEE"]) == len(YEARS) * len(AUTHORITIES) * TAIL + 1
@@ -0,0 +1,212 @@
+"""Tests for date-range partitioning past the result window."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import json
+import re
+import threading
+
+import pytest
+
+from patsnap_pythonSDK import AsyncPatsnapClient
+from patsnap_pythonSDK.facets import run_sweep
+from patsnap_pythonSDK.partitions import assignee_query, plan_partitions, unique_rows
+from tests.shared import FakeResponse, FakeSession, make_client_with_session, create_oauth_payload
+
+
+EPOCH = datetime.date(2000, 1, 1)
+
+
+def make_dates(total: int) -> list:
+    """Application dates of ``total`` patents, spread unevenly over 2000-2021."""
+    return [EPOCH + datetime.timedelta(days=(i * i) % 8000) for i in range(total)]
+
+
+def matching(dates: list, query_text: str) -> list:
+    found = re.search(r"APD:\[(\d{8}) TO (\d{8})\]", query_text)
+    if not found:
+        return list(range(len(dates)))
+    low, high = (datetime.datetime.strptime(value, "%Y%m%d").date() for value in found.groups())
+    return [i for i, day in enumerate(dates) if low <= day <= high]
+
+
+def make_patent(i: int, day: datetime.date) -> dict:
+    return {
+        "pn": f"US{i}", "apdt": int(f"{day:%Y%m%d}"), "apno": f"A{i}", "pbdt": 20220101, "title": "T",
+        "inventor": "I", "patent_id": f"id-{i}", "current_assignee": "C", "original_assignee": "O",
+    }
+
+
+def respond(dates: list, path: str, body: dict) -> dict:
+    ids = matching(dates, body["query_text"])
+    if path.endswith("query-search-count/v2"):
+        return {"data": {"total_search_result_count": len(ids)}, "status": True, "error_code": 0}
+    assert body["offset"] + body["limit"] <= 20000
+    results = [make_patent(i, dates[i]) for i in ids[body["offset"]:body["offset"] + body["limit"]]]
+    return {
+        "data": {"results": results, "result_count": len(results), "total_search_result_count": len(ids)},
+        "status": True,
+        "error_code": 0,
+    }
+
+
+class DatedSession(FakeSession):
+    """Fake session serving query_count and query_search over dated patents."""
+
+    def __init__(self, total: int):
+        super().__init__(FakeResponse(200, create_oauth_payload()), FakeResponse(200, {}))
+        self.dates = make_dates(total)
+        self.queries = []
+        self.bodies = []
+        self._lock = threading.Lock()
+
+    def post(self, url, **kwargs):
+        if url.endswith("/oauth/token"):
+            return super().post(url, **kwargs)
+        with self._lock:
+            self.queries.append(kwargs["json"]["query_text"])
+            self.bodies.append(kwargs["json"])
+        return FakeResponse(200, respond(self.dates, url, kwargs["json"]))
+
+
+def test_plan_splits_until_every_slice_fits():
+    dates = make_dates(5000)
+
+    plan = run_sweep(
+        plan_partitions("TACD: x", start=EPOCH, end=datetime.date(2021, 12, 31), window_limit=400),
+        lambda text: len(matching(dates, text)),
+        concurrency=4,
+    )
+
+    assert plan.complete
+    assert plan.total == 5000
+    assert all(0 < partition.count <= 400 for partition in plan.partitions)
+    assert sum(partition.count for partition in plan.partitions) == 5000
+    # Neighbouring slices are merged back while they fit together
+    assert all(a.count + b.count > 400 for a, b in zip(plan.partitions, plan.partitions[1:]))
+    assert all(a.end < b.start for a, b in zip(plan.partitions, plan.partitions[1:]))
+
+
+def test_plan_marks_a_day_over_the_window_incomplete():
+    dates = [EPOCH] * 30 + make_dates(10)
+
+    plan = run_sweep(
+        plan_partitions("TACD: x", start=EPOCH, end=datetime.date(2021, 12, 31), window_limit=20),
+        lambda text: len(matching(dates, text)),
+        concurrency=1,
+    )
+
+    assert not plan.complete
+    assert plan.partitions[0].start == plan.partitions[0].end == EPOCH
+
+
+def test_small_query_is_not_split():
+    session = DatedSession(50)
+    client = make_client_with_session(session)
+
+    plan = client.analytics.search.partition_query(query_text="TACD: x")
+
+    assert plan.probes == 1
+    assert [partition.query_text for partition in plan.partitions] == ["TACD: x"]
+
+
+def test_iter_partitioned_search_reaches_every_result():
+    """Test 45,000 results are streamed through slices that each fit the 20,000 window."""
+    session = DatedSession(45000)
+    client = make_client_with_session(session)
+
+    rows = list(client.analytics.search.iter_partitioned_search(
+        query_text="TACD: x", start=EPOCH, end=datetime.date(2021, 12, 31), concurrency=4,
+    ))
+
+    assert len(rows) == 45000
+    assert len({row.patent_id for row in rows}) == 45000
+    # Slices come in date order
+    assert rows[0].apdt <= rows[-1].apdt
+
+
+def test_iter_partitioned_assignee_search_builds_the_query():
+    session = DatedSession(10)
+    client = make_client_with_session(session)
+
+    rows = list(client.patents.search.iter_partitioned("by_current_assignee", assignee="Apple, Inc. OR Huawei"))
+
+    assert len(rows) == 10
+    assert session.queries[0] == 'ANCS:("Apple, Inc." OR "Huawei")'
+    with pytest.raises(ValueError, match="iter_partitioned"):
+        client.patents.search.iter_partitioned("by_defense_applicant", application="x")
+
+
+def test_sort_is_passed_to_the_searches_only():
+    session = DatedSession(30)
+    client = make_client_with_session(session)
+    sort = [{"field": "APD_YEARMONTHDAY", "order": "ASC"}]
+
+    rows = list(client.analytics.search.iter_partitioned_search(query_text="TACD: x", sort=sort))
+
+    assert len(rows) == 30
+    count_body, search_body = session.bodies
+    assert "sort" not in count_body
+    assert search_body["sort"] == sort
+
+
+def test_assignee_query_escapes_quotes():
+    assert assignee_query('A "B" OR C', "ANS") == 'ANS:("A \\"B\\"" OR "C")'
+
+
+def test_unique_rows_drops_repeated_patents():
+    rows = [{"patent_id": "a"}, {"patent_id": "b"}, {"patent_id": "a"}, {"pn": "no id"}]
+
+    assert list(unique_rows(iter(rows))) == rows[:2] + rows[3:]
+
+
+def test_rejects_unknown_date_field():
+    client = make_client_with_session(DatedSession(1))
+
+    with pytest.raises(ValueError, match="date_field"):
+        client.analytics.search.partition_query(query_text="TACD: x", date_field="ISD")
+
+
+def test_async_partition_query():
+    httpx = pytest.importorskip("httpx")
+    dates = make_dates(30000)
+
+    def handler(request):
+        if request.url.path.endswith("/oauth/token"):
+            return httpx.Response(200, json=create_oauth_payload())
+        return httpx.Response(200, json=respond(dates, request.url.path, json.loads(request.content)))
+
+    async def run():
+        transport = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncPatsnapClient(client_id="id", client_secret="secret", client=transport) as client:
+            return await client.analytics.search.partition_query(query_text="TACD: x", start=EPOCH)
+
+    plan = asyncio.run(run())
+
+    assert plan.complete
+    assert plan.total == 30000
+    assert len(plan) == 2
+
+
+def test_async_iter_partitioned():
+    httpx = pytest.importorskip("httpx")
+    dates = make_dates(25000)
+
+    def handler(request):
+        if request.url.path.endswith("/oauth/token"):
+            return httpx.Response(200, json=create_oauth_payload())
+        return httpx.Response(200, json=respond(dates, request.url.path, json.loads(request.content)))
+
+    async def run():
+        transport = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncPatsnapClient(client_id="id", client_secret="secret", client=transport) as client:
+            rows = client.patents.search.iter_partitioned(
+                "by_current_assignee", assignee="Apple", start=EPOCH, concurrency=4
+            )
+            return [row.patent_id async for row in rows]
+
+    patent_ids = asyncio.run(run())
+
+    assert len(patent_ids) == len(set(patent_ids)) == 25000
@@ -0,0 +1 @@
+"""Tests for core client infrastructure (HTTP, auth, transport)."""
@@ -0,0 +1,159 @@
+"""Tests for the adaptive concurrency limiter."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from patsnap_pythonSDK import AdaptiveConcurrencyLimiter, AsyncPatsnapClient, RetryPolicy
+from tests.shared import FakeResponse, FakeSession, make_client_with_session, create_oauth_payload
+
+
+PATH = "/search/patent/query-search-count/v2"
+
+
+def run_round(limiter: AdaptiveConcurrencyLimiter, latency: float) -> None:
+    """Fill every slot, then complete them all with ``latency``."""
+    slots = limiter.limit(PATH)
+    for _ in range(slots):
+        limiter.acquire(PATH)
+    for _ in range(slots):
+        limiter.release(PATH, latency)
+
+
+def test_grows_while_latency_is_flat():
+    limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=10, window=5)
+
+    for _ in range(40):
+        run_round(limiter, 0.01)
+
+    assert limiter.limit(PATH) == 10
+    assert limiter.in_flight(PATH) == 0
+
+
+def test_does_not_grow_when_the_limit_is_not_used():
+    limiter = AdaptiveConcurrencyLimiter(initial=4, window=5)
+
+    for _ in range(50):
+        limiter.acquire(PATH)
+        limiter.release(PATH, 0.01)
+
+    assert limiter.limit(PATH) == 4
+
+
+def test_shrinks_by_the_latency_gradient():
+    limiter = AdaptiveConcurrencyLimiter(initial=8, max_limit=8, window=4)
+    for _ in range(3):
+        run_round(limiter, 0.01)
+
+    run_round(limiter, 0.02)
+
+    # p50 rose 2x against a 1.5x tolerance: 8 * 0.75
+    assert limiter.limit(PATH) == 6
+
+
+def test_overload_halves_once_per_round():
+    limiter = AdaptiveConcurrencyLimiter(initial=8, max_limit=16)
+    for _ in range(8):
+        limiter.acquire(PATH)
+
+    for _ in range(8):
+        limiter.release(PATH, overloaded=True)
+
+    assert limiter.limit(PATH) == 4
+    assert limiter.limits() == {PATH: 4}
+
+
+def test_overload_classification():
+    limiter = AdaptiveConcurrencyLimiter(overload_error_codes=frozenset({67200002}))
+
+    assert limiter.is_overload(429, None)
+    assert limiter.is_overload(200, 67200002)
+    assert not limiter.is_overload(200, 67200005)
+    assert not limiter.is_overload(400, None)
+    assert AdaptiveConcurrencyLimiter().is_overload(200, 1)
+
+
+def test_rejects_inconsistent_limits():
+    with pytest.raises(ValueError, match="min_limit"):
+        AdaptiveConcurrencyLimiter(initial=100, max_limit=10)
+
+
+class ThrottlingSession(FakeSession):
+    """Answers query_count, with a 429 whenever more than ``capacity`` calls overlap."""
+
+    def __init__(self, capacity: int):
+        super().__init__(FakeResponse(200, create_oauth_payload()), FakeResponse(200, {}))
+        self.capacity = capacity
+        self.active = 0
+        self.peak = 0
+        self.throttled = 0
+        self._lock = threading.Lock()
+
+    def post(self, url, **kwargs):
+        if url.endswith("/oauth/token"):
+            return super().post(url, **kwargs)
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            over = self.active > self.capacity
+            self.throttled += over
+        try:
+            time.sleep(0.002)
+            if over:
+                return FakeResponse(429, text="slow down")
+            count = len(kwargs["json"]["query_text"])
+            return FakeResponse(200, {"data": {"total_search_result_count": count}, "status": True, "error_code": 0})
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def test_bulk_helper_settles_below_the_throttling_point():
+    """Test a fan-out runs the limiter's workers and backs off on 429s instead of failing."""
+    session = ThrottlingSession(capacity=6)
+    limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=32, window=5)
+    # Every throttled attempt is retried at once; only the limiter slows the job down
+    retry_policy = RetryPolicy(max_attempts=20, base_delay=0.0, max_delay=0.0, budget_capacity=1000.0)
+    client = make_client_with_session(session, concurrency_limiter=limiter, retry_policy=retry_policy)
+    terms = [f"TACD: {'x' * i}" for i in range(300)]
+
+    matrix = client.analytics.search.count_matrix(terms, concurrency=2)
+
+    assert matrix.counts == [len(f"({term})") for term in terms]
+    assert session.peak > 2
+    assert session.throttled < len(terms) // 4
+    assert limiter.limit(PATH) <= 7
+    assert limiter.in_flight(PATH) == 0
+
+
+def test_async_client_uses_the_limiter():
+    httpx = pytest.importorskip("httpx")
+    limiter = AdaptiveConcurrencyLimiter(initial=3, max_limit=3)
+    active = peak = 0
+
+    async def handler(request):
+        nonlocal active, peak
+        if request.url.path.endswith("/oauth/token"):
+            return httpx.Response(200, json=create_oauth_payload())
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.001)
+        active -= 1
+        return httpx.Response(200, json={"data": {"total_search_result_count": 1}, "status": True, "error_code": 0})
+
+    async def run():
+        transport = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncPatsnapClient(
+            client_id="id", client_secret="secret", client=transport, concurrency_limiter=limiter
+        ) as client:
+            return await client.analytics.search.count_matrix([f"TACD: {i}" for i in range(40)], concurrency=40)
+
+    matrix = asyncio.run(run())
+
+    assert matrix.counts == [1] * 40
+    assert peak == 3
+    assert limiter.in_flight(PATH) == 0
@@ -0,0 +1,129 @@
+"""Tests for the asyncio client."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from patsnap_pythonSDK import AsyncPatsnapClient
+from patsnap_pythonSDK.errors import ApiError
+from tests.shared import create_oauth_payload
+
+httpx = pytest.importorskip("httpx")
+
+
+def make_async_client(handler) -> AsyncPatsnapClient:
+    """Create an async client whose transport is served by ``handler``."""
+    transport = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncPatsnapClient(client_id="client-id", client_secret="client-secret", client=transport)
+
+
+def test_async_query_count_success():
+    """Test an async analytics call goes through auth and parses the response."""
+    requests_seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        if request.url.path.endswith("/oauth/token"):
+            return httpx.Response(200, json=create_oauth_payload())
+        return httpx.Response(200, json={"data": {"total_search_result_count": 42}, "status": True, "error_code": 0})
+
+    async def run():
+        async with make_async_client(handler) as client:
+            return await client.analytics.search.query_count(query_text="TACD: virtual reality")
+
+    resp = asyncio.run(run())
+
+    assert resp.total_search_result_count == 42
+    business = requests_seen[-1]
+    assert business.headers["Authorization"].startswith("Bearer ")
+    assert business.url.params["apikey"] == "client-id"
+    assert json.loads(business.content)["query_text"] == "TACD: virtual reality"
+
+
+def test_async_concurrent_calls_share_single_token_fetch():
+    """Test concurrent coroutines trigger only one token request."""
+    token_calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/oauth/token"):
+            token_calls.append(request)
+            return httpx.Response(200, json={"token": "tok", "expires_in": 1799})
+        pn = json.loads(request.content)["pn"]
+        return httpx.Response(200, json={
+            "data": {
+                "results": [{
+                    "pn": pn, "apdt": 20200101, "apno": "A1", "pbdt": 20210101, "title": "T",
+                    "inventor": "I", "patent_id": pn.lower(), "current_assignee": "C", "original_assignee": "O",
+                }],
+                "result_count": 1,
+                "total_search_result_count": 1,
+            },
+            "status": True,
+            "error_code": 0,
+        })
+
+    async def run():
+        async with make_async_client(handler) as client:
+            return await asyncio.gather(*(client.patents.search.by_number(pn=f"US{i}") for i in range(20)))
+
+    results = asyncio.run(run())
+
+    assert len(token_calls) == 1
+    assert [r.data.results[0].pn for r in results] == [f"US{i}" for i in range(20)]
+
+
+def test_async_api_error():
+    """Test business errors surface as ApiError on the async client."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/oauth/token"):
+            return httpx.Response(200, json=create_oauth_payload())
+        return httpx.Response(200, json={"status": False, "error_code": 68300004, "error_msg": "Invalid parameter!"})
+
+    async def run():
+        async with make_async_client(handler) as client:
+            await client.analytics.search.query_count(query_text="bad")
+
+    with pytest.raises(ApiError):
+        asyncio.run(run())
+
+
+def make_row(i: int) -> dict:
+    return {
+        "pn": f"US{i}", "apdt": 20200101, "apno": f"A{i}", "pbdt": 20210101, "title": "T",
+        "inventor": "I", "patent_id": f"id-{i}", "current_assignee": "C", "original_assignee": "O",
+    }
+
+
+def test_async_iter_pages_through_results():
+    """Test iter_* helpers return async iterators on the async client."""
+    offsets = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/oauth/token"):
+            return httpx.Response(200, json=create_oauth_payload())
+        body = json.loads(request.content)
+        offsets.append(body["offset"])
+        rows = [make_row(i) for i in range(body["offset"], min(body["offset"] + body["limit"], 25))]
+        return httpx.Response(200, json={
+            "data": {"results": rows, "result_count": len(rows), "total_search_result_count": 25},
+            "status": True,
+            "error_code": 0,
+        })
+
+    async def run():
+        async with make_async_client(handler) as client:
+            assignee = [row.pn async for row in client.patents.search.iter_by_current_assignee(
+                assignee="Apple, Inc.", page_size=10
+            )]
+            query = [row.pn async for row in client.analytics.search.iter_query_search(
+                query_text="TACD: x", page_size=10, prefetch=False
+            )]
+            return assignee, query
+
+    assignee, query = asyncio.run(run())
+
+    assert assignee == query == [f"US{i}" for i in range(25)]
+    assert offsets == [0, 10, 20, 0, 10, 20]
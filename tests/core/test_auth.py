@@ -0,0 +1,240 @@
+"""Tests for token caching and refresh."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from patsnap_pythonSDK.auth import DEFAULT_TOKEN_URL, AsyncAuthClient, AuthClient, _TokenState, _token_state_from_response
+from patsnap_pythonSDK.errors import AuthError
+from patsnap_pythonSDK.utils.tokenstore import FileTokenStore, MemoryTokenStore, StoredToken, store_key
+from tests.shared import FakeResponse, FakeSession
+
+
+def token_payload(token: str, expires_in: int = 1800) -> dict:
+    return {"token": token, "token_type": "BearerToken", "expires_in": expires_in, "status": "approved"}
+
+
+class TokenSession(FakeSession):
+    """Fake session issuing numbered tokens; blocks while ``gate`` is clear."""
+
+    def __init__(self, fail: bool = False):
+        super().__init__(FakeResponse(200, {}), FakeResponse(200, {}))
+        self.gate = threading.Event()
+        self.gate.set()
+        self.entered = threading.Event()
+        self.fail = fail
+        self.token_calls = 0
+
+    def post(self, url, **kwargs):
+        self.token_calls += 1
+        self.entered.set()
+        self.gate.wait(timeout=5)
+        if self.fail:
+            return FakeResponse(503, None, text="unavailable")
+        return FakeResponse(200, token_payload(f"token-{self.token_calls}"))
+
+
+def state(token: str, *, expires_in: float, refresh_in: float) -> _TokenState:
+    now = datetime.now(timezone.utc)
+    return _TokenState(
+        token=token,
+        expires_at_utc=now + timedelta(seconds=expires_in),
+        refresh_at_utc=now + timedelta(seconds=refresh_in),
+    )
+
+
+def wait_for(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def test_token_state_separates_refresh_from_expiry():
+    """Test the leeway moves refresh_at, not the hard expiry."""
+    parsed = _token_state_from_response(FakeResponse(200, token_payload("t", 1800)), 60)
+
+    assert parsed.refresh_at_utc < parsed.expires_at_utc
+    assert (parsed.expires_at_utc - parsed.refresh_at_utc).total_seconds() == pytest.approx(55, abs=1)
+
+
+def test_token_in_leeway_window_is_served_while_refreshing_in_background():
+    """Test callers keep the current token while one thread fetches the next."""
+    session = TokenSession()
+    session.gate.clear()
+    auth = AuthClient("id", "secret", session=session)
+    auth._state = state("old", expires_in=30, refresh_in=-1)
+
+    # The token endpoint is blocked, yet callers are not
+    assert auth.get_token() == "old"
+    assert session.entered.wait(timeout=5)
+    assert [auth.get_token() for _ in range(10)] == ["old"] * 10
+
+    session.gate.set()
+    wait_for(lambda: auth._state.token != "old")
+    assert auth.get_token() == "token-1"
+    assert session.token_calls == 1
+
+
+def test_expired_token_is_fetched_once_for_concurrent_callers():
+    """Test threads waiting on a missing token share one token request."""
+    session = TokenSession()
+    session.gate.clear()
+    auth = AuthClient("id", "secret", session=session)
+    tokens = []
+
+    threads = [threading.Thread(target=lambda: tokens.append(auth.get_token())) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    assert session.entered.wait(timeout=5)
+    wait_for(lambda: auth._refresh_flight.coalesced == 4)
+    session.gate.set()
+    for thread in threads:
+        thread.join()
+
+    assert tokens == ["token-1"] * 5
+    assert session.token_calls == 1
+
+
+def test_background_failure_keeps_current_token():
+    """Test a failed background refresh is retried later and never surfaces early."""
+    session = TokenSession(fail=True)
+    auth = AuthClient("id", "secret", session=session)
+    auth._state = state("old", expires_in=30, refresh_in=-1)
+
+    assert auth.get_token() == "old"
+    wait_for(lambda: not auth._refreshing and session.token_calls >= 1)
+    assert auth.get_token() == "old"
+
+    auth._state = state("old", expires_in=-1, refresh_in=-1)
+    with pytest.raises(AuthError):
+        auth.get_token()
+
+
+def test_force_refresh_always_fetches():
+    """Test force_refresh bypasses a perfectly valid token."""
+    session = TokenSession()
+    auth = AuthClient("id", "secret", session=session)
+    auth._state = state("old", expires_in=600, refresh_in=500)
+
+    assert auth.get_token(force_refresh=True) == "token-1"
+    assert auth.get_token() == "token-1"
+    assert session.token_calls == 1
+
+
+def test_file_token_store_is_shared_between_clients(tmp_path):
+    """Test a second client (another process, in practice) reuses the stored token."""
+    store_path = tmp_path / "token.json"
+    first_session, second_session = TokenSession(), TokenSession()
+    first = AuthClient("id", "secret", session=first_session, token_store=FileTokenStore(store_path))
+    second = AuthClient("id", "secret", session=second_session, token_store=FileTokenStore(store_path))
+
+    assert first.get_token() == "token-1"
+    assert second.get_token() == "token-1"
+    assert (first_session.token_calls, second_session.token_calls) == (1, 0)
+    assert "secret" not in store_path.read_text()
+    assert oct(store_path.stat().st_mode & 0o777) == "0o600"
+
+
+def test_forced_refresh_skips_the_rejected_stored_token(tmp_path):
+    """Test force_refresh fetches a new token instead of reloading the rejected one."""
+    store = FileTokenStore(tmp_path / "token.json")
+    session = TokenSession()
+    auth = AuthClient("id", "secret", session=session, token_store=store)
+
+    assert auth.get_token() == "token-1"
+    assert auth.get_token(force_refresh=True) == "token-2"
+    assert AuthClient("id", "secret", session=TokenSession(), token_store=store).get_token() == "token-2"
+
+
+def test_stale_stored_token_is_not_reused():
+    """Test a stored token inside its refresh window triggers a new fetch."""
+    store = MemoryTokenStore()
+    store.save(store_key(DEFAULT_TOKEN_URL, "id"), StoredToken("stale", time.time() + 30, time.time() - 1))
+    session = TokenSession()
+
+    assert AuthClient("id", "secret", session=session, token_store=store).get_token() == "token-1"
+    assert store.load(store_key(DEFAULT_TOKEN_URL, "id")).token == "token-1"
+
+
+def test_async_refresh_does_not_block_the_loop_on_the_store_lock(tmp_path):
+    """Test a store save waiting on another holder's file lock leaves the event loop running."""
+    httpx = pytest.importorskip("httpx")
+
+    store = FileTokenStore(tmp_path / "token.json")
+    holder_has_lock = threading.Event()
+    release = threading.Event()
+
+    def hold_lock():
+        # Stands in for a sync process fetching a token under the refresh lock
+        with FileTokenStore(tmp_path / "token.json").refresh_lock("any"):
+            holder_has_lock.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=hold_lock)
+    holder.start()
+    holder_has_lock.wait(5)
+
+    def handler(request):
+        return httpx.Response(200, json=token_payload("async-token"))
+
+    async def run():
+        auth = AsyncAuthClient(
+            "id", "secret", client=httpx.AsyncClient(transport=httpx.MockTransport(handler)), token_store=store
+        )
+        ticks = 0
+        fetch = asyncio.ensure_future(auth.get_token())
+        while ticks < 20:
+            await asyncio.sleep(0.005)
+            ticks += 1
+        assert not fetch.done()
+        release.set()
+        return await fetch
+
+    assert asyncio.run(run()) == "async-token"
+    holder.join()
+
+
+def test_async_refresh_waits_for_the_store_lock_and_reuses_its_token(tmp_path):
+    """Test the async client reuses the token a process holding the refresh lock publishes."""
+    httpx = pytest.importorskip("httpx")
+
+    holder_has_lock = threading.Event()
+    release = threading.Event()
+    requests_sent = []
+
+    def hold_lock():
+        # Stands in for a sync process fetching a token under the refresh lock
+        other = FileTokenStore(tmp_path / "token.json")
+        with other.refresh_lock(store_key(DEFAULT_TOKEN_URL, "id")):
+            holder_has_lock.set()
+            release.wait(5)
+            other.save(store_key(DEFAULT_TOKEN_URL, "id"), StoredToken("sync-token", time.time() + 1800, time.time() + 1740))
+
+    holder = threading.Thread(target=hold_lock)
+    holder.start()
+    holder_has_lock.wait(5)
+
+    def handler(request):
+        requests_sent.append(request)
+        return httpx.Response(200, json=token_payload("async-token"))
+
+    async def run():
+        auth = AsyncAuthClient(
+            "id",
+            "secret",
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            token_store=FileTokenStore(tmp_path / "token.json"),
+        )
+        fetch = asyncio.ensure_future(auth.get_token())
+        await asyncio.sleep(0.05)
+        release.set()
+        return await fetch
+
+    assert asyncio.run(run()) == "sync-token"
+    assert requests_sent == []
+    holder.join()
@@ -0,0 +1,146 @@
+"""Tests for retry, backoff and circuit breaking."""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+import requests
+import urllib3
+
+from patsnap_pythonSDK.errors import ApiError, CircuitOpenError
+from patsnap_pythonSDK.utils.backoff import CircuitBreaker, RetryController, RetryPolicy, parse_retry_after
+from tests.shared import FakeResponse, FakeSession, make_client_with_session, create_oauth_payload
+
+
+COUNT_PAYLOAD = {"data": {"total_search_result_count": 7}, "status": True, "error_code": 0}
+
+
+class SequenceSession(FakeSession):
+    """Fake session replaying business responses (or exceptions) in order."""
+
+    def __init__(self, *outcomes):
+        super().__init__(FakeResponse(200, create_oauth_payload()), FakeResponse(200, {}))
+        self.outcomes = list(outcomes)
+        self.business_calls = 0
+
+    def post(self, url, **kwargs):
+        if url.endswith("/oauth/token"):
+            return super().post(url, **kwargs)
+        self.business_calls += 1
+        outcome = self.outcomes.pop(0) if len(self.outcomes) > 1 else self.outcomes[0]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def test_transient_errors_are_retried_until_success():
+    """Test 503 and connection resets are retried transparently."""
+    session = SequenceSession(
+        FakeResponse(503, None, text="unavailable"),
+        requests.ConnectionError("connection reset"),
+        FakeResponse(200, COUNT_PAYLOAD),
+    )
+    client = make_client_with_session(session)
+
+    resp = client.analytics.search.query_count(query_text="AI")
+
+    assert resp.total_search_result_count == 7
+    assert session.business_calls == 3
+    client.close()
+
+
+def test_client_errors_are_not_retried():
+    """Test a 400 fails on the first attempt."""
+    session = SequenceSession(FakeResponse(400, None, text="bad request"))
+    client = make_client_with_session(session)
+
+    with pytest.raises(ApiError):
+        client.analytics.search.query_count(query_text="AI")
+
+    assert session.business_calls == 1
+    client.close()
+
+
+def test_retries_stop_at_max_attempts():
+    """Test the last error surfaces once attempts are exhausted."""
+    session = SequenceSession(FakeResponse(500, None, text="boom"))
+    client = make_client_with_session(session, retry_policy=RetryPolicy(max_attempts=3, base_delay=0.0))
+
+    with pytest.raises(ApiError) as exc_info:
+        client.analytics.search.query_count(query_text="AI")
+
+    assert exc_info.value.status_code == 500
+    assert session.business_calls == 3
+    client.close()
+
+
+def test_failed_connections_count_as_unsent():
+    """Test an upload is retried when connecting failed, but not after a reset."""
+    refused = urllib3.exceptions.MaxRetryError(
+        None, "/image-search/image-upload", urllib3.exceptions.NewConnectionError(None, "Connection refused")
+    )
+    upload_ok = FakeResponse(200, {"data": {"url": "https://img/1", "expire": 32400}, "status": True, "error_code": 0})
+    session = SequenceSession(requests.ConnectionError(refused), upload_ok)
+    client = make_client_with_session(session)
+
+    assert client.patents.search.upload_image(image=io.BytesIO(b"\x89PNG")).url == "https://img/1"
+    assert session.business_calls == 2
+
+    session = SequenceSession(requests.ConnectionError(urllib3.exceptions.ProtocolError("reset")), upload_ok)
+    client = make_client_with_session(session)
+
+    with pytest.raises(requests.ConnectionError):
+        client.patents.search.upload_image(image=io.BytesIO(b"\x89PNG"))
+    assert session.business_calls == 1
+
+
+def test_upload_is_not_retried_after_server_error():
+    """Test the non-idempotent upload endpoint is only retried on 429."""
+    controller = RetryController(policy=RetryPolicy(base_delay=0.0))
+
+    assert controller.retry_delay("/image-search/image-upload", 0, status_code=500) is None
+    assert controller.retry_delay("/image-search/image-upload", 0, status_code=429) == 0.0
+    assert controller.retry_delay("/search/patent/query/v2", 0, status_code=500) == 0.0
+
+
+def test_retry_after_is_respected():
+    """Test Retry-After overrides a shorter backoff, bounded by max_delay."""
+    controller = RetryController(policy=RetryPolicy(base_delay=0.0, max_delay=10.0))
+
+    assert controller.retry_delay("/p", 0, status_code=429, retry_after=3.0) == 3.0
+    assert controller.retry_delay("/p", 0, status_code=429, retry_after=60.0) == 10.0
+    assert parse_retry_after("2") == 2.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+
+
+def test_retry_budget_limits_retries_per_endpoint():
+    """Test an endpoint cannot retry beyond its banked budget."""
+    controller = RetryController(policy=RetryPolicy(base_delay=0.0, budget_capacity=2.0, budget_ratio=0.0))
+
+    assert controller.retry_delay("/a", 0, status_code=503) is not None
+    assert controller.retry_delay("/a", 0, status_code=503) is not None
+    assert controller.retry_delay("/a", 0, status_code=503) is None
+    # Budgets are tracked per endpoint
+    assert controller.retry_delay("/b", 0, status_code=503) is not None
+
+
+def test_circuit_breaker_opens_and_recovers():
+    """Test the breaker fails fast when open and closes after a good trial call."""
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10.0, clock=lambda: now[0])
+
+    breaker.record_failure()
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    now[0] = 11.0
+    breaker.before_call()  # the single half-open trial
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
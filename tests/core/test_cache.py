@@ -0,0 +1,129 @@
+"""Tests for the response cache."""
+
+from __future__ import annotations
+
+import pytest
+
+from patsnap_pythonSDK.utils import cache as cache_module
+from patsnap_pythonSDK.utils.cache import MemoryCacheBackend, ResponseCache, SQLiteCacheBackend
+from tests.shared import FakeResponse, FakeSession, make_client_with_session, create_oauth_payload
+
+
+COUNT_PATH = "/search/patent/query-search-count/v2"
+
+
+class CountingSession(FakeSession):
+    """Fake session answering every business call with an incrementing count."""
+
+    def __init__(self):
+        super().__init__(FakeResponse(200, create_oauth_payload()), FakeResponse(200, {}))
+        self.business_calls = 0
+
+    def post(self, url, **kwargs):
+        if url.endswith("/oauth/token"):
+            return super().post(url, **kwargs)
+        self.business_calls += 1
+        payload = {"data": {"total_search_result_count": self.business_calls}, "status": True, "error_code": 0}
+        return FakeResponse(200, payload)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return MemoryCacheBackend(max_entries=2)
+    return SQLiteCacheBackend(tmp_path / "cache.sqlite", max_entries=2)
+
+
+def test_repeated_calls_are_served_from_cache(backend):
+    """Test identical requests hit the cache and different ones miss."""
+    session = CountingSession()
+    cache = ResponseCache(backend)
+    client = make_client_with_session(session, cache=cache)
+
+    first = client.analytics.search.query_count(query_text="AI")
+    second = client.analytics.search.query_count(query_text="AI")
+    other = client.analytics.search.query_count(query_text="robot")
+
+    assert first.total_search_result_count == second.total_search_result_count == 1
+    assert other.total_search_result_count == 2
+    assert session.business_calls == 2
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.stores) == (1, 2, 2)
+    client.close()
+
+
+def test_bypass_and_refresh(backend):
+    """Test bypass skips the cache and refresh replaces the stored entry."""
+    session = CountingSession()
+    cache = ResponseCache(backend)
+    client = make_client_with_session(session, cache=cache)
+
+    client.analytics.search.query_count(query_text="AI")
+    with cache.bypass():
+        assert client.analytics.search.query_count(query_text="AI").total_search_result_count == 2
+    with cache.refresh():
+        assert client.analytics.search.query_count(query_text="AI").total_search_result_count == 3
+    assert client.analytics.search.query_count(query_text="AI").total_search_result_count == 3
+
+    assert session.business_calls == 3
+    assert cache.stats.bypassed == 1
+    client.close()
+
+
+def test_cache_flag_applies_to_one_call(backend):
+    """Test a per-call cache= overrides the cache for that call alone."""
+    session = CountingSession()
+    cache = ResponseCache(backend)
+    client = make_client_with_session(session, cache=cache)
+
+    def count(**options):
+        return client._http.call(COUNT_PATH, json={"query_text": "AI"}, parse=lambda payload: payload["data"], **options)
+
+    assert count()["total_search_result_count"] == 1
+    assert count(cache="bypass")["total_search_result_count"] == 2
+    assert count()["total_search_result_count"] == 1
+    assert count(cache="refresh")["total_search_result_count"] == 3
+    with cache.bypass():
+        assert count(cache="use")["total_search_result_count"] == 3
+    with pytest.raises(ValueError, match="cache must be one of"):
+        count(cache="skip")
+
+    assert session.business_calls == 3
+    client.close()
+
+
+def test_entries_expire_after_ttl(backend, monkeypatch):
+    """Test per-endpoint TTLs and uncached endpoints."""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    cache = ResponseCache(backend, ttls={COUNT_PATH: 60}, default_ttl=None)
+
+    key, payload = cache.lookup(COUNT_PATH, {"query_text": "AI"})
+    cache.store(COUNT_PATH, key, {"n": 1})
+    assert cache.lookup(COUNT_PATH, {"query_text": "AI"})[1] == {"n": 1}
+
+    now[0] += 61
+    assert cache.lookup(COUNT_PATH, {"query_text": "AI"})[1] is None
+    assert cache.lookup("/other", {}) == (None, None)
+
+
+def test_lru_eviction(backend, monkeypatch):
+    """Test the least recently used entry is evicted once the backend is full."""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    for key in ("a", "b"):
+        now[0] += 1
+        backend.set(key, {"k": key}, expires_at=now[0] + 100)
+    now[0] += 1
+    backend.get("a", now[0])
+    now[0] += 1
+    backend.set("c", {"k": "c"}, expires_at=now[0] + 100)
+
+    assert backend.get("b", now[0]) is None
+    assert backend.get("a", now[0]) == {"k": "a"}
+    assert len(backend) == 2
+
+
+def test_key_is_canonical():
+    """Test key order does not change the cache key."""
+    assert ResponseCache.key(COUNT_PATH, {"a": 1, "b": 2}) == ResponseCache.key(COUNT_PATH, {"b": 2, "a": 1})
+    assert ResponseCache.key(COUNT_PATH, {"a": 1}) != ResponseCache.key("/other", {"a": 1})
@@ -0,0 +1,93 @@
+"""Tests for columnar export of search results."""
+
+from __future__ import annotations
+
+import importlib.util
+
+import pytest
+
+from patsnap_pythonSDK.export import column_types, parse_relevancy, to_arrow, to_columns, to_records, write_parquet
+from patsnap_pythonSDK.models.search.patents import PatentBaseV2Response, PatentMessage, SemanticResult
+from tests.core.test_pagination import make_patent
+from tests.shared import FakeResponse, FakeSession, make_client_with_session, create_oauth_payload
+
+
+def semantic_row(i: int, relevancy: str) -> dict:
+    return dict(make_patent(i), relevancy=relevancy)
+
+
+def test_column_types_follow_the_row_model():
+    """Test dates are int32, relevancy is a float and optional fields are nullable."""
+    patent = column_types(PatentBaseV2Response)
+    assert patent["apdt"] == ("int32", False) and patent["pbdt"] == ("int32", False)
+    assert patent["pn"] == ("string", False)
+    assert column_types(SemanticResult)["relevancy"] == ("float64", False)
+    assert column_types(PatentMessage)["score"] == ("float64", True)
+    assert column_types(PatentMessage)["loc_match"] == ("int64", True)
+
+
+def test_parse_relevancy():
+    assert parse_relevancy("87%") == 87.0
+    assert parse_relevancy(" 12.5 % ") == 12.5
+    assert parse_relevancy(3) == 3.0
+    assert parse_relevancy("") is None and parse_relevancy(None) is None
+
+
+def test_to_columns_accepts_dict_and_model_rows():
+    """Test dict rows and model rows produce the same typed columns."""
+    rows = [semantic_row(0, "90%"), semantic_row(1, "75.5%")]
+    from_dicts = to_columns(SemanticResult, rows)
+    from_models = to_columns(SemanticResult, [SemanticResult(**row) for row in rows])
+
+    assert from_dicts == from_models
+    assert from_dicts["relevancy"] == [90.0, 75.5]
+    assert from_dicts["apdt"] == [20200101, 20200101]
+
+
+def test_lazy_pages_export_without_validating_rows():
+    """Test exporting a lazy page reads the raw rows and leaves them unvalidated."""
+    payload = {
+        "data": {"results": [make_patent(i) for i in range(3)], "result_count": 3, "total_search_result_count": 3},
+        "status": True,
+        "error_code": 0,
+    }
+    session = FakeSession(FakeResponse(200, create_oauth_payload()), FakeResponse(200, payload))
+    page = make_client_with_session(session, response_mode="lazy").patents.search.by_number(pn="US0")
+
+    columns = to_columns(PatentBaseV2Response, page.data.results)
+
+    assert columns["pn"] == ["US0", "US1", "US2"]
+    assert all(isinstance(row, dict) for row in page.data.results.iter_raw())
+
+
+@pytest.mark.skipif(importlib.util.find_spec("pyarrow") is not None, reason="pyarrow is installed")
+def test_missing_pyarrow_names_the_extra():
+    with pytest.raises(ImportError, match=r"patsnap-pythonSDK\[arrow\]"):
+        to_arrow(PatentBaseV2Response, [make_patent(0)])
+
+
+def test_to_arrow_and_parquet_round_trip(tmp_path):
+    """Test the Arrow table is typed and streamed Parquet files read back intact."""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    rows = [make_patent(i) for i in range(5)]
+
+    table = to_arrow(PatentBaseV2Response, rows)
+    assert table.schema.field("apdt").type == pa.int32()
+    assert table.column("pn").to_pylist() == [f"US{i}" for i in range(5)]
+
+    path = tmp_path / "patents.parquet"
+    assert write_parquet(iter(rows), path, PatentBaseV2Response, batch_size=2) == 5
+    parquet = pq.ParquetFile(path)
+    assert parquet.num_row_groups == 3
+    assert parquet.read().equals(table)
+
+
+def test_to_records():
+    np = pytest.importorskip("numpy")
+    rows = [dict(make_patent(0), url="u", patent_pn="US0", score=None, loc_match=1)]
+
+    records = to_records(PatentMessage, rows)
+
+    assert records.apdt.dtype == np.int32
+    assert np.isnan(records.score[0])
@@ -0,0 +1,109 @@
+"""Tests for pluggable JSON decoding and raw-body model validation."""
+
+from __future__ import annotations
+
+import pytest
+
+from patsnap_pythonSDK.errors import ApiError
+from patsnap_pythonSDK.models.search.patents import SearchPatentV2Response
+from patsnap_pythonSDK.utils.cache import ResponseCache, SQLiteCacheBackend
+from patsnap_pythonSDK.utils.jsoncodec import StdlibJsonCodec, default_codec
+from tests.core.test_pagination import make_patent
+from tests.shared import FakeResponse, FakeSession, make_client_with_session, create_oauth_payload
+
+
+class CountingCodec(StdlibJsonCodec):
+    """Stdlib codec that counts decoded bodies."""
+
+    def __init__(self):
+        self.loads_calls = 0
+
+    def loads(self, data):
+        self.loads_calls += 1
+        return super().loads(data)
+
+
+def make_session(business_payload, text=""):
+    return FakeSession(FakeResponse(200, create_oauth_payload()), FakeResponse(200, business_payload, text=text))
+
+
+def search_payload(count=2):
+    results = [make_patent(i) for i in range(count)]
+    return {
+        "data": {"results": results, "result_count": count, "total_search_result_count": count},
+        "status": True,
+        "error_code": 0,
+    }
+
+
+def test_default_codec_prefers_orjson():
+    """Test orjson is picked up when it is installed."""
+    pytest.importorskip("orjson")
+    assert default_codec().name == "orjson"
+
+
+def test_stdlib_codec_raises_value_error_on_bad_input():
+    """Test codecs report malformed JSON as ValueError."""
+    codec = StdlibJsonCodec()
+    assert codec.loads(codec.dumps({"a": [1, "é"]})) == {"a": [1, "é"]}
+    with pytest.raises(ValueError):
+        codec.loads(b"{not json")
+
+
+def test_response_model_is_validated_from_raw_bytes():
+    """Test parsers with a response model skip the codec entirely."""
+    codec = CountingCodec()
+    client = make_client_with_session(make_session(search_payload()), json_codec=codec)
+
+    result = client.patents.search.by_number(pn="US0")
+
+    assert isinstance(result, SearchPatentV2Response)
+    assert [row.pn for row in result.data.results] == ["US0", "US1"]
+    assert codec.loads_calls == 0
+
+
+def test_raw_body_without_data_wrapper_falls_back_to_parser():
+    """Test bodies that do not match the model are decoded and normalised by the parser."""
+    payload = search_payload()["data"]
+    codec = CountingCodec()
+    client = make_client_with_session(make_session(payload), json_codec=codec)
+
+    result = client.patents.search.by_number(pn="US0")
+
+    assert result.data.result_count == 2
+    assert codec.loads_calls == 1
+
+
+def test_raw_path_still_raises_business_errors():
+    """Test the envelope of a raw body is checked for API errors."""
+    payload = {"status": False, "error_code": 67200002, "error_msg": "quota exceeded"}
+    client = make_client_with_session(make_session(payload))
+
+    with pytest.raises(ApiError) as exc_info:
+        client.patents.search.by_number(pn="US0")
+    assert exc_info.value.error_code == 67200002
+    assert "quota exceeded" in str(exc_info.value)
+
+
+def test_invalid_json_raises_api_error():
+    """Test undecodable bodies surface as ApiError on both decode paths."""
+    client = make_client_with_session(make_session(None, text="<html>"))
+
+    with pytest.raises(ApiError, match="not valid JSON"):
+        client.patents.search.by_number(pn="US0")
+    with pytest.raises(ApiError, match="not valid JSON"):
+        client.analytics.search.query_count(query_text="TTL: battery")
+
+
+def test_raw_bodies_round_trip_through_sqlite_cache(tmp_path):
+    """Test raw bodies are cached as bytes and validated on a hit."""
+    session = make_session(search_payload())
+    cache = ResponseCache(SQLiteCacheBackend(tmp_path / "cache.sqlite"))
+    client = make_client_with_session(session, cache=cache)
+
+    first = client.patents.search.by_number(pn="US0")
+    session._business_response = FakeResponse(500, None)
+    second = client.patents.search.by_number(pn="US0")
+
+    assert second == first
+    assert cache.stats.hits == 1
@@ -0,0 +1,161 @@
+"""Tests running the clients over HTTP against the mock Patsnap server."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import random
+
+import pytest
+
+from patsnap_pythonSDK import AdaptiveConcurrencyLimiter, ApiError, AsyncPatsnapClient, PatsnapClient, RetryPolicy
+from tests.shared.loadtest import run_load
+from tests.shared.mockserver import Latency, MockCorpus, MockPatsnapServer, MockServerConfig
+
+
+FAST_RETRIES = RetryPolicy(max_attempts=10, base_delay=0.0, max_delay=0.0, budget_capacity=1000.0)
+
+
+@pytest.fixture
+def serve():
+    servers = []
+
+    def start(**options):
+        server = MockPatsnapServer(MockServerConfig(**options)).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.stop()
+
+
+def client_for(server, **options):
+    return PatsnapClient(client_id="id", client_secret="secret", base_url=server.url, **options)
+
+
+def test_counts_agree_with_the_pages(serve):
+    server = serve(totals={"TACD: car": 250})
+    client = client_for(server)
+
+    total = client.analytics.search.query_count(query_text="TACD: car").total_search_result_count
+    rows = client.analytics.search.fetch_all(query_text="TACD: car", page_size=100).data.results
+
+    assert total == 250
+    assert len(rows) == 250
+    assert len({row.patent_id for row in rows}) == 250
+    assert server.stats["by_path"]["/oauth/token"] == 1
+
+
+def test_filters_narrow_the_result_set_exactly(serve):
+    server = serve(totals={"TACD: car": 6000})
+    client = client_for(server)
+
+    def count(query_text):
+        return client.analytics.search.query_count(query_text=query_text).total_search_result_count
+
+    halves = [
+        count("(TACD: car) AND APD:[19000101 TO 20051231]"),
+        count("(TACD: car) AND APD:[20060101 TO 20301231]"),
+    ]
+    authorities = [count(f"(TACD: car) AND AUTHORITY:({code})") for code in ("US", "CN", "EP", "JP", "KR", "WO")]
+
+    assert sum(halves) == 6000 and all(halves)
+    assert sum(authorities) == 6000
+    assert count("(TACD: car) AND APD:[19000101 TO 19800101]") == 0
+
+
+def test_rows_fall_inside_the_date_clause():
+    corpus = MockCorpus(MockServerConfig(totals={"q": 5000}))
+
+    selection = corpus.select("(q) AND PBD:[20000101 TO 20001231] AND AUTHORITY:(CN)")
+    rows = corpus.page(selection, 0, selection.count)
+
+    assert rows
+    assert all(20000101 <= row["pbdt"] <= 20001231 for row in rows)
+    assert all(row["pn"].startswith("CN") for row in rows)
+
+
+def test_paging_past_the_window_is_rejected(serve):
+    client = client_for(serve(totals={"TACD: car": 30000}))
+
+    with pytest.raises(ApiError):
+        client.analytics.search.query_search(query_text="TACD: car", offset=19950, limit=100)
+
+
+def test_partitioned_search_reads_past_the_window(serve):
+    server = serve(totals={"TACD: car": 26000})
+    client = client_for(server)
+
+    rows = list(client.analytics.search.iter_partitioned_search(
+        query_text="TACD: car", start=datetime.date(1980, 1, 1), concurrency=8,
+    ))
+
+    assert len({row.patent_id for row in rows}) == 26000
+
+
+def test_adaptive_limiter_backs_off_below_capacity(serve):
+    server = serve(capacity=4, latency=Latency("fixed", 0.005))
+    limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=16, window=5)
+    client = client_for(server, concurrency_limiter=limiter, retry_policy=FAST_RETRIES)
+
+    matrix = client.analytics.search.count_matrix([f"TACD: term {i}" for i in range(150)])
+
+    assert len(matrix.counts) == 150
+    assert server.stats["peak_active"] > 2
+    assert server.stats["throttled"] < 40
+    assert limiter.in_flight("/search/patent/query-search-count/v2") == 0
+
+
+def test_injected_faults_are_retried(serve):
+    server = serve(throttle_rate=0.1, error_rate=0.1, retry_after=0, seed=3)
+    client = client_for(server, retry_policy=FAST_RETRIES)
+
+    counts = [client.analytics.search.query_count(query_text=f"TACD: {i}") for i in range(60)]
+
+    assert len(counts) == 60
+    assert server.stats["by_status"]["429"] > 0
+    assert server.stats["by_status"]["503"] > 0
+
+
+def test_error_code_responses_raise(serve):
+    client = client_for(serve(error_code_rate=1.0, error_code=67200002), retry_policy=RetryPolicy(max_attempts=1))
+
+    with pytest.raises(ApiError) as excinfo:
+        client.analytics.search.query_count(query_text="TACD: car")
+
+    assert excinfo.value.error_code == 67200002
+
+
+def test_async_client(serve):
+    pytest.importorskip("httpx")
+    server = serve()
+
+    async def run():
+        async with AsyncPatsnapClient(client_id="id", client_secret="secret", base_url=server.url) as client:
+            return await client.patents.search.by_semantic_text(text="battery", offset=990, limit=10)
+
+    result = asyncio.run(run())
+
+    assert len(result.data.results) == 10
+
+
+def test_latency_distributions():
+    rng = random.Random(0)
+
+    assert Latency.parse("0.05").sample(rng) == 0.05
+    assert 0.01 <= Latency.parse("uniform:0.01:0.02").sample(rng) <= 0.02
+    assert Latency.parse("lognormal:0.02:0.5").sample(rng) > 0
+    with pytest.raises(ValueError, match="distribution"):
+        Latency.parse("pareto:1")
+
+
+def test_load_driver_reports(serve):
+    server = serve(latency=Latency("fixed", 0.001))
+
+    report = run_load(server.url, scenario="search", operations=40, concurrency=4)
+
+    assert report.errors == 0
+    assert report.http_requests == 41
+    assert report.p99_ms >= report.p50_ms > 0
+    assert report.cpu_ms_per_request > 0
@@ -0,0 +1,126 @@
+"""Tests for offset/limit pagination helpers."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from patsnap_pythonSDK.pagination import iter_results
+from tests.shared import FakeResponse, FakeSession, make_client_with_session, create_oauth_payload
+
+
+def make_page(offset: int, limit: int, total: int):
+    rows = list(range(offset, min(offset + limit, total)))
+    return SimpleNamespace(data=SimpleNamespace(results=rows, result_count=len(rows), total_search_result_count=total))
+
+
+def make_patent(i: int) -> dict:
+    return {
+        "pn": f"US{i}", "apdt": 20200101, "apno": f"A{i}", "pbdt": 20210101, "title": "T",
+        "inventor": "I", "patent_id": f"id-{i}", "current_assignee": "C", "original_assignee": "O",
+    }
+
+
+class PagedSession(FakeSession):
+    """Fake session serving offset/limit pages out of ``total`` patents."""
+
+    def __init__(self, total: int):
+        super().__init__(FakeResponse(200, create_oauth_payload()), FakeResponse(200, {}))
+        self.total = total
+        self.calls = []
+
+    def post(self, url, *, headers=None, params=None, data=None, json=None, timeout=None, auth=None):
+        if url.endswith("/oauth/token"):
+            return super().post(url, headers=headers, params=params, data=data, json=json, timeout=timeout, auth=auth)
+        self.calls.append((json["offset"], json["limit"]))
+        offset, limit = json["offset"], json["limit"]
+        results = [make_patent(i) for i in range(offset, min(offset + limit, self.total))]
+        return FakeResponse(200, {
+            "data": {"results": results, "result_count": len(results), "total_search_result_count": self.total},
+            "status": True,
+            "error_code": 0,
+        })
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_results_stops_at_total(prefetch):
+    """Test iteration walks every page and stops at the reported total."""
+    calls = []
+
+    def fetch(offset, limit):
+        calls.append((offset, limit))
+        return make_page(offset, limit, total=25)
+
+    assert list(iter_results(fetch, page_size=10, prefetch=prefetch)) == list(range(25))
+    assert calls == [(0, 10), (10, 10), (20, 5)]
+
+
+def test_iter_pages_respects_window_limit_and_max_results():
+    """Test iteration never requests past the API window or max_results."""
+    calls = []
+
+    def fetch(offset, limit):
+        calls.append((offset, limit))
+        return make_page(offset, limit, total=10_000)
+
+    rows = list(iter_results(fetch, offset=900, page_size=60, window_limit=1000))
+    assert rows == list(range(900, 1000))
+    assert calls[-1] == (960, 40)
+
+    calls.clear()
+    assert len(list(iter_results(fetch, page_size=100, max_results=150))) == 150
+    assert calls == [(0, 100), (100, 50)]
+
+
+def test_iter_pages_stops_on_empty_page():
+    """Test iteration stops if the API returns fewer rows than advertised."""
+    calls = []
+
+    def fetch(offset, limit):
+        calls.append(offset)
+        page = make_page(offset, limit, total=5)
+        page.data.total_search_result_count = 50
+        return page
+
+    assert list(iter_results(fetch, page_size=5)) == list(range(5))
+    assert calls == [0, 5]
+
+
+def test_iter_by_current_assignee_streams_all_pages():
+    """Test the namespace iterator issues sequential offset windows."""
+    session = PagedSession(total=2500)
+    client = make_client_with_session(session)
+
+    pns = [p.pn for p in client.patents.search.iter_by_current_assignee(assignee="Apple, Inc.")]
+
+    assert len(pns) == 2500
+    assert pns[0] == "US0" and pns[-1] == "US2499"
+    assert session.calls == [(0, 1000), (1000, 1000), (2000, 500)]
+
+    client.close()
+
+
+def test_fetch_all_issues_windows_concurrently_and_keeps_order():
+    """Test fetch_all reassembles concurrently fetched pages in offset order."""
+    session = PagedSession(total=4500)
+    client = make_client_with_session(session)
+
+    resp = client.analytics.search.fetch_all(query_text="TACD: virtual reality", concurrency=3)
+
+    assert resp.data.result_count == 4500
+    assert resp.data.total_search_result_count == 4500
+    assert [p.pn for p in resp.data.results] == [f"US{i}" for i in range(4500)]
+    assert sorted(session.calls) == [(0, 1000), (1000, 1000), (2000, 1000), (3000, 1000), (4000, 500)]
+
+    client.close()
+
+
+def test_fetch_all_rejects_unpaginated_endpoint():
+    """Test fetch_all only accepts offset/limit endpoints."""
+    client = make_client_with_session(PagedSession(total=1))
+
+    with pytest.raises(ValueError):
+        client.patents.search.fetch_all("by_number", pn="US1")
+
+    client.close()
@@ -0,0 +1,91 @@
+"""Tests for the client-side rate limiters."""
+
+from __future__ import annotations
+
+import types
+
+import pytest
+
+from patsnap_pythonSDK.utils import ratelimit
+from patsnap_pythonSDK.utils.ratelimit import FileLockRateLimiter, InProcessRateLimiter
+from tests.shared import FakeResponse, FakeSession, make_client_with_session, create_oauth_payload
+
+
+QUERY_PATH = "/search/patent/query-search-count/v2"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze the limiter's wall clock; advance it by assigning ``clock.now``."""
+    fake = types.SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(ratelimit, "time", types.SimpleNamespace(time=lambda: fake.now))
+    return fake
+
+
+def test_bucket_allows_burst_then_spaces_requests(clock):
+    """Test requests past the burst wait 1/rate seconds each."""
+    limiter = InProcessRateLimiter({QUERY_PATH: 2}, burst=2)
+
+    assert limiter.reserve(QUERY_PATH) == 0.0
+    assert limiter.reserve(QUERY_PATH) == 0.0
+    assert limiter.reserve(QUERY_PATH) == pytest.approx(0.5)
+    assert limiter.reserve(QUERY_PATH) == pytest.approx(1.0)
+
+    clock.now += 2.0
+    assert limiter.reserve(QUERY_PATH) == 0.0
+
+
+def test_unlisted_paths_use_default_rate_or_run_unlimited(clock):
+    """Test the per-path table, the default rate and unlimited endpoints."""
+    assert InProcessRateLimiter({QUERY_PATH: 1}).reserve("/other") == 0.0
+
+    limiter = InProcessRateLimiter(default_rate=1)
+    assert limiter.reserve("other") == 0.0
+    assert limiter.reserve("/other") == pytest.approx(1.0)
+
+
+def test_global_rate_caps_all_endpoints(clock):
+    """Test the global bucket is shared across endpoint paths."""
+    limiter = InProcessRateLimiter(global_rate=1)
+
+    assert limiter.reserve("/a") == 0.0
+    assert limiter.reserve("/b") == pytest.approx(1.0)
+
+
+def test_invalid_rate_is_rejected():
+    """Test non-positive rates raise ValueError."""
+    with pytest.raises(ValueError):
+        InProcessRateLimiter({QUERY_PATH: 0})
+
+
+def test_file_limiter_shares_state_between_instances(clock, tmp_path):
+    """Test two limiters on one file draw from the same bucket, as processes would."""
+    state_file = tmp_path / "quota.json"
+    first = FileLockRateLimiter(state_file, global_rate=1)
+    second = FileLockRateLimiter(state_file, global_rate=1)
+
+    assert first.reserve(QUERY_PATH) == 0.0
+    assert second.reserve(QUERY_PATH) == pytest.approx(1.0)
+    assert first.reserve(QUERY_PATH) == pytest.approx(2.0)
+
+
+def test_client_sleeps_for_reserved_wait(monkeypatch):
+    """Test HttpClient waits out the limiter before sending."""
+    sleeps = []
+    monkeypatch.setattr("patsnap_pythonSDK.http.time.sleep", sleeps.append)
+
+    class StubLimiter(InProcessRateLimiter):
+        def reserve(self, path):
+            sleeps.append(path)
+            return 0.25
+
+    session = FakeSession(
+        FakeResponse(200, create_oauth_payload()),
+        FakeResponse(200, {"data": {"total_search_result_count": 3}, "status": True, "error_code": 0}),
+    )
+    client = make_client_with_session(session, rate_limiter=StubLimiter())
+
+    client.analytics.search.query_count(query_text="AI")
+
+    assert sleeps == [QUERY_PATH, 0.25]
+    client.close()
@@ -0,0 +1,81 @@
+"""Tests for compact result records and the compact response mode."""
+
+from __future__ import annotations
+
+import pickle
+import sys
+import warnings
+
+import pytest
+
+from patsnap_pythonSDK import CompactRecord, record_type
+from patsnap_pythonSDK.export import to_columns
+from patsnap_pythonSDK.models.search.patents import PatentBaseV2Response, PatentMessage, SearchPatentV2Response
+from tests.core.test_pagination import PagedSession, make_patent
+from tests.shared import make_client_with_session
+
+
+def test_record_type_mirrors_the_row_model():
+    """Test records expose the model's fields and convert back to the model."""
+    Record = record_type(PatentBaseV2Response)
+    record = Record.from_dict(make_patent(7))
+
+    assert Record is record_type(PatentBaseV2Response)
+    assert Record.__name__ == "PatentBaseV2ResponseRecord"
+    assert record.pn == "US7" and record.apdt == 20200101
+    assert not hasattr(record, "__dict__")
+    assert record.to_model() == PatentBaseV2Response(**make_patent(7))
+    assert pickle.loads(pickle.dumps(record)) == record
+
+
+def test_records_are_smaller_than_models():
+    row = make_patent(1)
+    record = record_type(PatentBaseV2Response).from_dict(row)
+    model = PatentBaseV2Response(**row)
+
+    assert sys.getsizeof(record) < sys.getsizeof(model) + sys.getsizeof(model.__dict__)
+
+
+def test_records_fill_optional_defaults_and_reject_missing_fields():
+    """Test optional fields default like the model and required ones must be present."""
+    Record = record_type(PatentMessage)
+    row = dict(make_patent(0), url="u", patent_pn="US0")
+    row.pop("pn")
+
+    record = Record.from_dict(row)
+    assert record.score is None and record.loc_match is None
+    row.pop("apno")
+    with pytest.raises(ValueError, match="apno"):
+        Record.from_dict(row)
+
+
+def test_compact_mode_returns_records_in_the_usual_response():
+    """Test compact pages keep the response type, paginate, export and dump."""
+    client = make_client_with_session(PagedSession(total=5), response_mode="compact")
+    search = client.patents.search
+
+    rows = list(search.iter_by_current_assignee(assignee="C", page_size=2))
+    merged = search.fetch_all("by_current_assignee", assignee="C", page_size=2)
+
+    assert all(isinstance(row, CompactRecord) for row in rows)
+    assert isinstance(merged, SearchPatentV2Response)
+    assert [row.pn for row in merged.data.results] == [f"US{i}" for i in range(5)]
+    assert to_columns(PatentBaseV2Response, merged.data.results)["apdt"] == [20200101] * 5
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        dumped = merged.model_dump()
+    assert dumped["data"]["results"][0] == make_patent(0)
+    # Dumping does not swap the records out of the response
+    assert isinstance(merged.data.results[0], CompactRecord)
+
+
+def test_compact_mode_keeps_query_filter_buckets():
+    """Test rows of a model without declared fields stay models in compact mode."""
+    from patsnap_pythonSDK.models.analytics.search import PatentDataFieldResponse
+    from patsnap_pythonSDK.resources._parsing import build_list
+    from patsnap_pythonSDK.utils.responsemode import response_mode
+
+    with response_mode("compact"):
+        rows = build_list(PatentDataFieldResponse, [{"assignee": [{"name": "APPLE INC.", "count": 2509}]}])
+
+    assert rows[0].assignee[0].name == "APPLE INC."
@@ -0,0 +1,98 @@
+"""Tests for the model/dict/lazy response modes."""
+
+from __future__ import annotations
+
+import warnings
+
+import pytest
+from pydantic import ValidationError
+
+from patsnap_pythonSDK import response_mode
+from patsnap_pythonSDK.models.search.patents import PatentBaseV2Response, SearchPatentV2Response
+from patsnap_pythonSDK.utils.responsemode import LazyModelList
+from tests.core.test_pagination import PagedSession, make_patent
+from tests.shared import FakeResponse, FakeSession, make_client_with_session, create_oauth_payload
+
+
+def search_session(results):
+    payload = {
+        "data": {"results": results, "result_count": len(results), "total_search_result_count": len(results)},
+        "status": True,
+        "error_code": 0,
+    }
+    return FakeSession(FakeResponse(200, create_oauth_payload()), FakeResponse(200, payload))
+
+
+def test_dict_mode_returns_the_payload():
+    """Test the dict mode skips models entirely."""
+    client = make_client_with_session(search_session([make_patent(0)]), response_mode="dict")
+
+    payload = client.patents.search.by_number(pn="US0")
+
+    assert payload["data"]["results"][0]["pn"] == "US0"
+    assert payload["status"] is True
+
+
+def test_response_mode_block_overrides_client_default():
+    """Test a response_mode block wins over the client setting, then is restored."""
+    client = make_client_with_session(search_session([make_patent(0)]))
+
+    with response_mode("dict"):
+        assert isinstance(client.patents.search.by_number(pn="US0"), dict)
+    assert isinstance(client.patents.search.by_number(pn="US0"), SearchPatentV2Response)
+
+
+def test_unknown_response_mode_is_rejected():
+    with pytest.raises(ValueError, match="response_mode"):
+        make_client_with_session(search_session([]), response_mode="arrow")
+    with pytest.raises(ValueError):
+        with response_mode("eager"):
+            pass
+
+
+def test_lazy_mode_validates_rows_on_first_access():
+    """Test lazy pages keep raw rows until each is read."""
+    bad_row = dict(make_patent(1), apdt="not a date")
+    client = make_client_with_session(search_session([make_patent(0), bad_row]), response_mode="lazy")
+
+    page = client.patents.search.by_number(pn="US0")
+
+    assert isinstance(page, SearchPatentV2Response)
+    results = page.data.results
+    assert isinstance(results, LazyModelList)
+    assert len(results) == 2 and page.data.result_count == 2
+    assert isinstance(list.__getitem__(results, 0), dict)
+    assert isinstance(results[0], PatentBaseV2Response)
+    assert results[0].pn == "US0"
+    with pytest.raises(ValidationError):
+        results[1]
+
+
+def test_lazy_page_dumps_like_a_validated_page():
+    """Test dumping a lazy page validates pending rows and matches model mode."""
+    rows = [make_patent(i) for i in range(3)]
+    eager = make_client_with_session(search_session(rows)).patents.search.by_number(pn="US0")
+    lazy = make_client_with_session(search_session(rows), response_mode="lazy").patents.search.by_number(pn="US0")
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert lazy.model_dump() == eager.model_dump()
+        assert lazy.data.model_dump_json() == eager.data.model_dump_json()
+
+
+@pytest.mark.parametrize("mode", ["dict", "lazy"])
+def test_pagination_helpers_accept_every_mode(mode):
+    """Test streaming and merged fetches work on dict and lazy pages."""
+    client = make_client_with_session(PagedSession(total=5), response_mode=mode)
+    search = client.patents.search
+
+    rows = list(search.iter_by_current_assignee(assignee="C", page_size=2))
+    merged = search.fetch_all("by_current_assignee", assignee="C", page_size=2)
+
+    pns = [row["pn"] if mode == "dict" else row.pn for row in rows]
+    assert pns == [f"US{i}" for i in range(5)]
+    if mode == "dict":
+        assert [row["pn"] for row in merged["data"]["results"]] == pns
+    else:
+        assert isinstance(merged.data.results, LazyModelList)
+        assert [row.pn for row in merged.data.results] == pns
@@ -0,0 +1,167 @@
+"""Tests for single-flight coalescing of identical in-flight calls."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from patsnap_pythonSDK.errors import ApiError
+from patsnap_pythonSDK.utils.singleflight import AsyncSingleFlight, SingleFlight
+from tests.shared import FakeResponse, FakeSession, make_client_with_session, create_oauth_payload
+
+
+class GatedSession(FakeSession):
+    """Fake session whose business calls block until ``release`` is set."""
+
+    def __init__(self, response: FakeResponse):
+        super().__init__(FakeResponse(200, create_oauth_payload()), response)
+        self.release = threading.Event()
+        self.business_calls = 0
+
+    def post(self, url, **kwargs):
+        if url.endswith("/oauth/token"):
+            return super().post(url, **kwargs)
+        self.business_calls += 1
+        self.release.wait(timeout=5)
+        return self._business_response
+
+
+def run_concurrently(client, session, callers: int):
+    results, errors = [], []
+
+    def worker():
+        try:
+            results.append(client.analytics.search.query_count(query_text="AI"))
+        except ApiError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while client._http._inflight.coalesced < callers - 1 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    session.release.set()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def test_identical_concurrent_calls_share_one_request():
+    """Test five identical in-flight calls produce one upstream request."""
+    payload = {"data": {"total_search_result_count": 7}, "status": True, "error_code": 0}
+    session = GatedSession(FakeResponse(200, payload))
+    client = make_client_with_session(session)
+
+    results, errors = run_concurrently(client, session, 5)
+
+    assert session.business_calls == 1
+    assert not errors
+    assert [r.total_search_result_count for r in results] == [7] * 5
+    # Each caller gets its own model instance
+    assert len({id(r) for r in results}) == 5
+    client.close()
+
+
+def test_errors_are_shared_with_waiting_callers():
+    """Test followers receive the leader's exception."""
+    session = GatedSession(FakeResponse(400, None, text="bad request"))
+    client = make_client_with_session(session)
+
+    results, errors = run_concurrently(client, session, 3)
+
+    assert session.business_calls == 1
+    assert not results
+    assert len(errors) == 3
+    client.close()
+
+
+def test_sequential_calls_are_not_coalesced():
+    """Test finished calls are forgotten, so nothing is ever stale."""
+    group = SingleFlight()
+    counter = iter(range(10))
+
+    assert group.do("k", lambda: next(counter)) == 0
+    assert group.do("k", lambda: next(counter)) == 1
+    assert group.coalesced == 0
+
+
+def test_async_single_flight():
+    """Test concurrent tasks with one key await a single coroutine."""
+    group = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"n": len(calls)}
+
+    async def main():
+        return await asyncio.gather(*(group.do("k", fetch) for _ in range(4)))
+
+    results = asyncio.run(main())
+
+    assert calls == [1]
+    assert results == [{"n": 1}] * 4
+    assert group.coalesced == 3
+
+
+def test_async_single_flight_propagates_errors():
+    """Test tasks waiting on a failed call all see the error."""
+    group = AsyncSingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ApiError("boom")
+
+    async def main():
+        return await asyncio.gather(*(group.do("k", fail) for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(main())
+
+    assert all(isinstance(result, ApiError) for result in results)
+
+
+def test_async_cancelled_leader_does_not_cancel_followers():
+    """Test a leader's timeout leaves the shared call running for the other callers."""
+    group = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "payload"
+
+    async def main():
+        leader = asyncio.ensure_future(asyncio.wait_for(group.do("k", fetch), timeout=0.01))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(group.do("k", fetch))
+        with pytest.raises(asyncio.TimeoutError):
+            await leader
+        return await follower
+
+    assert asyncio.run(main()) == "payload"
+    assert calls == [1]
+
+
+def test_async_call_is_cancelled_with_its_last_caller():
+    group = AsyncSingleFlight()
+    finished = []
+
+    async def fetch():
+        await asyncio.sleep(0.05)
+        finished.append(1)
+
+    async def main():
+        callers = [asyncio.ensure_future(group.do("k", fetch)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        for caller in callers:
+            caller.cancel()
+        await asyncio.sleep(0.08)
+        return group._calls
+
+    assert asyncio.run(main()) == {}
+    assert finished == []
@@ -0,0 +1,111 @@
+"""Tests for per-request tracing."""
+
+from __future__ import annotations
+
+import types
+
+import pytest
+
+from patsnap_pythonSDK.errors import ApiError
+from patsnap_pythonSDK.utils.tracing import NOOP_TRACER, CallbackTracer, OpenTelemetryTracer
+from tests.shared import FakeResponse, FakeSession, make_client_with_session, create_oauth_payload
+from tests.core.test_backoff import SequenceSession
+from tests.core.test_pagination import make_patent
+
+
+SEARCH_PAYLOAD = {
+    "data": {
+        "results": [make_patent(1), make_patent(2)],
+        "result_count": 2,
+        "total_search_result_count": 2,
+    },
+    "status": True,
+    "error_code": 0,
+}
+
+
+def test_trace_records_phases_and_metadata():
+    """Test a traced call reports path, phases, sizes and result_count."""
+    traces = []
+    session = FakeSession(FakeResponse(200, create_oauth_payload()), FakeResponse(200, SEARCH_PAYLOAD))
+    client = make_client_with_session(session, tracer=CallbackTracer(traces.append))
+
+    client.analytics.search.query_search(query_text="AI", limit=2)
+
+    assert len(traces) == 1
+    trace = traces[0]
+    assert trace.path == "/search/patent/query-search-patent/v2"
+    assert set(trace.phase_totals()) == {"auth", "encode", "network", "decode", "parse"}
+    assert trace.request_bytes > 0
+    assert trace.status_code == 200
+    assert trace.result_count == 2
+    assert trace.retries == 0
+    assert trace.error is None
+    assert trace.duration >= sum(trace.phase_totals().values())
+    client.close()
+
+
+def test_trace_counts_retries_and_errors():
+    """Test retries and the final error are recorded on one trace."""
+    traces = []
+    session = SequenceSession(FakeResponse(503, None, text="unavailable"))
+    client = make_client_with_session(session, tracer=CallbackTracer(traces.append))
+
+    with pytest.raises(ApiError):
+        client.analytics.search.query_count(query_text="AI")
+
+    assert len(traces) == 1
+    assert traces[0].retries == 3
+    assert isinstance(traces[0].error, ApiError)
+    assert traces[0].status_code == 503
+    client.close()
+
+
+def test_failing_exporter_does_not_break_the_call():
+    """Test exporter exceptions surface as warnings only."""
+    def explode(trace):
+        raise RuntimeError("exporter down")
+
+    session = FakeSession(FakeResponse(200, create_oauth_payload()), FakeResponse(200, SEARCH_PAYLOAD))
+    client = make_client_with_session(session, tracer=CallbackTracer(explode))
+
+    with pytest.warns(RuntimeWarning):
+        client.analytics.search.query_search(query_text="AI", limit=2)
+    client.close()
+
+
+def test_noop_tracer_is_the_default():
+    """Test clients without a tracer use the shared no-op tracer."""
+    session = FakeSession(FakeResponse(200, create_oauth_payload()), FakeResponse(200, SEARCH_PAYLOAD))
+    client = make_client_with_session(session)
+
+    assert client._http._tracer is NOOP_TRACER
+    with NOOP_TRACER.trace("/x") as trace:
+        trace.retries = 5
+        assert trace.enabled is False and trace.retries == 0
+    client.close()
+
+
+def test_opentelemetry_tracer_emits_parent_and_phase_spans():
+    """Test spans are emitted through an injected OpenTelemetry-style tracer."""
+    spans = []
+
+    class FakeSpan:
+        def __init__(self, name, kwargs):
+            self.name, self.kwargs = name, kwargs
+            spans.append(self)
+
+        def end(self, end_time=None):
+            self.end_time = end_time
+
+    otel = types.SimpleNamespace(start_span=lambda name, **kwargs: FakeSpan(name, kwargs))
+    session = FakeSession(FakeResponse(200, create_oauth_payload()), FakeResponse(200, SEARCH_PAYLOAD))
+    client = make_client_with_session(session, tracer=OpenTelemetryTracer(otel))
+
+    client.analytics.search.query_search(query_text="AI", limit=2)
+
+    assert spans[0].name == "POST /search/patent/query-search-patent/v2"
+    assert spans[0].kwargs["attributes"]["patsnap.result_count"] == 2
+    assert [span.name for span in spans[1:]] == ["auth", "encode", "network", "decode", "parse"]
+    assert all(span.end_time >= span.kwargs["start_time"] for span in spans)
+    client.close()
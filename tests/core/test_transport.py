@@ -0,0 +1,58 @@
+"""Tests for the tuned HTTP transport."""
+
+from __future__ import annotations
+
+import socket
+
+from patsnap_pythonSDK import PatsnapClient
+from patsnap_pythonSDK.transport import TransportConfig
+from tests.shared import FakeResponse, FakeSession, make_client_with_session, create_oauth_payload
+
+
+def test_build_session_sizes_pool_and_sets_compression():
+    """Test pool size, blocking and Accept-Encoding come from the config."""
+    session = TransportConfig(pool_maxsize=64, pool_block=True).build_session()
+    adapter = session.get_adapter("https://connect.patsnap.com")
+
+    assert adapter._pool_maxsize == 64
+    assert adapter._pool_block is True
+    assert "gzip" in session.headers["Accept-Encoding"]
+    assert TransportConfig(compression=False).build_session().headers["Accept-Encoding"] == "identity"
+
+
+def test_keepalive_socket_options():
+    """Test TCP keep-alive is enabled on pooled connections unless disabled."""
+    adapter = TransportConfig().build_session().get_adapter("https://connect.patsnap.com")
+    options = adapter.poolmanager.connection_pool_kw["socket_options"]
+
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) not in TransportConfig(tcp_keepalive=False).socket_options()
+
+
+def test_client_uses_separate_connect_and_read_timeouts():
+    """Test the client passes (connect, read) timeouts and a tuned session."""
+    client = PatsnapClient(
+        client_id="id",
+        client_secret="secret",
+        transport=TransportConfig(connect_timeout=2.0, read_timeout=45.0),
+    )
+
+    assert client._http._timeout == (2.0, 45.0)
+    assert client._http._session.get_adapter("https://connect.patsnap.com")._pool_maxsize == 100
+    client.close()
+
+
+def test_request_params_and_headers_are_not_rebuilt():
+    """Test consecutive calls reuse the same apikey params and auth header objects."""
+    payload = {"data": {"total_search_result_count": 1}, "status": True, "error_code": 0}
+    session = FakeSession(FakeResponse(200, create_oauth_payload()), FakeResponse(200, payload))
+    client = make_client_with_session(session)
+
+    client.analytics.search.query_count(query_text="AI")
+    first = session.last_request
+    client.analytics.search.query_count(query_text="robot")
+    second = session.last_request
+
+    assert first.params is second.params and first.params["apikey"] == "client-id"
+    assert first.headers is second.headers and first.headers["Authorization"] == "Bearer token_example"
+    client.close()
@@ -0,0 +1,179 @@
+"""Tests for bulk patent-number lookups."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from patsnap_pythonSDK.bulk import AsyncBulkRun, BulkRun, normalize_patent_number
+from patsnap_pythonSDK.errors import ApiError
+from tests.shared import FakeResponse, FakeSession, make_client_with_session, create_oauth_payload
+
+
+def patent_payload(pn: str) -> dict:
+    return {
+        "data": {
+            "results": [{
+                "pn": pn, "apdt": 20211108, "apno": "US17/521392", "pbdt": 20230815, "title": "T",
+                "inventor": "I", "patent_id": f"id-{pn}", "current_assignee": "C", "original_assignee": "O",
+            }],
+            "result_count": 1,
+            "total_search_result_count": 1,
+        },
+        "status": True,
+        "error_code": 0,
+    }
+
+
+class NumberSession(FakeSession):
+    """Fake session answering search_pn calls; numbers in ``bad`` fail with HTTP 400."""
+
+    def __init__(self, bad=()):
+        super().__init__(FakeResponse(200, create_oauth_payload()), FakeResponse(200, {}))
+        self.bad = set(bad)
+        self.looked_up = []
+
+    def post(self, url, **kwargs):
+        if url.endswith("/oauth/token"):
+            return super().post(url, **kwargs)
+        pn = kwargs["json"]["pn"]
+        self.looked_up.append(pn)
+        if pn in self.bad:
+            return FakeResponse(400, None, text="bad request")
+        return FakeResponse(200, patent_payload(pn))
+
+
+def test_normalize_patent_number():
+    """Test spaces and commas are stripped and letters upper-cased."""
+    assert normalize_patent_number(" us 11,205,304 b2\n") == "US11205304B2"
+    assert normalize_patent_number("US17/521392") == "US17/521392"
+
+
+def test_by_numbers_streams_results_and_errors():
+    """Test duplicates collapse, failures are yielded and stats add up."""
+    session = NumberSession(bad={"US2B2"})
+    client = make_client_with_session(session)
+    numbers = ["US1B2", "us 1b2", "US2B2", "", "US3B2"]
+
+    run = client.patents.search.by_numbers(numbers, concurrency=2, chunk=2)
+    results = dict(run)
+
+    assert sorted(session.looked_up) == ["US1B2", "US2B2", "US3B2"]
+    assert results["US1B2"].data.results[0].pn == "US1B2"
+    assert results["US3B2"].data.results[0].pn == "US3B2"
+    assert isinstance(results["US2B2"], ApiError)
+    assert isinstance(results[""], ValueError)
+    assert (run.stats.succeeded, run.stats.failed, run.stats.duplicates, run.stats.invalid) == (2, 1, 1, 1)
+    assert run.stats.finished_at is not None and run.stats.throughput > 0
+    client.close()
+
+
+def test_every_spelling_of_a_number_gets_its_result():
+    """Test repeated numbers are looked up once but every input is paired with the result."""
+    looked_up = []
+
+    def lookup(number):
+        looked_up.append(number)
+        return f"result-{number}"
+
+    # concurrency=1: the first lookup finishes before its repeats are read
+    numbers = ["US7654321B2", "US 7,654,321 B2", "US1B2", "us7654321b2"]
+    pairs = list(BulkRun(lookup, numbers, concurrency=1, chunk=2))
+
+    assert sorted(pairs) == sorted([
+        ("US7654321B2", "result-US7654321B2"),
+        ("US 7,654,321 B2", "result-US7654321B2"),
+        ("US1B2", "result-US1B2"),
+        ("us7654321b2", "result-US7654321B2"),
+    ])
+    assert sorted(looked_up) == ["US1B2", "US7654321B2"]
+
+
+def test_repeats_of_dropped_results_are_looked_up_again():
+    """Test only the last ``chunk`` results are kept; an older repeat is looked up again."""
+    looked_up = []
+
+    def lookup(number):
+        looked_up.append(number)
+        return number
+
+    # chunk=1: each lookup finishes before the next input is read
+    run = BulkRun(lookup, ["A", "B", "A", "B"], concurrency=1, chunk=1)
+    pairs = list(run)
+
+    assert pairs == [("A", "A"), ("B", "B"), ("A", "A"), ("B", "B")]
+    assert looked_up == ["A", "B", "A", "B"]
+    assert (run.stats.submitted, run.stats.duplicates) == (4, 2)
+    assert len(run._recent) == 1
+
+
+def test_repeats_waiting_on_a_lookup_count_against_chunk():
+    """Test a run of repeats of an in-flight number stops the read-ahead at ``chunk``."""
+    pulled = []
+    release = threading.Event()
+
+    def numbers():
+        for i in range(100):
+            pulled.append(i)
+            yield "US1"
+
+    def lookup(number):
+        release.wait(5)
+        return number
+
+    run = iter(BulkRun(lookup, numbers(), concurrency=1, chunk=4))
+    timer = threading.Timer(0.05, release.set)
+    timer.start()
+    first = next(run)
+
+    assert first == ("US1", "US1")
+    assert len(pulled) <= 5
+    timer.join()
+
+
+def test_inputs_are_read_lazily():
+    """Test no more than ``chunk`` inputs are pulled ahead of consumed results."""
+    pulled = []
+
+    def numbers():
+        for i in range(100):
+            pulled.append(i)
+            yield f"US{i}"
+
+    run = BulkRun(lambda number: number, numbers(), concurrency=2, chunk=4)
+    first = next(iter(run))
+
+    assert first[0] == first[1]
+    assert len(pulled) <= 5
+
+
+def test_invalid_arguments():
+    """Test bad number_type and concurrency are rejected."""
+    client = make_client_with_session(NumberSession())
+
+    with pytest.raises(ValueError):
+        client.patents.search.by_numbers(["US1"], number_type="doc")
+    with pytest.raises(ValueError):
+        client.patents.search.by_numbers(["US1"], concurrency=0)
+    client.close()
+
+
+def test_async_bulk_run():
+    """Test the async run looks every unique number up once and answers every input."""
+    async def lookup(number):
+        await asyncio.sleep(0)
+        if number == "BAD":
+            raise ApiError("boom")
+        return number.lower()
+
+    async def collect():
+        run = AsyncBulkRun(lookup, ["A", "a", "B", "BAD"], concurrency=2)
+        return run, {number: result async for number, result in run}
+
+    run, results = asyncio.run(collect())
+
+    assert results["A"] == results["a"] == "a" and results["B"] == "b"
+    assert isinstance(results["BAD"], ApiError)
+    assert run.stats.duplicates == 1
@@ -0,0 +1,114 @@
+"""Tests for batch and matrix claim similarity."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from patsnap_pythonSDK import AsyncPatsnapClient
+from patsnap_pythonSDK.claims import ClaimScoreCache, escape_claim
+from tests.shared import FakeResponse, FakeSession, make_client_with_session, create_oauth_payload
+
+
+def fake_score(src: str, tgt: str) -> float:
+    """Deterministic, symmetric score for two claim texts."""
+    return round(1 / (1 + abs(len(src) - len(tgt))), 4)
+
+
+class ClaimSession(FakeSession):
+    """Fake session scoring claim pairs and recording each call."""
+
+    def __init__(self):
+        super().__init__(FakeResponse(200, create_oauth_payload()), FakeResponse(200, {}))
+        self.pairs = []
+        self._lock = threading.Lock()
+
+    def post(self, url, **kwargs):
+        if url.endswith("/oauth/token"):
+            return super().post(url, **kwargs)
+        body = kwargs["json"]
+        with self._lock:
+            self.pairs.append((body["src"], body["tgt"]))
+        return FakeResponse(200, {"data": {"score": fake_score(body["src"], body["tgt"])}, "status": True, "error_code": 0})
+
+
+def test_escape_claim():
+    assert escape_claim("1. A\n\tB\r\nC") == "1. A\\n\\tB\\r\\nC"
+
+
+def test_batch_scores_in_input_order_and_deduplicates():
+    """Test identical and reversed pairs are scored by one call each."""
+    session = ClaimSession()
+    client = make_client_with_session(session)
+    a, b, c = "claim a", "claim bb", "claim ccc"
+
+    scores = client.patents.search.claim_similarity_batch([(a, b), (b, a), (a, b), (a, c)], concurrency=4)
+
+    assert scores == [fake_score(a, b), fake_score(a, b), fake_score(a, b), fake_score(a, c)]
+    assert len(session.pairs) == 2
+
+
+def test_batch_keeps_direction_when_not_symmetric():
+    session = ClaimSession()
+    client = make_client_with_session(session)
+
+    client.patents.search.claim_similarity_batch([("x", "yy"), ("yy", "x")], symmetric=False)
+
+    assert sorted(session.pairs) == [("x", "yy"), ("yy", "x")]
+
+
+def test_scores_are_cached_by_content_across_batches():
+    """Test a later batch only calls for pairs it has not scored before."""
+    session = ClaimSession()
+    client = make_client_with_session(session)
+    search = client.patents.search
+
+    search.claim_similarity_batch([("p", "qq")])
+    search.claim_similarity_batch([("qq", "p"), ("p", "rrr")])
+
+    assert len(session.pairs) == 2
+
+
+def test_matrix_scores_every_pair_with_mirrored_pairs_once():
+    """Test a self-similarity matrix is symmetric and costs n*(n+1)/2 calls."""
+    session = ClaimSession()
+    client = make_client_with_session(session)
+    claims = ["one", "three", "seventeen"]
+
+    matrix = client.patents.search.claim_similarity_matrix(claims, as_array=False, cache=ClaimScoreCache())
+
+    assert matrix == [[fake_score(s, t) for t in claims] for s in claims]
+    assert len(session.pairs) == 6
+
+
+def test_matrix_as_numpy_array():
+    np = pytest.importorskip("numpy")
+    client = make_client_with_session(ClaimSession())
+
+    matrix = client.patents.search.claim_similarity_matrix(["a", "bb"], ["ccc", "d", "ee"])
+
+    assert isinstance(matrix, np.ndarray) and matrix.shape == (2, 3)
+
+
+def test_async_matrix():
+    """Test the async client returns an awaitable matrix."""
+    httpx = pytest.importorskip("httpx")
+    calls = []
+
+    def handler(request):
+        if request.url.path.endswith("/oauth/token"):
+            return httpx.Response(200, json=create_oauth_payload())
+        body = json.loads(request.content)
+        calls.append(body)
+        return httpx.Response(200, json={"data": {"score": fake_score(body["src"], body["tgt"])}, "status": True, "error_code": 0})
+
+    async def run():
+        transport = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncPatsnapClient(client_id="id", client_secret="secret", client=transport) as client:
+            return await client.patents.search.claim_similarity_matrix(["a", "bb"], ["a"], as_array=False)
+
+    assert asyncio.run(run()) == [[fake_score("a", "a")], [fake_score("bb", "a")]]
+    assert len(calls) == 2
@@ -0,0 +1,195 @@
+"""Tests for image-search pagination and multi-query fusion."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from patsnap_pythonSDK import AsyncPatsnapClient
+from patsnap_pythonSDK.fusion import fuse_results
+from patsnap_pythonSDK.models.search.patents import ImageSearchSingleRequest, PatentMessage
+from patsnap_pythonSDK.utils.responsemode import response_mode
+from tests.shared import FakeResponse, FakeSession, make_client_with_session, create_oauth_payload
+
+
+def make_message(i: int, score: float) -> dict:
+    return {
+        "url": f"https://img/{i}.png", "apdt": 20200101, "apno": f"A{i}", "pbdt": 20210101, "title": "T",
+        "inventor": "I", "patent_id": f"id-{i}", "patent_pn": f"USD{i}", "current_assignee": "C",
+        "original_assignee": "O", "score": score,
+    }
+
+
+def image_page(body: dict, total: int, step: int = 1) -> dict:
+    """Page of ``total`` results for the query image; patent ids advance by ``step``."""
+    offset, limit = body["offset"], body["limit"]
+    messages = [make_message(i * step, round(1 - i / 2000, 4)) for i in range(offset, min(offset + limit, total))]
+    return {"data": {"patent_messages": messages, "total_search_result_count": total}, "status": True, "error_code": 0}
+
+
+class ImageSession(FakeSession):
+    """Fake session serving image-search pages; ``totals`` maps image URL -> (total, id step)."""
+
+    def __init__(self, totals):
+        super().__init__(FakeResponse(200, create_oauth_payload()), FakeResponse(200, {}))
+        self.totals = totals
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def post(self, url, **kwargs):
+        if url.endswith("/oauth/token"):
+            return super().post(url, **kwargs)
+        body = kwargs["json"]
+        with self._lock:
+            self.calls.append((body["url"], body["offset"], body["limit"]))
+        return FakeResponse(200, image_page(body, *self.totals[body["url"]]))
+
+
+def rows(*entries):
+    return [PatentMessage(**make_message(i, score)) for i, score in entries]
+
+
+def test_iter_image_search_walks_the_full_window():
+    """Test iteration reaches 1,100 results without an offset past 1000."""
+    session = ImageSession({"u": (5000, 1)})
+    client = make_client_with_session(session)
+
+    results = list(client.patents.search.iter_by_image(url="u", patent_type="D", model=1))
+
+    assert len(results) == 1100
+    assert results[-1].patent_id == "id-1099"
+    assert max(offset for _, offset, _ in session.calls) == 1000
+    assert all(limit <= 100 for _, _, limit in session.calls)
+
+
+def test_iter_image_search_stops_before_offset_cap():
+    """Test a page size that does not divide 1000 stops at the last legal offset."""
+    session = ImageSession({"u": (5000, 1)})
+    client = make_client_with_session(session)
+
+    results = list(client.patents.search.iter_by_image(url="u", patent_type="D", model=1, page_size=70, prefetch=False))
+
+    assert session.calls[-1][1] == 980
+    assert len(results) == 1050
+
+
+def test_iter_image_search_stops_at_total():
+    session = ImageSession({"u": (130, 1)})
+    client = make_client_with_session(session)
+
+    assert len(list(client.patents.search.iter_by_image(url="u", patent_type="D", model=1))) == 130
+    assert [offset for _, offset, _ in session.calls] == [0, 100]
+
+
+def test_fuse_max_mean_and_rrf():
+    a = rows((1, 0.9), (2, 0.8))
+    b = rows((2, 0.95), (3, 0.7))
+
+    assert [(r.patent_id, r.score) for r in fuse_results([a, b], aggregate="max")] == [
+        ("id-2", 0.95), ("id-1", 0.9), ("id-3", 0.7),
+    ]
+    assert [r.patent_id for r in fuse_results([a, b], aggregate="mean")] == ["id-2", "id-1", "id-3"]
+    assert fuse_results([a, b], aggregate="mean")[0].score == pytest.approx((0.8 + 0.95) / 2)
+    rrf = fuse_results([a, b], aggregate="rrf", rrf_k=60)
+    assert rrf[0].patent_id == "id-2"
+    assert rrf[0].score == pytest.approx(1 / 62 + 1 / 61)
+
+
+def test_fuse_callable_and_best_row():
+    a = rows((1, 0.5))
+    b = rows((1, 0.9))
+
+    hits = fuse_results([a, b], aggregate=lambda scores: sum(score is not None for score in scores))
+
+    assert hits[0].score == 2
+    assert hits[0].url == "https://img/1.png"
+
+
+def test_fuse_rejects_unknown_aggregate():
+    with pytest.raises(ValueError, match="aggregate"):
+        fuse_results([], aggregate="median")
+
+
+def test_fused_search_fetches_depth_per_query_and_merges():
+    """Test each query is paged to ``depth`` and overlapping patents are merged."""
+    session = ImageSession({"a": (1000, 1), "b": (1000, 2)})
+    client = make_client_with_session(session)
+    queries = [
+        {"url": "a", "patent_type": "D", "model": 1},
+        ImageSearchSingleRequest(url="b", patent_type="D", model=1, limit=5, offset=40),
+    ]
+
+    fused = client.patents.search.by_images_fused(queries, depth=250, concurrency=4)
+
+    assert sorted(call for call in session.calls if call[0] == "a") == [("a", 0, 100), ("a", 100, 100), ("a", 200, 50)]
+    ids = [row.patent_id for row in fused.patent_messages]
+    # a: ids 0..249, b: even ids 0..498; 125 of b's fall inside a's range
+    assert len(ids) == len(set(ids)) == 250 + 125
+    assert fused.total_search_result_count == 375
+    assert ids[0] == "id-0"
+
+
+def test_fused_search_returns_model_in_dict_mode():
+    client = make_client_with_session(ImageSession({"a": (10, 1)}))
+
+    with response_mode("dict"):
+        fused = client.patents.search.by_images_fused([{"url": "a", "patent_type": "D", "model": 1}], depth=5)
+
+    assert len(fused.patent_messages) == 5
+
+
+def test_fused_search_validates_depth():
+    client = make_client_with_session(ImageSession({}))
+
+    with pytest.raises(ValueError, match="depth"):
+        client.patents.search.by_images_fused([], depth=2000)
+
+
+def test_async_fused_search():
+    httpx = pytest.importorskip("httpx")
+    totals = {"a": (150, 1), "b": (150, 3)}
+
+    def handler(request):
+        if request.url.path.endswith("/oauth/token"):
+            return httpx.Response(200, json=create_oauth_payload())
+        body = json.loads(request.content)
+        return httpx.Response(200, json=image_page(body, *totals[body["url"]]))
+
+    async def run():
+        transport = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncPatsnapClient(client_id="id", client_secret="secret", client=transport) as client:
+            queries = [{"url": url, "patent_type": "U", "model": 4} for url in totals]
+            return await client.patents.search.by_images_fused(queries, depth=150, aggregate="rrf")
+
+    fused = asyncio.run(run())
+
+    # a: ids 0..149, b: multiples of 3 up to 447; 50 overlap
+    assert len(fused.patent_messages) == 150 + 100
+
+
+def test_async_iter_image_search():
+    httpx = pytest.importorskip("httpx")
+    offsets = []
+
+    def handler(request):
+        if request.url.path.endswith("/oauth/token"):
+            return httpx.Response(200, json=create_oauth_payload())
+        body = json.loads(request.content)
+        offsets.append(body["offset"])
+        return httpx.Response(200, json=image_page({**body, "url": "u"}, 5000))
+
+    async def run():
+        transport = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncPatsnapClient(client_id="id", client_secret="secret", client=transport) as client:
+            single = [row async for row in client.patents.search.iter_by_image(url="u", patent_type="D", model=1)]
+            multiple = client.patents.search.iter_by_multiple_images(urls=["u", "v"], patent_type="D", model=1, max_results=150)
+            return single, [row async for row in multiple]
+
+    single, multiple = asyncio.run(run())
+
+    assert len(single) == 1100
+    assert max(offsets) == 1000
+    assert [row.patent_id for row in multiple] == [f"id-{i}" for i in range(150)]
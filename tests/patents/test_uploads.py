@@ -0,0 +1,324 @@
+"""Tests for streamed, hash-deduplicated image uploads."""
+
+from __future__ import annotations
+
+import asyncio
+import email
+import hashlib
+import io
+import threading
+
+import pytest
+
+from patsnap_pythonSDK import AsyncPatsnapClient, PatsnapClient
+from patsnap_pythonSDK.http import _MultipartStream
+from patsnap_pythonSDK.uploads import MAX_IMAGE_BYTES, ImagePreprocessor, PreprocessStats, UploadCache, prepare_image
+from patsnap_pythonSDK.utils.responsemode import response_mode
+from tests.shared import FakeResponse, FakeSession, make_client_with_session, create_oauth_payload
+from tests.shared.mockserver import MockPatsnapServer, MockServerConfig
+
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 64
+
+
+class UploadSession(FakeSession):
+    """Fake session returning one URL per upload and recording the uploaded bytes."""
+
+    def __init__(self):
+        super().__init__(FakeResponse(200, create_oauth_payload()), FakeResponse(200, {}))
+        self.uploads = []
+        self._lock = threading.Lock()
+
+    def post(self, url, **kwargs):
+        if url.endswith("/oauth/token"):
+            return super().post(url, **kwargs)
+        filename, content, content_type = read_multipart(kwargs["data"], kwargs["headers"]["Content-Type"])
+        with self._lock:
+            self.uploads.append((filename, content, content_type))
+            url = f"https://img.example.com/{len(self.uploads)}.png"
+        return FakeResponse(200, {"data": {"url": url, "expire": 32400}, "status": True, "error_code": 0})
+
+
+def read_multipart(body, content_type):
+    """``(filename, content, content_type)`` of the one file in a streamed multipart body."""
+    # A file-like body, not bytes: requests reads it in blocks while sending
+    assert hasattr(body, "read")
+    length = len(body)
+    raw = b"".join(body)
+    assert len(raw) == length
+    message = email.message_from_bytes(f"Content-Type: {content_type}\r\n\r\n".encode() + raw)
+    [part] = message.get_payload()
+    return part.get_filename(), part.get_payload(decode=True), part.get_content_type()
+
+
+def write_image(tmp_path, name, content=PNG):
+    path = tmp_path / name
+    path.write_bytes(content)
+    return path
+
+
+def test_upload_streams_file_from_disk(tmp_path):
+    session = UploadSession()
+    client = make_client_with_session(session)
+
+    result = client.patents.search.upload_image(image=write_image(tmp_path, "front.png"))
+
+    assert result.url == "https://img.example.com/1.png"
+    assert session.uploads == [("front.png", PNG, "image/png")]
+
+
+def test_upload_body_is_read_in_blocks(tmp_path):
+    """Test the multipart body reads the file block by block rather than all at once."""
+    content = PNG + bytes(range(256)) * 1000
+    with open(write_image(tmp_path, 'a "quoted".png', content), "rb") as stream:
+        body = _MultipartStream.of({"image": ('a "quoted".png', stream, "image/png")})
+        blocks = list(iter(lambda: body.read(1000), b""))
+
+    raw = b"".join(blocks)
+    assert all(len(block) == 1000 for block in blocks[:-1])
+    assert len(raw) == len(body)
+    message = email.message_from_bytes(f"Content-Type: {body.content_type}\r\n\r\n".encode() + raw)
+    [part] = message.get_payload()
+    assert part.get_payload(decode=True) == content
+    assert part.get_param("filename", header="content-disposition") == "a %22quoted%22.png"
+
+
+def test_upload_to_the_mock_server_over_http(tmp_path):
+    server = MockPatsnapServer(MockServerConfig()).start()
+    try:
+        client = PatsnapClient(client_id="id", client_secret="secret", base_url=server.url)
+        result = client.patents.search.upload_image(image=write_image(tmp_path, "a.png"))
+        client.close()
+    finally:
+        server.stop()
+
+    # The mock names the upload after the SHA-256 of the body it read
+    assert result.url.startswith("https://mock.patsnap.local/uploads/")
+    assert hashlib.sha256(b"").hexdigest()[:16] not in result.url
+    assert server.stats["by_path"]["/image-search/image-upload"] == 1
+
+
+def test_identical_content_reuses_url(tmp_path):
+    """Test a second file with the same bytes returns the first URL without uploading."""
+    session = UploadSession()
+    client = make_client_with_session(session)
+    search = client.patents.search
+
+    first = search.upload_image(image=write_image(tmp_path, "a.png"))
+    second = search.upload_image(image=write_image(tmp_path, "copy-of-a.png"))
+    third = search.upload_image(image=write_image(tmp_path, "b.png", PNG + b"\x01"))
+
+    assert second.url == first.url
+    assert 32400 - 5 <= second.expire <= 32400
+    assert third.url != first.url
+    assert len(session.uploads) == 2
+
+
+def test_reuse_false_always_uploads(tmp_path):
+    session = UploadSession()
+    client = make_client_with_session(session)
+    path = write_image(tmp_path, "a.png")
+
+    client.patents.search.upload_image(image=path)
+    client.patents.search.upload_image(image=path, reuse=False)
+
+    assert len(session.uploads) == 2
+
+
+def test_upload_images_keeps_order_and_deduplicates(tmp_path):
+    session = UploadSession()
+    client = make_client_with_session(session)
+    a = write_image(tmp_path, "a.png")
+    b = write_image(tmp_path, "b.jpg", PNG + b"\x02")
+
+    results = client.patents.search.upload_images([a, b, a, b, a], concurrency=4)
+
+    assert len(session.uploads) == 2
+    assert results[0].url == results[2].url == results[4].url
+    assert results[1].url == results[3].url != results[0].url
+    assert {upload[2] for upload in session.uploads} == {"image/png", "image/jpeg"}
+
+
+def test_upload_returns_model_in_dict_mode(tmp_path):
+    client = make_client_with_session(UploadSession())
+
+    with response_mode("dict"):
+        result = client.patents.search.upload_image(image=write_image(tmp_path, "a.png"))
+
+    assert result.url == "https://img.example.com/1.png"
+
+
+def test_non_seekable_stream_is_buffered():
+    class OneShot(io.RawIOBase):
+        def __init__(self, data):
+            self._data = io.BytesIO(data)
+
+        def readable(self):
+            return True
+
+        def readinto(self, buffer):
+            return self._data.readinto(buffer)
+
+    prepared = prepare_image(OneShot(PNG))
+
+    assert prepared.digest() == hashlib.sha256(PNG).hexdigest()
+    assert prepared.stream.read() == PNG
+
+
+def test_upload_cache_skips_urls_about_to_expire():
+    cache = UploadCache(min_remaining=600)
+    cache.put("fresh", "https://a", 32400)
+    cache.put("stale", "https://b", 300)
+
+    assert cache.get("fresh")[0] == "https://a"
+    assert cache.get("stale") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert len(cache) == 1
+
+
+def test_upload_cache_evicts_oldest():
+    cache = UploadCache(max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.put(key, f"https://{key}", 32400)
+
+    assert cache.get("a") is None
+    assert cache.get("c") is not None
+
+
+def test_path_validation_errors(tmp_path):
+    with pytest.raises(FileNotFoundError, match="Image file not found"):
+        prepare_image(tmp_path / "missing.png")
+    with pytest.raises(ValueError, match="Unsupported image format"):
+        prepare_image(write_image(tmp_path, "a.gif"))
+
+
+def test_async_upload_images_deduplicates(tmp_path):
+    httpx = pytest.importorskip("httpx")
+    uploads = []
+
+    def handler(request):
+        if request.url.path.endswith("/oauth/token"):
+            return httpx.Response(200, json=create_oauth_payload())
+        uploads.append(request.content)
+        return httpx.Response(200, json={"data": {"url": f"https://img/{len(uploads)}", "expire": 32400}, "status": True, "error_code": 0})
+
+    a = write_image(tmp_path, "a.png")
+    b = write_image(tmp_path, "b.png", PNG + b"\x03")
+
+    async def run():
+        transport = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncPatsnapClient(client_id="id", client_secret="secret", client=transport) as client:
+            return await client.patents.search.upload_images([a, b, a], concurrency=2)
+
+    results = asyncio.run(run())
+
+    assert results[0].url == results[2].url != results[1].url
+    assert len(uploads) == 2
+    assert all(PNG in body for body in uploads)
+
+
+def test_preprocessor_accepts_files_over_the_limit(tmp_path):
+    path = write_image(tmp_path, "huge.png", PNG + b"\x00" * MAX_IMAGE_BYTES)
+
+    with pytest.raises(ValueError, match="Image file too large"):
+        prepare_image(path)
+    prepare_image(path, ImagePreprocessor()).close()
+
+
+def test_preprocess_settings_change_the_cache_key(tmp_path):
+    path = write_image(tmp_path, "a.png")
+
+    digests = {
+        prepare_image(path).digest(),
+        prepare_image(path, ImagePreprocessor(quality=80)).digest(),
+        prepare_image(path, ImagePreprocessor(quality=60)).digest(),
+    }
+
+    assert len(digests) == 3
+
+
+def test_preprocessor_validates_settings():
+    with pytest.raises(ValueError, match="quality"):
+        ImagePreprocessor(quality=100)
+    with pytest.raises(ValueError, match="format"):
+        ImagePreprocessor(format="webp")
+
+
+def test_preprocess_stats():
+    stats = PreprocessStats(images=2, bytes_in=4000, bytes_out=1000)
+
+    assert stats.bytes_saved == 3000
+    assert stats.ratio == 0.25
+
+
+def test_preprocess_without_pillow_explains_extra(tmp_path, monkeypatch):
+    import sys
+
+    monkeypatch.setitem(sys.modules, "PIL", None)
+    prepared = prepare_image(write_image(tmp_path, "a.png"), ImagePreprocessor())
+
+    with pytest.raises(ImportError, match=r"\[images\]"):
+        prepared.files()
+
+
+def test_preprocess_downscales_and_strips_exif(tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    path = tmp_path / "catalog.png"
+    Image.new("RGBA", (4000, 3000), (10, 120, 200, 255)).save(path)
+    exif = Image.Exif()
+    exif[0x010F] = "Camera maker"
+    Image.new("RGB", (100, 100)).save(tmp_path / "photo.jpg", exif=exif)
+
+    session = UploadSession()
+    client = make_client_with_session(session)
+    preprocessor = ImagePreprocessor(max_dimension=1000, quality=80)
+
+    client.patents.search.upload_images([path, tmp_path / "photo.jpg"], preprocess=preprocessor, concurrency=1)
+
+    (name, data, content_type), (_, photo, _) = session.uploads
+    assert (name, content_type) == ("catalog.jpg", "image/jpeg")
+    with Image.open(io.BytesIO(data)) as uploaded:
+        assert uploaded.size == (1000, 750)
+    with Image.open(io.BytesIO(photo)) as uploaded:
+        assert not uploaded.getexif()
+    assert preprocessor.stats.images == 2
+    assert preprocessor.stats.bytes_saved > 0
+
+
+def test_async_shared_upload_survives_a_cancelled_leader(tmp_path):
+    """Test the file stays open for the shared upload when the caller that started it is cancelled."""
+    httpx = pytest.importorskip("httpx")
+    bodies = []
+
+    class SlowUpload(httpx.AsyncBaseTransport):
+        def __init__(self):
+            self.started = asyncio.Event()
+            self.release = asyncio.Event()
+
+        async def handle_async_request(self, request):
+            if request.url.path.endswith("/oauth/token"):
+                return httpx.Response(200, json=create_oauth_payload())
+            self.started.set()
+            await self.release.wait()
+            bodies.append(await request.aread())
+            return httpx.Response(200, json={"data": {"url": "https://img/1", "expire": 32400}, "status": True, "error_code": 0})
+
+    path = write_image(tmp_path, "a.png")
+
+    async def run():
+        transport = SlowUpload()
+        async with AsyncPatsnapClient(client_id="id", client_secret="secret", client=httpx.AsyncClient(transport=transport)) as client:
+            leader = asyncio.ensure_future(client.patents.search.upload_image(image=path))
+            await transport.started.wait()
+            follower = asyncio.ensure_future(client.patents.search.upload_image(image=path))
+            await asyncio.sleep(0)
+            leader.cancel()
+            await asyncio.sleep(0)
+            transport.release.set()
+            return await follower, leader.cancelled()
+
+    result, leader_cancelled = asyncio.run(run())
+
+    assert leader_cancelled
+    assert result.url == "https://img/1"
+    assert len(bodies) == 1 and PNG in bodies[0]
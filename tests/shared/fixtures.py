@@ -7,25 +7,44 @@ and creating test clients across all test modules.
 
 from __future__ import annotations
 
+import json
 from typing import Any, Dict
 from types import SimpleNamespace
 
 from patsnap_pythonSDK.client import PatsnapClient
+from patsnap_pythonSDK.utils.backoff import RetryPolicy
+
+
+# Retries stay enabled in tests but without real sleeps
+FAST_RETRY_POLICY = RetryPolicy(base_delay=0.0, max_delay=0.0)
 
 
 class FakeResponse:
     """Mock HTTP response for testing."""
     
-    def __init__(self, status_code: int, json_data: Dict[str, Any] | None = None, text: str = "") -> None:
+    def __init__(
+        self,
+        status_code: int,
+        json_data: Dict[str, Any] | None = None,
+        text: str = "",
+        headers: Dict[str, str] | None = None,
+    ) -> None:
         self.status_code = status_code
         self._json = json_data
         self.text = text
+        self.headers = headers or {}
 
     def json(self) -> Dict[str, Any]:
         if self._json is None:
             raise ValueError("no json")
         return self._json
 
+    @property
+    def content(self) -> bytes:
+        if self._json is None:
+            return self.text.encode("utf-8")
+        return json.dumps(self._json).encode("utf-8")
+
 
 class FakeSession:
     """A simple fake of requests.Session with programmable responses.
@@ -38,8 +57,10 @@ class FakeSession:
         self._business_response = business_response
         self.last_request = SimpleNamespace(url=None, headers=None, params=None, json=None)
 
-    def post(self, url, *, headers=None, params=None, data=None, json=None, timeout=None, auth=None):
-        self.last_request = SimpleNamespace(url=url, headers=headers, params=params, json=json, data=data, auth=auth)
+    def post(self, url, *, headers=None, params=None, data=None, json=None, files=None, timeout=None, auth=None):
+        self.last_request = SimpleNamespace(
+            url=url, headers=headers, params=params, json=json, data=data, files=files, auth=auth
+        )
         if url.endswith("/oauth/token"):
             return self._oauth_response
         return self._business_response
@@ -48,9 +69,10 @@ class FakeSession:
         pass
 
 
-def make_client_with_session(session: FakeSession) -> PatsnapClient:
+def make_client_with_session(session: FakeSession, **kwargs: Any) -> PatsnapClient:
     """Create a test client with a fake session."""
-    return PatsnapClient(client_id="client-id", client_secret="client-secret", session=session)
+    kwargs.setdefault("retry_policy", FAST_RETRY_POLICY)
+    return PatsnapClient(client_id="client-id", client_secret="client-secret", session=session, **kwargs)
 
 
 def create_oauth_payload() -> Dict[str, Any]:
@@ -0,0 +1,213 @@
+"""Load-test driver: run a client workload against the mock Patsnap API.
+
+Reports operations and HTTP requests per second, p50/p99 latency per
+operation and the client's CPU time per HTTP request. By default the mock
+server runs in a child process, so the process CPU time measured here is
+the client's alone.
+
+Run ``python -m tests.shared.loadtest --scenario search --operations 2000
+--concurrency 32 --latency lognormal:0.02:0.5``; ``--help`` lists the
+options.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from patsnap_pythonSDK import AsyncPatsnapClient, PatsnapClient
+
+from .mockserver import Latency, MockPatsnapServer, MockServerConfig, serve_in_subprocess
+
+
+# Scenario -> what one operation does, given a client and the operation's index
+SCENARIOS: Dict[str, Callable[[Any, int], Any]] = {
+    "count": lambda client, i: client.analytics.search.query_count(query_text=f"TACD: load {i}"),
+    "search": lambda client, i: client.analytics.search.query_search(
+        query_text=f"TACD: load {i}", offset=(i * 100) % 19000, limit=100
+    ),
+    "number": lambda client, i: client.patents.search.by_number(pn=f"US{i}"),
+    "semantic": lambda client, i: client.patents.search.by_semantic_text(text=f"load {i}", limit=50),
+}
+
+
+@dataclass
+class LoadReport:
+    """Outcome of a load run."""
+
+    scenario: str
+    operations: int
+    errors: int
+    concurrency: int
+    wall_seconds: float
+    operations_per_second: float
+    # HTTP requests the server answered, token requests and retries included
+    http_requests: int
+    requests_per_second: float
+    p50_ms: float
+    p99_ms: float
+    # Client process CPU time per HTTP request
+    cpu_ms_per_request: float
+    throttled: int
+    server_peak_concurrency: int
+
+    def format(self) -> str:
+        return "\n".join(f"{name:>24}: {value}" for name, value in asdict(self).items())
+
+
+def run_load(
+    url: str,
+    *,
+    scenario: str = "search",
+    operations: int = 1000,
+    concurrency: int = 16,
+    use_async: bool = False,
+    **client_options: Any,
+) -> LoadReport:
+    """Run ``operations`` of ``scenario`` against the mock server at ``url``.
+
+    Args:
+        url: Base URL of a :class:`MockPatsnapServer`
+        scenario: One of :data:`SCENARIOS`
+        operations: Operations to run
+        concurrency: Operations in flight at once (threads, or tasks with ``use_async``)
+        use_async: Drive :class:`AsyncPatsnapClient` instead of :class:`PatsnapClient`
+        **client_options: Passed to the client, e.g. ``concurrency_limiter``
+    """
+    if scenario not in SCENARIOS:
+        raise ValueError(f"scenario must be one of {', '.join(SCENARIOS)}; got {scenario!r}")
+    operation = SCENARIOS[scenario]
+    _server_stats(url, reset=True)
+    latencies: List[float] = []
+    errors = 0
+
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    if use_async:
+        latencies, errors = asyncio.run(_run_async(url, operation, operations, concurrency, client_options))
+    else:
+        lock = threading.Lock()
+        client = PatsnapClient(client_id="load", client_secret="test", base_url=url, **client_options)
+
+        def timed(i: int) -> None:
+            nonlocal errors
+            started = time.perf_counter()
+            try:
+                operation(client, i)
+            except Exception:
+                with lock:
+                    errors += 1
+                return
+            with lock:
+                latencies.append(time.perf_counter() - started)
+
+        try:
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                list(pool.map(timed, range(operations)))
+        finally:
+            client.close()
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    stats = _server_stats(url)
+    requests = stats["requests"]
+    return LoadReport(
+        scenario=scenario,
+        operations=operations,
+        errors=errors,
+        concurrency=concurrency,
+        wall_seconds=round(wall, 3),
+        operations_per_second=round(operations / wall, 1),
+        http_requests=requests,
+        requests_per_second=round(requests / wall, 1),
+        p50_ms=round(_percentile(latencies, 50) * 1000, 2),
+        p99_ms=round(_percentile(latencies, 99) * 1000, 2),
+        cpu_ms_per_request=round(cpu * 1000 / max(requests, 1), 3),
+        throttled=stats["throttled"],
+        server_peak_concurrency=stats["peak_active"],
+    )
+
+
+async def _run_async(url, operation, operations, concurrency, client_options):
+    latencies: List[float] = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+    async with AsyncPatsnapClient(client_id="load", client_secret="test", base_url=url, **client_options) as client:
+
+        async def timed(i: int) -> None:
+            nonlocal errors
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    await operation(client, i)
+                except Exception:
+                    errors += 1
+                    return
+                latencies.append(time.perf_counter() - started)
+
+        await asyncio.gather(*(timed(i) for i in range(operations)))
+    return latencies, errors
+
+
+@contextmanager
+def mock_server(config: MockServerConfig, *, in_process: bool = False) -> Iterator[str]:
+    """Serve the mock API and yield its URL; in a child process unless ``in_process``."""
+    if in_process:
+        with MockPatsnapServer(config) as server:
+            yield server.url
+    else:
+        with serve_in_subprocess(config) as url:
+            yield url
+
+
+def _server_stats(url: str, *, reset: bool = False) -> Dict[str, Any]:
+    with urllib.request.urlopen(f"{url}/__stats{'?reset=1' if reset else ''}") as response:
+        return json.loads(response.read())
+
+
+def _percentile(values: List[float], percent: int) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100, method="inclusive")[percent - 1]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Load-test the SDK against the mock Patsnap API")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="search")
+    parser.add_argument("--operations", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--async", dest="use_async", action="store_true", help="Use AsyncPatsnapClient")
+    parser.add_argument("--latency", type=Latency.parse, default=Latency("lognormal", 0.02, 0.5))
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--capacity", type=int, default=None)
+    parser.add_argument("--in-process", action="store_true", help="Serve from this process (CPU figures include the server)")
+    args = parser.parse_args(argv)
+
+    config = MockServerConfig(
+        latency=args.latency, throttle_rate=args.throttle_rate, error_rate=args.error_rate, capacity=args.capacity
+    )
+    with mock_server(config, in_process=args.in_process) as url:
+        report = run_load(
+            url,
+            scenario=args.scenario,
+            operations=args.operations,
+            concurrency=args.concurrency,
+            use_async=args.use_async,
+        )
+    print(report.format())
+
+
+if __name__ == "__main__":
+    main()
+
+
+__all__ = ["SCENARIOS", "LoadReport", "run_load", "mock_server"]
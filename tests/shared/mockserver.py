@@ -0,0 +1,519 @@
+"""Local stand-in for the Patsnap API, for integration and load tests.
+
+:class:`MockPatsnapServer` answers ``/oauth/token`` and every endpoint the
+resources call over real HTTP on ``127.0.0.1``, so the clients run their
+whole stack: sessions, connection pools, retries, rate and concurrency
+limiters. Behaviour is set by :class:`MockServerConfig`:
+
+- Latency per endpoint from a :class:`Latency` distribution
+- Injected 429s (with ``Retry-After``), 503s and ``error_code`` responses
+- A capacity: calls beyond it are answered 429 at once, like a throttling gateway
+- The API's paging caps (``limit + offset`` 20,000 or 1,000, image offset 1,000)
+
+Result sets are synthetic but consistent. A query matches a fixed number of
+patents, derived from its text or set in ``totals``, spread in date order
+over 1990-2022. ``APD``/``PBD`` range clauses and ``AUTHORITY:(..)``
+filters narrow that set exactly, so counts, pages and partitions agree
+across calls. The assignee searches match ``ANS:(..)``/``ANCS:(..)``
+queries on the same names.
+
+``GET /__stats`` returns the request counters; add ``?reset=1`` to clear them.
+Run ``python -m tests.shared.mockserver --port 8080`` to serve it standalone.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import hashlib
+import json
+import math
+import multiprocessing
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+
+EPOCH = datetime.date(1990, 1, 1)
+SPAN_DAYS = 12000
+# Publication follows application by this many days
+PUBLICATION_LAG = 540
+AUTHORITIES = ("US", "CN", "EP", "JP", "KR", "WO")
+
+# Paging caps of the real API
+RESULT_WINDOW = 20000
+SEMANTIC_WINDOW = 1000
+IMAGE_MAX_OFFSET = 1000
+IMAGE_MAX_LIMIT = 100
+FACET_WINDOW = 200
+
+_DATE_CLAUSE = re.compile(r"\s+AND\s+(APD|PBD):\[(\d{8}) TO (\d{8})\]")
+_AUTHORITY_CLAUSE = re.compile(r"\s+AND\s+AUTHORITY:\((\w+)\)")
+
+
+@dataclass(frozen=True)
+class Latency:
+    """A latency distribution in seconds.
+
+    ``fixed``: always ``a``; ``uniform``: between ``a`` and ``b``;
+    ``lognormal``: median ``a`` with shape ``b``; ``exponential``: mean ``a``.
+    """
+
+    kind: str = "fixed"
+    a: float = 0.0
+    b: float = 0.0
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "fixed":
+            return self.a
+        if self.kind == "uniform":
+            return rng.uniform(self.a, self.b)
+        if self.kind == "lognormal":
+            return rng.lognormvariate(math.log(self.a), self.b) if self.a > 0 else 0.0
+        if self.kind == "exponential":
+            return rng.expovariate(1 / self.a) if self.a > 0 else 0.0
+        raise ValueError(f"Unknown latency distribution: {self.kind}")
+
+    @classmethod
+    def parse(cls, spec: str) -> "Latency":
+        """``"0.02"``, ``"uniform:0.01:0.05"``, ``"lognormal:0.02:0.5"`` or ``"exponential:0.02"``."""
+        parts = spec.split(":")
+        if len(parts) == 1:
+            return cls("fixed", float(parts[0]))
+        numbers = [float(part) for part in parts[1:]]
+        latency = cls(parts[0], *numbers)
+        latency.sample(random.Random(0))
+        return latency
+
+
+@dataclass
+class MockServerConfig:
+    """Behaviour of a :class:`MockPatsnapServer`.
+
+    Attributes:
+        latency: Latency of every endpoint without its own entry
+        endpoint_latency: Latency per endpoint path
+        throttle_rate: Share of calls answered 429
+        retry_after: Retry-After seconds sent with 429s (None: no header)
+        error_rate: Share of calls answered 503
+        error_code_rate: Share of calls answered 200 with ``status: false``
+        error_code: The ``error_code`` of those responses
+        capacity: Calls served at once; any beyond are answered 429 (None: unlimited)
+        corpus_size: Upper bound on the results a query matches
+        totals: Results matched by specific queries, overriding the derived count
+        token_ttl: ``expires_in`` of issued tokens
+        seed: Seed of the latency and fault draws
+    """
+
+    latency: Latency = field(default_factory=Latency)
+    endpoint_latency: Dict[str, Latency] = field(default_factory=dict)
+    throttle_rate: float = 0.0
+    retry_after: Optional[float] = None
+    error_rate: float = 0.0
+    error_code_rate: float = 0.0
+    error_code: int = 1
+    capacity: Optional[int] = None
+    corpus_size: int = 100000
+    totals: Dict[str, int] = field(default_factory=dict)
+    token_ttl: int = 1799
+    seed: int = 0
+
+
+@dataclass
+class _Selection:
+    """The patents of a query left after its filters: ``first + step * n`` for n < count."""
+
+    base: str
+    digest: int
+    total: int
+    first: int
+    step: int
+    count: int
+
+    def index(self, position: int) -> int:
+        return self.first + self.step * position
+
+
+class MockCorpus:
+    """Deterministic synthetic result sets."""
+
+    def __init__(self, config: MockServerConfig) -> None:
+        self._config = config
+
+    def select(self, query: str) -> _Selection:
+        """Parse a query into its base text and filters and select the matching patents."""
+        authorities = _AUTHORITY_CLAUSE.findall(query)
+        dates = _DATE_CLAUSE.findall(query)
+        base = _AUTHORITY_CLAUSE.sub("", _DATE_CLAUSE.sub("", query)).strip()
+        if (dates or authorities) and base.startswith("(") and base.endswith(")"):
+            base = base[1:-1]
+        digest = _digest(base)
+        total = self._config.totals.get(base, digest % (self._config.corpus_size + 1))
+
+        low, high = 0, total
+        for date_field, start, end in dates:
+            lag = PUBLICATION_LAG if date_field == "PBD" else 0
+            start_day = (_parse_date(start) - EPOCH).days - lag
+            end_day = (_parse_date(end) - EPOCH).days - lag
+            # Patent k is filed on day k * SPAN_DAYS // total
+            low = max(low, _ceil_div(max(start_day, 0) * total, SPAN_DAYS))
+            high = min(high, _ceil_div(max(end_day + 1, 0) * total, SPAN_DAYS))
+        if high <= low:
+            return _Selection(base, digest, total, 0, 1, 0)
+        if not authorities:
+            return _Selection(base, digest, total, low, 1, high - low)
+        if len(set(authorities)) > 1 or authorities[0] not in AUTHORITIES:
+            return _Selection(base, digest, total, 0, 1, 0)
+        # Patent k belongs to AUTHORITIES[k % len(AUTHORITIES)]
+        step = len(AUTHORITIES)
+        first = low + (AUTHORITIES.index(authorities[0]) - low) % step
+        return _Selection(base, digest, total, first, step, max(0, _ceil_div(high - first, step)))
+
+    def patent(self, selection: _Selection, k: int) -> Dict[str, Any]:
+        filed = EPOCH + datetime.timedelta(days=k * SPAN_DAYS // max(selection.total, 1))
+        published = filed + datetime.timedelta(days=PUBLICATION_LAG)
+        authority = AUTHORITIES[k % len(AUTHORITIES)]
+        return {
+            "pn": f"{authority}{selection.digest % 9000 + 1000}{k:07d}",
+            "apdt": int(filed.strftime("%Y%m%d")),
+            "apno": f"{authority}{filed.year}{k:07d}",
+            "pbdt": int(published.strftime("%Y%m%d")),
+            "title": f"Mock patent {k} for {selection.base[:40]}",
+            "inventor": f"Inventor {k % 97}",
+            "patent_id": f"{selection.digest:08x}-{k}",
+            "current_assignee": f"Assignee {k % 500}",
+            "original_assignee": f"Assignee {k % 450}",
+        }
+
+    def page(self, selection: _Selection, offset: int, limit: int) -> List[Dict[str, Any]]:
+        end = min(offset + limit, selection.count)
+        return [self.patent(selection, selection.index(position)) for position in range(offset, end)]
+
+
+class MockPatsnapServer:
+    """Patsnap API stand-in served from a background thread.
+
+    Example:
+        >>> with MockPatsnapServer(MockServerConfig(latency=Latency("lognormal", 0.02, 0.4))) as server:
+        ...     client = PatsnapClient(client_id="id", client_secret="secret", base_url=server.url)
+        ...     client.analytics.search.query_count(query_text="TACD: battery")
+    """
+
+    def __init__(self, config: Optional[MockServerConfig] = None, *, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.config = config or MockServerConfig()
+        self.corpus = MockCorpus(self.config)
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._active = 0
+        self.stats: Dict[str, Any] = {}
+        self.reset_stats()
+        self._httpd = _Server((host, port), _handler_for(self))
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockPatsnapServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="mock-patsnap", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "MockPatsnapServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.stats = {"requests": 0, "by_path": {}, "by_status": {}, "throttled": 0, "peak_active": 0}
+
+    def handle(self, path: str, body: Any) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        """Answer one call: ``(status, payload, headers)``."""
+        with self._lock:
+            self._active += 1
+            self.stats["requests"] += 1
+            self.stats["by_path"][path] = self.stats["by_path"].get(path, 0) + 1
+            self.stats["peak_active"] = max(self.stats["peak_active"], self._active)
+            over_capacity = self.config.capacity is not None and self._active > self.config.capacity
+            draw = self._rng.random()
+            latency = self.config.endpoint_latency.get(path, self.config.latency).sample(self._rng)
+        try:
+            status, payload, headers = self._answer(path, body, draw, over_capacity, latency)
+        finally:
+            with self._lock:
+                self._active -= 1
+        with self._lock:
+            self.stats["by_status"][str(status)] = self.stats["by_status"].get(str(status), 0) + 1
+            self.stats["throttled"] += status == 429
+        return status, payload, headers
+
+    def _answer(
+        self, path: str, body: Any, draw: float, over_capacity: bool, latency: float
+    ) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        config = self.config
+        if path == "/oauth/token":
+            time.sleep(latency)
+            return 200, _token_payload(config.token_ttl), {}
+        route = _ROUTES.get(path)
+        if route is None:
+            return 404, {"status": False, "error_code": 404, "error_msg": f"No mock for {path}"}, {}
+
+        throttle_headers = {"Retry-After": str(config.retry_after)} if config.retry_after is not None else {}
+        if over_capacity or draw < config.throttle_rate:
+            return 429, {"status": False, "error_msg": "Too many requests"}, throttle_headers
+        draw -= config.throttle_rate
+        if draw < config.error_rate:
+            return 503, {"status": False, "error_msg": "Service unavailable"}, {}
+        draw -= config.error_rate
+        time.sleep(latency)
+        if draw < config.error_code_rate:
+            return 200, {"status": False, "error_code": config.error_code, "error_msg": "Injected error"}, {}
+        try:
+            data = route(self.corpus, body if isinstance(body, dict) else {})
+        except _PagingError as exc:
+            return 400, {"status": False, "error_code": 400, "error_msg": str(exc)}, {}
+        return 200, {"data": data, "status": True, "error_code": 0}, {}
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 drops connections when a load test opens many at once
+    request_queue_size = 1024
+
+
+class _PagingError(ValueError):
+    pass
+
+
+def _window(body: Dict[str, Any], window: int, default_limit: int = 10) -> Tuple[int, int]:
+    offset, limit = int(body.get("offset") or 0), int(body.get("limit") or default_limit)
+    if offset < 0 or limit < 1 or offset + limit > window:
+        raise _PagingError(f"limit + offset must be <= {window}")
+    return offset, limit
+
+
+def _search(corpus: MockCorpus, query: str, body: Dict[str, Any]) -> Dict[str, Any]:
+    selection = corpus.select(query)
+    offset, limit = _window(body, RESULT_WINDOW)
+    results = corpus.page(selection, offset, limit)
+    return {"results": results, "result_count": len(results), "total_search_result_count": selection.count}
+
+
+def _assignee_query(field_code: str, names: str) -> str:
+    # The query iter_partitioned sends for the same names
+    quoted = " OR ".join('"{}"'.format(name.strip().replace('"', '\\"')) for name in names.split(" OR "))
+    return f"{field_code}:({quoted})"
+
+
+def _semantic(corpus: MockCorpus, seed_text: str, body: Dict[str, Any]) -> Dict[str, Any]:
+    selection = corpus.select(seed_text)
+    offset, limit = _window(body, SEMANTIC_WINDOW)
+    results = []
+    for position, row in enumerate(corpus.page(selection, offset, limit), start=offset):
+        results.append({**row, "relevancy": f"{max(1, 99 - position // 12)}%"})
+    return {"results": results, "result_count": len(results), "total_search_result_count": selection.count}
+
+
+def _image(corpus: MockCorpus, key: str, body: Dict[str, Any]) -> Dict[str, Any]:
+    offset, limit = int(body.get("offset") or 0), int(body.get("limit") or 10)
+    if offset > IMAGE_MAX_OFFSET or not 1 <= limit <= IMAGE_MAX_LIMIT:
+        raise _PagingError(f"offset must be <= {IMAGE_MAX_OFFSET} and limit <= {IMAGE_MAX_LIMIT}")
+    selection = corpus.select(f"IMAGE:{key}")
+    messages = []
+    for position, row in enumerate(corpus.page(selection, offset, limit), start=offset):
+        messages.append({
+            "url": f"https://mock.patsnap.local/images/{row['patent_id']}.png",
+            "apdt": row["apdt"], "apno": row["apno"], "pbdt": row["pbdt"], "title": row["title"],
+            "inventor": row["inventor"], "patent_id": row["patent_id"], "patent_pn": row["pn"],
+            "current_assignee": row["current_assignee"], "original_assignee": row["original_assignee"],
+            "score": round(1 - position / 2000, 4),
+        })
+    return {"patent_messages": messages, "total_search_result_count": selection.count}
+
+
+def _facets(corpus: MockCorpus, body: Dict[str, Any]) -> List[Dict[str, Any]]:
+    offset, limit = _window(body, FACET_WINDOW, default_limit=50)
+    selection = corpus.select(body.get("query", ""))
+    row = {}
+    for code in str(body.get("field", "")).split(","):
+        buckets = 20 + _digest(code) % 400
+        # Bucket i holds a share of the selection decreasing with i
+        weights = [1 / (i + 1) for i in range(buckets)]
+        scale = selection.count / sum(weights)
+        ranked = [{"name": f"{code}-{i}", "count": int(weight * scale)} for i, weight in enumerate(weights)]
+        row[code.strip().lower()] = [bucket for bucket in ranked if bucket["count"]][offset:offset + limit]
+    return [row]
+
+
+def _pn_search(corpus: MockCorpus, body: Dict[str, Any]) -> Dict[str, Any]:
+    number = body.get("pn") or body.get("apno") or ""
+    selection = corpus.select(f"PN:{number}")
+    results = corpus.page(selection, 0, 1) if selection.count else []
+    if results:
+        results[0]["pn" if body.get("pn") else "apno"] = number
+    return {"results": results, "result_count": len(results), "total_search_result_count": len(results)}
+
+
+_ROUTES = {
+    "/search/patent/query-search-count/v2": lambda corpus, body: {
+        "total_search_result_count": corpus.select(body.get("query_text", "")).count
+    },
+    "/search/patent/query-search-patent/v2": lambda corpus, body: _search(corpus, body.get("query_text", ""), body),
+    "/search/patent/company-search-patent/v2": lambda corpus, body: _search(
+        corpus, _assignee_query("ANS", body.get("application", "")), body
+    ),
+    "/search/patent/current-search-patent/v2": lambda corpus, body: _search(
+        corpus, _assignee_query("ANCS", body.get("assignee", "")), body
+    ),
+    "/search/patent/company-search-defense-patent/v2": lambda corpus, body: _search(
+        corpus, f"DEFENSE:{body.get('application', '')}", body
+    ),
+    "/search/patent/similar-search-patent/v2": lambda corpus, body: _semantic(
+        corpus, f"SIMILAR:{body.get('patent_id') or body.get('patent_number')}", body
+    ),
+    "/search/patent/semantic-search-patent/v2": lambda corpus, body: _semantic(corpus, f"TEXT:{body.get('text', '')}", body),
+    "/search/patent/pn-search-patent/v2": _pn_search,
+    "/search/patent/query/v2": _facets,
+    "/search/patent/image-single": lambda corpus, body: _image(corpus, body.get("url", ""), body),
+    "/search/patent/image-multiple": lambda corpus, body: _image(corpus, ",".join(body.get("urls", [])), body),
+    "/search/patent/claim-sim": lambda corpus, body: {
+        "score": round(_digest(f"{body.get('src')}|{body.get('tgt')}") % 10000 / 10000, 4)
+    },
+    "/image-search/image-upload": lambda corpus, body: {
+        "url": f"https://mock.patsnap.local/uploads/{body.get('sha256', 'image')[:16]}.png",
+        "expire": 32400,
+    },
+}
+
+
+def _handler_for(server: MockPatsnapServer) -> type:
+    class Handler(BaseHTTPRequestHandler):
+        # Keep-alive, so client connection pools behave as against the real API
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b""
+            path = urlparse(self.path).path
+            if self.headers.get("Content-Type", "").startswith("application/json"):
+                body: Any = json.loads(raw or b"{}")
+            else:
+                # Form-encoded token requests and multipart uploads
+                body = {"sha256": hashlib.sha256(raw).hexdigest()}
+            status, payload, headers = server.handle(path, body)
+            self._send(status, payload, headers)
+
+        def do_GET(self) -> None:
+            parsed = urlparse(self.path)
+            if parsed.path != "/__stats":
+                self._send(404, {"error_msg": "not found"}, {})
+                return
+            with server._lock:
+                stats = json.loads(json.dumps(server.stats))
+            if parse_qs(parsed.query).get("reset"):
+                server.reset_stats()
+            self._send(200, stats, {})
+
+        def _send(self, status: int, payload: Any, headers: Dict[str, str]) -> None:
+            content = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(content)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    return Handler
+
+
+def _serve(config: MockServerConfig, port: int, conn: Any) -> None:
+    server = MockPatsnapServer(config, port=port)
+    conn.send(server.url)
+    server._httpd.serve_forever()
+
+
+@contextmanager
+def serve_in_subprocess(config: Optional[MockServerConfig] = None, *, port: int = 0) -> Iterator[str]:
+    """Run a :class:`MockPatsnapServer` in a child process and yield its URL.
+
+    Keeps the server's CPU time out of the measuring process, as the load
+    test needs.
+    """
+    context = multiprocessing.get_context("spawn")
+    parent, child = context.Pipe()
+    process = context.Process(target=_serve, args=(config or MockServerConfig(), port, child), daemon=True)
+    process.start()
+    try:
+        if not parent.poll(30):
+            raise RuntimeError("Mock server did not start")
+        yield parent.recv()
+    finally:
+        process.terminate()
+        process.join()
+
+
+def _token_payload(ttl: int) -> Dict[str, Any]:
+    return {
+        "token": "mock-token",
+        "token_type": "BearerToken",
+        "expires_in": ttl,
+        "status": "approved",
+        "issued_at": str(int(time.time() * 1000)),
+    }
+
+
+def _digest(text: str) -> int:
+    return int.from_bytes(hashlib.sha1(text.encode("utf-8")).digest()[:8], "big")
+
+
+def _ceil_div(numerator: int, denominator: int) -> int:
+    return -(-numerator // denominator)
+
+
+def _parse_date(value: str) -> datetime.date:
+    return datetime.datetime.strptime(value, "%Y%m%d").date()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve the mock Patsnap API")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=Latency.parse, default=Latency(), help="e.g. lognormal:0.02:0.5")
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--capacity", type=int, default=None)
+    args = parser.parse_args(argv)
+    config = MockServerConfig(
+        latency=args.latency, throttle_rate=args.throttle_rate, error_rate=args.error_rate, capacity=args.capacity
+    )
+    server = MockPatsnapServer(config, port=args.port)
+    print(f"Mock Patsnap API on {server.url}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
+
+
+__all__ = ["Latency", "MockServerConfig", "MockCorpus", "MockPatsnapServer", "serve_in_subprocess"]